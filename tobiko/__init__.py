@@ -28,6 +28,7 @@ from tobiko.common import _lockutils
 from tobiko.common import _logging
 from tobiko.common import _operation
 from tobiko.common import _os
+from tobiko.common import _poller
 from tobiko.common import _retry
 from tobiko.common import _select
 from tobiko.common import _shelves
@@ -104,12 +105,20 @@ load_object = _loader.load_object
 load_module = _loader.load_module
 
 interworker_synched = _lockutils.interworker_synched
+interworker_lock = _lockutils.lock
 
 makedirs = _os.makedirs
 open_output_file = _os.open_output_file
 get_truncated_filename = _os.get_truncated_filename
 truncate_logfile = _os.truncate_logfile
 
+PollingKind = _poller.PollingKind
+StatusPoller = _poller.StatusPoller
+WaitForObjectTimeout = _poller.WaitForObjectTimeout
+wait_for_object = _poller.wait_for_object
+wait_for_futures = _poller.wait_for_futures
+watch_object = _poller.watch_object
+
 runs_operation = _operation.runs_operation
 before_operation = _operation.before_operation
 after_operation = _operation.after_operation
@@ -136,7 +145,9 @@ ObjectNotFound = _select.ObjectNotFound
 MultipleObjectsFound = _select.MultipleObjectsFound
 
 addme_to_shared_resource = _shelves.addme_to_shared_resource
+lease_shared_resource = _shelves.lease_shared_resource
 removeme_from_shared_resource = _shelves.removeme_from_shared_resource
+get_shared_resource_users = _shelves.get_shared_resource_users
 remove_test_from_all_shared_resources = (
     _shelves.remove_test_from_all_shared_resources)
 initialize_shelves = _shelves.initialize_shelves
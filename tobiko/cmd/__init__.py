@@ -17,13 +17,17 @@ from __future__ import absolute_import
 
 import sys
 
+from tobiko.cmd import _cleanup_stacks
 from tobiko.cmd import _http_ping
 from tobiko.cmd import _ping
+from tobiko.cmd import _prepare_stacks
 from tobiko.cmd import _main
 
 main = _main.main
+TobikoCleanupStacks = _cleanup_stacks.TobikoCleanupStacks
 TobikoHttpPing = _http_ping.TobikoHttpPing
 TobikoPing = _ping.TobikoPing
+TobikoPrepareStacks = _prepare_stacks.TobikoPrepareStacks
 
 if __name__ == '__main__':
     sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,66 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import sys
+
+from cliff import command
+from oslo_log import log as logging
+
+from tobiko.cmd import _prepare_stacks
+from tobiko.openstack import heat
+
+LOG = logging.getLogger(__name__)
+
+
+class TobikoCleanupStacks(command.Command):
+    """Delete the Heat stacks required by selected tests"""
+
+    def get_parser(self, prog_name):
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            'tests',
+            nargs='+',
+            help='Test files, directories or IDs, as they would be given to '
+                 'pytest'
+        )
+        parser.add_argument(
+            '-k',
+            dest='keyword',
+            default=None,
+            help='Only select tests matching given pytest keyword expression'
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=None,
+            help='Maximum number of seconds to wait for stacks deletion'
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        args = list(parsed_args.tests)
+        if parsed_args.keyword:
+            args += ['-k', parsed_args.keyword]
+        objects = _prepare_stacks.collect_tests(args)
+        try:
+            stacks = heat.cleanup_stacks(objects,
+                                         timeout=parsed_args.timeout)
+        except heat.CleanupStacksError as ex:
+            LOG.error("Failed to delete Heat stacks: %s", ex)
+            sys.exit(1)
+        for name in stacks:
+            print(name)
@@ -0,0 +1,104 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import sys
+import typing
+
+from cliff import command
+from oslo_log import log as logging
+import pytest
+
+from tobiko.openstack import heat
+
+LOG = logging.getLogger(__name__)
+
+
+class TestsCollector:
+    """Pytest plugin getting the objects of collected tests"""
+
+    def __init__(self):
+        self.objects: typing.List[typing.Any] = []
+
+    def pytest_collection_finish(self, session):
+        for item in session.items:
+            for obj in [getattr(item, 'cls', None),
+                        getattr(item, 'obj', None)]:
+                if obj is not None:
+                    self.objects.append(obj)
+
+
+def collect_tests(args: typing.List[str]) -> typing.List[typing.Any]:
+    """Get the tests pytest would select with given command line args"""
+    collector = TestsCollector()
+    exit_code = pytest.main(['--collect-only', '-q', '-p', 'no:xdist'] +
+                            args,
+                            plugins=[collector])
+    if exit_code not in [pytest.ExitCode.OK,
+                         pytest.ExitCode.NO_TESTS_COLLECTED]:
+        raise RuntimeError(f"Unable to collect tests {args} "
+                           f"(exit code: {exit_code})")
+    return collector.objects
+
+
+class TobikoPrepareStacks(command.Command):
+    """Create the Heat stacks required by selected tests"""
+
+    def get_parser(self, prog_name):
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            'tests',
+            nargs='+',
+            help='Test files, directories or IDs, as they would be given to '
+                 'pytest'
+        )
+        parser.add_argument(
+            '-k',
+            dest='keyword',
+            default=None,
+            help='Only select tests matching given pytest keyword expression'
+        )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=None,
+            help='Maximum number of stacks created at the same time'
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='Only list required stacks, without creating them'
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        args = list(parsed_args.tests)
+        if parsed_args.keyword:
+            args += ['-k', parsed_args.keyword]
+        objects = collect_tests(args)
+        if parsed_args.list:
+            dependencies = heat.get_stacks_dependencies(objects)
+            for name, required in sorted(dependencies.items()):
+                print(name, *sorted(required))
+            return
+        try:
+            stacks = heat.prepare_stacks(objects,
+                                         max_workers=parsed_args.max_workers)
+        except heat.PrepareStacksError as ex:
+            LOG.error("Failed to prepare Heat stacks: %s", ex)
+            sys.exit(1)
+        for name in stacks:
+            print(name)
@@ -17,6 +17,7 @@ import json
 import os
 import inspect
 import sys
+import threading
 import typing
 
 import fixtures
@@ -481,6 +482,8 @@ class FixtureManager:
 
     def __init__(self):
         self.fixtures: typing.Dict[str, F] = {}
+        # fixture initialization could require other fixtures
+        self._lock = threading.RLock()
 
     def get_fixture(self,
                     obj: FixtureType,
@@ -489,16 +492,17 @@ class FixtureManager:
         name, obj = get_name_and_object(obj)
         if fixture_id:
             name += f'-{fixture_id}'
-        try:
-            return self.fixtures[name]
-        except KeyError:
-            fixture: F = self.init_fixture(obj=obj,
-                                           name=name,
-                                           fixture_id=fixture_id,
-                                           **kwargs)
-            assert isinstance(fixture, fixtures.Fixture)
-            self.fixtures[name] = fixture
-            return fixture
+        with self._lock:
+            try:
+                return self.fixtures[name]
+            except KeyError:
+                fixture: F = self.init_fixture(obj=obj,
+                                               name=name,
+                                               fixture_id=fixture_id,
+                                               **kwargs)
+                assert isinstance(fixture, fixtures.Fixture)
+                self.fixtures[name] = fixture
+                return fixture
 
     def init_fixture(self, obj: typing.Union[typing.Type[F], F],
                      name: str,
@@ -532,6 +536,8 @@ def fixture_manager(obj: FixtureType,
 
 FIXTURES = FixtureManager()
 
+_SETUP_LOCKS_LOCK = threading.Lock()
+
 
 class SharedFixture(fixtures.Fixture):
     """Base class for fixtures intended to be shared between multiple tests
@@ -581,10 +587,21 @@ class SharedFixture(fixtures.Fixture):
 
         """
         if not self._setup_executed:
-            LOG.debug('Set up fixture %r', self.fixture_name)
-            super(SharedFixture, self).setUp()
-            self._cleanup_executed = False
-            self._setup_executed = True
+            with self._get_setup_lock():
+                if not self._setup_executed:
+                    LOG.debug('Set up fixture %r', self.fixture_name)
+                    super(SharedFixture, self).setUp()
+                    self._cleanup_executed = False
+                    self._setup_executed = True
+
+    def _get_setup_lock(self) -> threading.RLock:
+        # it allows to set up the fixture only once when it is required by
+        # more threads at the same time
+        with _SETUP_LOCKS_LOCK:
+            lock = self.__dict__.get('_setup_lock')
+            if lock is None:
+                self._setup_lock = lock = threading.RLock()
+            return lock
 
     def cleanUp(self, raise_first=True):
         """Executes registered cleanups if any"""
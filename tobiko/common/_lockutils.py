@@ -18,6 +18,8 @@ from __future__ import absolute_import
 import contextlib
 import functools
 import os
+import threading
+import typing
 
 from oslo_concurrency import lockutils
 from oslo_log import log
@@ -31,18 +33,19 @@ LOG = log.getLogger(__name__)
 def interworker_synched(name):
     """Re-definition of oslo_concurrency.lockutils.synchronized.
 
-    Tobiko needs to re-difine this decorator in order to avoid intra-
-    process/worker locks. This is because tobiko is executed in multiple
-    processes (using pytest), but each process only runs one thread.
+    Tobiko needs to re-difine this decorator in order to use reentrant
+    intra-process/worker locks. This is because tobiko is executed in
+    multiple processes (using pytest), and some processes run more threads
+    (for example to set up stacks concurrently).
 
-    The intra-process lock should not be applied in tobiko because some of the
-    locked methods could be called recurrently.
+    The intra-process lock has to be reentrant because some of the locked
+    methods could be called recurrently by the same thread.
     Example:
     The creation (setup_fixture) of CirrosPeerServerStackFixture depends on the
     creation of CirrosServerStackFixture, which is also its parent class.
-    With intra-process locks, the creation of CirrosServerStackFixture could
-    not be started (would be locked by the creation of
-    CirrosPeerServerStackFixture).
+    With non reentrant intra-process locks, the creation of
+    CirrosServerStackFixture could not be started (would be locked by the
+    creation of CirrosPeerServerStackFixture).
     """
 
     def wrap(f):
@@ -81,11 +84,52 @@ def interworker_synched(name):
     return wrap
 
 
+class ThreadLock:
+    """Reentrant intra-process lock owning the inter-worker lock"""
+
+    def __init__(self):
+        self.rlock = threading.RLock()
+        # times the lock has been entered by the thread owning it
+        self.depth = 0
+
+
+_THREAD_LOCKS: typing.Dict[str, ThreadLock] = {}
+_THREAD_LOCKS_LOCK = threading.Lock()
+
+
+def get_thread_lock(name: str) -> ThreadLock:
+    with _THREAD_LOCKS_LOCK:
+        thread_lock = _THREAD_LOCKS.get(name)
+        if thread_lock is None:
+            _THREAD_LOCKS[name] = thread_lock = ThreadLock()
+        return thread_lock
+
+
 @contextlib.contextmanager
 def lock(name):
-    """Re-definition of oslo_concurrency.lockutils.lock that does not apply
-    intra-worker locks. Only inter-worker locks are applied.
+    """Re-definition of oslo_concurrency.lockutils.lock that applies
+    inter-worker locks and reentrant intra-worker locks.
+
+    File locks are owned by processes, so only the outermost call of the
+    thread holding the intra-worker lock acquires and releases the
+    inter-worker lock.
     """
+    thread_lock = get_thread_lock(name)
+    with thread_lock.rlock:
+        thread_lock.depth += 1
+        try:
+            if thread_lock.depth > 1:
+                # recurrent call: inter-worker lock is already acquired
+                yield None
+            else:
+                with external_lock(name) as ext_lock:
+                    yield ext_lock
+        finally:
+            thread_lock.depth -= 1
+
+
+@contextlib.contextmanager
+def external_lock(name):
     from tobiko import config
     lock_path = os.path.expanduser(config.CONF.tobiko.common.lock_dir)
 
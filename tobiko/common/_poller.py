@@ -0,0 +1,264 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import collections
+from concurrent import futures
+import threading
+import typing
+
+from oslo_log import log
+
+from tobiko.common import _retry
+from tobiko.common import _time
+
+
+LOG = log.getLogger(__name__)
+
+DEFAULT_INTERVAL = 3.
+MIN_INTERVAL = 1.
+BACKOFF = 1.5
+
+
+class WaitForObjectTimeout(_retry.RetryTimeLimitError):
+    message = ("{kind} '{object_id}' didn't get to expected condition after "
+               "{timeout} seconds (last value: {last_value!r})")
+
+
+def get_object_id(obj) -> str:
+    return obj['id']
+
+
+class PollingKind(typing.NamedTuple):
+    """How to get objects of a kind of resource
+
+    :param name: name of the kind, used for logging
+    :param get_object: called as get_object(object_id, **params) to get
+        a single object
+    :param list_objects: when given, all objects of this kind watched
+        without extra parameters are got by calling it only once
+    :param get_id: returns the ID of a listed object
+    """
+    name: str
+    get_object: typing.Callable[..., typing.Any]
+    list_objects: typing.Optional[
+        typing.Callable[[], typing.Iterable[typing.Any]]] = None
+    get_id: typing.Callable[[typing.Any], str] = get_object_id
+
+
+ObjectPredicate = typing.Callable[[typing.Any], bool]
+
+
+class ObjectWatch:
+
+    def __init__(self,
+                 kind: PollingKind,
+                 object_id: str,
+                 predicate: ObjectPredicate,
+                 params: typing.Dict[str, typing.Any],
+                 timeout: _time.Seconds,
+                 interval: float,
+                 backoff: float):
+        self.kind = kind
+        self.object_id = object_id
+        self.predicate = predicate
+        self.params = params
+        self.timeout = timeout
+        self.max_interval = interval
+        self.interval = min(MIN_INTERVAL, interval)
+        self.backoff = backoff
+        self.future: futures.Future = futures.Future()
+        self.next_poll = _time.time()
+        self.deadline: typing.Optional[float] = None
+        if timeout is not None:
+            self.deadline = self.next_poll + timeout
+        self.last_value: typing.Any = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.kind.name} {self.object_id}>"
+
+    @property
+    def batched(self) -> bool:
+        return self.kind.list_objects is not None and not self.params
+
+    def get_object(self):
+        try:
+            value = self.kind.get_object(self.object_id, **self.params)
+        except Exception as ex:
+            self.future.set_exception(ex)
+        else:
+            self.update(value)
+
+    def update(self, value):
+        self.last_value = value
+        try:
+            if self.predicate(value):
+                self.future.set_result(value)
+                return
+        except Exception as ex:
+            self.future.set_exception(ex)
+            return
+
+        now = _time.time()
+        if self.deadline is not None and now >= self.deadline:
+            self.future.set_exception(WaitForObjectTimeout(
+                kind=self.kind.name, object_id=self.object_id,
+                timeout=self.timeout, last_value=value))
+            return
+
+        # Poll fast at first, then slower and slower
+        self.next_poll = now + self.interval
+        self.interval = min(self.interval * self.backoff, self.max_interval)
+        LOG.debug(f"Waiting for {self.kind.name} '{self.object_id}' "
+                  f"(next check in {self.next_poll - now:.1f} seconds)")
+
+
+class StatusPoller:
+    """Checks conditions on many objects from a background thread
+
+    Every registered watch gets a future that is resolved with the object
+    once the predicate returns true for it. When the predicate raises an
+    exception, or the object can't be got, or the timeout expires, the
+    exception is set to the future instead. The thread terminates as soon
+    as there are no more objects to watch.
+    """
+
+    def __init__(self, backoff: float = BACKOFF):
+        self.backoff = backoff
+        self._watches: typing.List[ObjectWatch] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def watch(self,
+              kind: PollingKind,
+              object_id: str,
+              predicate: ObjectPredicate,
+              timeout: _time.Seconds = None,
+              interval: _time.Seconds = None,
+              **params) -> futures.Future:
+        watch = ObjectWatch(kind=kind,
+                            object_id=object_id,
+                            predicate=predicate,
+                            params=params,
+                            timeout=_time.to_seconds(timeout),
+                            interval=(_time.to_seconds(interval) or
+                                      DEFAULT_INTERVAL),
+                            backoff=self.backoff)
+        with self._lock:
+            self._watches.append(watch)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='tobiko-status-poller',
+                                                daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        return watch.future
+
+    def _run(self):
+        while True:
+            with self._lock:
+                self._watches = [watch for watch in self._watches
+                                 if not watch.future.done()]
+                if not self._watches:
+                    self._thread = None
+                    return
+                due = self._select_due_watches()
+                self._wakeup.clear()
+            if due:
+                self.poll(due)
+            with self._lock:
+                next_poll = min((watch.next_poll
+                                 for watch in self._watches
+                                 if not watch.future.done()), default=0.)
+            self._wakeup.wait(max(0., next_poll - _time.time()))
+
+    def _select_due_watches(self) -> typing.List[ObjectWatch]:
+        now = _time.time()
+        due = [watch for watch in self._watches if watch.next_poll <= now]
+        # all objects of a kind are got with a single list call anyway
+        batched_kinds = set(watch.kind for watch in due if watch.batched)
+        due += [watch for watch in self._watches
+                if (watch.next_poll > now and watch.batched and
+                    watch.kind in batched_kinds)]
+        return due
+
+    @staticmethod
+    def poll(watches: typing.List[ObjectWatch]):
+        batches: typing.Dict[PollingKind, typing.List[ObjectWatch]] = (
+            collections.defaultdict(list))
+        for watch in watches:
+            if watch.batched:
+                batches[watch.kind].append(watch)
+            else:
+                watch.get_object()
+
+        for kind, kind_watches in batches.items():
+            assert kind.list_objects is not None
+            try:
+                objects = {kind.get_id(obj): obj
+                           for obj in kind.list_objects()}
+            except Exception:
+                LOG.exception(f"Error listing {kind.name} objects")
+                objects = {}
+            for watch in kind_watches:
+                obj = objects.get(watch.object_id)
+                if obj is None:
+                    # let get_object report what is wrong with it
+                    watch.get_object()
+                else:
+                    watch.update(obj)
+
+
+STATUS_POLLER = StatusPoller()
+
+
+def watch_object(kind: PollingKind,
+                 object_id: str,
+                 predicate: ObjectPredicate,
+                 timeout: _time.Seconds = None,
+                 interval: _time.Seconds = None,
+                 **params) -> futures.Future:
+    """Get a future resolved once predicate returns true for the object"""
+    return STATUS_POLLER.watch(kind=kind,
+                               object_id=object_id,
+                               predicate=predicate,
+                               timeout=timeout,
+                               interval=interval,
+                               **params)
+
+
+def wait_for_object(kind: PollingKind,
+                    object_id: str,
+                    predicate: ObjectPredicate,
+                    timeout: _time.Seconds = None,
+                    interval: _time.Seconds = None,
+                    **params) -> typing.Any:
+    """Wait until predicate returns true for the object and return it"""
+    return watch_object(kind=kind,
+                        object_id=object_id,
+                        predicate=predicate,
+                        timeout=timeout,
+                        interval=interval,
+                        **params).result()
+
+
+def wait_for_futures(watched: typing.Iterable[futures.Future]) \
+        -> typing.List[typing.Any]:
+    """Wait for all futures, raising the first error found"""
+    # start watching all objects before waiting for any of them
+    watched = list(watched)
+    return [future.result() for future in watched]
@@ -16,6 +16,7 @@ from __future__ import absolute_import
 import dbm
 import os
 import shelve
+import typing
 
 from oslo_log import log
 
@@ -37,11 +38,13 @@ def get_shelf_path(shelf):
     return os.path.join(get_shelves_dir(), shelf)
 
 
-def addme_to_shared_resource(shelf, resource):
+def addme_to_shared_resource(shelf, resource,
+                             testcase_id: typing.Optional[str] = None):
     shelf_path = get_shelf_path(shelf)
     # this is needed for unit tests
     resource = str(resource)
-    testcase_id = tobiko.get_test_case().id()
+    if testcase_id is None:
+        testcase_id = tobiko.get_test_case().id()
     for attempt in tobiko.retry(timeout=10.0,
                                 interval=0.5):
         try:
@@ -59,11 +62,40 @@ def addme_to_shared_resource(shelf, resource):
                 raise
 
 
-def removeme_from_shared_resource(shelf, resource):
+def lease_shared_resource(shelf, resource):
+    """Add current test case to a resource users only if it has no others
+
+    :returns: True when the resource is used only by current test case
+    """
     shelf_path = get_shelf_path(shelf)
     # this is needed for unit tests
     resource = str(resource)
     testcase_id = tobiko.get_test_case().id()
+    # reading and writing the shelf has to be atomic between workers
+    with tobiko.interworker_lock(f'shelf_{shelf}'):
+        for attempt in tobiko.retry(timeout=10.0,
+                                    interval=0.5):
+            try:
+                with shelve.open(shelf_path) as db:
+                    users = db.get(resource) or set()
+                    if users - {testcase_id}:
+                        return False
+                    db[resource] = users | {testcase_id}
+                    return True
+            except dbm.error:
+                LOG.exception(f"Error accessing shelf {shelf}")
+                if attempt.is_last:
+                    raise
+    raise RuntimeError('Broken retry loop')
+
+
+def removeme_from_shared_resource(shelf, resource,
+                                  testcase_id: typing.Optional[str] = None):
+    shelf_path = get_shelf_path(shelf)
+    # this is needed for unit tests
+    resource = str(resource)
+    if testcase_id is None:
+        testcase_id = tobiko.get_test_case().id()
     for attempt in tobiko.retry(timeout=10.0,
                                 interval=0.5):
         try:
@@ -81,6 +113,23 @@ def removeme_from_shared_resource(shelf, resource):
                 raise
 
 
+def get_shared_resource_users(shelf, resource) -> typing.Set[str]:
+    """Get the test cases using a resource without changing the shelf"""
+    shelf_path = get_shelf_path(shelf)
+    # this is needed for unit tests
+    resource = str(resource)
+    for attempt in tobiko.retry(timeout=10.0,
+                                interval=0.5):
+        try:
+            with shelve.open(shelf_path) as db:
+                return set(db.get(resource) or ())
+        except dbm.error:
+            LOG.exception(f"Error accessing shelf {shelf}")
+            if attempt.is_last:
+                raise
+    raise RuntimeError('Broken retry loop')
+
+
 def remove_test_from_shelf_resources(testcase_id, shelf):
     shelf_path = get_shelf_path(shelf)
     for attempt in tobiko.retry(timeout=10.0,
@@ -15,10 +15,18 @@ from __future__ import absolute_import
 
 import yaml
 
+# libyaml based classes are much faster than pure Python ones
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper  # type: ignore
+    from yaml import SafeLoader  # type: ignore
+
 
 def load_yaml(stream):
-    return yaml.safe_load(stream)
+    return yaml.load(stream, Loader=SafeLoader)
 
 
 def dump_yaml(data, stream=None, **kwargs):
-    return yaml.safe_dump(data, stream=stream, **kwargs)
+    return yaml.dump(data, stream=stream, Dumper=SafeDumper, **kwargs)
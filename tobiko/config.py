@@ -94,6 +94,23 @@ COMMON_OPTIONS = [
     cfg.StrOpt('lock_dir',
                default='~/.tobiko/cache/lock',
                help="Directory where lock persistent files will be saved"),
+    cfg.StrOpt('log_cursors_dir',
+               default='~/.tobiko/cache/log_cursors',
+               help=("Directory where the read positions of the background "
+                     "processes log files are saved. Unlike shelves, it is "
+                     "not cleaned up when a new test run starts")),
+    cfg.FloatOpt('api_cache_ttl',
+                 default=10.,
+                 help=("Seconds the results of OpenStack list and get "
+                       "calls are cached for. Cached results about a "
+                       "resource are discarded as soon as tobiko changes "
+                       "it. Status waiters and health checks always get "
+                       "fresh results. Set it to zero to disable the "
+                       "cache")),
+    cfg.IntOpt('api_cache_size',
+               default=256,
+               help=("Maximum number of results cached for every "
+                     "OpenStack client")),
 ]
 
 
@@ -0,0 +1,9 @@
+
+from tobiko.openstack import _cache
+
+
+ApiCache = _cache.ApiCache
+ApiCacheStats = _cache.ApiCacheStats
+api_cache_disabled = _cache.api_cache_disabled
+get_api_cache_stats = _cache.get_api_cache_stats
+invalidate_api_caches = _cache.invalidate_api_caches
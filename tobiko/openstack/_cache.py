@@ -0,0 +1,298 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import collections
+import contextlib
+import functools
+import itertools
+import re
+import threading
+import typing
+import weakref
+
+from oslo_log import log
+
+import tobiko
+
+
+LOG = log.getLogger(__name__)
+
+# Mutating any of these resources could change any other one
+INVALIDATES_ALL = frozenset(['stack'])
+
+# Other resources that are changed as a side effect of mutating a resource
+RELATED_RESOURCES: typing.Dict[str, typing.FrozenSet[str]] = {
+    'interface_router': frozenset(['port', 'router', 'subnet']),
+    'gateway_router': frozenset(['port', 'router']),
+    'network': frozenset(['port', 'subnet']),
+    'router': frozenset(['port']),
+    'server': frozenset(['hypervisor', 'port', 'floatingip']),
+    'service': frozenset(['hypervisor']),
+    'subnet': frozenset(['port']),
+}
+
+NEUTRON_METHOD_REGEX = re.compile(
+    r'^(list|show|create|update|delete|add|remove|insert|replace|'
+    r'associate|disassociate)_(\w+)$')
+
+# Read-only methods of client managers
+MANAGER_CACHED_METHODS = frozenset(['get', 'list'])
+
+MANAGER_MUTATING_METHOD_REGEX = re.compile(
+    r'^(create|update|delete|add|remove|set|unset|enable|disable|force|'
+    r'reset)')
+
+
+class ApiCacheStats(typing.NamedTuple):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+class ApiCacheEntry(typing.NamedTuple):
+    resource: str
+    expires: float
+    value: typing.Any
+
+
+class ApiCache:
+    """Read-through cache for the results of OpenStack read-only calls
+
+    Results are kept for ttl seconds, up to max_size of them, discarding
+    the least recently used one first. All results about a resource type
+    are discarded as soon as a call mutating that resource is made
+    through any client having a cache.
+    """
+
+    def __init__(self, name: str, ttl: float, max_size: int):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: typing.OrderedDict[typing.Any, ApiCacheEntry] = (
+            collections.OrderedDict())
+        self._lock = threading.Lock()
+        self._stats = ApiCacheStats()
+        API_CACHES.add(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.name}>"
+
+    @property
+    def stats(self) -> ApiCacheStats:
+        with self._lock:
+            return self._stats._replace(size=len(self._entries))
+
+    def _count(self, **increments):
+        self._stats = self._stats._replace(
+            **{field: getattr(self._stats, field) + increment
+               for field, increment in increments.items()})
+
+    def call(self, resource: str, method: typing.Callable, *args, **kwargs):
+        key = (resource, method.__name__, repr(args),
+               repr(sorted(kwargs.items())))
+        if not is_api_cache_disabled():
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry.expires > tobiko.time():
+                    self._entries.move_to_end(key)
+                    self._count(hits=1)
+                    return copy_result(entry.value)
+                self._count(misses=1)
+
+        value = method(*args, **kwargs)
+        with self._lock:
+            self._entries[key] = ApiCacheEntry(
+                resource=resource,
+                expires=tobiko.time() + self.ttl,
+                value=value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._count(evictions=1)
+        return copy_result(value)
+
+    def invalidate(self, resources: typing.Iterable[str] = None):
+        with self._lock:
+            if resources is None:
+                keys = list(self._entries)
+            else:
+                resources = set(resources)
+                keys = [key for key, entry in self._entries.items()
+                        if entry.resource in resources]
+            for key in keys:
+                del self._entries[key]
+            self._count(invalidations=len(keys))
+
+
+API_CACHES: 'weakref.WeakSet[ApiCache]' = weakref.WeakSet()
+
+_DISABLED = threading.local()
+
+
+@contextlib.contextmanager
+def api_cache_disabled(disabled: bool = True):
+    """Make calls done by current thread always get fresh results
+
+    Fresh results are cached again for next calls. Status waiters and
+    health checks use it (via the cached=False parameter of the list and
+    get helpers) as cloud services can change status behind tobiko back.
+
+    :param disabled: when false the cache is used as usual
+    """
+    previous = getattr(_DISABLED, 'value', False)
+    _DISABLED.value = previous or disabled
+    try:
+        yield
+    finally:
+        _DISABLED.value = previous
+
+
+def is_api_cache_disabled() -> bool:
+    return getattr(_DISABLED, 'value', False)
+
+
+def invalidate_api_caches(resource: str = None):
+    """Discard cached results about resources changed by mutating resource
+    """
+    resources: typing.Optional[typing.Set[str]] = None
+    if resource is not None and resource not in INVALIDATES_ALL:
+        resources = {resource}
+        resources.update(RELATED_RESOURCES.get(resource, []))
+    LOG.debug(f"Invalidate cached results about {resources or 'anything'}")
+    for cache in list(API_CACHES):
+        cache.invalidate(resources)
+
+
+def get_api_cache_stats() -> ApiCacheStats:
+    """Get the counters of all caches added together"""
+    all_stats = [cache.stats for cache in list(API_CACHES)]
+    return ApiCacheStats(*[sum(values) for values in zip(*all_stats)])
+
+
+def copy_result(value):
+    """Copy plain containers so that callers can't change cached values"""
+    if isinstance(value, dict):
+        return {k: copy_result(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_result(v) for v in value]
+    return value
+
+
+def get_resource_name(name: str) -> str:
+    if name.endswith('ies'):
+        return name[:-3] + 'y'
+    if name.endswith('s') and not name.endswith('ss'):
+        return name[:-1]
+    return name
+
+
+def cached_method(cache: ApiCache, resource: str, method: typing.Callable):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        return cache.call(resource, method, *args, **kwargs)
+    return wrapper
+
+
+def cached_neutron_list_method(cache: ApiCache,
+                               resource: str,
+                               method: typing.Callable):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if not kwargs.get('retrieve_all', True):
+            # pages are requested while the caller iterates over them
+            return method(*args, **kwargs)
+        return cache.call(resource, method, *args, **kwargs)
+    return wrapper
+
+
+def invalidating_method(resource: str, method: typing.Callable):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            invalidate_api_caches(resource)
+    return wrapper
+
+
+def get_api_cache(name: str) -> typing.Optional[ApiCache]:
+    conf = tobiko.tobiko_config().common
+    if conf.api_cache_ttl <= 0.:
+        return None
+    return ApiCache(name=name,
+                    ttl=conf.api_cache_ttl,
+                    max_size=conf.api_cache_size)
+
+
+def setup_neutron_client_cache(client) -> typing.Optional[ApiCache]:
+    """Cache list_* and show_* calls and invalidate them on mutating calls
+    """
+    cache = get_api_cache('neutron')
+    if cache is None:
+        return None
+    for name in dir(type(client)):
+        match = NEUTRON_METHOD_REGEX.match(name)
+        if match is None or name.endswith('_ext'):
+            continue
+        verb, resource = match.groups()
+        resource = get_resource_name(resource)
+        method = getattr(client, name)
+        if verb == 'list':
+            method = cached_neutron_list_method(cache, resource, method)
+        elif verb == 'show':
+            method = cached_method(cache, resource, method)
+        else:
+            method = invalidating_method(resource, method)
+        setattr(client, name, method)
+    return cache
+
+
+def setup_managers_cache(name: str,
+                         client,
+                         cached_managers: typing.Iterable[str] = (),
+                         mutating_managers: typing.Iterable[str] = ()) \
+        -> typing.Optional[ApiCache]:
+    """Cache list and get calls of given client managers
+
+    Methods whose names start with a mutating verb (like create or delete)
+    invalidate the cached results about the managed resource. Only
+    invalidation is set up for mutating_managers, as their resources
+    (like servers or stacks) change status too often to be cached.
+    """
+    cache = get_api_cache(name)
+    if cache is None:
+        return None
+    cached_managers = tuple(cached_managers)
+    for manager_name in itertools.chain(cached_managers, mutating_managers):
+        manager = getattr(client, manager_name, None)
+        if manager is None:
+            continue
+        resource = get_resource_name(manager_name)
+        for method_name in dir(type(manager)):
+            if (method_name in MANAGER_CACHED_METHODS and
+                    manager_name in cached_managers):
+                method = cached_method(cache, resource,
+                                       getattr(manager, method_name))
+            elif MANAGER_MUTATING_METHOD_REGEX.match(method_name):
+                method = invalidating_method(
+                    resource, getattr(manager, method_name))
+            else:
+                continue
+            setattr(manager, method_name, method)
+    return cache
@@ -14,19 +14,25 @@
 from __future__ import absolute_import
 
 import abc
+import typing
 
 from oslo_log import log
 
 import tobiko
+from tobiko.openstack import _cache
 
 
 LOG = log.getLogger(__name__)
 
+# Number of resources got with every request by paginated list functions
+DEFAULT_PAGE_SIZE = 500
+
 
 class OpenstackClientFixture(tobiko.SharedFixture):
 
     client = None
     session = None
+    api_cache: typing.Optional[_cache.ApiCache] = None
 
     def __init__(self, session=None, client=None):
         super(OpenstackClientFixture, self).__init__()
@@ -43,8 +49,14 @@ class OpenstackClientFixture(tobiko.SharedFixture):
         if not client:
             self.session = session = self.get_session()
             self.client = client = self.init_client(session=session)
+            self.api_cache = self.setup_api_cache(client)
         return client
 
+    def setup_api_cache(self, client) -> typing.Optional[_cache.ApiCache]:
+        # pylint: disable=unused-argument
+        """Override it to cache the results of read-only calls"""
+        return None
+
     def get_session(self):
         from tobiko.openstack import keystone
         return keystone.keystone_session(self.session)
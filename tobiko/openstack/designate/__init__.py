@@ -29,6 +29,7 @@ get_recordset = _client.get_recordset
 
 # Waiters
 wait_for_status = _client.wait_for_status
+watch_status = _client.watch_status
 
 # Constants
 STATUS = _constants.STATUS
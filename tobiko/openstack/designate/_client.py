@@ -15,6 +15,7 @@ from __future__ import absolute_import
 
 import typing
 from collections import abc
+from concurrent import futures
 
 from oslo_log import log
 from designateclient.v2 import client
@@ -107,6 +108,27 @@ def get_recordset(zone_id: str, recordset_id: str):
         zone=zone_id, recordset=recordset_id)
 
 
+def watch_status(status_key, status, get_client, object_id,
+                 interval: tobiko.Seconds = None,
+                 timeout: tobiko.Seconds = None,
+                 **kwargs) -> futures.Future:
+    """Get a future resolved once the object reaches a specific status"""
+    kind = tobiko.PollingKind(name=get_client.__name__,
+                              get_object=get_client)
+
+    def has_status(response) -> bool:
+        LOG.debug(f"{kind.name} '{object_id}' {status_key} is "
+                  f"'{response[status_key]}' (waiting for '{status}')")
+        return response[status_key] == status
+
+    return tobiko.watch_object(kind=kind,
+                               object_id=object_id,
+                               predicate=has_status,
+                               timeout=300. if timeout is None else timeout,
+                               interval=3. if interval is None else interval,
+                               **kwargs)
+
+
 def wait_for_status(status_key, status, get_client, object_id,
                     interval: tobiko.Seconds = None,
                     timeout: tobiko.Seconds = None,
@@ -121,20 +143,15 @@ def wait_for_status(status_key, status, get_client, object_id,
     :param object_id: The id of the object to query.
     :param interval: How often to check the status, in seconds.
     :param timeout: The maximum time, in seconds, to check the status.
-    :raises TimeoutException: The object did not achieve the status or ERROR in
-                              the check_timeout period.
+    :raises tobiko.WaitForObjectTimeout: The object did not achieve the
+                                         status in the timeout period.
     :raises UnexpectedStatusException: The request returned an unexpected
                                        response code.
     """
-    for attempt in tobiko.retry(timeout=timeout,
-                                interval=interval,
-                                default_timeout=300.,
-                                default_interval=3.):
-        response = get_client(object_id, **kwargs)
-        if response[status_key] == status:
-            return response
-
-        attempt.check_limits()
-
-        LOG.debug(f"Waiting for {get_client.__name__} {status_key} to get "
-                  f"from '{response[status_key]}' to '{status}'...")
+    return watch_status(status_key=status_key,
+                        status=status,
+                        get_client=get_client,
+                        object_id=object_id,
+                        interval=interval,
+                        timeout=timeout,
+                        **kwargs).result()
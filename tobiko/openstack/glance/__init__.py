@@ -13,12 +13,24 @@
 #    under the License.
 from __future__ import absolute_import
 
+from tobiko.openstack.glance import _cache
 from tobiko.openstack.glance import _client
+from tobiko.openstack.glance import _download
 from tobiko.openstack.glance import _image
 from tobiko.openstack.glance import _io
 from tobiko.openstack.glance import _lzma
+from tobiko.openstack.glance import _pipeline
 
 
+CachedImageFile = _cache.CachedImageFile
+GlanceImageCache = _cache.GlanceImageCache
+glance_image_cache = _cache.glance_image_cache
+
+DownloadStats = _download.DownloadStats
+ImageDownloader = _download.ImageDownloader
+ImageDownloadError = _download.ImageDownloadError
+download_image_file = _download.download_image_file
+
 glance_client = _client.glance_client
 get_glance_client = _client.get_glance_client
 GlanceClientFixture = _client.GlanceClientFixture
@@ -27,11 +39,24 @@ get_image = _client.get_image
 find_image = _client.find_image
 list_images = _client.list_images
 delete_image = _client.delete_image
+stage_image = _client.stage_image
+import_image = _client.import_image
+get_import_methods = _client.get_import_methods
+get_stores = _client.get_stores
 
 GlanceImageFixture = _image.GlanceImageFixture
 HasImageMixin = _image.HasImageMixin
 UrlGlanceImageFixture = _image.UrlGlanceImageFixture
+UploadGlanceImageFixture = _image.UploadGlanceImageFixture
+GlanceImageImportFailed = _image.GlanceImageImportFailed
+GlanceImageImportTimeout = _image.GlanceImageImportTimeout
+get_image_stores = _image.get_image_stores
 
+get_compression_type = _io.get_compression_type
 open_image_file = _io.open_image_file
 
 has_lzma = _lzma.has_lzma
+
+DecompressionPipeline = _pipeline.DecompressionPipeline
+PipelineStats = _pipeline.PipelineStats
+open_image_pipeline = _pipeline.open_image_pipeline
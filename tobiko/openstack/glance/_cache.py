@@ -0,0 +1,300 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import hashlib
+import json
+import os
+import shutil
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.glance import _io
+from tobiko.openstack.glance import _pipeline
+
+
+LOG = log.getLogger(__name__)
+
+# Size of the buffers used to compute image files digests
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+class CachedImageFile(typing.NamedTuple):
+    path: str
+    sha256: str
+    size: int
+
+
+class GlanceImageCache:
+    """Stores downloaded image files named after their SHA-256 digest
+
+    Every downloaded URL is recorded together with the digest and the size
+    of its content, so that the same URL is never downloaded again and
+    files with the same content are stored only once. The content of a
+    file is verified again against its name every time its modification
+    time changes. Only one tobiko process at a time can download the same
+    URL: the others wait for it and then use its file. Files whose
+    download fails are kept to be resumed by the next download of the
+    same URL.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, 'sha256')
+        self.urls_dir = os.path.join(cache_dir, 'urls')
+        self.hashes_dir = os.path.join(cache_dir, 'hashes')
+        self.decompressed_dir = os.path.join(cache_dir, 'decompressed')
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.cache_dir}>"
+
+    def get_object_file(self, sha256: str) -> str:
+        return os.path.join(self.objects_dir, sha256)
+
+    def get_record_file(self, url: str) -> str:
+        return os.path.join(self.urls_dir, get_text_digest(url) + '.json')
+
+    def get_image_file(self, url: str) -> typing.Optional[CachedImageFile]:
+        """Get the file downloaded from given URL if still valid"""
+        record_file = self.get_record_file(url)
+        record = read_json_file(record_file)
+        if record is None:
+            return None
+        path = self.get_object_file(record['sha256'])
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            LOG.debug(f"Cached image file '{path}' not found")
+            return None
+        if stat.st_size != record['size']:
+            LOG.warning(f"Cached image file '{path}' size mismatch: "
+                        f"{stat.st_size} != {record['size']}")
+            return None
+        if stat.st_mtime_ns != record.get('verified_mtime'):
+            sha256 = get_file_digest(path)
+            if sha256 != record['sha256']:
+                LOG.warning(f"Cached image file '{path}' is corrupted: "
+                            f"SHA-256 digest is '{sha256}'")
+                os.remove(path)
+                return None
+            record['verified_mtime'] = stat.st_mtime_ns
+            write_json_file(record_file, record)
+        return CachedImageFile(path=path,
+                               sha256=record['sha256'],
+                               size=record['size'])
+
+    def fetch_image_file(self,
+                         url: str,
+                         download: typing.Callable[[str], None]) \
+            -> CachedImageFile:
+        """Get the file downloaded from given URL, downloading it if needed
+
+        :param download: function writing the content of the URL to the
+            file whose path it receives
+        """
+        image_file = self.get_image_file(url)
+        if image_file is None:
+            with tobiko.interworker_lock(
+                    f'glance_image_cache_{get_text_digest(url)}'):
+                # another process could have downloaded it in the meantime
+                image_file = self.get_image_file(url)
+                if image_file is None:
+                    image_file = self.add_image_file(url, download)
+        LOG.debug(f"Image URL '{url}' content cached as file "
+                  f"'{image_file.path}' ({image_file.size} bytes)")
+        return image_file
+
+    def add_image_file(self,
+                       url: str,
+                       download: typing.Callable[[str], None]) \
+            -> CachedImageFile:
+        tobiko.makedirs(self.objects_dir)
+        # the same partial file is used every time the same URL is
+        # downloaded, so that an interrupted download can be resumed
+        temp_file = os.path.join(self.objects_dir,
+                                 '.download-' + get_text_digest(url))
+        download(temp_file)
+        sha256 = get_file_digest(temp_file)
+        path = self.get_object_file(sha256)
+        os.replace(temp_file, path)
+        stat = os.stat(path)
+        write_json_file(self.get_record_file(url),
+                        {'url': url,
+                         'sha256': sha256,
+                         'size': stat.st_size,
+                         'verified_mtime': stat.st_mtime_ns})
+        return CachedImageFile(path=path, sha256=sha256, size=stat.st_size)
+
+    def get_data_hash(self,
+                      image_file: str,
+                      algorithm: str,
+                      compression_type: str = None) -> str:
+        """Get the digest of the data uploaded to Glance from given file
+
+        Compressed files are uploaded decompressed, so that the digest is
+        the one Glance computes as image 'os_hash_value'. Digests are
+        stored in the cache until the file changes.
+        """
+        record = self.get_data_record(image_file=image_file,
+                                      compression_type=compression_type,
+                                      algorithms=[algorithm])
+        return record['hashes'][algorithm]
+
+    def get_data_size(self,
+                      image_file: str,
+                      compression_type: str = None) -> int:
+        """Get the size of the data uploaded to Glance from given file"""
+        return self.get_data_record(image_file=image_file,
+                                    compression_type=compression_type)['size']
+
+    def get_data_record(self,
+                        image_file: str,
+                        compression_type: str = None,
+                        algorithms: typing.Iterable[str] = ()) \
+            -> typing.Dict[str, typing.Any]:
+        """Get the size and the digests of the data of given file
+
+        The file is decompressed only when something is missing from the
+        record of the file, and then all missing digests are computed
+        together.
+        """
+        image_file = os.path.realpath(image_file)
+        record_file = os.path.join(
+            self.hashes_dir,
+            get_data_key(image_file, compression_type) + '.json')
+        record = read_json_file(record_file) or {}
+        hashes = record.get('hashes', {})
+        missing = [algorithm
+                   for algorithm in algorithms
+                   if algorithm not in hashes]
+        if 'size' in record and not missing:
+            return record
+        digests = {algorithm: hashlib.new(algorithm)
+                   for algorithm in missing}
+        size = 0
+        with _pipeline.open_image_pipeline(
+                filename=image_file,
+                compression_type=compression_type) as stream:
+            while True:
+                chunk = stream.read(_pipeline.DEFAULT_BUFFER_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                for digest in digests.values():
+                    digest.update(chunk)
+        hashes.update((algorithm, digest.hexdigest())
+                      for algorithm, digest in digests.items())
+        record = {'file': image_file,
+                  'compression_type': compression_type,
+                  'size': size,
+                  'hashes': hashes}
+        write_json_file(record_file, record)
+        return record
+
+    def get_decompressed_file(self,
+                              image_file: str,
+                              compression_type: str = None) -> str:
+        """Get a flat copy of a compressed file, creating it if needed
+
+        The copy is kept until the compressed file changes, so that it is
+        decompressed only once.
+        """
+        image_file = os.path.realpath(image_file)
+        key = get_data_key(image_file, compression_type)
+        path = os.path.join(self.decompressed_dir, key)
+        if not os.path.isfile(path):
+            with tobiko.interworker_lock(f'glance_image_decompress_{key}'):
+                if not os.path.isfile(path):
+                    add_decompressed_file(image_file=image_file,
+                                          compression_type=compression_type,
+                                          path=path)
+        return path
+
+
+def get_data_key(image_file: str,
+                 compression_type: typing.Optional[str]) -> str:
+    """Get a key changing every time the data of a file changes"""
+    if compression_type is None:
+        compression_type = _io.get_compression_type(image_file)
+    stat = os.stat(image_file)
+    return get_text_digest(f'{image_file}\0{stat.st_size}\0'
+                           f'{stat.st_mtime_ns}\0{compression_type}')
+
+
+def add_decompressed_file(image_file: str,
+                          compression_type: typing.Optional[str],
+                          path: str):
+    LOG.debug(f"Decompressing image file '{image_file}' to '{path}'...")
+    tobiko.makedirs(os.path.dirname(path))
+    temp_file = f'{path}.{os.getpid()}'
+    try:
+        with _pipeline.open_image_pipeline(
+                filename=image_file,
+                compression_type=compression_type) as source:
+            with open(temp_file, 'wb') as destination:
+                shutil.copyfileobj(source, destination,
+                                   _pipeline.DEFAULT_BUFFER_SIZE)
+        os.replace(temp_file, path)
+    except Exception:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+
+
+def get_text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def get_stream_digest(stream: typing.BinaryIO,
+                      algorithm: str = 'sha256') -> str:
+    digest = hashlib.new(algorithm)
+    while True:
+        chunk = stream.read(HASH_BUFFER_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_file_digest(path: str, algorithm: str = 'sha256') -> str:
+    with open(path, 'rb') as stream:
+        return get_stream_digest(stream, algorithm=algorithm)
+
+
+def read_json_file(path: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    try:
+        with open(path) as stream:
+            return json.load(stream)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        LOG.exception(f"Invalid image cache file: '{path}'")
+        return None
+
+
+def write_json_file(path: str, content: typing.Dict[str, typing.Any]):
+    tobiko.makedirs(os.path.dirname(path))
+    temp_file = f'{path}.{os.getpid()}'
+    with open(temp_file, 'w') as stream:
+        json.dump(content, stream)
+    os.replace(temp_file, path)
+
+
+def glance_image_cache(cache_dir: str) -> GlanceImageCache:
+    return GlanceImageCache(
+        cache_dir=os.path.realpath(os.path.expanduser(cache_dir)))
@@ -13,6 +13,8 @@
 #    under the License.
 from __future__ import absolute_import
 
+import typing
+
 from glanceclient.v2 import client as glanceclient
 from glanceclient import exc
 from oslo_log import log
@@ -116,6 +118,33 @@ def upload_image(image_id, image_data, client=None, **params):
         image_id=image_id, image_data=image_data, **params)
 
 
+def stage_image(image_id, image_data, client=None, **params):
+    """Upload image data to the staging area of the interoperable import"""
+    return glance_client(client).images.stage(
+        image_id=image_id, image_data=image_data, **params)
+
+
+def import_image(image_id, method, client=None, **params):
+    """Start the interoperable import of image data using given method"""
+    return glance_client(client).images.image_import(
+        image_id=image_id, method=method, **params)
+
+
+def get_import_methods(client=None) -> typing.List[str]:
+    """Get the names of the image import methods enabled in Glance"""
+    info = glance_client(client).images.get_import_info()
+    return list(info.get('import-methods', {}).get('value', []))
+
+
+def get_stores(client=None) -> typing.List[str]:
+    """Get the IDs of Glance stores (an empty list without multi-store)"""
+    try:
+        info = glance_client(client).images.get_stores_info()
+    except (exc.HTTPNotFound, exc.HTTPBadRequest):
+        return []
+    return [store['id'] for store in info.get('stores', [])]
+
+
 class HasGlanceClientMixin(object):
 
     glance_client = None
@@ -0,0 +1,366 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from concurrent import futures
+import os
+import shutil
+import threading
+import typing
+from urllib import parse
+
+from oslo_log import log
+import requests
+
+import tobiko
+from tobiko.openstack.glance import _cache
+
+
+LOG = log.getLogger(__name__)
+
+# Size of the buffers used to read responses and to copy files
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Size of the segments downloaded with a single request
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+# Maximum number of segments downloaded at the same time
+DEFAULT_MAX_WORKERS = 4
+
+# Seconds to wait before requesting again a segment failed to download
+DEFAULT_RETRY_INTERVAL = 1.
+
+# Seconds to wait for the server to connect or to send data
+DEFAULT_TIMEOUT = 60.
+
+# Number of times a segment download is tried
+DEFAULT_RETRY_COUNT = 3
+
+
+class ImageDownloadError(tobiko.TobikoException):
+    message = "unable to download {url!r}: {reason}"
+
+
+class DownloadStats(typing.NamedTuple):
+    """Describes how a file has been downloaded
+
+    :param downloaded: number of bytes got from the server
+    :param resumed: number of bytes found already downloaded by an
+        interrupted previous download
+    """
+    url: str
+    size: int
+    downloaded: int
+    resumed: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Downloaded bytes per second"""
+        if self.elapsed <= 0.:
+            return 0.
+        return self.downloaded / self.elapsed
+
+
+class DownloadProgress:
+    """Records the segments already written to a partial file
+
+    It is saved to a sidecar file every time a segment is completed, so
+    that an interrupted download can be resumed later. It is valid only
+    for the same URL, remote file size, ETag and segment size.
+    """
+
+    def __init__(self,
+                 path: str,
+                 url: str,
+                 size: int,
+                 etag: typing.Optional[str],
+                 segment_size: int):
+        self.path = path
+        self.header = {'url': url,
+                       'size': size,
+                       'etag': etag,
+                       'segment_size': segment_size}
+        self.done: typing.Set[int] = set()
+        self._lock = threading.Lock()
+
+    def load(self) -> typing.Set[int]:
+        content = _cache.read_json_file(self.path)
+        if content is None:
+            return set()
+        if content.get('header') != self.header:
+            LOG.debug(f"Ignoring outdated download progress file "
+                      f"'{self.path}'")
+            return set()
+        self.done = set(content['done'])
+        return set(self.done)
+
+    def mark_done(self, index: int):
+        with self._lock:
+            self.done.add(index)
+            _cache.write_json_file(self.path,
+                                   {'header': self.header,
+                                    'done': sorted(self.done)})
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ImageDownloader:
+    """Downloads a file with many concurrent HTTP Range requests
+
+    The file is preallocated (as a sparse file) and every segment is
+    written at its offset by its own thread. Completed segments are
+    recorded to a sidecar progress file, so that a later download of the
+    same URL to the same file only gets the missing ones. Servers not
+    accepting Range requests are downloaded with a single request. Local
+    files (file:// URLs) are copied by the kernel with sendfile.
+    """
+
+    def __init__(self,
+                 url: str,
+                 path: str,
+                 max_workers: int = None,
+                 segment_size: int = None,
+                 buffer_size: int = None,
+                 checksum: str = None,
+                 retry_count: int = None,
+                 retry_interval: float = None,
+                 timeout: float = None,
+                 session: requests.Session = None):
+        self.url = url
+        self.path = path
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self.segment_size = segment_size or DEFAULT_SEGMENT_SIZE
+        self.buffer_size = buffer_size or DEFAULT_BUFFER_SIZE
+        self.checksum = checksum
+        self.retry_count = retry_count or DEFAULT_RETRY_COUNT
+        self.retry_interval = retry_interval or DEFAULT_RETRY_INTERVAL
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.session = session or requests.Session()
+        self.progress_file = path + '.progress'
+
+    def download(self) -> DownloadStats:
+        started = tobiko.time()
+        resumed = 0
+        url = parse.urlparse(self.url)
+        if url.scheme == 'file':
+            size = downloaded = copy_file(
+                parse.unquote(url.path), self.path,
+                buffer_size=self.buffer_size)
+        else:
+            size, etag, accept_ranges = self.get_remote_info()
+            if size and accept_ranges:
+                downloaded, resumed = self.download_segments(size=size,
+                                                             etag=etag)
+            else:
+                downloaded = self.download_stream()
+        self.verify(size)
+        stats = DownloadStats(url=self.url,
+                              size=os.path.getsize(self.path),
+                              downloaded=downloaded,
+                              resumed=resumed,
+                              elapsed=tobiko.time() - started)
+        LOG.info(f"Downloaded '{self.url}' to '{self.path}': "
+                 f"{stats.downloaded} bytes in {stats.elapsed:.1f} s "
+                 f"({stats.throughput / 1e6:.1f} MB/s, {stats.resumed} "
+                 "bytes resumed)")
+        return stats
+
+    def get_remote_info(self) \
+            -> typing.Tuple[int, typing.Optional[str], bool]:
+        try:
+            response = self.session.head(self.url,
+                                         allow_redirects=True,
+                                         timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException:
+            LOG.debug(f"Unable to get '{self.url}' headers", exc_info=1)
+            return 0, None, False
+        size = int(response.headers.get('content-length', 0))
+        etag = (response.headers.get('etag') or
+                response.headers.get('last-modified'))
+        accept_ranges = response.headers.get('accept-ranges') == 'bytes'
+        return size, etag, accept_ranges
+
+    def download_segments(self, size: int, etag: typing.Optional[str]) \
+            -> typing.Tuple[int, int]:
+        progress = DownloadProgress(path=self.progress_file,
+                                    url=self.url,
+                                    size=size,
+                                    etag=etag,
+                                    segment_size=self.segment_size)
+        segments = {index: (start, min(start + self.segment_size, size) - 1)
+                    for index, start in enumerate(
+                        range(0, size, self.segment_size))}
+        done: typing.Set[int] = set()
+        if (os.path.isfile(self.path) and
+                os.path.getsize(self.path) == size):
+            done = progress.load()
+        resumed = sum(end - start + 1
+                      for index, (start, end) in segments.items()
+                      if index in done)
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if not done:
+                # it allocates a sparse file without writing anything
+                os.ftruncate(fd, size)
+            self.download_pending_segments(
+                fd=fd,
+                segments={index: segment
+                          for index, segment in segments.items()
+                          if index not in done},
+                progress=progress)
+        finally:
+            os.close(fd)
+        progress.remove()
+        return size - resumed, resumed
+
+    def download_pending_segments(
+            self,
+            fd: int,
+            segments: typing.Dict[int, typing.Tuple[int, int]],
+            progress: DownloadProgress):
+        if not segments:
+            return
+        LOG.debug(f"Downloading {len(segments)} segments of '{self.url}'...")
+        errors: typing.List[Exception] = []
+        max_workers = min(self.max_workers, len(segments))
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            submitted = {executor.submit(self.download_segment,
+                                         fd, start, end): index
+                         for index, (start, end) in segments.items()}
+            for future in futures.as_completed(submitted):
+                try:
+                    future.result()
+                except Exception as ex:
+                    errors.append(ex)
+                else:
+                    progress.mark_done(submitted[future])
+        if errors:
+            raise ImageDownloadError(
+                url=self.url,
+                reason=f"{len(errors)} of {len(segments)} segments "
+                       f"failed: {errors[0]}") from errors[0]
+
+    def download_segment(self, fd: int, start: int, end: int):
+        offset = start
+        for attempt in tobiko.retry(count=self.retry_count,
+                                    interval=self.retry_interval):
+            response: typing.Optional[requests.Response] = None
+            try:
+                response = self.get_range(offset, end)
+                for chunk in response.iter_content(
+                        chunk_size=self.buffer_size):
+                    pwrite_all(fd, chunk, offset)
+                    offset += len(chunk)
+                if offset != end + 1:
+                    raise requests.RequestException(
+                        f"got {offset - start} bytes of {end - start + 1}")
+                return
+            except requests.RequestException:
+                if attempt.is_last:
+                    raise
+                # next request gets only the bytes not written yet
+                LOG.debug(f"Error downloading bytes {offset}-{end} of "
+                          f"'{self.url}'", exc_info=1)
+            finally:
+                if response is not None:
+                    response.close()
+
+    def get_range(self, start: int, end: int) -> requests.Response:
+        response = self.session.get(self.url,
+                                    headers={'Range': f'bytes={start}-{end}'},
+                                    stream=True,
+                                    timeout=self.timeout)
+        if response.status_code != 206:
+            response.close()
+            response.raise_for_status()
+            raise ImageDownloadError(
+                url=self.url,
+                reason=f"unexpected status code {response.status_code} "
+                       "for a Range request")
+        return response
+
+    def download_stream(self) -> int:
+        response = self.session.get(self.url,
+                                    stream=True,
+                                    timeout=self.timeout)
+        try:
+            response.raise_for_status()
+            with open(self.path, 'wb', buffering=0) as stream:
+                for chunk in response.iter_content(
+                        chunk_size=self.buffer_size):
+                    stream.write(chunk)
+        finally:
+            response.close()
+        return os.path.getsize(self.path)
+
+    def verify(self, size: int):
+        actual_size = os.path.getsize(self.path)
+        if size and actual_size != size:
+            raise ImageDownloadError(
+                url=self.url,
+                reason=f"file size mismatch: {actual_size} != {size}")
+        if self.checksum:
+            algorithm, expected = self.checksum.split(':', 1)
+            actual = _cache.get_file_digest(self.path, algorithm=algorithm)
+            if actual != expected.lower():
+                # it must not be resumed
+                os.remove(self.path)
+                raise ImageDownloadError(
+                    url=self.url,
+                    reason=f"{algorithm} checksum mismatch: {actual} != "
+                           f"{expected}")
+
+
+def pwrite_all(fd: int, data: bytes, offset: int):
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def copy_file(source: str, destination: str,
+              buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """Copy a file without passing its content through user space
+
+    :returns: the number of bytes copied
+    """
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset,
+                                   size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            LOG.debug("Unable to copy file with sendfile", exc_info=1)
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+            shutil.copyfileobj(src, dst, buffer_size)
+    return os.path.getsize(destination)
+
+
+def download_image_file(url: str, path: str, **kwargs) -> DownloadStats:
+    return ImageDownloader(url=url, path=path, **kwargs).download()
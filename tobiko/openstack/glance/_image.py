@@ -16,19 +16,20 @@ from __future__ import absolute_import
 import contextlib
 import io
 import os
-import tempfile
 import time
 import typing
 from abc import ABC
 from urllib.parse import urlparse
 
 from oslo_log import log
-import requests
 
 import tobiko
 from tobiko.config import get_bool_env
+from tobiko.openstack.glance import _cache
 from tobiko.openstack.glance import _client
+from tobiko.openstack.glance import _download
 from tobiko.openstack.glance import _io
+from tobiko.openstack.glance import _pipeline
 from tobiko.openstack import keystone
 
 
@@ -93,6 +94,10 @@ class GlanceImageFixture(
     image = None
     wait_interval = 3.
 
+    #: ID of an image with the same data created with another name, used
+    # instead of creating a new one
+    reused_image_id: typing.Optional[str] = None
+
     def __init__(self,
                  image_name: typing.Optional[str] = None,
                  username: typing.Optional[str] = None, password:
@@ -115,6 +120,12 @@ class GlanceImageFixture(
         self.setup_image()
 
     def cleanup_fixture(self):
+        if self.reused_image_id:
+            # the image is owned by somebody else
+            LOG.debug(f"Glance image {self.reused_image_id} not deleted "
+                      f"because it is not named '{self.image_name}'")
+            self.image = self.reused_image_id = None
+            return
         self.delete_image()
 
     def setup_image(self):
@@ -126,6 +137,9 @@ class GlanceImageFixture(
                 image_id=image_id, **params)
         else:
             image = self.find_image(name=self.image_name, default=None)
+            if image is None and self.reused_image_id:
+                image = super(GlanceImageFixture, self).get_image(
+                    image_id=self.reused_image_id, default=None)
         self.image = image
         return image
 
@@ -194,10 +208,29 @@ class UploadGlanceImageFixture(GlanceImageFixture, ABC):
     create_image_retries = None
     tags: typing.List[str] = []
 
+    #: Glance interoperable import method used to send image data instead
+    # of uploading it ('web-download' or 'glance-direct')
+    image_import_method: typing.Optional[str] = None
+
+    #: IDs of the Glance stores the image data has to be in
+    image_import_stores: typing.Optional[typing.List[str]] = None
+
     def __init__(self, disk_format=None, container_format=None, tags=None,
+                 image_import_method=None, image_import_stores=None,
                  **kwargs):
         super(UploadGlanceImageFixture, self).__init__(**kwargs)
 
+        conf = tobiko.tobiko_config().glance
+        if image_import_method:
+            self.image_import_method = image_import_method
+        elif self.image_import_method is None:
+            self.image_import_method = conf.image_import_method or None
+
+        if image_import_stores is not None:
+            self.image_import_stores = list(image_import_stores)
+        elif self.image_import_stores is None:
+            self.image_import_stores = list(conf.image_import_stores)
+
         if container_format:
             self.container_format = container_format
         tobiko.check_valid_type(self.container_format, str)
@@ -234,6 +267,16 @@ class UploadGlanceImageFixture(GlanceImageFixture, ABC):
                     # Cleanup cached objects
                     self.image = image = None
 
+                    image = self.find_image_with_same_data()
+                    if image is not None:
+                        LOG.info(f"Using Glance image '{image.name}' "
+                                 f"(id={image.id}) instead of creating "
+                                 f"image '{self.image_name}': it has the "
+                                 "same data")
+                        self.image = image
+                        self.reused_image_id = image.id
+                        break
+
                     LOG.debug('Creating Glance image %r '
                               '(re-tries left %d)...',
                               self.image_name, retries)
@@ -260,6 +303,9 @@ class UploadGlanceImageFixture(GlanceImageFixture, ABC):
                 # be deleted
                 cleanup_image_ids.remove(image.id)
 
+        if (image and self.image_import_stores and
+                not self.prevent_image_create):
+            image = self.copy_image_to_stores(image)
         return image
 
     @property
@@ -285,8 +331,20 @@ class UploadGlanceImageFixture(GlanceImageFixture, ABC):
                     LOG.exception('Error deleting image %r (%r)',
                                   self.image_name, image_id)
 
+    def find_image_with_same_data(self):
+        """Look for an active image that would have the same data
+
+        :returns: None when no such image is found (or when it is not
+            possible to know the data an image would have)
+        """
+        return None
+
     def upload_image(self):
         self.check_image_status(self.image, {GlanceImageStatus.QUEUED})
+        method = self.get_image_import_method()
+        if method is not None:
+            self.import_image(method)
+            return
         image_data, image_size = self.get_image_data()
         with image_data:
             _client.upload_image(image_id=self.image_id,
@@ -297,6 +355,120 @@ class UploadGlanceImageFixture(GlanceImageFixture, ABC):
     def get_image_data(self):
         raise NotImplementedError
 
+    def get_image_import_uri(self) -> typing.Optional[str]:
+        """Get the URI Glance could download image data from by itself
+
+        :returns: None when image data is only available to tobiko
+        """
+        return None
+
+    def get_image_import_method(self) -> typing.Optional[str]:
+        """Get the import method to be used instead of uploading data
+
+        Method 'web-download' is replaced by 'glance-direct' when Glance
+        can't download image data by itself or when it is not enabled.
+
+        :returns: None when image data has to be uploaded
+        """
+        method = self.image_import_method
+        if not method:
+            return None
+        candidates = [method]
+        if method == WEB_DOWNLOAD_IMPORT_METHOD:
+            if self.get_image_import_uri() is None:
+                LOG.debug(f"Glance can't download image '{self.image_name}' "
+                          "data by itself: staging it instead")
+                candidates = [GLANCE_DIRECT_IMPORT_METHOD]
+            else:
+                candidates.append(GLANCE_DIRECT_IMPORT_METHOD)
+        methods = _client.get_import_methods(client=self.glance_client)
+        for candidate in candidates:
+            if candidate in methods:
+                return candidate
+        LOG.warning(f"Glance image import method '{method}' is not "
+                    f"enabled (enabled methods: {methods}): uploading "
+                    f"image '{self.image_name}' data instead")
+        return None
+
+    def import_image(self, method: str):
+        """Make Glance import image data using interoperable import API"""
+        image_id = self.image_id
+        params: typing.Dict[str, typing.Any] = {}
+        if self.image_import_stores:
+            params.update(stores=self.image_import_stores,
+                          allow_failure=False)
+        if method == WEB_DOWNLOAD_IMPORT_METHOD:
+            params['uri'] = self.get_image_import_uri()
+        else:
+            image_data, image_size = self.get_image_data()
+            with image_data:
+                _client.stage_image(image_id=image_id,
+                                    image_data=image_data,
+                                    image_size=image_size,
+                                    client=self.glance_client)
+            LOG.debug(f"Image '{self.image_name}' data staged")
+        LOG.debug(f"Importing image '{self.image_name}' (id={image_id}) "
+                  f"with method '{method}'...")
+        _client.import_image(image_id=image_id,
+                             method=method,
+                             client=self.glance_client,
+                             **params)
+        self.wait_for_image_imported(image_id=image_id)
+        LOG.debug(f"Image '{self.image_name}' imported")
+
+    def copy_image_to_stores(self, image):
+        """Copy image data to the required stores it is not in yet"""
+        missing = sorted(set(self.image_import_stores or []) -
+                         set(get_image_stores(image)))
+        if not missing:
+            return image
+        LOG.info(f"Copying image '{image.name}' (id={image.id}) to Glance "
+                 f"stores {missing}...")
+        _client.import_image(image_id=image.id,
+                             method=COPY_IMAGE_IMPORT_METHOD,
+                             stores=missing,
+                             allow_failure=False,
+                             client=self.glance_client)
+        return self.wait_for_image_imported(image_id=image.id,
+                                            stores=missing)
+
+    def wait_for_image_imported(self,
+                                image_id: str,
+                                stores: typing.Iterable[str] = (),
+                                timeout: tobiko.Seconds = None):
+        """Wait for Glance to import image data, to all given stores
+
+        Image status is polled every wait_interval seconds. Failed imports
+        are reported by Glance as image properties.
+        """
+        stores = set(stores)
+        conf = tobiko.tobiko_config().glance
+        for attempt in tobiko.retry(
+                timeout=timeout,
+                interval=self.wait_interval,
+                default_timeout=conf.image_import_timeout):
+            image = self.get_image(image_id=image_id)
+            failed = get_image_stores(image, 'os_glance_failed_import')
+            if failed or image.status == GlanceImageStatus.KILLED:
+                raise GlanceImageImportFailed(image_name=self.image_name,
+                                              image_id=image_id,
+                                              status=image.status,
+                                              stores=failed)
+            if (image.status == GlanceImageStatus.ACTIVE and
+                    not get_image_stores(
+                        image, 'os_glance_importing_to_stores') and
+                    stores.issubset(get_image_stores(image))):
+                return image
+            if attempt.is_last:
+                raise GlanceImageImportTimeout(image_name=self.image_name,
+                                               image_id=image_id,
+                                               status=image.status,
+                                               attempt=attempt)
+            LOG.debug(f"Waiting for image '{self.image_name}' "
+                      f"(id={image_id}) to be imported (status="
+                      f"'{image.status}')...")
+        raise RuntimeError('Retry loop broken')
+
 
 class UrlGlanceImageFixture(UploadGlanceImageFixture, ABC):
 
@@ -304,6 +476,8 @@ class UrlGlanceImageFixture(UploadGlanceImageFixture, ABC):
     image_dir: str = ''
     image_file: str = ''
     compression_type: typing.Optional[str] = None
+    # expected digest of the downloaded file, like 'sha256:<hex digest>'
+    image_checksum: typing.Optional[str] = None
 
     def __init__(self,
                  image_url: str = None,
@@ -338,79 +512,126 @@ class UrlGlanceImageFixture(UploadGlanceImageFixture, ABC):
             return os.path.expanduser(self.image_file)
         return os.path.join(self.real_image_dir, self.image_file)
 
-    def get_image_data(self):
+    @property
+    def image_cache(self) -> _cache.GlanceImageCache:
+        return _cache.glance_image_cache(self.real_image_dir)
+
+    def get_image_file(self) -> str:
         real_image_file = self.real_image_file
         # if the file exists, then skip the download part
         if os.path.exists(real_image_file):
-            return self.get_image_from_file(real_image_file)
+            return real_image_file
         # else, download the image
-        return self.get_image_from_url(real_image_file)
+        return self.image_cache.fetch_image_file(
+            url=self.image_url,
+            download=self._download_image_file).path
+
+    def get_image_data(self):
+        return self.get_image_from_file(self.get_image_file())
+
+    def has_local_image_file(self) -> bool:
+        return (os.path.exists(self.real_image_file) or
+                self.image_cache.get_image_file(self.image_url) is not None)
+
+    def get_image_import_uri(self) -> typing.Optional[str]:
+        url = urlparse(self.image_url)
+        if url.scheme not in ['http', 'https']:
+            return None
+        # Glance would import compressed data as it is
+        if self.compression_type or url.path.endswith(
+                tuple(f'.{compression_type}'
+                      for compression_type in _io.COMPRESSED_FILE_TYPES)):
+            return None
+        return self.image_url
+
+    def find_image_with_same_data(self):
+        conf = tobiko.tobiko_config().glance
+        if not conf.reuse_images_with_same_data:
+            return None
+        if (self.image_import_method == WEB_DOWNLOAD_IMPORT_METHOD and
+                self.get_image_import_uri() is not None and
+                not self.has_local_image_file()):
+            # it would require downloading the image Glance is going to
+            # download by itself
+            return None
+        algorithm = conf.image_hash_algorithm
+        data_hash = self.image_cache.get_data_hash(
+            image_file=self.get_image_file(),
+            algorithm=algorithm,
+            compression_type=self.compression_type)
+        client = _client.glance_client(self.glance_client)
+        # images of other projects could be deleted by their owners
+        project_id = keystone.get_project_id(
+            session=client.http_client.session)
+        for image in _client.list_images(client=client,
+                                         os_hash_value=data_hash,
+                                         owner=project_id,
+                                         status=GlanceImageStatus.ACTIVE):
+            if (getattr(image, 'os_hash_algo', None) == algorithm and
+                    getattr(image, 'owner', None) == project_id and
+                    self.has_image_parameters(image)):
+                return image
+        LOG.debug(f"No Glance image found with {algorithm} hash "
+                  f"'{data_hash}'")
+        return None
+
+    def has_image_parameters(self, image) -> bool:
+        """Check the image has the properties this fixture would set"""
+        for name, value in self.create_image_parameters.items():
+            if name in ['client', 'name']:
+                continue
+            actual = getattr(image, name, None)
+            if name == 'tags':
+                if sorted(actual or []) != sorted(value):
+                    return False
+            elif actual != value:
+                return False
+        return True
 
     def get_image_from_file(self, image_file: str):
-        image_size = os.path.getsize(image_file)
+        conf = tobiko.tobiko_config().glance
+        compression_type = (self.compression_type or
+                            _io.get_compression_type(image_file))
+        if compression_type and conf.cache_decompressed_images:
+            image_file = self.image_cache.get_decompressed_file(
+                image_file=image_file, compression_type=compression_type)
+            compression_type = None
+        if compression_type:
+            # data is uploaded while it is decompressed by another thread
+            image_size = self.image_cache.get_data_size(
+                image_file=image_file, compression_type=compression_type)
+            image_data: io.IOBase = _pipeline.open_image_pipeline(
+                filename=image_file,
+                compression_type=compression_type,
+                buffer_size=conf.decompression_buffer_size,
+                queue_size=conf.decompression_queue_size)
+        else:
+            image_size = os.path.getsize(image_file)
+            image_data = open(image_file, 'rb')
         LOG.debug('Uploading image %r data from file %r (%d bytes)',
                   self.image_name, image_file, image_size)
-        image_data = _io.open_image_file(
-            filename=image_file, mode='rb',
-            compression_type=self.compression_type)
         return image_data, image_size
 
-    def get_image_from_url(self, image_file: str):
-        # pylint: disable=missing-timeout
-        http_request = requests.get(self.image_url, stream=True)
-        expected_size = int(http_request.headers.get('content-length', 0))
-        chunks = http_request.iter_content(chunk_size=io.DEFAULT_BUFFER_SIZE)
-        try:
-            http_request.raise_for_status()
-        except requests.exceptions.HTTPError:
-            error_content = b''.join(chunks).decode()
-            LOG.exception("Error getting image file from URL: "
-                          f"{self.image_url}:\n"
-                          f"{error_content}")
-            raise
-
-        download_image = True
-        if expected_size:
-            try:
-                actual_size = os.path.getsize(image_file)
-            except Exception as ex:
-                LOG.debug("Unable to get image %r data from file %r: %s",
-                          self.image_name, image_file, ex)
-            else:
-                if actual_size == expected_size:
-                    LOG.debug("Cached image %r file %r found (%d bytes)",
-                              self.image_name, image_file, actual_size)
-                    download_image = False
-
-        if download_image:
-            LOG.debug("Downloading image %r from URL %r to file %r "
-                      "(%d bytes)", self.image_name, self.image_url,
-                      image_file, expected_size)
-            self._download_image_file(image_file=image_file,
-                                      chunks=chunks,
-                                      expected_size=expected_size)
-        return self.get_image_from_file(image_file=image_file)
-
-    def _download_image_file(self, image_file, chunks, expected_size):
-        image_dir = os.path.dirname(image_file)
-        LOG.debug('Ensure image directory exists: %r', image_dir)
-        tobiko.makedirs(image_dir)
-
-        fd, temp_file = tempfile.mkstemp(dir=image_dir)
-        with io.open(fd, 'wb', io.DEFAULT_BUFFER_SIZE) as image_data:
-            for chunk in chunks:
-                image_data.write(chunk)
-
-        actual_size = os.path.getsize(temp_file)
-        LOG.debug('Downloaded image %r from URL %r to file %r (%d bytes)',
-                  self.image_name, self.image_url, image_file,
-                  actual_size)
-
-        if expected_size and actual_size != expected_size:
-            message = "Download file size mismatch: {!s} != {!r}".format(
-                expected_size, actual_size)
-            raise RuntimeError(message)
-        os.rename(temp_file, image_file)
+    def _download_image_file(self, image_file: str):
+        conf = tobiko.tobiko_config().glance
+        LOG.debug("Downloading image %r from URL %r to file %r",
+                  self.image_name, self.image_url, image_file)
+        _download.download_image_file(
+            url=self.image_url,
+            path=image_file,
+            max_workers=conf.image_download_workers,
+            segment_size=conf.image_download_segment_size,
+            checksum=self.image_checksum)
+
+
+class GlanceImageImportFailed(tobiko.TobikoException):
+    message = ("Failed importing image {image_name!r} (id {image_id!r}, "
+               "status {status!r}) to stores {stores!r}")
+
+
+class GlanceImageImportTimeout(tobiko.TobikoException):
+    message = ("Timed out waiting for image {image_name!r} (id "
+               "{image_id!r}, status {status!r}) to be imported: {attempt}")
 
 
 class InvalidGlanceImageStatus(tobiko.TobikoException):
@@ -441,3 +662,16 @@ GETTING_ACTIVE_STATUS = {GlanceImageStatus.QUEUED,
 
 def is_image_getting_active(image):
     return image and image.status in GETTING_ACTIVE_STATUS
+
+
+WEB_DOWNLOAD_IMPORT_METHOD = 'web-download'
+GLANCE_DIRECT_IMPORT_METHOD = 'glance-direct'
+COPY_IMAGE_IMPORT_METHOD = 'copy-image'
+
+
+def get_image_stores(image, name: str = 'stores') -> typing.List[str]:
+    """Get the list of store IDs of an image comma separated property"""
+    value = getattr(image, name, None) or ''
+    if isinstance(value, str):
+        value = value.split(',')
+    return [store.strip() for store in value if store.strip()]
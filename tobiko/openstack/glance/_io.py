@@ -61,18 +61,26 @@ class ZipFileType(object):
     open_file = zipfile.ZipFile
 
 
+def get_compression_type(filename):
+    """Get the compression type of a file from its magic number
+
+    :returns: None for flat files
+    """
+    max_magic_len = max(len(cls.file_magic)
+                        for cls in COMPRESSED_FILE_TYPES.values())
+    with io.open(filename, 'rb') as f:
+        magic = f.read(max_magic_len)
+    for cls in COMPRESSED_FILE_TYPES.values():
+        if magic.startswith(cls.file_magic):
+            LOG.debug("Compression type %r of file %r got from file magic",
+                      cls.compression_type, filename)
+            return cls.compression_type
+    return None
+
+
 def open_image_file(filename, mode, compression_type=None):
     if compression_type is None:
-        max_magic_len = max(len(cls.file_magic)
-                            for cls in COMPRESSED_FILE_TYPES.values())
-        with io.open(filename, 'rb') as f:
-            magic = f.read(max_magic_len)
-        for cls in COMPRESSED_FILE_TYPES.values():
-            if magic.startswith(cls.file_magic):
-                compression_type = cls.compression_type
-                LOG.debug("Compression type %r of file %r got from file magic",
-                          compression_type, filename)
-                break
+        compression_type = get_compression_type(filename)
 
     if compression_type:
         LOG.debug("Open compressed file %r (mode=%r, compression_type=%r)",
@@ -0,0 +1,185 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import io
+import queue
+import threading
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.glance import _io
+
+
+LOG = log.getLogger(__name__)
+
+# Size of the buffers of decompressed data passed to the reader
+DEFAULT_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Maximum number of buffers decompressed before they are read
+DEFAULT_QUEUE_SIZE = 4
+
+# Seconds the worker waits for a free queue slot before checking the
+# pipeline has not been closed
+PUT_TIMEOUT = .1
+
+
+class PipelineStats(typing.NamedTuple):
+    """Describes how data has been passed through a pipeline
+
+    :param reader_wait: seconds spent by the reader waiting for data (it
+        is the time the reader could have been faster)
+    """
+    size: int
+    elapsed: float
+    reader_wait: float
+
+    @property
+    def throughput(self) -> float:
+        """Read bytes per second"""
+        if self.elapsed <= 0.:
+            return 0.
+        return self.size / self.elapsed
+
+
+class DecompressionPipeline(io.RawIOBase):
+    """Reads an image file decompressed by a worker thread
+
+    The worker thread reads large buffers of decompressed data and puts
+    them into a bounded queue, so that decompressing the file and sending
+    its data (for example to Glance) are done at the same time, while
+    never holding more than queue_size buffers in memory. Decompressors of
+    all supported compression types (zlib, bz2 and lzma) release the GIL,
+    so a thread is enough to use another CPU.
+    """
+
+    def __init__(self,
+                 filename: str,
+                 compression_type: str = None,
+                 buffer_size: int = None,
+                 queue_size: int = None):
+        super().__init__()
+        self.filename = filename
+        self.compression_type = compression_type
+        self.buffer_size = buffer_size or DEFAULT_BUFFER_SIZE
+        self._queue: 'queue.Queue[typing.Any]' = queue.Queue(
+            maxsize=queue_size or DEFAULT_QUEUE_SIZE)
+        self._stop = threading.Event()
+        self._buffer = memoryview(b'')
+        self._eof = False
+        self._size = 0
+        self._reader_wait = 0.
+        self._started = tobiko.time()
+        self._thread = threading.Thread(target=self._produce,
+                                        name=f'decompress-{filename}',
+                                        daemon=True)
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.filename}>"
+
+    @property
+    def stats(self) -> PipelineStats:
+        return PipelineStats(size=self._size,
+                             elapsed=tobiko.time() - self._started,
+                             reader_wait=self._reader_wait)
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: typing.Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            return self.readall()
+        while not self._buffer:
+            if self._eof:
+                return b''
+            self._get_buffer()
+        chunk = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        self._size += len(chunk)
+        return bytes(chunk)
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            # it unblocks the worker waiting for a free slot
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._thread.join()
+        super().close()
+
+    def _get_buffer(self):
+        started = tobiko.time()
+        item = self._queue.get()
+        self._reader_wait += tobiko.time() - started
+        if isinstance(item, Exception):
+            self._eof = True
+            raise item
+        if not item:
+            self._eof = True
+            stats = self.stats
+            LOG.debug(f"Decompressed file '{self.filename}' ({stats.size} "
+                      f"bytes in {stats.elapsed:.1f} s, "
+                      f"{stats.throughput / 1e6:.1f} MB/s, reader waited "
+                      f"{stats.reader_wait:.1f} s)")
+        self._buffer = memoryview(item)
+
+    def _produce(self):
+        try:
+            with _io.open_image_file(
+                    filename=self.filename,
+                    mode='rb',
+                    compression_type=self.compression_type) as stream:
+                while not self._stop.is_set():
+                    chunk = stream.read(self.buffer_size)
+                    if not chunk:
+                        break
+                    self._put(chunk)
+        except Exception as ex:
+            LOG.debug(f"Error decompressing file '{self.filename}'",
+                      exc_info=1)
+            self._put(ex)
+        else:
+            self._put(b'')
+
+    def _put(self, item: typing.Any):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=PUT_TIMEOUT)
+            except queue.Full:
+                continue
+            else:
+                break
+
+
+def open_image_pipeline(filename: str,
+                        compression_type: str = None,
+                        buffer_size: int = None,
+                        queue_size: int = None) -> DecompressionPipeline:
+    return DecompressionPipeline(filename=filename,
+                                 compression_type=compression_type,
+                                 buffer_size=buffer_size,
+                                 queue_size=queue_size)
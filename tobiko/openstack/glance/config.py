@@ -24,6 +24,56 @@ OPTIONS = [
                default='~/.tobiko/cache/glance/images',
                help=("Default directory where to look for image "
                      "files")),
+    cfg.StrOpt('image_hash_algorithm',
+               default='sha512',
+               help=("Algorithm Glance uses to compute images "
+                     "'os_hash_value' (see Glance 'hashing_algorithm' "
+                     "option)")),
+    cfg.BoolOpt('reuse_images_with_same_data',
+                default=False,
+                help=("Use any active image of the same project having "
+                      "the same data (and formats and tags) instead of "
+                      "creating a new one with a different name")),
+    cfg.IntOpt('image_download_workers',
+               default=4,
+               help=("Maximum number of segments of an image file "
+                     "downloaded at the same time (only from servers "
+                     "accepting HTTP Range requests)")),
+    cfg.IntOpt('image_download_segment_size',
+               default=64 * 1024 * 1024,
+               help=("Size in bytes of the segments of an image file "
+                     "downloaded with a single request")),
+    cfg.BoolOpt('cache_decompressed_images',
+                default=False,
+                help=("Keep a decompressed copy of compressed image files "
+                      "in image_dir, so that they are decompressed only "
+                      "once instead of every time they are uploaded")),
+    cfg.IntOpt('decompression_buffer_size',
+               default=4 * 1024 * 1024,
+               help=("Size in bytes of the buffers of decompressed image "
+                     "data passed by the decompressing thread to Glance "
+                     "upload")),
+    cfg.IntOpt('decompression_queue_size',
+               default=4,
+               help=("Maximum number of buffers of image data "
+                     "decompressed before being uploaded")),
+    cfg.StrOpt('image_import_method',
+               default=None,
+               choices=['', 'web-download', 'glance-direct'],
+               help=("Glance interoperable import method used to create "
+                     "images instead of uploading their data. With "
+                     "'web-download' Glance downloads image data from "
+                     "image URL by itself (images that are only available "
+                     "to tobiko are imported with 'glance-direct')")),
+    cfg.ListOpt('image_import_stores',
+                default=[],
+                help=("IDs of the Glance stores (with multi-store enabled) "
+                      "where images data is imported. Existing images are "
+                      "copied to the stores they are missing from")),
+    cfg.FloatOpt('image_import_timeout',
+                 default=1200.,
+                 help=("Seconds to wait for Glance to import or copy "
+                       "image data")),
 ]
 
 
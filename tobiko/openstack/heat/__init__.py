@@ -13,10 +13,16 @@
 #    under the License.
 from __future__ import absolute_import
 
+from tobiko.openstack.heat import _cleanup
 from tobiko.openstack.heat import _client
+from tobiko.openstack.heat import _prepare
 from tobiko.openstack.heat import _template
 from tobiko.openstack.heat import _resource
 from tobiko.openstack.heat import _stack
+from tobiko.openstack.heat import _watcher
+
+cleanup_stacks = _cleanup.cleanup_stacks
+CleanupStacksError = _cleanup.CleanupStacksError
 
 heat_client = _client.heat_client
 default_heat_client = _client.default_heat_client
@@ -25,6 +31,14 @@ HeatClient = _client.HeatClient
 HeatClientFixture = _client.HeatClientFixture
 HeatClientType = _client.HeatClientType
 
+get_stacks_dependencies = _prepare.get_stacks_dependencies
+prepare_stacks = _prepare.prepare_stacks
+validate_stacks = _prepare.validate_stacks
+InvalidStacksError = _prepare.InvalidStacksError
+OutdatedStackError = _prepare.OutdatedStackError
+PrepareStacksError = _prepare.PrepareStacksError
+RequiredStacksNotPrepared = _prepare.RequiredStacksNotPrepared
+
 heat_template = _template.heat_template
 heat_template_file = _template.heat_template_file
 HeatTemplateFixture = _template.HeatTemplateFixture
@@ -38,7 +52,11 @@ list_resources = _resource.list_resources
 StackType = _stack.StackType
 HeatStackFixture = _stack.HeatStackFixture
 HeatStackNotFound = _stack.HeatStackNotFound
+HeatStackUpdateFailed = _stack.HeatStackUpdateFailed
 heat_stack_parameters = _stack.heat_stack_parameters
+get_stack_fingerprint = _stack.get_stack_fingerprint
+find_stack_fingerprint = _stack.find_stack_fingerprint
+FINGERPRINT_TAG_PREFIX = _stack.FINGERPRINT_TAG_PREFIX
 find_stack = _stack.find_stack
 list_stacks = _stack.list_stacks
 INIT_IN_PROGRESS = _stack.INIT_IN_PROGRESS
@@ -49,4 +67,11 @@ CREATE_FAILED = _stack.CREATE_FAILED
 DELETE_IN_PROGRESS = _stack.DELETE_IN_PROGRESS
 DELETE_COMPLETE = _stack.DELETE_COMPLETE
 DELETE_FAILED = _stack.DELETE_FAILED
+UPDATE_IN_PROGRESS = _stack.UPDATE_IN_PROGRESS
+UPDATE_COMPLETE = _stack.UPDATE_COMPLETE
+UPDATE_FAILED = _stack.UPDATE_FAILED
 STACK_CLASSES = _stack.STACK_CLASSES
+
+HeatStackStatusWatcher = _watcher.HeatStackStatusWatcher
+heat_stack_status_watcher = _watcher.heat_stack_status_watcher
+get_stack_failures = _watcher.get_stack_failures
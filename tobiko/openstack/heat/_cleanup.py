@@ -0,0 +1,184 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import contextlib
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.heat import _client
+from tobiko.openstack.heat import _prepare
+from tobiko.openstack.heat import _stack
+from tobiko.openstack.heat import _watcher
+
+
+LOG = log.getLogger(__name__)
+
+
+class CleanupStacksError(tobiko.TobikoException):
+    message = "Unable to delete {failed} of {total} Heat stacks:\n{details}"
+
+
+class StacksCleanup:
+    """Deletes stacks as soon as no other stack being deleted requires them
+
+    All stacks that can be deleted are deleted at the same time, then the
+    status of all of them is got with a single list call per interval.
+    """
+
+    def __init__(self,
+                 fixtures: typing.Dict[str, _stack.HeatStackFixture],
+                 dependencies: typing.Dict[str, typing.Set[str]],
+                 exit_stack: contextlib.ExitStack):
+        self.fixtures = fixtures
+        self.exit_stack = exit_stack
+        # stacks to be deleted before every stack
+        self.dependents: typing.Dict[str, typing.Set[str]] = {
+            name: {other
+                   for other, required in dependencies.items()
+                   if name in required and other in fixtures}
+            for name in fixtures}
+        self.pending = set(fixtures)
+        self.deleting: typing.Dict[
+            str, _watcher.HeatStackStatusWatcher] = {}
+        self.deleted: typing.List[str] = []
+        self.errors: typing.Dict[str, Exception] = {}
+
+    def run(self,
+            timeout: tobiko.Seconds = None,
+            interval: tobiko.Seconds = None):
+        for attempt in tobiko.retry(
+                timeout=timeout,
+                interval=interval,
+                default_timeout=_stack.HeatStackFixture.wait_timeout,
+                default_interval=_stack.HeatStackFixture.wait_interval):
+            self.delete_ready()
+            if not self.deleting:
+                break
+            self.check_deleting(
+                max_age=tobiko.to_seconds_float(attempt.interval))
+            if not (self.pending or self.deleting):
+                break
+            if attempt.is_last:
+                for name in self.deleting:
+                    self.errors[name] = tobiko.RetryTimeLimitError(
+                        attempt=attempt)
+                break
+            LOG.debug(f"Waiting for {len(self.deleting)} Heat stacks to be "
+                      "deleted...")
+
+        # stacks still pending are required by stacks that failed
+        for name in sorted(self.pending):
+            LOG.info(f"Stack '{name}' not deleted because it is required "
+                     "by stacks that can't be deleted")
+
+    def delete_ready(self):
+        for name in sorted(self.pending):
+            dependents = self.dependents[name]
+            if (dependents.intersection(self.pending) or
+                    dependents.intersection(self.deleting) or
+                    dependents.intersection(self.errors)):
+                continue
+            self.pending.remove(name)
+            fixture = self.fixtures[name]
+            try:
+                client = fixture.setup_client()
+                watcher = _watcher.heat_stack_status_watcher(client)
+                self.exit_stack.enter_context(
+                    watcher.watch(fixture.setup_stack_name()))
+                fixture.delete_stack()
+            except Exception as ex:
+                LOG.exception(f"Error deleting stack '{name}'")
+                self.errors[name] = ex
+            else:
+                self.deleting[name] = watcher
+
+    def check_deleting(self, max_age: float):
+        for name, watcher in list(self.deleting.items()):
+            fixture = self.fixtures[name]
+            try:
+                stack = fixture.watch_stack(watcher=watcher, max_age=max_age)
+                if is_stack_deleted(stack, client=fixture.client):
+                    LOG.debug(f"Stack '{name}' deleted")
+                    self.deleted.append(name)
+                    # next time it is required it will be created again
+                    tobiko.remove_fixture(name)
+                    del self.deleting[name]
+            except Exception as ex:
+                LOG.exception(f"Error deleting stack '{name}'")
+                self.errors[name] = ex
+                del self.deleting[name]
+
+
+def is_stack_deleted(stack: typing.Optional[_stack.StackType],
+                     client: _client.HeatClientType = None) -> bool:
+    if stack is None or stack.stack_status == _stack.DELETE_COMPLETE:
+        return True
+    if stack.stack_status.endswith('_IN_PROGRESS'):
+        return False
+    _stack.check_stack_status(stack, {_stack.DELETE_COMPLETE}, client=client)
+    raise RuntimeError('Invalid stack status not detected')
+
+
+def cleanup_stacks(objects: typing.Iterable[typing.Any],
+                   timeout: tobiko.Seconds = None,
+                   interval: tobiko.Seconds = None) -> typing.List[str]:
+    """Delete stack fixtures required by given objects no test is using
+
+    Stacks are deleted concurrently, but only after all stacks using their
+    outputs. Stacks still used by any test (as recorded in shelves) are
+    kept, together with all the stacks they require. Shelves are only
+    read, so the test cases using the stacks are left untouched.
+
+    :returns: the names of the deleted stack fixtures
+    :raises CleanupStacksError: when any stack can't be deleted. Stacks
+        required by it are not deleted.
+    """
+    dependencies = _prepare.get_stacks_dependencies(objects)
+    fixtures: typing.Dict[str, _stack.HeatStackFixture] = {}
+    in_use: typing.Set[str] = set()
+    for name in dependencies:
+        fixture = tobiko.get_fixture(name)
+        if fixture.count_stack_users() == 0:
+            fixtures[name] = fixture
+        else:
+            in_use.add(name)
+    # stacks required by stacks in use are in use too
+    for name in list(fixtures):
+        if any(name in dependencies[other] for other in in_use):
+            LOG.info(f"Stack '{name}' not deleted because it is required "
+                     "by stacks in use")
+            del fixtures[name]
+
+    LOG.info(f"Deleting {len(fixtures)} Heat stacks...")
+    with contextlib.ExitStack() as exit_stack:
+        cleanup = StacksCleanup(fixtures=fixtures,
+                                dependencies=dependencies,
+                                exit_stack=exit_stack)
+        cleanup.run(timeout=timeout, interval=interval)
+
+    LOG.info(f"Deleted {len(cleanup.deleted)} of {len(fixtures)} Heat "
+             "stacks")
+    if cleanup.errors:
+        details = '\n'.join(f"- {name}: {error}"
+                            for name, error in sorted(cleanup.errors.items()))
+        raise CleanupStacksError(failed=len(cleanup.errors),
+                                 total=len(fixtures),
+                                 details=details,
+                                 errors=cleanup.errors)
+    return cleanup.deleted
@@ -19,6 +19,7 @@ from heatclient.v1 import client as v1_client
 
 import tobiko
 from tobiko import config
+from tobiko.openstack import _cache
 from tobiko.openstack import _client
 from tobiko.openstack import keystone
 
@@ -34,6 +35,11 @@ class HeatClientFixture(_client.OpenstackClientFixture):
             endpoint_type=config.CONF.tobiko.heat.endpoint_type,
             service_type='orchestration')
 
+    def setup_api_cache(self, client):
+        # stacks can create, change or delete any other resource
+        return _cache.setup_managers_cache('heat', client,
+                                           mutating_managers=['stacks'])
+
 
 class HeatClientManager(_client.OpenstackClientManager):
 
@@ -0,0 +1,234 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from concurrent import futures
+import inspect
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko import config
+from tobiko.openstack.heat import _stack
+
+
+LOG = log.getLogger(__name__)
+
+# Maximum number of stacks created at the same time
+DEFAULT_MAX_WORKERS = 8
+
+
+class PrepareStacksError(tobiko.TobikoException):
+    message = "Unable to prepare {failed} of {total} Heat stacks:\n{details}"
+
+
+class RequiredStacksNotPrepared(tobiko.TobikoException):
+    message = "required stacks not prepared: {required}"
+
+
+class InvalidStacksError(tobiko.TobikoException):
+    message = "{failed} of {total} Heat stacks are not valid:\n{details}"
+
+
+class OutdatedStackError(tobiko.TobikoException):
+    message = ("stack {name!r} fingerprint {observed!r} differs from "
+               "{expected!r}")
+
+
+def is_stack_fixture_name(name: str) -> bool:
+    try:
+        cls = tobiko.get_fixture_class(name)
+    except Exception:
+        return False
+    return (inspect.isclass(cls) and
+            issubclass(cls, _stack.HeatStackFixture))
+
+
+def get_stacks_dependencies(objects: typing.Iterable[typing.Any]) \
+        -> typing.Dict[str, typing.Set[str]]:
+    """Get the names of the stack fixtures required by given objects
+
+    :param objects: tests, test classes, modules or fixtures (or their
+        names)
+    :returns: a dict mapping every required stack fixture name to the names
+        of the other stack fixtures it requires, directly or through other
+        fixtures
+    """
+    names = [name
+             for name in tobiko.list_required_fixtures(list(objects))
+             if is_stack_fixture_name(name)]
+    return {name: {required
+                   for required in tobiko.list_required_fixtures([name])
+                   if required != name and required in names}
+            for name in names}
+
+
+class StacksPreparation:
+
+    def __init__(self,
+                 dependencies: typing.Dict[str, typing.Set[str]],
+                 executor: futures.Executor):
+        self.pending = dict(dependencies)
+        self.executor = executor
+        self.running: typing.Dict[futures.Future, str] = {}
+        self.done: typing.List[str] = []
+        self.errors: typing.Dict[str, Exception] = {}
+
+    def run(self):
+        while self.pending or self.running:
+            self.submit_ready()
+            if not self.running:
+                # it could happen only with dependency loops
+                for name, required in self.pending.items():
+                    self.errors[name] = RequiredStacksNotPrepared(
+                        required=sorted(required))
+                break
+            self.wait_for_completed()
+
+    def submit_ready(self):
+        for name, required in list(self.pending.items()):
+            failed = required.intersection(self.errors)
+            if failed:
+                del self.pending[name]
+                self.errors[name] = RequiredStacksNotPrepared(
+                    required=sorted(failed))
+            elif required.issubset(self.done):
+                del self.pending[name]
+                LOG.debug(f"Setting up stack fixture '{name}'...")
+                future = self.executor.submit(tobiko.setup_fixture, name)
+                self.running[future] = name
+
+    def wait_for_completed(self):
+        completed, _ = futures.wait(self.running,
+                                    return_when=futures.FIRST_COMPLETED)
+        for future in completed:
+            name = self.running.pop(future)
+            try:
+                future.result()
+            except Exception as ex:
+                LOG.exception(f"Error setting up stack fixture '{name}'")
+                self.errors[name] = ex
+            else:
+                LOG.debug(f"Stack fixture '{name}' set up")
+                self.done.append(name)
+
+
+def prepare_stacks(objects: typing.Iterable[typing.Any],
+                   max_workers: int = None) -> typing.List[str]:
+    """Set up all stack fixtures required by given objects
+
+    Independent stacks are created concurrently, up to max_workers at a
+    time. Every stack is created only after all stacks it requires.
+    Stacks are created as they would be by tests (honoring inter-worker
+    locks and shelves), so that setting them up later is only a matter of
+    checking their status. When TOBIKO_PREVENT_CREATE is set, stacks are
+    only validated instead.
+
+    :returns: the names of the stack fixtures set up
+    :raises PrepareStacksError: when any stack can't be set up. Stacks
+        requiring it are not created.
+    """
+    if config.get_bool_env('TOBIKO_PREVENT_CREATE'):
+        return validate_stacks(objects)
+    dependencies = get_stacks_dependencies(objects)
+    LOG.info(f"Preparing {len(dependencies)} Heat stacks...")
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        preparation = StacksPreparation(dependencies, executor)
+        preparation.run()
+
+    LOG.info(f"Prepared {len(preparation.done)} of {len(dependencies)} "
+             "Heat stacks")
+    if preparation.errors:
+        details = '\n'.join(f"- {name}: {error}"
+                            for name, error in
+                            sorted(preparation.errors.items()))
+        raise PrepareStacksError(failed=len(preparation.errors),
+                                 total=len(dependencies),
+                                 details=details,
+                                 errors=preparation.errors)
+    return preparation.done
+
+
+def list_fixtures_stacks(fixtures: typing.Iterable[_stack.HeatStackFixture]) \
+        -> typing.Dict[str, _stack.StackType]:
+    """Get the stacks of given fixtures with a single call per client"""
+    names_by_client: typing.Dict[typing.Any, typing.List[str]] = {}
+    for fixture in fixtures:
+        names_by_client.setdefault(fixture.setup_client(), []).append(
+            fixture.setup_stack_name())
+    listed: typing.Dict[str, _stack.StackType] = {}
+    for client, names in names_by_client.items():
+        listed.update((stack.stack_name, stack)
+                      for stack in client.stacks.list(
+                          filters={'name': names}))
+    return listed
+
+
+def validate_stack(fixture: _stack.HeatStackFixture,
+                   stack: typing.Optional[_stack.StackType]):
+    if stack is None:
+        raise _stack.HeatStackNotFound(name=fixture.stack_name)
+    _stack.check_stack_status(
+        stack,
+        _stack.with_updated_status(fixture.expected_creted_status),
+        client=fixture.client)
+    observed = _stack.find_stack_fingerprint(stack)
+    if observed is not None:
+        expected = fixture.get_stack_fingerprint()
+        if observed != expected:
+            raise OutdatedStackError(name=fixture.stack_name,
+                                     observed=observed,
+                                     expected=expected)
+
+
+def validate_stacks(objects: typing.Iterable[typing.Any]) \
+        -> typing.List[str]:
+    """Check stacks required by given objects can be used as they are
+
+    The status of all stacks is got with a single list call, then their
+    fingerprints are compared to the ones of their fixtures. No stack is
+    created, updated or deleted.
+
+    :returns: the names of the valid stack fixtures
+    :raises InvalidStacksError: when any stack is missing, is not in a
+        valid status or is not up to date
+    """
+    names = list(get_stacks_dependencies(objects))
+    LOG.info(f"Validating {len(names)} Heat stacks...")
+    fixtures = {name: tobiko.get_fixture(name) for name in names}
+    listed = list_fixtures_stacks(fixtures.values())
+    valid: typing.List[str] = []
+    errors: typing.Dict[str, Exception] = {}
+    for name, fixture in fixtures.items():
+        try:
+            validate_stack(fixture, listed.get(fixture.stack_name))
+        except Exception as ex:
+            LOG.debug(f"Invalid stack fixture '{name}': {ex}")
+            errors[name] = ex
+        else:
+            valid.append(name)
+
+    LOG.info(f"Validated {len(valid)} of {len(names)} Heat stacks")
+    if errors:
+        details = '\n'.join(f"- {name}: {error}"
+                            for name, error in sorted(errors.items()))
+        raise InvalidStacksError(failed=len(errors),
+                                 total=len(names),
+                                 details=details,
+                                 errors=errors)
+    return valid
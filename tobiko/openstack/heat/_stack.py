@@ -14,6 +14,8 @@
 from __future__ import absolute_import
 
 from collections import abc
+import hashlib
+import json
 import random
 import time
 import typing
@@ -26,6 +28,7 @@ import tobiko
 from tobiko import config
 from tobiko.openstack.heat import _client
 from tobiko.openstack.heat import _template
+from tobiko.openstack.heat import _watcher
 from tobiko.openstack import keystone
 from tobiko.openstack.base import _fixture as base_fixture
 
@@ -42,10 +45,23 @@ CREATE_FAILED = 'CREATE_FAILED'
 DELETE_IN_PROGRESS = 'DELETE_IN_PROGRESS'
 DELETE_COMPLETE = 'DELETE_COMPLETE'
 DELETE_FAILED = 'DELETE_FAILED'
+UPDATE_IN_PROGRESS = 'UPDATE_IN_PROGRESS'
+UPDATE_COMPLETE = 'UPDATE_COMPLETE'
+UPDATE_FAILED = 'UPDATE_FAILED'
+
+# Status an updated stack has instead of the one of a created stack
+UPDATED_STATUS = {CREATE_IN_PROGRESS: UPDATE_IN_PROGRESS,
+                  CREATE_COMPLETE: UPDATE_COMPLETE}
 
 
 TEMPLATE_FILE_SUFFIX = '.yaml'
 
+# Prefix of the stack tag telling the fingerprint of the stack
+FINGERPRINT_TAG_PREFIX = 'tobiko-fingerprint='
+
+# Number of hexadecimal digits of the stack fingerprint
+FINGERPRINT_LENGTH = 40
+
 
 def heat_stack_parameters(obj,
                           stack: 'HeatStackFixture' = None) \
@@ -91,6 +107,45 @@ def get_stack(stack: StackIdType,
             stack_id, resolve_outputs=resolve_outputs)
 
 
+def with_updated_status(expected_status: typing.Iterable[str]) \
+        -> typing.Set[str]:
+    """Add the status of updated stacks to the one of created stacks"""
+    expected_status = set(expected_status)
+    return expected_status.union(UPDATED_STATUS[status]
+                                 for status in expected_status
+                                 if status in UPDATED_STATUS)
+
+
+def get_stack_fingerprint(template: _template.HeatTemplateFixture,
+                          parameters: typing.Mapping[str, typing.Any]) \
+        -> str:
+    """Hash the template, its files and the parameters of a stack"""
+    content = json.dumps({'template': template.template_yaml,
+                          'template_files': template.template_files,
+                          'parameters': parameters},
+                         sort_keys=True,
+                         default=str)
+    digest = hashlib.sha256(content.encode()).hexdigest()
+    return digest[:FINGERPRINT_LENGTH]
+
+
+def list_stack_tags(stack: StackType) -> typing.List[str]:
+    tags = getattr(stack, 'tags', None)
+    if isinstance(tags, str):
+        tags = tags.split(',')
+    if not isinstance(tags, abc.Sequence):
+        return []
+    return [str(tag) for tag in tags]
+
+
+def find_stack_fingerprint(stack: StackType) -> typing.Optional[str]:
+    """Get the fingerprint a stack has been tagged with, if any"""
+    for tag in list_stack_tags(stack):
+        if tag.startswith(FINGERPRINT_TAG_PREFIX):
+            return tag[len(FINGERPRINT_TAG_PREFIX):]
+    return None
+
+
 def list_stacks(client: _client.HeatClientType = None,
                 **kwargs) -> tobiko.Selection[StackType]:
     client = _client.heat_client(client)
@@ -182,9 +237,20 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
     def get_stack_parameters(self):
         return tobiko.reset_fixture(self.parameters).values
 
+    def get_stack_fingerprint(self, parameters=None) -> str:
+        self.setup_template()
+        if parameters is None:
+            parameters = self.get_stack_parameters()
+        return get_stack_fingerprint(template=self.template,
+                                     parameters=parameters)
+
     def create_stack(self, retry: tobiko.Retry = None) -> stacks.Stack:
         if config.get_bool_env('TOBIKO_PREVENT_CREATE'):
             stack = self.validate_created_stack()
+            if not self.is_stack_up_to_date(stack):
+                LOG.warning(f"Stack '{self.stack_name}' is not up to date, "
+                            "but it can't be updated because "
+                            "TOBIKO_PREVENT_CREATE is set")
         else:
             for attempt in tobiko.retry(retry,
                                         count=self.retry_count,
@@ -223,21 +289,38 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
 
     def validate_created_stack(self):
         return self.wait_for_stack_status(
-            expected_status=self.expected_creted_status,
+            expected_status=with_updated_status(self.expected_creted_status),
             check=True)
 
+    def is_stack_up_to_date(self, stack: stacks.Stack) -> bool:
+        """Compare the fingerprint the stack is tagged with to its own
+
+        Stacks not tagged with any fingerprint (like the ones created by
+        older tobiko versions) are considered up to date.
+        """
+        fingerprint = find_stack_fingerprint(stack)
+        if fingerprint is None:
+            LOG.debug(f"Stack '{self.stack_name}' has no fingerprint")
+            return True
+        return fingerprint == self.get_stack_fingerprint()
+
     def try_create_stack(self) -> stacks.Stack:
         stack = self.wait_for_stack_status(
             expected_status={CREATE_COMPLETE, CREATE_FAILED,
                              CREATE_IN_PROGRESS, DELETE_COMPLETE,
-                             DELETE_FAILED})
+                             DELETE_FAILED, UPDATE_COMPLETE, UPDATE_FAILED,
+                             UPDATE_IN_PROGRESS})
 
         if stack is not None:
             stack_status = stack.stack_status
-            if stack_status in {CREATE_IN_PROGRESS, CREATE_COMPLETE}:
+            if stack_status in with_updated_status({CREATE_IN_PROGRESS,
+                                                    CREATE_COMPLETE}):
                 LOG.debug(f"Stack already created (name='{self.stack_name}', "
                           f"id='{stack.id}').")
-                return self.validate_created_stack()
+                stack = self.validate_created_stack()
+                if self.is_stack_up_to_date(stack):
+                    return stack
+                return self.update_stack(stack)
 
             if stack_status.endswith('_FAILED'):
                 LOG.error(f"Stack '{self.stack_name}' (id='{stack.id}') "
@@ -263,11 +346,13 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
         self.prepare_external_resources()
 
         LOG.debug('Begin creating stack %r...', self.stack_name)
+        fingerprint = self.get_stack_fingerprint(parameters=parameters)
         try:
             stack_id: str = self.setup_client().stacks.create(
                 stack_name=self.stack_name,
                 template=self.template.template_yaml,
-                parameters=parameters)['stack']['id']
+                parameters=parameters,
+                tags=FINGERPRINT_TAG_PREFIX + fingerprint)['stack']['id']
         except exc.HTTPConflict:
             LOG.debug(f"Stack '{self.stack_name}' already created")
             return self.validate_created_stack()
@@ -296,6 +381,36 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
                   f"(name={self.stack_name}, id={stack.id}).")
         return stack
 
+    def update_stack(self, stack: stacks.Stack) -> stacks.Stack:
+        """Update the stack template, parameters and fingerprint in place
+
+        It is used instead of deleting and creating again stacks whose
+        fingerprint changed, so that Heat only replaces changed resources.
+        """
+        if stack.stack_status.endswith('_IN_PROGRESS'):
+            # Heat refuses to update stacks still being created or updated
+            stack = self.wait_for_stack_status(
+                expected_status={CREATE_COMPLETE, UPDATE_COMPLETE})
+        parameters = self.get_stack_parameters()
+        fingerprint = self.get_stack_fingerprint(parameters=parameters)
+        tags = [tag
+                for tag in list_stack_tags(stack)
+                if not tag.startswith(FINGERPRINT_TAG_PREFIX)]
+        tags.append(FINGERPRINT_TAG_PREFIX + fingerprint)
+        LOG.info(f"Updating stack '{self.stack_name}' (id='{stack.id}') "
+                 f"because its fingerprint changed to '{fingerprint}'...")
+        self.ensure_quota_limits()
+        self.prepare_external_resources()
+        self.setup_client().stacks.update(
+            stack.id,
+            existing=True,
+            template=self.template.template_yaml,
+            parameters=parameters,
+            tags=','.join(tags))
+        self.wait_for_stack_status(expected_status={UPDATE_COMPLETE},
+                                   cached=False)
+        return self.validate_created_stack()
+
     def prepare_external_resources(self):
         pass
 
@@ -309,14 +424,26 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
         return resources
 
     def cleanup_fixture(self):
-        n_tests_using_stack = len(tobiko.removeme_from_shared_resource(
-            __name__, self.stack_name))
-        if n_tests_using_stack == 0:
+        if self.release_stack() == 0:
             self.setup_client()
             self.cleanup_stack()
-        else:
+
+    def release_stack(self) -> int:
+        """Stop current test case from using the stack
+
+        :returns: the number of tests still using the stack
+        """
+        n_tests_using_stack = len(tobiko.removeme_from_shared_resource(
+            __name__, self.stack_name))
+        if n_tests_using_stack:
             LOG.info('Stack %r not deleted because %d tests are using it',
                      self.stack_name, n_tests_using_stack)
+        return n_tests_using_stack
+
+    def count_stack_users(self) -> int:
+        """Get the number of tests using the stack without releasing it"""
+        return len(tobiko.get_shared_resource_users(
+            __name__, self.setup_stack_name()))
 
     def cleanup_stack(self):
         self.delete_stack()
@@ -364,7 +491,8 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
                                  timeout: tobiko.Seconds = None,
                                  interval: tobiko.Seconds = None) \
             -> typing.Optional[stacks.Stack]:
-        return self.wait_for_stack_status(expected_status={CREATE_COMPLETE},
+        return self.wait_for_stack_status(expected_status={CREATE_COMPLETE,
+                                                           UPDATE_COMPLETE},
                                           cached=cached,
                                           check=check,
                                           timeout=timeout,
@@ -426,17 +554,56 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
             timeout: tobiko.Seconds = None,
             interval: tobiko.Seconds = None) \
             -> typing.Optional[stacks.Stack]:
-        """Waits for the stack to reach the given status."""
+        """Waits for the stack to reach the given status.
+
+        After the first check, the status of the stack is got together with
+        the status of all other stacks being waited for by the same process.
+        """
+        watcher = _watcher.heat_stack_status_watcher(self.setup_client())
+        with watcher.watch(self.setup_stack_name()):
+            stack = self._wait_for_stack_status(
+                watcher=watcher,
+                expected_status=expected_status,
+                cached=cached,
+                timeout=timeout,
+                interval=interval)
+
+        if stack is not None:
+            self._log_stack_status(stack)
+
+        if check:
+            if stack is None:
+                if DELETE_COMPLETE not in expected_status:
+                    raise HeatStackNotFound(name=self.stack_name)
+            else:
+                check_stack_status(stack, expected_status,
+                                   client=self.client)
+
+        return stack
+
+    def _wait_for_stack_status(
+            self,
+            watcher: _watcher.HeatStackStatusWatcher,
+            expected_status: typing.Container[str],
+            cached: bool,
+            timeout: tobiko.Seconds,
+            interval: tobiko.Seconds) -> typing.Optional[stacks.Stack]:
+        first = True
         for attempt in tobiko.retry(
                 timeout=timeout,
                 interval=interval,
                 default_timeout=self.wait_timeout,
                 default_interval=self.wait_interval):
-            if cached:
-                cached = False
-                stack = self.stack or self.get_stack()
+            if first:
+                first = False
+                if cached:
+                    stack = self.stack or self.get_stack()
+                else:
+                    stack = self.get_stack()
             else:
-                stack = self.get_stack()
+                stack = self.watch_stack(
+                    watcher=watcher,
+                    max_age=tobiko.to_seconds_float(attempt.interval))
             stack_status = getattr(stack, 'stack_status', DELETE_COMPLETE)
             if stack_status in expected_status:
                 LOG.debug(f"Stack '{self.stack_name}' reached expected "
@@ -459,17 +626,17 @@ class HeatStackFixture(base_fixture.BaseResourceFixture):
                       f"'{expected_status}'...")
         else:
             raise RuntimeError('Retry loop broken')
+        return stack
 
-        if stack is not None:
-            self._log_stack_status(stack)
-
-        if check:
-            if stack is None:
-                if DELETE_COMPLETE not in expected_status:
-                    raise HeatStackNotFound(name=self.stack_name)
-            else:
-                check_stack_status(stack, expected_status)
-
+    def watch_stack(self,
+                    watcher: _watcher.HeatStackStatusWatcher,
+                    max_age: float) -> typing.Optional[stacks.Stack]:
+        """Get the stack status as listed at most max_age seconds ago"""
+        try:
+            self.stack = stack = watcher.get_stack(self.setup_stack_name(),
+                                                   max_age=max_age)
+        finally:
+            self._outputs = self._resources = None
         return stack
 
     _outputs = None
@@ -637,10 +804,22 @@ class HeatStackOutputsFixture(HeatStackNamespaceFixture):
 
 
 def check_stack_status(stack: stacks.Stack,
-                       expected_status: typing.Container[str]):
+                       expected_status: typing.Container[str],
+                       client: _client.HeatClientType = None):
     stack_status = stack.stack_status
     if stack_status in expected_status:
         return stack_status
+    status_reason = stack.stack_status_reason
+    failures: typing.List[str] = []
+    if stack_status.endswith('_FAILED'):
+        # stack status reason often tells only the first failure of nested
+        # stacks: events tell which resources actually failed
+        failures = _watcher.get_stack_failures(stack, client=client)
+        if failures:
+            status_reason = '\n'.join([f'{status_reason}',
+                                       'Failed resources:'] +
+                                      [f'- {failure}'
+                                       for failure in failures])
     if stack_status == CREATE_FAILED and (
             CREATE_IN_PROGRESS in expected_status or
             CREATE_COMPLETE in expected_status):
@@ -648,7 +827,8 @@ def check_stack_status(stack: stacks.Stack,
             name=stack.stack_name,
             observed=stack_status,
             expected=expected_status,
-            status_reason=stack.stack_status_reason)
+            status_reason=status_reason,
+            failures=failures)
     if stack_status == DELETE_FAILED and (
             DELETE_IN_PROGRESS in expected_status or
             DELETE_COMPLETE in expected_status):
@@ -656,12 +836,23 @@ def check_stack_status(stack: stacks.Stack,
             name=stack.stack_name,
             observed=stack_status,
             expected=expected_status,
-            status_reason=stack.stack_status_reason)
+            status_reason=status_reason,
+            failures=failures)
+    if stack_status == UPDATE_FAILED and (
+            UPDATE_IN_PROGRESS in expected_status or
+            UPDATE_COMPLETE in expected_status):
+        raise HeatStackUpdateFailed(
+            name=stack.stack_name,
+            observed=stack_status,
+            expected=expected_status,
+            status_reason=status_reason,
+            failures=failures)
     raise InvalidHeatStackStatus(
         name=stack.stack_name,
         observed=stack_status,
         expected=expected_status,
-        status_reason=stack.stack_status_reason)
+        status_reason=status_reason,
+        failures=failures)
 
 
 class HeatStackError(tobiko.TobikoException):
@@ -685,6 +876,10 @@ class HeatStackDeletionFailed(InvalidHeatStackStatus):
     pass
 
 
+class HeatStackUpdateFailed(InvalidHeatStackStatus):
+    pass
+
+
 class HeatStackResourceFixture(HeatStackNamespaceFixture):
 
     key_error = HeatStackResourceKeyError
@@ -14,15 +14,24 @@
 from __future__ import absolute_import
 
 from collections import abc
+import copy
+import hashlib
+import json
 import os
 import sys
+import threading
 import typing
+from urllib import parse
+from urllib import request
 
 from heatclient.common import template_utils
+from oslo_log import log
 
 import tobiko
 
 
+LOG = log.getLogger(__name__)
+
 TEMPLATE_SUFFIX = '.yaml'
 
 TEMPLATE_DIRS = list(sys.path)
@@ -84,7 +93,7 @@ class HeatTemplateFileFixture(HeatTemplateFixture):
             template_file = find_heat_template_file(
                 template_file=self.template_file,
                 template_dirs=template_dirs)
-        template_files, template = template_utils.get_template_contents(
+        template_files, template = get_template_contents(
             template_file=template_file)
         self.template = template
         self.template_files = template_files
@@ -124,3 +133,141 @@ def find_heat_template_file(template_file: str,
     msg = "Template file {!r} not found in directories {!r}".format(
         template_file, template_dirs)
     raise IOError(msg)
+
+
+class HeatTemplateCacheEntry(typing.NamedTuple):
+    """Template compiled from a file
+
+    :param dependencies: the modification time (in nanoseconds) of every
+        local file the template refers to
+    """
+    template: typing.Dict[str, typing.Any]
+    template_files: typing.Dict[str, typing.Any]
+    dependencies: typing.Dict[str, int]
+
+
+class HeatTemplateCache:
+    """Caches templates compiled from files
+
+    Compiling a template means parsing its file and every file it refers
+    to. Compiled templates are kept in memory and, when cache_dir is given,
+    stored on disk to be shared between tobiko processes. They are looked
+    up by a hash of the template file path, modification time and content.
+    They are compiled again when any of the files they refer to changed.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir
+        self._entries: typing.Dict[str, HeatTemplateCacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.cache_dir}>"
+
+    def get_template_contents(self, template_file: str) \
+            -> typing.Tuple[typing.Dict[str, typing.Any],
+                            typing.Dict[str, typing.Any]]:
+        """Get the same values as template_utils.get_template_contents"""
+        entry = self.get_entry(template_file)
+        # callers are free to change what they get
+        return (copy.deepcopy(entry.template_files),
+                copy.deepcopy(entry.template))
+
+    def get_entry(self, template_file: str) -> HeatTemplateCacheEntry:
+        key = get_template_file_key(template_file)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or not is_valid_cache_entry(entry):
+            entry = self.load_entry(key)
+            if entry is None or not is_valid_cache_entry(entry):
+                entry = compile_template_file(template_file)
+                self.save_entry(key, entry)
+            with self._lock:
+                self._entries[key] = entry
+        return entry
+
+    def get_cache_file(self, key: str) -> typing.Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def load_entry(self, key: str) -> typing.Optional[HeatTemplateCacheEntry]:
+        cache_file = self.get_cache_file(key)
+        if cache_file is None:
+            return None
+        try:
+            with open(cache_file) as stream:
+                entry = HeatTemplateCacheEntry(**json.load(stream))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            LOG.exception(f"Invalid Heat template cache file: '{cache_file}'")
+            return None
+        LOG.debug(f"Heat template loaded from cache file '{cache_file}'")
+        return entry
+
+    def save_entry(self, key: str, entry: HeatTemplateCacheEntry):
+        cache_file = self.get_cache_file(key)
+        if cache_file is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            temp_file = f'{cache_file}.{os.getpid()}'
+            with open(temp_file, 'w') as stream:
+                json.dump(entry._asdict(), stream)
+            os.replace(temp_file, cache_file)
+        except Exception:
+            LOG.exception(f"Unable to write Heat template cache file: "
+                          f"'{cache_file}'")
+
+
+def get_template_file_key(template_file: str) -> str:
+    path = os.path.realpath(template_file)
+    with open(path, 'rb') as stream:
+        content = stream.read()
+    mtime = os.stat(path).st_mtime_ns
+    return hashlib.sha256(f'{path}\0{mtime}\0'.encode() +
+                          content).hexdigest()
+
+
+def compile_template_file(template_file: str) -> HeatTemplateCacheEntry:
+    template_files, template = template_utils.get_template_contents(
+        template_file=template_file)
+    dependencies = {}
+    for url in template_files:
+        url = parse.urlparse(url)
+        if url.scheme == 'file':
+            path = request.url2pathname(url.path)
+            dependencies[path] = os.stat(path).st_mtime_ns
+    return HeatTemplateCacheEntry(template=template,
+                                  template_files=template_files,
+                                  dependencies=dependencies)
+
+
+def is_valid_cache_entry(entry: HeatTemplateCacheEntry) -> bool:
+    for path, mtime in entry.dependencies.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+        except FileNotFoundError:
+            return False
+    return True
+
+
+_CACHE: typing.Optional[HeatTemplateCache] = None
+
+
+def heat_template_cache() -> HeatTemplateCache:
+    global _CACHE
+    if _CACHE is None:
+        cache_dir = tobiko.tobiko_config().heat.template_cache_dir
+        if cache_dir:
+            cache_dir = os.path.realpath(os.path.expanduser(cache_dir))
+        _CACHE = HeatTemplateCache(cache_dir=cache_dir or None)
+    return _CACHE
+
+
+def get_template_contents(template_file: str) \
+        -> typing.Tuple[typing.Dict[str, typing.Any],
+                        typing.Dict[str, typing.Any]]:
+    return heat_template_cache().get_template_contents(template_file)
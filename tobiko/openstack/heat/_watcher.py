@@ -0,0 +1,165 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import collections
+import contextlib
+import threading
+import typing
+import weakref
+
+from heatclient.v1 import stacks
+from heatclient import exc
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.heat import _client
+
+
+LOG = log.getLogger(__name__)
+
+# Maximum number of failure events reported for a failed stack
+MAX_FAILURE_EVENTS = 10
+
+# Nested stacks depth looked into for failure events
+FAILURE_EVENTS_NESTED_DEPTH = 3
+
+
+class HeatStackStatusWatcher:
+    """Gets the status of all watched stacks with a single list call
+
+    Fixtures waiting for their stacks to change status register them with
+    watch() and then get them with get_stack(). The status of all stacks
+    being watched is listed at most once every max_age seconds and the
+    result is shared between all callers. Stacks that are not listed (like
+    the ones just deleted) are got one by one instead.
+    """
+
+    def __init__(self, client: _client.HeatClient):
+        self.client = client
+        self.watched: typing.Dict[str, int] = collections.defaultdict(int)
+        self.listed: typing.Dict[str, stacks.Stack] = {}
+        self.last_status: typing.Dict[str, str] = {}
+        self.list_time = 0.
+        self._lock = threading.Lock()
+        self._list_lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def watch(self, stack_name: str):
+        with self._lock:
+            self.watched[stack_name] += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self.watched[stack_name] -= 1
+                if self.watched[stack_name] <= 0:
+                    del self.watched[stack_name]
+                    self.last_status.pop(stack_name, None)
+
+    def get_stack(self, stack_name: str, max_age: float) \
+            -> typing.Optional[stacks.Stack]:
+        self.refresh(max_age=max_age)
+        with self._lock:
+            stack = self.listed.get(stack_name)
+        if stack is None:
+            # not listed or not watched yet when stacks were listed
+            stack = self.get_single_stack(stack_name)
+        self.notify_status(stack_name, stack)
+        return stack
+
+    def get_single_stack(self, stack_name: str) \
+            -> typing.Optional[stacks.Stack]:
+        try:
+            return self.client.stacks.get(stack_name, resolve_outputs=False)
+        except exc.HTTPNotFound:
+            LOG.debug(f"Stack '{stack_name}' not found")
+            return None
+
+    def refresh(self, max_age: float):
+        # only one thread at a time lists stacks, the others reuse its result
+        with self._list_lock:
+            if tobiko.time() - self.list_time < max_age:
+                return
+            with self._lock:
+                names = sorted(self.watched)
+            if not names:
+                return
+            try:
+                listed = {stack.stack_name: stack
+                          for stack in self.client.stacks.list(
+                              filters={'name': names})}
+            except Exception:
+                LOG.exception("Error listing Heat stacks")
+                listed = {}
+            with self._lock:
+                self.listed = listed
+                self.list_time = tobiko.time()
+            LOG.debug(f"Listed status of {len(listed)} of {len(names)} "
+                      "watched Heat stacks")
+
+    def notify_status(self, stack_name: str,
+                      stack: typing.Optional[stacks.Stack]):
+        status = getattr(stack, 'stack_status', None) or 'NOT_FOUND'
+        with self._lock:
+            previous = self.last_status.get(stack_name)
+            if stack_name in self.watched:
+                self.last_status[stack_name] = status
+        if previous is not None and previous != status:
+            LOG.info(f"Stack '{stack_name}' status changed from "
+                     f"'{previous}' to '{status}'")
+
+
+_WATCHERS: 'weakref.WeakKeyDictionary[typing.Any, HeatStackStatusWatcher]'
+_WATCHERS = weakref.WeakKeyDictionary()
+_WATCHERS_LOCK = threading.Lock()
+
+
+def heat_stack_status_watcher(client: _client.HeatClientType = None) \
+        -> HeatStackStatusWatcher:
+    """Get the watcher shared by all stacks using given client"""
+    client = _client.heat_client(client)
+    with _WATCHERS_LOCK:
+        watcher = _WATCHERS.get(client)
+        if watcher is None:
+            _WATCHERS[client] = watcher = HeatStackStatusWatcher(client)
+        return watcher
+
+
+def get_stack_failures(stack: stacks.Stack,
+                       client: _client.HeatClientType = None) \
+        -> typing.List[str]:
+    """Describe the resources making the stack fail using its events"""
+    status = stack.stack_status
+    action = status.rsplit('_', 1)[0]
+    try:
+        events = _client.heat_client(client).events.list(
+            stack.id,
+            filters={'resource_status': f'{action}_FAILED'},
+            nested_depth=FAILURE_EVENTS_NESTED_DEPTH,
+            sort_dir='desc',
+            limit=MAX_FAILURE_EVENTS)
+    except Exception:
+        LOG.exception(f"Unable to list events of stack '{stack.stack_name}'")
+        return []
+    failures = []
+    for event in events:
+        resource_name = getattr(event, 'resource_name', None)
+        if resource_name == stack.stack_name:
+            continue
+        failures.append(f"{resource_name}: "
+                        f"{getattr(event, 'resource_status_reason', None)}")
+    return failures
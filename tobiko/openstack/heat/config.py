@@ -24,6 +24,11 @@ OPTIONS = [
                default='public',
                help="heat endpoint type used when heat client is "
                     "instantiated."),
+    cfg.StrOpt('template_cache_dir',
+               default='~/.tobiko/cache/heat_templates',
+               help=("Directory where compiled Heat templates are cached "
+                     "to be shared between tobiko processes. Set it empty "
+                     "to disable the disk cache")),
     ]
 
 
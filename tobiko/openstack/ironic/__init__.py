@@ -20,6 +20,8 @@ get_ironic_client = _client.get_ironic_client
 
 power_off_node = _node.power_off_node
 power_on_node = _node.power_on_node
+wait_for_node_power_state = _node.wait_for_node_power_state
+watch_node_power_state = _node.watch_node_power_state
 IronicNodeType = _node.IronicNodeType
 WaitForNodePowerStateError = _node.WaitForNodePowerStateError
 WaitForNodePowerStateTimeout = _node.WaitForNodePowerStateTimeout
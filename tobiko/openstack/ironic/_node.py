@@ -13,6 +13,8 @@
 #    under the License.
 from __future__ import absolute_import
 
+from concurrent import futures
+import functools
 import typing
 
 import ironicclient.v1.client
@@ -64,43 +66,87 @@ IRONIC_NODE_TRANSIENT_POWER_STATES: typing.Dict[str, typing.List[str]] = {
 }
 
 
-def wait_for_node_power_state(
+def get_node_uuid(node: IronicNode) -> str:
+    return node.uuid
+
+
+@functools.lru_cache()
+def ironic_node_kind(client: ironicclient.v1.client.Client) \
+        -> tobiko.PollingKind:
+    """Get how the status poller has to get nodes using given client"""
+
+    def get_object(node_id: str) -> IronicNode:
+        return get_node(node_id=node_id, client=client)
+
+    def list_objects() -> typing.List[IronicNode]:
+        return client.node.list(detail=True)
+
+    return tobiko.PollingKind(name='ironic_node',
+                              get_object=get_object,
+                              list_objects=list_objects,
+                              get_id=get_node_uuid)
+
+
+def watch_node_power_state(
         node: IronicNodeType,
         power_state: str,
         client: _client.IronicClientType = None,
         timeout: tobiko.Seconds = None,
         sleep_time: tobiko.Seconds = None,
         transient_status: typing.Optional[typing.List[str]] = None) -> \
-            IronicNode:
+            futures.Future:
+    """Get a future resolved once the node reaches given power state
+
+    The nodes being waited for are checked together with a single list
+    call by the shared status poller.
+    """
     if transient_status is None:
         transient_status = IRONIC_NODE_TRANSIENT_POWER_STATES.get(
             power_state) or []
     node_id = get_node_id(node)
-    for attempt in tobiko.retry(timeout=timeout,
-                                interval=sleep_time,
-                                default_timeout=300.,
-                                default_interval=3.):
-        _node = get_node(node_id=node_id, client=client)
+
+    def has_power_state(_node: IronicNode) -> bool:
         if _node.power_state == power_state:
-            break
+            return True
         if _node.power_state not in transient_status:
             raise WaitForNodePowerStateError(
                 node_id=node_id,
                 node_power_state=_node.power_state,
                 power_state=power_state)
-        if attempt.is_last:
-            raise WaitForNodePowerStateTimeout(
-                node_id=node_id,
-                node_power_state=_node.power_state,
-                power_state=power_state,
-                timeout=timeout)
-
         LOG.debug(f"Waiting for Ironic node '{node_id}' power state to get "
                   f"from {_node.power_state} to {power_state}...")
-    else:
-        raise RuntimeError("Retry look break before timing out")
+        return False
+
+    return tobiko.watch_object(
+        kind=ironic_node_kind(_client.ironic_client(client)),
+        object_id=node_id,
+        predicate=has_power_state,
+        timeout=300. if timeout is None else timeout,
+        interval=3. if sleep_time is None else sleep_time)
 
-    return _node
+
+def wait_for_node_power_state(
+        node: IronicNodeType,
+        power_state: str,
+        client: _client.IronicClientType = None,
+        timeout: tobiko.Seconds = None,
+        sleep_time: tobiko.Seconds = None,
+        transient_status: typing.Optional[typing.List[str]] = None) -> \
+            IronicNode:
+    watched = watch_node_power_state(node=node,
+                                     power_state=power_state,
+                                     client=client,
+                                     timeout=timeout,
+                                     sleep_time=sleep_time,
+                                     transient_status=transient_status)
+    try:
+        return watched.result()
+    except tobiko.WaitForObjectTimeout as ex:
+        raise WaitForNodePowerStateTimeout(
+            node_id=ex.object_id,
+            node_power_state=getattr(ex.last_value, 'power_state', None),
+            power_state=power_state,
+            timeout=ex.timeout) from ex
 
 
 def power_off_node(node: IronicNodeType,
@@ -16,9 +16,11 @@ from __future__ import absolute_import
 from tobiko.openstack.keystone import _client
 from tobiko.openstack.keystone import _clouds_file
 from tobiko.openstack.keystone import _credentials
+from tobiko.openstack.keystone import _limiter
 from tobiko.openstack.keystone import _resource
 from tobiko.openstack.keystone import _services
 from tobiko.openstack.keystone import _session
+from tobiko.openstack.keystone import _token_cache
 
 KeystoneClient = _client.KeystoneClient
 KeystoneClientFixture = _client.KeystoneClientFixture
@@ -63,6 +65,12 @@ has_service = _services.has_service
 is_service_missing = _services.is_service_missing
 skip_if_missing_service = _services.skip_if_missing_service
 
+AdaptiveConcurrencyLimiter = _limiter.AdaptiveConcurrencyLimiter
+ConcurrencyLimiterManager = _limiter.ConcurrencyLimiterManager
+ConcurrencyLimiterStats = _limiter.ConcurrencyLimiterStats
+ConcurrencyStateFile = _limiter.ConcurrencyStateFile
+get_concurrency_limiter_stats = _limiter.get_concurrency_limiter_stats
+
 keystone_session = _session.keystone_session
 KeystoneSession = _session.KeystoneSession
 KeystoneSessionType = _session.KeystoneSessionType
@@ -71,3 +79,6 @@ KeystoneSessionManager = _session.KeystoneSessionManager
 get_keystone_endpoint = _session.get_keystone_endpoint
 get_keystone_session = _session.get_keystone_session
 get_keystone_token = _session.get_keystone_token
+
+KeystoneTokenCache = _token_cache.KeystoneTokenCache
+keystone_token_cache = _token_cache.keystone_token_cache
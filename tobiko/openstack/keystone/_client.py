@@ -24,6 +24,7 @@ from keystoneclient.v3 import endpoints as v3_endpoints
 from oslo_log import log
 
 import tobiko
+from tobiko.openstack import _cache
 from tobiko.openstack import _client
 
 
@@ -41,6 +42,11 @@ class KeystoneClientFixture(_client.OpenstackClientFixture):
                 session=session,
                 interface=config.CONF.tobiko.keystone.interface)
 
+    def setup_api_cache(self, client):
+        return _cache.setup_managers_cache(
+            'keystone', client,
+            cached_managers=['endpoints', 'regions', 'services'])
+
 
 class KeystoneClientManager(_client.OpenstackClientManager):
 
@@ -0,0 +1,359 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import functools
+import json
+import os
+import threading
+import typing
+from urllib import parse
+
+from keystoneauth1 import exceptions
+from oslo_log import log
+
+import tobiko
+
+
+LOG = log.getLogger(__name__)
+
+# Status codes telling the server is overloaded
+THROTTLING_STATUS_CODES = frozenset([429, 503])
+
+# Seconds between checks for limits changed by other processes
+SYNC_INTERVAL = 1.
+
+# Seconds a limit shared by a process is adopted by the other ones
+DEFAULT_STATE_TTL = 300.
+
+
+class ConcurrencyLimiterStats(typing.NamedTuple):
+    """Counters about the requests sent to a service
+
+    :param limit: current maximum number of concurrent requests
+    :param in_flight: number of requests waiting for a response
+    :param throttled: number of responses with a status code telling the
+        server is overloaded (429 or 503)
+    :param failures: number of requests failed without getting a response
+    """
+    service: str
+    limit: int
+    in_flight: int = 0
+    max_in_flight: int = 0
+    requests: int = 0
+    throttled: int = 0
+    failures: int = 0
+    total_latency: float = 0.
+    max_latency: float = 0.
+
+    @property
+    def mean_latency(self) -> float:
+        if not self.requests:
+            return 0.
+        return self.total_latency / self.requests
+
+
+class ConcurrencyStateFile:
+    """Shares reduced concurrency limits between tobiko processes
+
+    The file maps every service name to the last limit computed by a
+    process after being throttled by it, together with the time it was
+    written. It is only written when a limit is decreased, so that all
+    processes back off together while ramping up on their own. Limits
+    written more than ttl seconds ago are ignored, so that they are not
+    adopted by later test runs.
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_STATE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._mtime: typing.Optional[float] = None
+        self._limits: typing.Dict[str, typing.Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.path}>"
+
+    def get_limit(self, service: str) \
+            -> typing.Optional[typing.Dict[str, float]]:
+        with self._lock:
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except FileNotFoundError:
+                return None
+            if mtime != self._mtime:
+                self._limits = self._read()
+                self._mtime = mtime
+            limit = self._limits.get(service)
+        if limit is None or limit['updated'] < tobiko.time() - self.ttl:
+            return None
+        return limit
+
+    @tobiko.interworker_synched('keystone_concurrency_state')
+    def set_limit(self, service: str, limit: float):
+        limits = self._read()
+        limits[service] = {'limit': limit, 'updated': tobiko.time()}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_file = f'{self.path}.{os.getpid()}'
+        with open(temp_file, 'w') as stream:
+            json.dump(limits, stream)
+        os.replace(temp_file, self.path)
+
+    def _read(self) -> typing.Dict[str, typing.Dict[str, float]]:
+        try:
+            with open(self.path) as stream:
+                return json.load(stream)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            LOG.exception("Invalid concurrency state file: "
+                          f"'{self.path}'")
+            return {}
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of concurrent requests sent to a service
+
+    The limit is adjusted with an additive-increase/multiplicative-decrease
+    (AIMD) policy: it grows by one after a full window of successful
+    requests and it is multiplied by decrease_factor when the server
+    replies it is overloaded. Only requests started after the last decrease
+    can decrease it again, so that a burst of errors got by concurrent
+    requests makes it back off only once.
+    """
+
+    def __init__(self,
+                 service: str,
+                 min_limit: int = 1,
+                 max_limit: int = 32,
+                 initial_limit: int = 8,
+                 decrease_factor: float = 0.5,
+                 state_file: ConcurrencyStateFile = None):
+        self.service = service
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit),
+                               self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.state_file = state_file
+        self.last_decrease = 0.
+        self.next_sync = 0.
+        self._condition = threading.Condition()
+        self._stats = ConcurrencyLimiterStats(service=service,
+                                              limit=int(self.limit))
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}<{self.service} "
+                f"limit={int(self.limit)}>")
+
+    @property
+    def stats(self) -> ConcurrencyLimiterStats:
+        with self._condition:
+            return self._stats._replace(limit=int(self.limit))
+
+    def acquire(self) -> float:
+        """Wait until a new request can be sent
+
+        :returns: the time the request is allowed to start
+        """
+        with self._condition:
+            self._sync()
+            while self._stats.in_flight >= int(self.limit):
+                self._condition.wait(timeout=SYNC_INTERVAL)
+                self._sync()
+            in_flight = self._stats.in_flight + 1
+            self._stats = self._stats._replace(
+                in_flight=in_flight,
+                max_in_flight=max(in_flight, self._stats.max_in_flight))
+            return tobiko.time()
+
+    def release(self,
+                started: float,
+                status_code: typing.Optional[int] = None):
+        """Account for the completion of a request
+
+        :param started: the value returned by acquire
+        :param status_code: the status code of the response, or None when
+            no response was got
+        """
+        now = tobiko.time()
+        latency = now - started
+        throttled = is_throttling_status_code(status_code)
+        with self._condition:
+            self._stats = self._stats._replace(
+                in_flight=self._stats.in_flight - 1,
+                requests=self._stats.requests + 1,
+                throttled=self._stats.throttled + int(throttled),
+                failures=self._stats.failures + int(status_code is None),
+                total_latency=self._stats.total_latency + latency,
+                max_latency=max(self._stats.max_latency, latency))
+            if throttled:
+                if started >= self.last_decrease:
+                    self._decrease(now)
+            elif status_code is not None:
+                self.limit = min(float(self.max_limit),
+                                 self.limit + 1. / self.limit)
+            self._condition.notify_all()
+
+    def _decrease(self, now: float):
+        self.limit = max(float(self.min_limit),
+                         self.limit * self.decrease_factor)
+        self.last_decrease = now
+        LOG.warning(f"Service '{self.service}' is overloaded: sending at "
+                    f"most {int(self.limit)} concurrent requests")
+        if self.state_file is not None:
+            try:
+                self.state_file.set_limit(self.service, self.limit)
+            except Exception:
+                LOG.exception("Unable to share concurrency limit of "
+                              f"service '{self.service}'")
+
+    def _sync(self):
+        if self.state_file is None:
+            return
+        now = tobiko.time()
+        if now < self.next_sync:
+            return
+        self.next_sync = now + SYNC_INTERVAL
+        shared = self.state_file.get_limit(self.service)
+        if (shared is not None and
+                shared['updated'] > self.last_decrease and
+                shared['limit'] < self.limit):
+            LOG.debug(f"Service '{self.service}' is overloaded: another "
+                      f"process limited it to {int(shared['limit'])} "
+                      "concurrent requests")
+            self.limit = max(float(self.min_limit), shared['limit'])
+            self.last_decrease = shared['updated']
+
+
+def is_throttling_status_code(status_code: typing.Optional[int]) -> bool:
+    return status_code in THROTTLING_STATUS_CODES
+
+
+def get_service_name(url: str, kwargs: typing.Dict[str, typing.Any]) -> str:
+    endpoint_filter = kwargs.get('endpoint_filter') or {}
+    service_type = endpoint_filter.get('service_type')
+    if service_type:
+        return service_type
+    return parse.urlparse(url).netloc or 'unknown'
+
+
+_ACTIVE = threading.local()
+
+
+class ConcurrencyLimiterManager:
+    """Creates a limiter for every service and makes sessions use them"""
+
+    def __init__(self,
+                 min_limit: int = 1,
+                 max_limit: int = 32,
+                 initial_limit: int = 8,
+                 decrease_factor: float = 0.5,
+                 state_file: ConcurrencyStateFile = None):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.initial_limit = initial_limit
+        self.decrease_factor = decrease_factor
+        self.state_file = state_file
+        self.limiters: typing.Dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get_limiter(self, service: str) -> AdaptiveConcurrencyLimiter:
+        with self._lock:
+            limiter = self.limiters.get(service)
+            if limiter is None:
+                self.limiters[service] = limiter = AdaptiveConcurrencyLimiter(
+                    service=service,
+                    min_limit=self.min_limit,
+                    max_limit=self.max_limit,
+                    initial_limit=self.initial_limit,
+                    decrease_factor=self.decrease_factor,
+                    state_file=self.state_file)
+            return limiter
+
+    def get_stats(self) -> typing.Dict[str, ConcurrencyLimiterStats]:
+        with self._lock:
+            limiters = list(self.limiters.values())
+        return {limiter.service: limiter.stats for limiter in limiters}
+
+    def setup_session(self, session):
+        """Make every request sent by session wait for its limiter"""
+        request = session.request
+
+        @functools.wraps(request)
+        def limited_request(url, method, **kwargs):
+            if getattr(_ACTIVE, 'value', False):
+                # Nested requests (like authentication ones) are sent while
+                # holding the slot of the outer one
+                return request(url, method, **kwargs)
+            limiter = self.get_limiter(get_service_name(url, kwargs))
+            started = limiter.acquire()
+            status_code: typing.Optional[int] = None
+            _ACTIVE.value = True
+            try:
+                response = request(url, method, **kwargs)
+                status_code = response.status_code
+                return response
+            except exceptions.HttpError as ex:
+                status_code = ex.http_status
+                raise
+            finally:
+                _ACTIVE.value = False
+                limiter.release(started, status_code=status_code)
+
+        session.request = limited_request
+        return session
+
+
+_MANAGER: typing.Optional[ConcurrencyLimiterManager] = None
+
+
+def concurrency_limiter_manager() \
+        -> typing.Optional[ConcurrencyLimiterManager]:
+    """Get the limiters shared by all Keystone sessions, if enabled"""
+    global _MANAGER
+    conf = tobiko.tobiko_config().keystone
+    if conf.max_concurrent_requests <= 0:
+        return None
+    if _MANAGER is None:
+        state_file = None
+        if conf.concurrency_state_file:
+            state_file = ConcurrencyStateFile(
+                os.path.realpath(
+                    os.path.expanduser(conf.concurrency_state_file)),
+                ttl=conf.concurrency_state_ttl)
+        _MANAGER = ConcurrencyLimiterManager(
+            min_limit=conf.min_concurrent_requests,
+            max_limit=conf.max_concurrent_requests,
+            initial_limit=conf.initial_concurrent_requests,
+            decrease_factor=conf.concurrency_decrease_factor,
+            state_file=state_file)
+    return _MANAGER
+
+
+def setup_session_concurrency_limiter(session):
+    manager = concurrency_limiter_manager()
+    if manager is not None:
+        manager.setup_session(session)
+    return session
+
+
+def get_concurrency_limiter_stats() \
+        -> typing.Dict[str, ConcurrencyLimiterStats]:
+    """Get request counters by service name"""
+    if _MANAGER is None:
+        return {}
+    return _MANAGER.get_stats()
@@ -22,6 +22,8 @@ from oslo_log import log
 
 import tobiko
 from tobiko.openstack.keystone import _credentials
+from tobiko.openstack.keystone import _limiter
+from tobiko.openstack.keystone import _token_cache
 from tobiko import http
 
 
@@ -74,8 +76,12 @@ class KeystoneSessionFixture(tobiko.SharedFixture):
         params.pop('api_version', None)
         params.pop('cacert', None)
         auth = loader.load_from_options(**params)
+        token_cache = _token_cache.keystone_token_cache(credentials)
+        if token_cache is not None:
+            token_cache.setup_plugin(auth)
         session = _session.Session(auth=auth, verify=False)
         http.setup_http_session(session)
+        _limiter.setup_session_concurrency_limiter(session)
         return session
 
     @staticmethod
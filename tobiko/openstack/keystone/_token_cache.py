@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import hashlib
+import json
+import os
+import typing
+
+from keystoneauth1 import access
+from keystoneauth1 import plugin as _plugin
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.keystone import _credentials
+
+
+LOG = log.getLogger(__name__)
+
+
+class KeystoneTokenCache:
+    """Shares Keystone tokens between tobiko processes
+
+    Tokens are stored together with the service catalog in a file only
+    readable by current user, named after a hash of the credentials used
+    to get them. A token is reused by any process authenticating with the
+    same credentials until it is going to expire in less than
+    expiry_margin seconds. Only one process at a time can authenticate, so
+    that the others will find the new token in the cache once it got it.
+    """
+
+    def __init__(self,
+                 credentials: _credentials.KeystoneCredentials,
+                 cache_dir: str,
+                 expiry_margin: int = 300):
+        self.credentials = credentials
+        self.cache_dir = cache_dir
+        self.expiry_margin = expiry_margin
+        self.cache_file = os.path.join(
+            cache_dir, get_credentials_hash(credentials) + '.json')
+        self.last_token: typing.Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.cache_file}>"
+
+    def setup_plugin(self, auth: _plugin.BaseAuthPlugin):
+        """Make auth plugin look for a valid token in the cache first"""
+        authenticate = auth.get_auth_ref
+
+        def get_auth_ref(session, **kwargs):
+            return self.get_auth_ref(auth=auth,
+                                     authenticate=authenticate,
+                                     session=session,
+                                     **kwargs)
+
+        # It is called by the plugin only when it has no valid token
+        auth.get_auth_ref = get_auth_ref  # type: ignore
+
+    @tobiko.interworker_synched('keystone_token_cache')
+    def get_auth_ref(self, auth, authenticate, session, **kwargs):
+        auth_ref = self.load_auth_ref()
+        if auth_ref is None:
+            LOG.debug("Authenticating to Keystone with credentials "
+                      f"{self.credentials}")
+            auth_ref = authenticate(session, **kwargs)
+            auth.auth_ref = auth_ref
+            self.save_auth_state(auth.get_auth_state())
+        self.last_token = auth_ref.auth_token
+        return auth_ref
+
+    def load_auth_ref(self) -> typing.Optional[access.AccessInfo]:
+        try:
+            with open(self.cache_file) as fd:
+                auth_state = json.load(fd)
+            auth_ref = access.create(body=auth_state['body'],
+                                     auth_token=auth_state['auth_token'])
+        except FileNotFoundError:
+            return None
+        except Exception:
+            LOG.exception("Invalid Keystone token cache file: "
+                          f"'{self.cache_file}'")
+            return None
+
+        if auth_ref.auth_token == self.last_token:
+            # The plugin has been invalidated after using this token,
+            # probably because it has been revoked
+            LOG.debug("Ignoring Keystone token cached in file "
+                      f"'{self.cache_file}': it has been already used")
+            return None
+        if auth_ref.will_expire_soon(stale_duration=self.expiry_margin):
+            LOG.debug("Ignoring Keystone token cached in file "
+                      f"'{self.cache_file}': it is going to expire at "
+                      f"{auth_ref.expires}")
+            return None
+        LOG.debug(f"Using Keystone token cached in file '{self.cache_file}' "
+                  f"(expires at {auth_ref.expires})")
+        return auth_ref
+
+    def save_auth_state(self, auth_state: typing.Optional[str]):
+        if not auth_state:
+            return
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        temp_file = f'{self.cache_file}.{os.getpid()}'
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     0o600)
+        with os.fdopen(fd, 'w') as stream:
+            stream.write(auth_state)
+        os.replace(temp_file, self.cache_file)
+        LOG.debug(f"Keystone token saved to cache file '{self.cache_file}'")
+
+
+def get_credentials_hash(
+        credentials: _credentials.KeystoneCredentials) -> str:
+    return hashlib.sha256(
+        credentials.to_json(indent=None).encode()).hexdigest()
+
+
+def keystone_token_cache(credentials: _credentials.KeystoneCredentials) \
+        -> typing.Optional[KeystoneTokenCache]:
+    """Get the token cache for given credentials, if enabled"""
+    conf = tobiko.tobiko_config().keystone
+    if not conf.token_cache_dir:
+        return None
+    return KeystoneTokenCache(
+        credentials=credentials,
+        cache_dir=os.path.realpath(os.path.expanduser(conf.token_cache_dir)),
+        expiry_margin=conf.token_expiry_margin)
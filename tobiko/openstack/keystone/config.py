@@ -65,7 +65,45 @@ OPTIONS = [
                 help="Clouds file names"),
     cfg.StrOpt('interface',
                default=None,
-               help="default value in case keystone interface is needed")]
+               help="default value in case keystone interface is needed"),
+    cfg.StrOpt('token_cache_dir',
+               default='~/.tobiko/cache/keystone_tokens',
+               help=("Directory where Keystone tokens and service catalogs "
+                     "are cached to be shared between tobiko processes. "
+                     "Set it empty to disable the cache")),
+    cfg.IntOpt('token_expiry_margin',
+               default=300,
+               help=("Seconds before its expiration after which a cached "
+                     "Keystone token is no longer used")),
+    cfg.IntOpt('max_concurrent_requests',
+               default=32,
+               help=("Maximum number of concurrent requests sent to every "
+                     "OpenStack service by a tobiko process. Set it to zero "
+                     "to disable the adaptive concurrency limiter")),
+    cfg.IntOpt('min_concurrent_requests',
+               default=1,
+               help=("Number of concurrent requests sent to every "
+                     "OpenStack service even when it is overloaded")),
+    cfg.IntOpt('initial_concurrent_requests',
+               default=8,
+               help=("Number of concurrent requests sent to every "
+                     "OpenStack service before adapting it to its "
+                     "responses")),
+    cfg.FloatOpt('concurrency_decrease_factor',
+                 default=0.5,
+                 help=("Factor the number of concurrent requests is "
+                       "multiplied by when a service replies it is "
+                       "overloaded (429 or 503 status codes)")),
+    cfg.StrOpt('concurrency_state_file',
+               default='~/.tobiko/cache/keystone_concurrency.json',
+               help=("File where reduced concurrency limits are shared "
+                     "between tobiko processes. Set it empty to make every "
+                     "process adapt them on its own")),
+    cfg.FloatOpt('concurrency_state_ttl',
+                 default=300.,
+                 help=("Seconds a concurrency limit shared by a tobiko "
+                       "process is adopted by the other ones. Older limits "
+                       "are ignored"))]
 
 
 def register_tobiko_options(conf):
@@ -31,6 +31,8 @@ ensure_default_share_type_exists = _client.ensure_default_share_type_exists
 
 # Waiters
 wait_for_share_status = _waiters.wait_for_share_status
+wait_for_status = _waiters.wait_for_status
+watch_status = _waiters.watch_status
 wait_for_resource_deletion = _waiters.wait_for_resource_deletion
 
 # Exceptions
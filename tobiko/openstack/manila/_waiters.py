@@ -13,6 +13,7 @@
 #    under the License.
 from __future__ import absolute_import
 
+from concurrent import futures
 import typing
 import time
 
@@ -27,6 +28,38 @@ from tobiko.openstack.manila import _exceptions
 LOG = log.getLogger(__name__)
 
 
+SHARE_KIND = tobiko.PollingKind(name='share',
+                                get_object=_client.get_share,
+                                list_objects=_client.list_shares)
+
+
+def watch_status(object_id: str,
+                 status_key: str = _constants.RESOURCE_STATUS,
+                 status: str = _constants.STATUS_AVAILABLE,
+                 get_client: typing.Callable = None,
+                 interval: tobiko.Seconds = None,
+                 timeout: tobiko.Seconds = None,
+                 **kwargs) -> futures.Future:
+    """Get a future resolved once the object reaches a specific status"""
+    if get_client is None:
+        kind = SHARE_KIND
+    else:
+        kind = tobiko.PollingKind(name=get_client.__name__,
+                                  get_object=get_client)
+
+    def has_status(response) -> bool:
+        LOG.debug(f"{kind.name} '{object_id}' {status_key} is "
+                  f"'{response[status_key]}' (waiting for '{status}')")
+        return response[status_key] == status
+
+    return tobiko.watch_object(kind=kind,
+                               object_id=object_id,
+                               predicate=has_status,
+                               timeout=300. if timeout is None else timeout,
+                               interval=3. if interval is None else interval,
+                               **kwargs)
+
+
 def wait_for_status(object_id: str,
                     status_key: str = _constants.RESOURCE_STATUS,
                     status: str = _constants.STATUS_AVAILABLE,
@@ -44,26 +77,18 @@ def wait_for_status(object_id: str,
     :param object_id: The id of the object to query.
     :param interval: How often to check the status, in seconds.
     :param timeout: The maximum time, in seconds, to check the status.
-    :raises TimeoutException: The object did not achieve the status or ERROR in
-                              the check_timeout period.
+    :raises tobiko.WaitForObjectTimeout: The object did not achieve the
+                                         status in the timeout period.
     :raises UnexpectedStatusException: The request returned an unexpected
                                        response code.
     """
-
-    get_client = get_client or _client.get_share
-
-    for attempt in tobiko.retry(timeout=timeout,
-                                interval=interval,
-                                default_timeout=300.,
-                                default_interval=3.):
-        response = get_client(object_id, **kwargs)
-        if response[status_key] == status:
-            return response
-
-        attempt.check_limits()
-
-        LOG.debug(f"Waiting for {get_client.__name__} {status_key} to get "
-                  f"from '{response[status_key]}' to '{status}'...")
+    return watch_status(object_id=object_id,
+                        status_key=status_key,
+                        status=status,
+                        get_client=get_client,
+                        interval=interval,
+                        timeout=timeout,
+                        **kwargs).result()
 
 
 def wait_for_share_status(share_id):
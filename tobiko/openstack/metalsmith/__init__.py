@@ -26,6 +26,7 @@ get_metalsmith_client = _client.get_metalsmith_client
 
 MetalsmithInstance = _instance.MetalsmithInstance
 list_instances = _instance.list_instances
+iter_instances = _instance.iter_instances
 find_instance = _instance.find_instance
 list_instance_ip_addresses = _instance.list_instance_ip_addresses
 find_instance_ip_address = _instance.find_instance_ip_address
@@ -17,10 +17,12 @@ import typing
 
 import metalsmith
 import netaddr
+from openstack import exceptions
 
 import tobiko
 from tobiko.shell import ping
 from tobiko.shell import ssh
+from tobiko.openstack import _client as _openstack_client
 from tobiko.openstack.metalsmith import _client
 
 
@@ -37,6 +39,35 @@ def list_instances(client: _client.MetalsmithClientType = None,
     return instances
 
 
+def iter_instances(client: _client.MetalsmithClientType = None,
+                   page_size: int = None,
+                   **node_params) -> typing.Iterator[MetalsmithInstance]:
+    """Iterate over instances, requesting their nodes one page at a time
+
+    A new page of nodes is requested only when the caller has consumed the
+    previous one. Given node_params (like provision_state or
+    resource_class) are sent to Ironic server as filters.
+    """
+    connection = _client.metalsmith_client(client).connection
+    nodes = connection.baremetal.nodes(
+        associated=True,
+        details=True,
+        limit=page_size or _openstack_client.DEFAULT_PAGE_SIZE,
+        **node_params)
+    for node in nodes:
+        allocation = None
+        if node.allocation_id:
+            try:
+                allocation = connection.baremetal.get_allocation(
+                    node.allocation_id)
+            except exceptions.ResourceNotFound:
+                continue  # the instance has been just deleted
+        instance = metalsmith.Instance(connection, node,
+                                       allocation=allocation)
+        if instance.state != metalsmith.InstanceState.UNKNOWN:
+            yield instance
+
+
 def find_instance(client: _client.MetalsmithClientType = None,
                   unique=False, **params) -> MetalsmithInstance:
     servers = list_instances(client=client, **params)
@@ -14,6 +14,7 @@
 from __future__ import absolute_import
 
 from tobiko.openstack.neutron import _agent
+from tobiko.openstack.neutron import _bulk
 from tobiko.openstack.neutron import _client
 from tobiko.openstack.neutron import _extension
 from tobiko.openstack.neutron import _floating_ip
@@ -60,6 +61,10 @@ skip_if_is_old_ovn = _agent.skip_if_is_old_ovn
 has_ovn = _agent.has_ovn
 has_ovs = _agent.has_ovs
 
+BulkOperationError = _bulk.BulkOperationError
+create_neutron_resources = _bulk.create_resources
+delete_neutron_resources = _bulk.delete_resources
+
 NeutronClientFixture = _client.NeutronClientFixture
 ServiceUnavailable = _client.ServiceUnavailable
 NeutronClient = _client.NeutronClient
@@ -67,6 +72,7 @@ NeutronClientException = _client.NeutronClientException
 NeutronClientType = _client.NeutronClientType
 neutron_client = _client.neutron_client
 get_neutron_client = _client.get_neutron_client
+iter_neutron_resources = _client.iter_neutron_resources
 
 get_networking_extensions = _extension.get_networking_extensions
 missing_networking_extensions = _extension.missing_networking_extensions
@@ -86,13 +92,16 @@ FloatingIpIdType = _floating_ip.FloatingIpIdType
 NoSuchFloatingIp = _floating_ip.NoSuchFloatingIp
 
 create_port = _port.create_port
+create_ports_bulk = _port.create_ports_bulk
 delete_port = _port.delete_port
+delete_ports = _port.delete_ports
 get_port = _port.get_port
 get_port_id = _port.get_port_id
 find_device_ip_address = _port.find_device_ip_address
 find_port = _port.find_port
 find_port_ip_address = _port.find_port_ip_address
 list_ports = _port.list_ports
+iter_ports = _port.iter_ports
 list_port_ip_addresses = _port.list_port_ip_addresses
 list_device_ip_addresses = _port.list_device_ip_addresses
 update_port = _port.update_port
@@ -111,6 +120,7 @@ get_network = _network.get_network
 get_network_id = _network.get_network_id
 find_network = _network.find_network
 list_networks = _network.list_networks
+iter_networks = _network.iter_networks
 list_network_nameservers = _network.list_network_nameservers
 NoSuchNetwork = _network.NoSuchNetwork
 NetworkType = _network.NetworkType
@@ -156,3 +166,6 @@ create_security_group = _security_group.create_security_group
 update_security_group = _security_group.update_security_group
 delete_security_group = _security_group.delete_security_group
 create_security_group_rule = _security_group.create_security_group_rule
+create_security_group_rules_bulk = (
+    _security_group.create_security_group_rules_bulk)
+delete_security_group_rules = _security_group.delete_security_group_rules
@@ -20,6 +20,7 @@ import typing
 from oslo_log import log
 
 import tobiko
+from tobiko.openstack import _cache
 from tobiko.openstack.neutron import _client
 from tobiko.shell import sh
 
@@ -50,17 +51,20 @@ class AgentNotFoundOnHost(tobiko.TobikoException):
 NeutronAgentType = typing.Dict[str, typing.Any]
 
 
-def list_agents(client=None, **params) \
+def list_agents(client=None, cached=True, **params) \
         -> tobiko.Selection[NeutronAgentType]:
-    agents = _client.neutron_client(client).list_agents(**params)
+    with _cache.api_cache_disabled(not cached):
+        agents = _client.neutron_client(client).list_agents(**params)
     if isinstance(agents, abc.Mapping):
         agents = agents['agents']
     return tobiko.Selection[NeutronAgentType](agents)
 
 
-def list_l3_agent_hosting_routers(router, client=None, **params):
-    agents = _client.neutron_client(client).list_l3_agent_hosting_routers(
-        router, **params)
+def list_l3_agent_hosting_routers(router, client=None, cached=True,
+                                  **params):
+    with _cache.api_cache_disabled(not cached):
+        agents = _client.neutron_client(
+            client).list_l3_agent_hosting_routers(router, **params)
     if isinstance(agents, abc.Mapping):
         agents = agents['agents']
     return tobiko.select(agents)
@@ -76,9 +80,11 @@ def find_l3_agent_hosting_router(router, client=None, unique=False,
         return agents.first
 
 
-def list_dhcp_agent_hosting_network(network, client=None, **params):
-    agents = _client.neutron_client(client).list_dhcp_agent_hosting_networks(
-        network, **params)
+def list_dhcp_agent_hosting_network(network, client=None, cached=True,
+                                    **params):
+    with _cache.api_cache_disabled(not cached):
+        agents = _client.neutron_client(
+            client).list_dhcp_agent_hosting_networks(network, **params)
     if isinstance(agents, abc.Mapping):
         agents = agents['agents']
     return tobiko.select(agents)
@@ -109,17 +115,10 @@ def get_l3_agent_mode(
     return agent_mode
 
 
-class NetworkingAgentFixture(tobiko.SharedFixture):
-
-    agents = None
-
-    def setup_fixture(self):
-        self.agents = list_agents()
-
-
 def list_networking_agents(**attributes):
-    return tobiko.setup_fixture(
-        NetworkingAgentFixture).agents.with_items(**attributes)
+    # agents list is cached by the Neutron client for a short time only,
+    # so that agents restarts are noticed
+    return list_agents().with_items(**attributes)
 
 
 def count_networking_agents(**params) -> int:
@@ -0,0 +1,209 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from concurrent import futures
+import threading
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack import keystone
+from tobiko.openstack.neutron import _client
+
+
+LOG = log.getLogger(__name__)
+
+# Maximum number of resources created with a single request
+DEFAULT_BULK_SIZE = 100
+
+# Maximum number of concurrent requests
+DEFAULT_MAX_WORKERS = 8
+
+ResourceType = typing.Dict[str, typing.Any]
+
+
+class BulkOperationError(tobiko.TobikoException):
+    message = ("{operation} failed for {failed} of {total} Neutron "
+               "{collection}:\n{details}")
+
+
+def get_resource_id(resource: typing.Union[str, ResourceType]) -> str:
+    if isinstance(resource, str):
+        return resource
+    return resource['id']
+
+
+def check_bulk_errors(operation: str,
+                      collection: str,
+                      total: int,
+                      errors: typing.Dict[typing.Any, Exception]):
+    if errors:
+        details = '\n'.join(f"- {item}: {error}"
+                            for item, error in errors.items())
+        raise BulkOperationError(operation=operation,
+                                 collection=collection,
+                                 failed=len(errors),
+                                 total=total,
+                                 details=details,
+                                 errors=errors)
+
+
+def get_max_workers(client: _client.NeutronClientType = None,
+                    max_workers: int = None) -> int:
+    if client is not None:
+        # a given client can't be used for concurrent requests
+        return 1
+    return max_workers or DEFAULT_MAX_WORKERS
+
+
+def worker_client_getter(client: _client.NeutronClientType = None,
+                         max_workers: int = 1) \
+        -> typing.Callable[[], _client.NeutronClient]:
+    """Get a function returning the Neutron client of the calling thread
+
+    When requests are sent concurrently, every worker thread gets a client
+    with its own Keystone session, because with a common client an
+    SSLError exception is raised.
+    """
+    if max_workers <= 1:
+        return lambda: _client.neutron_client(client)
+
+    workers = threading.local()
+
+    def get_worker_client() -> _client.NeutronClient:
+        worker_client = getattr(workers, 'client', None)
+        if worker_client is None:
+            session = keystone.get_keystone_session(shared=False)
+            worker_client = workers.client = _client.get_neutron_client(
+                session=session, shared=False)
+        return worker_client
+
+    return get_worker_client
+
+
+def run_concurrently(function: typing.Callable,
+                     items: typing.Sequence[typing.Any],
+                     max_workers: int = None) \
+        -> typing.Tuple[typing.Dict[typing.Any, typing.Any],
+                        typing.Dict[typing.Any, Exception]]:
+    """Call function for every item, with a bounded number of threads
+
+    :returns: the results and the errors got, both indexed by item
+    """
+    results: typing.Dict[typing.Any, typing.Any] = {}
+    errors: typing.Dict[typing.Any, Exception] = {}
+    if not items:
+        return results, errors
+    max_workers = min(max_workers or DEFAULT_MAX_WORKERS, len(items))
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        submitted = {executor.submit(function, item): item
+                     for item in items}
+        for future in futures.as_completed(submitted):
+            item = submitted[future]
+            try:
+                results[item] = future.result()
+            except Exception as ex:
+                errors[item] = ex
+    return results, errors
+
+
+def create_resources(collection: str,
+                     resources: typing.Iterable[ResourceType],
+                     client: _client.NeutronClientType = None,
+                     bulk_size: int = None,
+                     max_workers: int = None) \
+        -> tobiko.Selection[ResourceType]:
+    """Create Neutron resources with as few requests as possible
+
+    Resources are sent to the server in bulk requests of up to bulk_size
+    of them (Neutron creates all the resources of a request or none of
+    them). Requests are sent concurrently, up to max_workers at a time,
+    each worker using its own Keystone session. When a client is given,
+    requests are sent with it one at a time instead.
+
+    :param collection: name of the resources collection (like 'ports')
+    :raises BulkOperationError: when any request fails. Its 'errors'
+        attribute maps the index of the first resource of every failed
+        request to the error got. Resources created by the other requests
+        are not deleted.
+    """
+    resources = list(resources)
+    bulk_size = bulk_size or DEFAULT_BULK_SIZE
+    starts = range(0, len(resources), bulk_size)
+    max_workers = min(get_max_workers(client, max_workers), len(starts))
+    get_client = worker_client_getter(client, max_workers)
+
+    def create_bulk(start: int) -> typing.List[ResourceType]:
+        create = getattr(get_client(), f'create_{collection[:-1]}')
+        body = {collection: resources[start:start + bulk_size]}
+        return create(body=body)[collection]
+
+    results, errors = run_concurrently(create_bulk, starts,
+                                       max_workers=max_workers)
+    created = tobiko.Selection[ResourceType](
+        resource for start in starts for resource in results.get(start, []))
+    LOG.debug(f"Created {len(created)} Neutron {collection} with "
+              f"{len(starts)} requests")
+    check_bulk_errors(operation='Creation', collection=collection,
+                      total=len(resources), errors=errors)
+    return created
+
+
+def delete_resources(collection: str,
+                     resources: typing.Iterable[
+                         typing.Union[str, ResourceType]],
+                     client: _client.NeutronClientType = None,
+                     max_workers: int = None,
+                     should_exist=False) -> typing.List[str]:
+    """Delete Neutron resources sending concurrent requests
+
+    At most max_workers requests are sent at a time, each worker using its
+    own Keystone session. When a client is given, requests are sent with
+    it one at a time instead.
+
+    :param collection: name of the resources collection (like 'ports')
+    :param should_exist: when false, resources already deleted are ignored
+    :returns: the IDs of the deleted resources
+    :raises BulkOperationError: when any resource can't be deleted. Its
+        'errors' attribute maps the ID of every failed resource to the
+        error got. All other resources are deleted anyway.
+    """
+    resource_ids = [get_resource_id(resource) for resource in resources]
+    max_workers = min(get_max_workers(client, max_workers),
+                      len(resource_ids))
+    get_client = worker_client_getter(client, max_workers)
+
+    def delete_resource(resource_id: str) -> bool:
+        delete = getattr(get_client(), f'delete_{collection[:-1]}')
+        try:
+            delete(resource_id)
+        except _client.NotFound:
+            if should_exist:
+                raise
+            return False
+        return True
+
+    results, errors = run_concurrently(delete_resource, resource_ids,
+                                       max_workers=max_workers)
+    deleted = [resource_id
+               for resource_id in resource_ids
+               if results.get(resource_id)]
+    LOG.debug(f"Deleted {len(deleted)} Neutron {collection}")
+    check_bulk_errors(operation='Deletion', collection=collection,
+                      total=len(resource_ids), errors=errors)
+    return deleted
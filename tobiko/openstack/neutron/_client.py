@@ -18,6 +18,7 @@ import typing
 from neutronclient.v2_0 import client as neutronclient
 
 import tobiko
+from tobiko.openstack import _cache
 from tobiko.openstack import _client
 
 
@@ -31,6 +32,9 @@ class NeutronClientFixture(_client.OpenstackClientFixture):
     def init_client(self, session):
         return neutronclient.Client(session=session)
 
+    def setup_api_cache(self, client):
+        return _cache.setup_neutron_client_cache(client)
+
 
 class NeutronClientManager(_client.OpenstackClientManager):
 
@@ -74,6 +78,31 @@ class HasNeutronClientFixture(tobiko.SharedFixture):
         self.client = neutron_client(self._obj)
 
 
+def iter_neutron_resources(collection: str,
+                           client: NeutronClientType = None,
+                           fields: typing.Iterable[str] = None,
+                           page_size: int = None,
+                           **params) \
+        -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """Iterate over Neutron resources, requesting them one page at a time
+
+    A new page is requested only when the caller has consumed the previous
+    one. Given params are sent to Neutron server as filters.
+
+    :param collection: name of the resources collection (like 'ports')
+    :param fields: when given, only these fields are got from the server
+    :param page_size: maximum number of resources got with every request
+    """
+    if fields is not None:
+        params['fields'] = list(fields)
+    list_resources = getattr(neutron_client(client), f'list_{collection}')
+    pages = list_resources(retrieve_all=False,
+                           limit=page_size or _client.DEFAULT_PAGE_SIZE,
+                           **params)
+    for page in pages:
+        yield from page[collection]
+
+
 def get_neutron_client(session=None, shared=True, init_client=None,
                        manager=None) -> neutronclient.Client:
     manager = manager or CLIENTS
@@ -55,6 +55,18 @@ def list_networks(client: _client.NeutronClientType = None,
     return tobiko.select(networks)
 
 
+def iter_networks(client: _client.NeutronClientType = None,
+                  fields: typing.Iterable[str] = None,
+                  page_size: int = None,
+                  **params) -> typing.Iterator[NetworkType]:
+    """Iterate over networks matching given filters, one page at a time"""
+    return _client.iter_neutron_resources('networks',
+                                          client=client,
+                                          fields=fields,
+                                          page_size=page_size,
+                                          **params)
+
+
 def find_network(client: _client.NeutronClientType = None,
                  unique=False,
                  default: NetworkType = None,
@@ -19,6 +19,8 @@ import typing
 import netaddr
 
 import tobiko
+from tobiko.openstack import _cache
+from tobiko.openstack.neutron import _bulk
 from tobiko.openstack.neutron import _client
 from tobiko.openstack.neutron import _network
 from tobiko.openstack.neutron import _subnet
@@ -39,11 +41,13 @@ def get_port_id(port: PortIdType) -> str:
 
 def get_port(port: PortIdType,
              client: _client.NeutronClientType = None,
+             cached=True,
              **params) -> PortType:
     port_id = get_port_id(port)
     try:
-        return _client.neutron_client(client).show_port(
-            port_id, **params)['port']
+        with _cache.api_cache_disabled(not cached):
+            return _client.neutron_client(client).show_port(
+                port_id, **params)['port']
     except _client.NotFound as ex:
         raise NoSuchPort(id=port_id) from ex
 
@@ -67,6 +71,43 @@ def create_port(client: _client.NeutronClientType = None,
     return port
 
 
+def create_ports_bulk(ports: typing.Iterable[typing.Dict[str, typing.Any]],
+                      client: _client.NeutronClientType = None,
+                      network: _network.NetworkIdType = None,
+                      add_cleanup=True,
+                      bulk_size: int = None,
+                      max_workers: int = None) \
+        -> tobiko.Selection[PortType]:
+    """Create many ports sending a few bulk requests
+
+    :param ports: parameters of every port to create
+    :param network: network of ports not specifying any network_id
+    """
+    ports = [dict(port) for port in ports]
+    if network is not None:
+        network_id = _network.get_network_id(network)
+        for port in ports:
+            port.setdefault('network_id', network_id)
+    created = _bulk.create_resources('ports', ports,
+                                     client=client,
+                                     bulk_size=bulk_size,
+                                     max_workers=max_workers)
+    if add_cleanup:
+        tobiko.add_cleanup(delete_ports, ports=created, client=client)
+    return created
+
+
+def delete_ports(ports: typing.Iterable[PortIdType],
+                 client: _client.NeutronClientType = None,
+                 max_workers: int = None,
+                 should_exist=False) -> typing.List[str]:
+    """Delete many ports sending concurrent requests"""
+    return _bulk.delete_resources('ports', ports,
+                                  client=client,
+                                  max_workers=max_workers,
+                                  should_exist=should_exist)
+
+
 def cleanup_port(port: PortIdType,
                  client: _client.NeutronClientType = None):
     try:
@@ -107,11 +148,10 @@ def get_device_id(device: DeviceIdType) -> str:
         raise TypeError(f'{device!r} is not a valid device type')
 
 
-def list_ports(client: _client.NeutronClientType = None,
-               device: DeviceIdType = None,
-               network: _network.NetworkIdType = None,
-               subnet: _subnet.SubnetIdType = None,
-               **params) -> tobiko.Selection[PortType]:
+def get_ports_filters(device: DeviceIdType = None,
+                      network: _network.NetworkIdType = None,
+                      subnet: _subnet.SubnetIdType = None,
+                      **params) -> typing.Dict[str, typing.Any]:
     if device is not None:
         params.setdefault('device_id', get_device_id(device))
     if network is not None:
@@ -119,10 +159,43 @@ def list_ports(client: _client.NeutronClientType = None,
     if subnet is not None:
         subnet_id = _subnet.get_subnet_id(subnet)
         params.setdefault('fixed_ips', f'subnet_id={subnet_id}')
-    ports = _client.neutron_client(client).list_ports(**params)['ports']
+    return params
+
+
+def list_ports(client: _client.NeutronClientType = None,
+               device: DeviceIdType = None,
+               network: _network.NetworkIdType = None,
+               subnet: _subnet.SubnetIdType = None,
+               cached=True,
+               **params) -> tobiko.Selection[PortType]:
+    params = get_ports_filters(device=device,
+                               network=network,
+                               subnet=subnet,
+                               **params)
+    with _cache.api_cache_disabled(not cached):
+        ports = _client.neutron_client(client).list_ports(**params)['ports']
     return tobiko.select(ports)
 
 
+def iter_ports(client: _client.NeutronClientType = None,
+               device: DeviceIdType = None,
+               network: _network.NetworkIdType = None,
+               subnet: _subnet.SubnetIdType = None,
+               fields: typing.Iterable[str] = None,
+               page_size: int = None,
+               **params) -> typing.Iterator[PortType]:
+    """Iterate over ports matching given filters, one page at a time"""
+    params = get_ports_filters(device=device,
+                               network=network,
+                               subnet=subnet,
+                               **params)
+    return _client.iter_neutron_resources('ports',
+                                          client=client,
+                                          fields=fields,
+                                          page_size=page_size,
+                                          **params)
+
+
 def find_port(client: _client.NeutronClientType = None,
               unique=False,
               default: PortType = None,
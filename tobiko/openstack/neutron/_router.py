@@ -95,7 +95,8 @@ def wait_for_master_and_backup_agents(
                                 interval=interval,
                                 default_timeout=300.,
                                 default_interval=3.):
-        router_agents = _agent.list_l3_agent_hosting_routers(router_id)
+        router_agents = _agent.list_l3_agent_hosting_routers(router_id,
+                                                             cached=False)
         master_agents = router_agents.with_items(ha_state='active')
         if master_agents:
             LOG.debug(
@@ -20,6 +20,7 @@ import typing
 from oslo_log import log
 
 import tobiko
+from tobiko.openstack.neutron import _bulk
 from tobiko.openstack.neutron import _client
 
 
@@ -112,6 +113,37 @@ def create_security_group_rule(security_group_id, add_cleanup=True,
     return sg_rule
 
 
+def create_security_group_rules_bulk(
+        security_group_id: str,
+        rules: typing.Iterable[typing.Dict[str, typing.Any]],
+        add_cleanup=True,
+        client: _client.NeutronClientType = None,
+        bulk_size: int = None) -> tobiko.Selection[SecurityGroupRuleType]:
+    """Add many rules to a security group sending a few bulk requests"""
+    rules = [dict(rule, security_group_id=security_group_id)
+             for rule in rules]
+    sg_rules = _bulk.create_resources('security_group_rules', rules,
+                                      client=client,
+                                      bulk_size=bulk_size)
+    if add_cleanup:
+        tobiko.add_cleanup(delete_security_group_rules,
+                           rules=sg_rules,
+                           client=client)
+    return sg_rules
+
+
+def delete_security_group_rules(rules: typing.Iterable[
+                                    SecurityGroupRuleIdType],
+                                client: _client.NeutronClientType = None,
+                                max_workers: int = None,
+                                should_exist=False) -> typing.List[str]:
+    """Delete many security group rules sending concurrent requests"""
+    return _bulk.delete_resources('security_group_rules', rules,
+                                  client=client,
+                                  max_workers=max_workers,
+                                  should_exist=should_exist)
+
+
 def delete_security_group_rule(rule_id: SecurityGroupRuleIdType,
                                should_exists: bool = False,
                                client: _client.NeutronClientType = None):
@@ -13,6 +13,7 @@
 #    under the License.
 from __future__ import absolute_import
 
+from tobiko.openstack.nova import _bulk
 from tobiko.openstack.nova import _checks
 from tobiko.openstack.nova import _client
 from tobiko.openstack.nova import _cloud_init
@@ -35,6 +36,7 @@ find_service = _client.find_service
 HasNovaClientMixin = _client.HasNovaClientMixin
 list_hypervisors = _client.list_hypervisors
 list_servers = _client.list_servers
+iter_servers = _client.iter_servers
 list_services = _client.list_services
 nova_client = _client.nova_client
 NovaClientFixture = _client.NovaClientFixture
@@ -63,12 +65,18 @@ NotInLocalStorageMigrateServerError = (
 NotInSharedStorageMigrateServerError = (
     _client.NotInSharedStorageMigrateServerError)
 
+CloudInitWaitResult = _cloud_init.CloudInitWaitResult
+InvalidCloudInitStatusError = _cloud_init.InvalidCloudInitStatusError
 WaitForCloudInitTimeoutError = _cloud_init.WaitForCloudInitTimeoutError
+WaitForServersCloudInitError = _cloud_init.WaitForServersCloudInitError
 cloud_config = _cloud_init.cloud_config
 get_cloud_init_status = _cloud_init.get_cloud_init_status
 user_data = _cloud_init.user_data
 wait_for_cloud_init_done = _cloud_init.wait_for_cloud_init_done
 wait_for_cloud_init_status = _cloud_init.wait_for_cloud_init_status
+wait_for_cloud_init_command = _cloud_init.wait_for_cloud_init_command
+wait_for_servers_cloud_init_done = (
+    _cloud_init.wait_for_servers_cloud_init_done)
 
 skip_if_missing_hypervisors = _hypervisor.skip_if_missing_hypervisors
 get_server_hypervisor = _hypervisor.get_server_hypervisor
@@ -90,8 +98,16 @@ action_on_all_instances = _server.action_on_all_instances
 
 wait_for_services_up = _service.wait_for_services_up
 
+CreateServersError = _bulk.CreateServersError
+create_servers = _bulk.create_servers
+delete_servers = _bulk.delete_servers
+get_server_index = _bulk.get_server_index
+list_reservation_servers = _bulk.list_reservation_servers
+
 check_nova_services_health = _checks.check_nova_services_health
 check_virsh_domains_running = _checks.check_virsh_domains_running
 wait_for_all_instances_status = _checks.wait_for_all_instances_status
+wait_for_servers_status = _checks.wait_for_servers_status
+WaitForServersStatusTimeout = _checks.WaitForServersStatusTimeout
 check_vms_ping = _checks.check_vms_ping
 check_vm_evacuations = _checks.check_vm_evacuations
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack.nova import _checks
+from tobiko.openstack.nova import _client
+
+
+LOG = log.getLogger(__name__)
+
+
+class CreateServersError(tobiko.TobikoException):
+    message = ("Nova created {created} servers instead of at least "
+               "{min_count} (reservation ID is {reservation_id!r})")
+
+
+def get_server_index(server: _client.NovaServer, name: str) -> int:
+    # Nova names multi-created servers as '<name>-<index>'
+    prefix = f'{name}-'
+    if server.name.startswith(prefix):
+        try:
+            return int(server.name[len(prefix):])
+        except ValueError:
+            pass
+    return 0
+
+
+def list_reservation_servers(reservation_id: str,
+                             client: _client.NovaClientType = None) \
+        -> typing.List[_client.NovaServer]:
+    """List servers created by a single multi-create request"""
+    return list(_client.iter_servers(client=client,
+                                     reservation_id=reservation_id))
+
+
+def delete_servers(servers: typing.Iterable[_client.ServerType],
+                   client: _client.NovaClientType = None):
+    """Delete servers ignoring the ones already deleted"""
+    for server in servers:
+        try:
+            _client.delete_server(server, client=client)
+        except _client.ServerNotFoundError:
+            LOG.debug(f"Server {_client.get_server_id(server)} already "
+                      "deleted")
+
+
+def create_servers(name: str,
+                   image: typing.Any,
+                   flavor: typing.Any,
+                   count: int,
+                   min_count: int = None,
+                   network: str = None,
+                   client: _client.NovaClientType = None,
+                   status: typing.Optional[str] = 'ACTIVE',
+                   timeout: tobiko.Seconds = None,
+                   interval: tobiko.Seconds = None,
+                   **params) -> tobiko.Selection[_client.NovaServer]:
+    """Create many servers with a single Nova request
+
+    Servers are created with Nova multi-create (min_count/max_count), so
+    that Nova names them '<name>-1', '<name>-2' and so on. When min_count
+    is given, Nova creates as many servers as it can up to count, or it
+    fails if it can't create at least min_count of them. Then it waits for
+    all of them to get given status listing them with a single request per
+    interval.
+
+    :param network: ID of the network where server ports are created,
+        unless 'nics' parameter is given
+    :param status: the status to wait for, or None not to wait at all
+    :param params: other novaclient servers.create parameters (like
+        key_name, security_groups, userdata or scheduler_hints)
+    :returns: servers details (including their IP addresses), sorted by
+        index
+    :raises CreateServersError: when Nova created too few servers
+    :raises WaitForServerStatusError: when any server gets an unexpected
+        status. All created servers are deleted before raising.
+    """
+    client = _client.nova_client(client)
+    min_count = min_count or count
+    if network is not None:
+        params.setdefault('nics', [{'net-id': network}])
+    reservation_id = client.servers.create(name=name,
+                                           image=image,
+                                           flavor=flavor,
+                                           min_count=min_count,
+                                           max_count=count,
+                                           reservation_id=True,
+                                           **params)
+    servers = list_reservation_servers(reservation_id, client=client)
+    LOG.info(f"Nova created {len(servers)} servers named '{name}' "
+             f"(reservation ID is {reservation_id!r})")
+    try:
+        if len(servers) < min_count:
+            raise CreateServersError(created=len(servers),
+                                     min_count=min_count,
+                                     reservation_id=reservation_id)
+        if status is not None:
+            found = _checks.wait_for_servers_status(servers=servers,
+                                                    status=status,
+                                                    client=client,
+                                                    timeout=timeout,
+                                                    interval=interval)
+            servers = [found[server.id] for server in servers]
+    except Exception:
+        LOG.exception(f"Deleting {len(servers)} servers named '{name}'")
+        delete_servers(servers, client=client)
+        raise
+    return tobiko.Selection[_client.NovaServer](
+        sorted(servers, key=lambda server: get_server_index(server, name)))
@@ -13,6 +13,8 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import typing
+
 from oslo_log import log
 
 import tobiko
@@ -132,11 +134,119 @@ def get_vm_uuid_list_running_via_virsh(topology_compute):
                       sudo=True).stdout.split()
 
 
+def list_changed_servers(changes_since: str = None,
+                         client: _client.NovaClientType = None) \
+        -> typing.Tuple[typing.List[_client.NovaServer],
+                        typing.Optional[str]]:
+    """List servers updated since given time, if any
+
+    :returns: the servers and the time to list next changes from
+    """
+    search_opts = {}
+    if changes_since is not None:
+        search_opts['changes-since'] = changes_since
+    servers = _client.nova_client(client).servers.list(
+        detailed=True, search_opts=search_opts)
+    for server in servers:
+        # changes-since is inclusive: servers updated at the same time are
+        # listed again and no change can be missed
+        if changes_since is None or server.updated > changes_since:
+            changes_since = server.updated
+    return servers, changes_since
+
+
+class WaitForServersStatusTimeout(tobiko.TobikoException):
+    message = ("{count} servers didn't change their status to {status} "
+               "after {timeout} seconds: {servers_status}")
+
+
+def wait_for_servers_status(
+        servers: typing.Iterable[_client.ServerType],
+        status: str,
+        client: _client.NovaClientType = None,
+        timeout: tobiko.Seconds = None,
+        interval: tobiko.Seconds = None,
+        transient_status: typing.Optional[typing.Container[str]] = None) \
+        -> typing.Dict[str, _client.NovaServer]:
+    """Wait until all given servers have got the same status
+
+    Instead of getting every server details, it lists at every interval
+    only the servers updated since the previous call (using Nova
+    changes-since filter), so that the number of API requests doesn't
+    depend on the number of servers.
+
+    :raises WaitForServerStatusError: as soon as a server gets a status
+        that is neither the expected nor a transient one
+    :raises WaitForServersStatusTimeout: when servers didn't reach the
+        status before the timeout
+    :returns: a dictionary with the details of every server by ID
+    """
+    if transient_status is None:
+        transient_status = (
+            _client.NOVA_SERVER_TRANSIENT_STATUS.get(status) or [])
+    server_ids = set(_client.get_server_id(server) for server in servers)
+    found: typing.Dict[str, _client.NovaServer] = {}
+    changes_since: typing.Optional[str] = None
+    for attempt in tobiko.retry(timeout=timeout,
+                                interval=interval,
+                                default_timeout=300.,
+                                default_interval=3.):
+        servers_list, changes_since = list_changed_servers(
+            changes_since=changes_since, client=client)
+        for server in servers_list:
+            if server.id not in server_ids:
+                continue
+            previous = found.get(server.id)
+            if previous is None or previous.status != server.status:
+                LOG.debug(f"Server {server.id} status is {server.status}")
+            found[server.id] = server
+
+        missing = server_ids - set(found)
+        if missing:
+            raise _client.ServerNotFoundError(server_id=sorted(missing)[0],
+                                              params={},
+                                              reason='server not listed')
+        pending = get_pending_servers_status(found=found,
+                                             status=status,
+                                             transient_status=transient_status)
+        if not pending:
+            break
+        try:
+            attempt.check_time_left()
+        except tobiko.RetryTimeLimitError as ex:
+            raise WaitForServersStatusTimeout(count=len(pending),
+                                              status=status,
+                                              timeout=timeout,
+                                              servers_status=pending) from ex
+        LOG.debug(f"Waiting for {len(pending)} of {len(server_ids)} "
+                  f"servers status to get to {status}")
+    else:
+        raise RuntimeError("Broken retry loop")
+
+    return found
+
+
+def get_pending_servers_status(
+        found: typing.Dict[str, _client.NovaServer],
+        status: str,
+        transient_status: typing.Container[str]) -> typing.Dict[str, str]:
+    pending = {server_id: server.status
+               for server_id, server in found.items()
+               if server.status != status}
+    for server_id, server_status in sorted(pending.items()):
+        if server_status not in transient_status:
+            raise _client.WaitForServerStatusError(server_id=server_id,
+                                                   server_status=server_status,
+                                                   status=status)
+    return pending
+
+
 def wait_for_all_instances_status(status, timeout=None):
     """wait for all instances for a certain status or raise an exception"""
-    for instance in _client.list_servers():
-        _client.wait_for_server_status(server=instance.id, status=status,
-                                       timeout=timeout)
+    instances = wait_for_servers_status(servers=_client.list_servers(),
+                                        status=status,
+                                        timeout=timeout)
+    for instance in instances.values():
         instance_info = 'instance {nova_instance} is {state} on {host}'.format(
             nova_instance=instance.name,
             state=status,
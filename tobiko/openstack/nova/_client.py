@@ -24,6 +24,7 @@ import novaclient.v2.hypervisors
 from oslo_log import log
 
 import tobiko
+from tobiko.openstack import _cache
 from tobiko.openstack import _client
 
 
@@ -40,6 +41,13 @@ class NovaClientFixture(_client.OpenstackClientFixture):
     def init_client(self, session) -> NovaClient:
         return novaclient.client.Client('2.56', session=session)
 
+    def setup_api_cache(self, client):
+        return _cache.setup_managers_cache(
+            'nova', client,
+            cached_managers=['aggregates', 'availability_zones', 'flavors',
+                             'hypervisors', 'services'],
+            mutating_managers=['servers'])
+
 
 class NovaClientManager(_client.OpenstackClientManager):
 
@@ -80,10 +88,12 @@ def get_nova_client(session=None, shared=True, init_client=None,
     return client.client
 
 
-def list_hypervisors(client: NovaClientType = None, detailed=True, **params) \
+def list_hypervisors(client: NovaClientType = None, detailed=True,
+                     cached=True, **params) \
         -> tobiko.Selection[NovaHypervisor]:
     client = nova_client(client)
-    hypervisors = client.hypervisors.list(detailed=detailed)
+    with _cache.api_cache_disabled(not cached):
+        hypervisors = client.hypervisors.list(detailed=detailed)
     return tobiko.select(hypervisors).with_attributes(**params)
 
 
@@ -102,6 +112,35 @@ def list_servers(client: NovaClientType = None, **params) -> \
     return tobiko.select(servers).with_attributes(**params)
 
 
+def iter_servers(client: NovaClientType = None,
+                 detailed=True,
+                 page_size: int = None,
+                 **search_opts) -> typing.Iterator[NovaServer]:
+    """Iterate over servers, requesting them one page at a time
+
+    A new page is requested only when the caller has consumed the previous
+    one. Given search options (like name, status or host) are sent to
+    Nova server as filters.
+
+    :param detailed: when false only server IDs, names and links are got
+    :param page_size: maximum number of servers got with every request. Nova
+        server could return fewer of them (see its max_limit option), so
+        pages are requested until an empty one is got.
+    """
+    client = nova_client(client)
+    page_size = page_size or _client.DEFAULT_PAGE_SIZE
+    marker = None
+    while True:
+        servers = client.servers.list(detailed=detailed,
+                                      search_opts=search_opts,
+                                      marker=marker,
+                                      limit=page_size)
+        if not servers:
+            break
+        yield from servers
+        marker = servers[-1].id
+
+
 def find_server(client: NovaClientType = None, unique=False, **params) -> \
         NovaServer:
     servers = list_servers(client=client, **params)
@@ -111,9 +150,11 @@ def find_server(client: NovaClientType = None, unique=False, **params) -> \
         return servers.first
 
 
-def list_services(client: NovaClientType = None, **params) -> tobiko.Selection:
+def list_services(client: NovaClientType = None, cached=True,
+                  **params) -> tobiko.Selection:
     client = nova_client(client)
-    services = client.services.list()
+    with _cache.api_cache_disabled(not cached):
+        services = client.services.list()
     return tobiko.select(services).with_attributes(**params)
 
 
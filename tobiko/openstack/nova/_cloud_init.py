@@ -14,6 +14,7 @@
 from __future__ import absolute_import
 
 from collections import abc
+from concurrent import futures
 import typing
 
 from oslo_log import log
@@ -29,6 +30,9 @@ CLOUD_INIT_TRANSIENT_STATES = {
     'done': ('running',)
 }
 
+# Seconds waited by default for cloud-init to complete
+CLOUD_INIT_TIMEOUT = 1200.
+
 CLOUD_INIT_OUTPUT_FILE = '/var/log/cloud-init-output.log'
 CLOUD_INIT_LOG_FILE = '/var/log/cloud-init.log'
 
@@ -203,7 +207,7 @@ def wait_for_cloud_init_status(
 
     for attempt in tobiko.retry(timeout=timeout,
                                 interval=sleep_interval,
-                                default_timeout=1200.,
+                                default_timeout=CLOUD_INIT_TIMEOUT,
                                 default_interval=5.):
         try:
             actual_status = get_cloud_init_status(ssh_client=ssh_client,
@@ -244,6 +248,159 @@ def wait_for_cloud_init_status(
     return actual_status
 
 
+class CloudInitWaitResult(typing.NamedTuple):
+    """Outcome of waiting for cloud-init on a single host
+
+    :param elapsed: seconds passed since the wait started when cloud-init
+        completed (or the wait failed) on this host
+    :param error: the reason why cloud-init didn't reach the expected
+        status, if any
+    """
+    ssh_client: typing.Optional[ssh.SSHClientFixture]
+    hostname: typing.Optional[str]
+    status: typing.Optional[str]
+    elapsed: float
+    error: typing.Optional[Exception] = None
+
+
+class WaitForServersCloudInitError(tobiko.TobikoException):
+    message = "cloud-init failed on {failed} of {total} hosts:\n{details}"
+
+
+def parse_cloud_init_status(output: str) -> typing.Optional[str]:
+    # 'cloud-init status --wait' prints dots before the status line
+    for line in reversed(output.splitlines()):
+        if line.startswith('status:'):
+            return line.split(':', 1)[1].strip()
+    return None
+
+
+def wait_for_cloud_init_command(
+        *expected_states: str,
+        ssh_client: typing.Optional[ssh.SSHClientFixture] = None,
+        timeout: tobiko.Seconds = None) \
+        -> str:
+    """Wait for cloud-init to complete with a single remote command
+
+    'cloud-init status --wait' returns as soon as cloud-init completes,
+    so that the same SSH session is kept open for the whole wait instead of
+    polling the status. Log files are read only when cloud-init doesn't
+    reach any of expected states. Guests whose cloud-init doesn't support
+    '--wait' are polled as by wait_for_cloud_init_status.
+    """
+    expected_states = expected_states or ('done',)
+    if timeout is None:
+        timeout = CLOUD_INIT_TIMEOUT
+    hostname = sh.get_hostname(ssh_client=ssh_client,
+                               timeout=timeout)
+
+    def _read_file(filename: str) -> str:
+        return read_file(filename=filename,
+                         ssh_client=ssh_client)
+
+    try:
+        output = sh.execute('cloud-init status --wait',
+                            ssh_client=ssh_client,
+                            timeout=timeout,
+                            sudo=True).stdout
+    except sh.ShellTimeoutExpired as ex:
+        raise WaitForCloudInitTimeoutError(
+            timeout=timeout,
+            hostname=hostname,
+            actual_status=parse_cloud_init_status(
+                getattr(ex, 'stdout', None) or ''),
+            expected_states=expected_states,
+            log_file=_read_file(CLOUD_INIT_LOG_FILE),
+            output_file=_read_file(CLOUD_INIT_OUTPUT_FILE)) from ex
+    except sh.ShellCommandFailed as ex:
+        # cloud-init exits with non-zero status when it reports errors
+        output = ex.stdout or ''
+
+    actual_status = parse_cloud_init_status(output)
+    if actual_status is None:
+        LOG.debug(f"'cloud-init status --wait' not supported on host "
+                  f"'{hostname}': polling cloud-init status")
+        return wait_for_cloud_init_status(*expected_states,
+                                          ssh_client=ssh_client,
+                                          timeout=timeout)
+    if actual_status not in expected_states:
+        raise InvalidCloudInitStatusError(
+            hostname=hostname,
+            actual_status=actual_status,
+            expected_states=expected_states,
+            log_file=_read_file(CLOUD_INIT_LOG_FILE),
+            output_file=_read_file(CLOUD_INIT_OUTPUT_FILE))
+    return actual_status
+
+
+def wait_for_servers_cloud_init_done(
+        ssh_clients: typing.Iterable[typing.Optional[ssh.SSHClientFixture]],
+        timeout: tobiko.Seconds = None,
+        max_workers: int = None) \
+        -> typing.List[CloudInitWaitResult]:
+    """Wait for cloud-init to complete on many hosts at the same time
+
+    A single 'cloud-init status --wait' command is executed on every host
+    concurrently, up to max_workers at a time (all of them by default).
+
+    :param timeout: seconds waited for every host (CLOUD_INIT_TIMEOUT by
+        default)
+    :returns: the result of every host, in the same order as ssh_clients
+    :raises WaitForServersCloudInitError: when cloud-init doesn't complete
+        on any host. Its 'results' attribute contains the result of every
+        host. Log files are included only for failed hosts.
+    """
+    ssh_clients = list(ssh_clients)
+    if not ssh_clients:
+        return []
+    if timeout is None:
+        timeout = CLOUD_INIT_TIMEOUT
+    start = tobiko.time()
+
+    def _wait(ssh_client: typing.Optional[ssh.SSHClientFixture]) \
+            -> CloudInitWaitResult:
+        hostname: typing.Optional[str] = None
+        status: typing.Optional[str] = None
+        error: typing.Optional[Exception] = None
+        try:
+            hostname = sh.get_hostname(ssh_client=ssh_client,
+                                       timeout=timeout)
+            status = wait_for_cloud_init_command('done',
+                                                 ssh_client=ssh_client,
+                                                 timeout=timeout)
+        except Exception as ex:
+            LOG.exception(f"cloud-init failed on host '{hostname}'")
+            error = ex
+            status = getattr(ex, 'actual_status', None)
+        elapsed = tobiko.time() - start
+        if error is None:
+            LOG.debug(f"cloud-init completed on host '{hostname}' after "
+                      f"{elapsed:.1f} seconds")
+        return CloudInitWaitResult(ssh_client=ssh_client,
+                                   hostname=hostname,
+                                   status=status,
+                                   elapsed=elapsed,
+                                   error=error)
+
+    max_workers = min(max_workers or len(ssh_clients), len(ssh_clients))
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_wait, ssh_clients))
+
+    failed = [result for result in results if result.error is not None]
+    LOG.info(f"cloud-init completed on {len(results) - len(failed)} of "
+             f"{len(results)} hosts after {tobiko.time() - start:.1f} "
+             "seconds")
+    if failed:
+        details = '\n'.join(f"- {result.hostname or result.ssh_client}: "
+                            f"{result.error}"
+                            for result in failed)
+        raise WaitForServersCloudInitError(failed=len(failed),
+                                           total=len(results),
+                                           details=details,
+                                           results=results)
+    return results
+
+
 def read_file(filename: str,
               tail=False,
               ssh_client: ssh.SSHClientType = None,
@@ -51,7 +51,8 @@ def wait_for_services_up(retry: typing.Optional[tobiko.Retry] = None,
                                 default_timeout=300.,
                                 default_interval=3.):
         try:
-            services = _client.list_services(**list_services_params)
+            services = _client.list_services(cached=False,
+                                             **list_services_params)
         except (ks_exceptions.connection.ConnectFailure,
                 nc_exceptions.ClientException):
             # Re-raises this exception in case this is the last attempt
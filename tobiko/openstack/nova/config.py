@@ -38,7 +38,16 @@ OPTIONS = [
     cfg.FloatOpt('cloudinit_is_reachable_timeout',
                  default=600.,
                  help="Timeout (in seconds) till cloud-init based server is "
-                      "reachable")
+                      "reachable"),
+    cfg.IntOpt('server_pool_size',
+               default=2,
+               help=("Number of pre-booted servers kept ready by every "
+                     "server pool (for every stack class) of every tobiko "
+                     "worker")),
+    cfg.FloatOpt('server_pool_lease_timeout',
+                 default=900.,
+                 help=("Timeout (in seconds) waiting for a server of a "
+                       "pool to be available")),
 ]
 
 
@@ -48,6 +48,7 @@ create_member = _client.create_member
 
 # Waiters
 wait_for_status = _waiters.wait_for_status
+watch_status = _waiters.watch_status
 wait_for_octavia_service = _waiters.wait_for_octavia_service
 
 # Validators
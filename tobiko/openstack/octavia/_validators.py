@@ -14,18 +14,19 @@
 #    under the License.
 from __future__ import absolute_import
 
-import collections
 import typing
 
 from oslo_log import log
 
 import tobiko
+from tobiko import config
 from tobiko.openstack import octavia
 from tobiko.shell import curl
-from tobiko.shell import ssh
 from tobiko.shell import sh
+from tobiko.shell import ssh
 
 
+CONF = config.CONF
 LOG = log.getLogger(__name__)
 
 
@@ -38,10 +39,25 @@ def check_members_balanced(ip_address: str,
                            requests_count: int = 10,
                            connect_timeout: tobiko.Seconds = 10.,
                            interval: tobiko.Seconds = 1,
-                           ssh_client: ssh.SSHClientFixture = None) -> (
+                           ssh_client: ssh.SSHClientFixture = None,
+                           concurrency: int = None,
+                           keep_alive: bool = None) -> (
         typing.Dict[str, int]):
 
-    """Check if traffic is properly balanced between members."""
+    """Check if traffic is properly balanced between members.
+
+    members_count * requests_count requests are sent concurrently from
+    a single command executed on the client host.
+
+    :param interval: pause between requests sent by the same worker
+    :param concurrency: number of requests being sent at the same time
+    :param keep_alive: whether every worker reuses the same connection.
+        It is ignored for TCP listeners, that balance connections instead
+        of requests.
+    :raises TrafficTimeoutError: when some request timed out
+    :raises sh.ShellCommandFailed: when curl failed for some other reason
+    :raises RequestException: when some request got an error reply
+    """
 
     # Getting the members count
     if members_count is None:
@@ -52,43 +68,48 @@ def check_members_balanced(ip_address: str,
         else:  # members_count is None and pool_id is not None
             members_count = len(list(octavia.list_members(pool_id=pool_id)))
 
-    last_content = None
-    replies: typing.Dict[str, int] = collections.defaultdict(lambda: 0)
-    for attempt in tobiko.retry(count=members_count * requests_count,
-                                interval=interval):
-        try:
-            content = curl.execute_curl(
-                hostname=ip_address,
-                scheme='HTTP' if protocol == 'TCP' else protocol,
-                port=port,
-                path='id',
-                connect_timeout=connect_timeout,
-                ssh_client=ssh_client).strip()
-        except sh.ShellCommandFailed as ex:
-            if ex.exit_status == 28:
-                raise octavia.TrafficTimeoutError(
-                    reason=str(ex.stderr)) from ex
-            else:
-                raise ex
-
-        replies[content] += 1
-
-        if last_content is not None and lb_algorithm == 'ROUND_ROBIN':
-            if members_count > 1 and last_content == content:
-                raise octavia.RoundRobinException(
-                    'Request was forwarded two times to the same host:\n'
-                    f'members_count: {members_count}\n'
-                    f'expected: {last_content}\n'
-                    f'actual: {content}\n')
-
-        last_content = content
-
-        if attempt.is_last:
-            break
-    else:
-        raise RuntimeError('Broken retry loop')
-
+    if concurrency is None:
+        concurrency = CONF.tobiko.octavia.traffic_concurrency
+    if keep_alive is None:
+        keep_alive = CONF.tobiko.octavia.traffic_keep_alive
+    if keep_alive and protocol == 'TCP':
+        # every connection would be forwarded to a single member
+        LOG.debug('Keep-alive is disabled for TCP listeners')
+        keep_alive = False
+
+    total_requests = members_count * requests_count
+    report = curl.execute_curl_load(
+        hostname=ip_address,
+        scheme='HTTP' if protocol == 'TCP' else protocol,
+        port=port,
+        path='id',
+        requests_count=total_requests,
+        concurrency=concurrency,
+        keep_alive=keep_alive,
+        connect_timeout=connect_timeout,
+        interval=interval,
+        ssh_client=ssh_client)
+
+    check_curl_load_failures(report)
+    if len(report.results) != total_requests:
+        raise octavia.RequestException(
+            command=f'curl {report.url}',
+            error=f'{len(report.results)} replies were got for '
+                  f'{total_requests} requests')
+
+    replies = report.hits
     LOG.debug(f"Replies counts from load balancer: {replies}")
+    LOG.debug("Replies latency percentiles from load balancer: "
+              f"{report.latency_percentiles()}")
+
+    if lb_algorithm == 'ROUND_ROBIN' and members_count > 1 and replies:
+        # whatever the order requests are forwarded in, round robin gives
+        # every member the same number of requests, give or take one
+        if max(replies.values()) - min(replies.values()) > 1:
+            raise octavia.RoundRobinException(
+                'Requests were not evenly forwarded to members:\n'
+                f'members_count: {members_count}\n'
+                f'replies: {replies}\n')
 
     # assert that 'members_count' servers replied
     missing_members_count = members_count - len(replies)
@@ -100,3 +121,31 @@ def check_members_balanced(ip_address: str,
             f'Missing replies from {missing_members_count} members.')
 
     return replies
+
+
+def check_curl_load_failures(report: curl.CurlLoadReport):
+    failures = report.failures
+    if not failures:
+        return
+    timeouts = [failure for failure in failures
+                if failure.exit_status == 28]
+    if timeouts:
+        raise octavia.TrafficTimeoutError(
+            reason=f'{len(timeouts)} of {len(report.results)} requests '
+                   'timed out')
+    errors = [failure for failure in failures
+              if failure.exit_status]
+    if errors:
+        exit_statuses = sorted(set(error.exit_status for error in errors))
+        raise sh.ShellCommandFailed(
+            command=f'curl {report.url}',
+            exit_status=exit_statuses[0],
+            stdin=None,
+            stdout=None,
+            stderr=f'{len(errors)} of {len(report.results)} requests '
+                   f'failed (exit statuses: {exit_statuses})')
+    http_codes = sorted(set(failure.http_code for failure in failures))
+    raise octavia.RequestException(
+        command=f'curl {report.url}',
+        error=f'{len(failures)} of {len(report.results)} requests got '
+              f'error replies (HTTP codes: {http_codes})')
@@ -14,6 +14,7 @@
 #    under the License.
 from __future__ import absolute_import
 
+from concurrent import futures
 import typing
 
 from oslo_log import log
@@ -28,6 +29,55 @@ LOG = log.getLogger(__name__)
 CONF = config.CONF
 
 
+def get_load_balancer(lb_id: str):
+    os_sdk_client = openstacksdkclient.openstacksdk_client()
+    return os_sdk_client.load_balancer.get_load_balancer(lb_id)
+
+
+def list_load_balancers():
+    return octavia.list_load_balancers()
+
+
+LOAD_BALANCER_KIND = tobiko.PollingKind(name='load_balancer',
+                                        get_object=get_load_balancer,
+                                        list_objects=list_load_balancers)
+
+
+def watch_status(object_id: str,
+                 status_key: str = _constants.PROVISIONING_STATUS,
+                 status: str = _constants.ACTIVE,
+                 get_client: typing.Callable = None,
+                 interval: tobiko.Seconds = None,
+                 timeout: tobiko.Seconds = None,
+                 **kwargs) -> futures.Future:
+    """Get a future resolved once the object reaches a specific status
+
+    Load balancers are checked by the shared status poller with a single
+    list call, however many of them are being waited for.
+    """
+    if get_client is None:
+        kind = LOAD_BALANCER_KIND
+    else:
+        kind = tobiko.PollingKind(name=get_client.__name__,
+                                  get_object=get_client)
+    if timeout is None:
+        timeout = CONF.tobiko.octavia.check_timeout
+    if interval is None:
+        interval = CONF.tobiko.octavia.check_interval
+
+    def has_status(response) -> bool:
+        LOG.debug(f"{kind.name} '{object_id}' {status_key} is "
+                  f"'{response[status_key]}' (waiting for '{status}')")
+        return response[status_key] == status
+
+    return tobiko.watch_object(kind=kind,
+                               object_id=object_id,
+                               predicate=has_status,
+                               timeout=timeout,
+                               interval=interval,
+                               **kwargs)
+
+
 def wait_for_status(object_id: str,
                     status_key: str = _constants.PROVISIONING_STATUS,
                     status: str = _constants.ACTIVE,
@@ -44,31 +94,18 @@ def wait_for_status(object_id: str,
                         Ex. _client.get_loadbalancer
     :param interval: How often to check the status, in seconds.
     :param timeout: The maximum time, in seconds, to check the status.
-    :raises TimeoutException: The object did not achieve the status or ERROR in
-                              the check_timeout period.
+    :raises tobiko.WaitForObjectTimeout: The object did not achieve the
+                                         status in the timeout period.
     :raises UnexpectedStatusException: The request returned an unexpected
                                        response code.
     """
-
-    if not get_client:
-        os_sdk_client = openstacksdkclient.openstacksdk_client()
-        get_client = os_sdk_client.load_balancer.get_load_balancer
-
-    for attempt in tobiko.retry(timeout=timeout,
-                                interval=interval,
-                                default_timeout=(
-                                        CONF.tobiko.octavia.check_timeout),
-                                default_interval=(
-                                        CONF.tobiko.octavia.check_interval)):
-        response = get_client(object_id, **kwargs)
-        if response[status_key] == status:
-            return response
-
-        # it will raise tobiko.RetryTimeLimitError in case of timeout
-        attempt.check_limits()
-
-        LOG.debug(f"Waiting for {get_client.__name__} {status_key} to get "
-                  f"from '{response[status_key]}' to '{status}'...")
+    return watch_status(object_id=object_id,
+                        status_key=status_key,
+                        status=status,
+                        get_client=get_client,
+                        interval=interval,
+                        timeout=timeout,
+                        **kwargs).result()
 
 
 def wait_for_octavia_service(interval: tobiko.Seconds = None,
@@ -28,6 +28,16 @@ OPTIONS = [
     cfg.StrOpt('amphora_user',
                default='cloud-user',
                help='The user we should use when we SSH the amphora.'),
+    cfg.IntOpt('traffic_concurrency',
+               default=10,
+               help='Number of concurrent HTTP requests sent to the load '
+                    'balancer when checking traffic is balanced between '
+                    'its members.'),
+    cfg.BoolOpt('traffic_keep_alive',
+                default=False,
+                help='Whether HTTP requests sent concurrently to the load '
+                     'balancer should reuse connections. It is ignored '
+                     'for TCP listeners.'),
 ]
 
 
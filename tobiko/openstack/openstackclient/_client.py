@@ -59,11 +59,12 @@ def _param_list(*args, **kwargs):
         credentials = keystone.keystone_credentials()
         tmp_auth = {}
         tmp_auth['os-auth-url'] = credentials.auth_url
-        tmp_auth['os-password'] = credentials.password
-        tmp_auth['os-username'] = credentials.username
+        # The token shared by tobiko workers is used, so that the CLI does
+        # not need to authenticate with user password every time
+        tmp_auth['os-auth-type'] = 'token'
+        tmp_auth['os-token'] = keystone.get_keystone_token()
         tmp_auth['os-cacert'] = credentials.cacert
         tmp_auth['os-project-name'] = credentials.project_name
-        tmp_auth['os-user-domain-name'] = credentials.user_domain_name
         tmp_auth['os-project-domain-name'] = credentials.project_domain_name
         tmp_auth['os-project-domain-id'] = credentials.project_domain_id
         if credentials.api_version == 3:
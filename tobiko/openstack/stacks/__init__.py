@@ -21,6 +21,7 @@ from tobiko.openstack.stacks import _l3ha
 from tobiko.openstack.stacks import _neutron
 from tobiko.openstack.stacks import _nova
 from tobiko.openstack.stacks import _octavia
+from tobiko.openstack.stacks import _pool
 from tobiko.openstack.stacks import _qos
 from tobiko.openstack.stacks import _advanced_vm
 from tobiko.openstack.stacks import _vlan
@@ -37,6 +38,7 @@ CirrosPeerServerStackFixture = _cirros.CirrosPeerServerStackFixture
 CirrosDifferentHostServerStackFixture = (
     _cirros.CirrosDifferentHostServerStackFixture)
 CirrosSameHostServerStackFixture = _cirros.CirrosSameHostServerStackFixture
+CirrosMultiServerStackFixture = _cirros.CirrosMultiServerStackFixture
 RebootCirrosServerOperation = _cirros.RebootCirrosServerOperation
 EvacuableCirrosImageFixture = _cirros.EvacuableCirrosImageFixture
 EvacuableServerStackFixture = _cirros.EvacuableServerStackFixture
@@ -83,6 +85,13 @@ ServerGroupStackFixture = _nova.ServerGroupStackFixture
 AffinityServerGroupStackFixture = _nova.AffinityServerGroupStackFixture
 AntiAffinityServerGroupStackFixture = _nova.AntiAffinityServerGroupStackFixture
 CloudInitServerStackFixture = _nova.CloudInitServerStackFixture
+MultiServerStackFixture = _nova.MultiServerStackFixture
+wait_for_servers_cloud_init_done = _nova.wait_for_servers_cloud_init_done
+
+ServerStackPool = _pool.ServerStackPool
+ServerStackPoolError = _pool.ServerStackPoolError
+server_stack_pool = _pool.server_stack_pool
+lease_server_stack = _pool.lease_server_stack
 
 # Octavia resources: backend servers
 OctaviaServerStackFixture = _octavia.OctaviaServerStackFixture
@@ -133,6 +133,15 @@ class CirrosDifferentHostServerStackFixture(
     pass
 
 
+class CirrosMultiServerStackFixture(_nova.MultiServerStackFixture):
+
+    #: Glance image used to create Nova server instances
+    image_fixture = tobiko.required_fixture(CirrosImageFixture)
+
+    #: Flavor used to create Nova server instances
+    flavor_stack = tobiko.required_fixture(CirrosFlavorStackFixture)
+
+
 class RebootCirrosServerOperation(sh.RebootHostOperation):
 
     stack = tobiko.required_fixture(CirrosServerStackFixture)
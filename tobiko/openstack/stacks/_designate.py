@@ -58,12 +58,19 @@ class DesignateZoneStackFixture(heat.HeatStackFixture):
             records=self.recordset_records)
 
     def wait_for_active_recordsets(self):
-        for recordset in designate.list_recordsets(self.zone_id):
-            self.wait_for_active_recordset(zone_id=self.zone_id,
-                                           recordset_id=recordset['id'])
+        tobiko.wait_for_futures(
+            self.watch_active_recordset(zone_id=self.zone_id,
+                                        recordset_id=recordset['id'])
+            for recordset in designate.list_recordsets(self.zone_id))
 
     def wait_for_active_recordset(self, zone_id, recordset_id, **kwargs):
-        designate.wait_for_status(
+        return self.watch_active_recordset(zone_id=zone_id,
+                                           recordset_id=recordset_id,
+                                           **kwargs).result()
+
+    @staticmethod
+    def watch_active_recordset(zone_id, recordset_id, **kwargs):
+        return designate.watch_status(
             status_key=designate.STATUS,
             status=designate.ACTIVE,
             get_client=designate.get_recordset,
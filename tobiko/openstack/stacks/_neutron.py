@@ -621,9 +621,8 @@ class StatelessSecurityGroupFixture(base_fixture.ResourceFixture):
             add_cleanup=False, stateful=False)
 
         # add rules once the SG was created
-        for rule in self.rules:
-            neutron.create_security_group_rule(
-                sg['id'], add_cleanup=False, **rule)
+        neutron.create_security_group_rules_bulk(
+            sg['id'], self.rules, add_cleanup=False)
 
         # return the updated SG, including the rules just added
         return self.resource_find()
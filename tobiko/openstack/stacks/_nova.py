@@ -15,6 +15,7 @@
 #    under the License.
 from __future__ import absolute_import
 
+import re
 import typing
 from abc import ABC
 
@@ -330,7 +331,8 @@ class ServerStackFixture(heat.HeatStackFixture, ABC):
         if stack:
             details[self.fixture_name + '.stack'] = (
                 self.details_content(get_json=lambda: stack._info))
-            if stack.stack_status == 'CREATE_COMPLETE':
+            if stack.stack_status in {heat.CREATE_COMPLETE,
+                                      heat.UPDATE_COMPLETE}:
                 details[self.fixture_name + '.server_details'] = (
                     self.details_content(
                         get_json=lambda: self.server_details._info))
@@ -480,6 +482,157 @@ class CloudInitServerStackFixture(ServerStackFixture, ABC):
                                       **params)
 
 
+def wait_for_servers_cloud_init_done(
+        server_stacks: typing.Iterable[CloudInitServerStackFixture],
+        timeout: tobiko.Seconds = None,
+        max_workers: int = None) \
+        -> typing.List[nova.CloudInitWaitResult]:
+    """Wait for cloud-init to complete on all given servers at once
+
+    By default it waits for the longest is_reachable_timeout of the stacks.
+    """
+    server_stacks = list(server_stacks)
+    if timeout is None:
+        timeouts = [stack.is_reachable_timeout
+                    for stack in server_stacks
+                    if stack.is_reachable_timeout is not None]
+        timeout = max(timeouts, default=None)
+    return nova.wait_for_servers_cloud_init_done(
+        [stack.ssh_client for stack in server_stacks],
+        timeout=timeout,
+        max_workers=max_workers)
+
+
+class MultiServerStackFixture(tobiko.SharedFixture, ABC):
+    """Many identical servers created with a single Nova request
+
+    Instead of creating a Heat stack (or a stack resource) for every
+    server, servers are created with Nova multi-create and the fixture
+    waits for all of them listing their status with a single request per
+    interval. Servers created before with the same name are reused when
+    there are enough of them and all of them are active.
+    """
+
+    #: number of servers to create
+    server_count = 2
+
+    #: minimum number of servers Nova has to create (server_count if None)
+    min_server_count: typing.Optional[int] = None
+
+    #: servers name prefix (fixture name if None)
+    server_name: typing.Optional[str] = None
+
+    #: maximum time servers have to get active
+    create_timeout: tobiko.Seconds = 900.
+
+    #: stack with the key pair for the server instances
+    key_pair_stack = tobiko.required_fixture(KeyPairStackFixture)
+
+    #: stack with the internal network where server ports are created
+    network_stack = tobiko.required_fixture(_neutron.NetworkStackFixture)
+
+    image_fixture: tobiko.RequiredFixture[glance.GlanceImageFixture]
+
+    flavor_stack: tobiko.RequiredFixture[FlavorStackFixture]
+
+    def __init__(self):
+        super(MultiServerStackFixture, self).__init__()
+        self.servers = tobiko.Selection[nova.NovaServer]()
+
+    @property
+    def security_groups(self) -> typing.List[str]:
+        """Security groups to be associated to network ports"""
+        return []
+
+    @property
+    def scheduler_hints(self) -> typing.Dict[str, typing.Any]:
+        return {}
+
+    @property
+    def user_data(self) -> typing.Optional[str]:
+        return None
+
+    def setup_server_name(self) -> str:
+        name = self.server_name
+        if name is None:
+            self.server_name = name = self.fixture_name
+        return name
+
+    @tobiko.interworker_synched('multi_server_setup_fixture')
+    def setup_fixture(self):
+        name = self.setup_server_name()
+        servers = self.find_servers()
+        if servers is None:
+            servers = self.create_servers()
+        self.servers = servers
+        tobiko.addme_to_shared_resource(__name__, name)
+
+    def list_servers(self) -> tobiko.Selection[nova.NovaServer]:
+        """List servers created by any previous fixture with the same name
+        """
+        name = self.setup_server_name()
+        servers = tobiko.Selection[nova.NovaServer](
+            server
+            for server in nova.iter_servers(
+                name=f'^{re.escape(name)}(-[0-9]+)?$')
+            if getattr(server, 'OS-EXT-STS:task_state', None) != 'deleting')
+        return servers
+
+    def find_servers(self) -> typing.Optional[
+            tobiko.Selection[nova.NovaServer]]:
+        name = self.setup_server_name()
+        servers = self.list_servers()
+        if not servers:
+            return None
+        min_count = self.min_server_count or self.server_count
+        if (len(servers) >= min_count and
+                all(server.status == 'ACTIVE' for server in servers)):
+            LOG.debug(f"Reusing {len(servers)} servers named '{name}'")
+            return tobiko.Selection[nova.NovaServer](
+                sorted(servers,
+                       key=lambda server: nova.get_server_index(server,
+                                                                name)))
+        LOG.info(f"Deleting {len(servers)} invalid servers named '{name}'")
+        nova.delete_servers(servers)
+        return None
+
+    def create_servers(self) -> tobiko.Selection[nova.NovaServer]:
+        return nova.create_servers(
+            name=self.setup_server_name(),
+            image=self.image_fixture.image_id,
+            flavor=self.flavor_stack.flavor_id,
+            count=self.server_count,
+            min_count=self.min_server_count,
+            network=self.network_stack.network_id,
+            key_name=self.key_pair_stack.key_name,
+            security_groups=self.security_groups or None,
+            scheduler_hints=self.scheduler_hints or None,
+            userdata=self.user_data,
+            timeout=self.create_timeout)
+
+    def cleanup_fixture(self):
+        name = self.setup_server_name()
+        n_tests_using_servers = len(tobiko.removeme_from_shared_resource(
+            __name__, name))
+        if n_tests_using_servers:
+            LOG.info(f"Servers named '{name}' not deleted because "
+                     f"{n_tests_using_servers} tests are using them")
+            return
+        nova.delete_servers(self.servers or self.list_servers())
+        self.servers = tobiko.Selection[nova.NovaServer]()
+
+    @property
+    def server_ids(self) -> typing.List[str]:
+        return [server.id for server in self.servers]
+
+    def list_fixed_ips(self, ip_version: typing.Optional[int] = None) \
+            -> typing.Dict[str, tobiko.Selection[netaddr.IPAddress]]:
+        """Get the fixed IP addresses of every server by server ID"""
+        return {server.id: nova.list_server_ip_addresses(
+                    server, ip_version=ip_version, address_type='fixed')
+                for server in self.servers}
+
+
 class ExternalServerStackFixture(ServerStackFixture, ABC):
     # pylint: disable=abstract-method
 
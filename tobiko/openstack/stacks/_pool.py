@@ -0,0 +1,275 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from concurrent import futures
+import threading
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.openstack import neutron
+from tobiko.openstack import nova
+from tobiko.openstack.stacks import _nova
+
+
+LOG = log.getLogger(__name__)
+
+# Seconds between checks for a pool server becoming available
+LEASE_INTERVAL = 1.
+
+# Shelves user keeping servers being replaced from being leased
+REPLACING_USER = f'{__name__}.replacing'
+
+ServerStackType = typing.TypeVar('ServerStackType',
+                                 bound=_nova.ServerStackFixture)
+
+
+class ServerStackPoolError(tobiko.TobikoException):
+    message = "no server of pool {name!r} can be leased: {reason}"
+
+
+class ServerStackPool(typing.Generic[ServerStackType]):
+    """Keeps pre-booted servers ready to be leased to test cases
+
+    The pool creates size stacks of the same class (named after the class
+    with a '-pool-<index>' suffix) in background threads. A leased server
+    is used exclusively by the test case that leased it: leases are
+    recorded in shelves like stacks users, so that servers are not shared
+    between pytest workers and leases left by any test case are dropped
+    when the test case ends. Every worker checks a server stack has not
+    been replaced by another worker before leasing it. Servers are reset
+    when released (their status and their port security groups) and the
+    ones that can't be reset are replaced in background, without any
+    worker being able to lease them until they are ready again.
+    """
+
+    def __init__(self,
+                 stack_class: typing.Type[ServerStackType],
+                 size: int,
+                 max_workers: int = None):
+        self.name = tobiko.get_fixture_name(stack_class)
+        self.size = max(1, size)
+        self.members: typing.Dict[str, ServerStackType] = {}
+        for index in range(self.size):
+            stack_name = f'{self.name}-pool-{index}'
+            self.members[stack_name] = stack_class(stack_name=stack_name)
+        self.security_groups: typing.Dict[str, typing.List[str]] = {}
+        # servers leased by this process
+        self.leased: typing.Set[str] = set()
+        self._futures: typing.Dict[str, futures.Future] = {}
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers or self.size,
+            thread_name_prefix=f'server-pool-{self.name}')
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.name}, size={self.size}>"
+
+    def refill(self):
+        """Prepare in background all servers that are not ready"""
+        with self._lock:
+            for stack_name, member in self.members.items():
+                future = self._futures.get(stack_name)
+                if (future is None or
+                        (future.done() and future.exception() is not None)):
+                    self._futures[stack_name] = self._executor.submit(
+                        self.prepare_member, member)
+
+    def prepare_member(self, member: ServerStackType) -> ServerStackType:
+        LOG.debug(f"Preparing pool server '{member.stack_name}'...")
+        try:
+            tobiko.setup_fixture(member)
+            self.check_member(member)
+            port = neutron.get_port(member.port_id)
+        except Exception:
+            LOG.exception(f"Unable to prepare pool server "
+                          f"'{member.stack_name}'")
+            raise
+        self.security_groups[member.setup_stack_name()] = sorted(
+            port['security_groups'])
+        LOG.debug(f"Pool server '{member.stack_name}' is ready")
+        return member
+
+    def discard_member(self, member: ServerStackType):
+        """Replace a server in background"""
+        LOG.warning(f"Replacing pool server '{member.stack_name}'")
+
+        def replace_member():
+            try:
+                member.setup_client()
+                member.cleanup_stack()
+                # a new fixture is required to set up the stack again
+                new_member = type(member)(stack_name=stack_name)
+                with self._lock:
+                    self.members[stack_name] = new_member
+                return self.prepare_member(new_member)
+            finally:
+                tobiko.removeme_from_shared_resource(
+                    __name__, stack_name, testcase_id=REPLACING_USER)
+
+        stack_name = member.setup_stack_name()
+        # other workers can't lease the server until it has been replaced
+        tobiko.addme_to_shared_resource(__name__, stack_name,
+                                        testcase_id=REPLACING_USER)
+        with self._lock:
+            self._futures[stack_name] = self._executor.submit(
+                replace_member)
+
+    @staticmethod
+    def check_member(member: ServerStackType):
+        server = nova.get_server(member.server_id)
+        if server.status != 'ACTIVE':
+            member.ensure_server_status('ACTIVE')
+
+    def lease(self, timeout: tobiko.Seconds = None) -> ServerStackType:
+        """Get a ready server no other test case is using
+
+        :raises ServerStackPoolError: when no server becomes available
+            within timeout seconds
+        """
+        self.refill()
+        for attempt in tobiko.retry(timeout=timeout,
+                                    interval=LEASE_INTERVAL,
+                                    default_timeout=900.):
+            member = self.lease_ready()
+            if member is not None:
+                return member
+            with self._lock:
+                pending = [future
+                           for future in self._futures.values()
+                           if not future.done()]
+            if attempt.is_last:
+                raise ServerStackPoolError(
+                    name=self.name,
+                    reason=f"{len(pending)} of {self.size} servers still "
+                           "being prepared, the others are leased or "
+                           "failed")
+            if pending:
+                futures.wait(pending,
+                             timeout=tobiko.to_seconds_float(
+                                 attempt.interval),
+                             return_when=futures.FIRST_COMPLETED)
+            # servers failed in the meantime are prepared again
+            self.refill()
+        raise RuntimeError('Broken retry loop')
+
+    def lease_ready(self) -> typing.Optional[ServerStackType]:
+        with self._lock:
+            ready = [stack_name
+                     for stack_name, future in self._futures.items()
+                     if future.done() and future.exception() is None]
+        for stack_name in ready:
+            with self._lock:
+                if (stack_name in self.leased or
+                        not tobiko.lease_shared_resource(__name__,
+                                                         stack_name)):
+                    continue
+                self.leased.add(stack_name)
+                member = self.members[stack_name]
+            if self.is_member_current(member):
+                LOG.debug(f"Pool server '{stack_name}' leased")
+                return member
+            self.renew_member(member)
+            tobiko.removeme_from_shared_resource(__name__, stack_name)
+            with self._lock:
+                self.leased.discard(stack_name)
+        return None
+
+    @staticmethod
+    def is_member_current(member: ServerStackType) -> bool:
+        """Check the stack has not been replaced by another worker
+
+        Stack outputs (like server_id or port_id) got by this worker are
+        discarded, so that they are got again from the stack.
+        """
+        stack_id = member.stack.id if member.stack is not None else None
+        stack = member.get_stack()
+        return (stack is not None and
+                stack_id is not None and
+                stack.id == stack_id)
+
+    def renew_member(self, member: ServerStackType):
+        """Prepare again in background a server replaced by another worker
+        """
+        stack_name = member.setup_stack_name()
+        LOG.info(f"Pool server '{stack_name}' has been replaced by another "
+                 "worker")
+        # a new fixture is required to set up the stack again
+        new_member = type(member)(stack_name=stack_name)
+        with self._lock:
+            self.members[stack_name] = new_member
+            self._futures[stack_name] = self._executor.submit(
+                self.prepare_member, new_member)
+
+    def release(self, member: ServerStackType):
+        """Reset a leased server and make it available again"""
+        try:
+            self.reset_member(member)
+        except Exception:
+            LOG.exception(f"Unable to reset pool server "
+                          f"'{member.stack_name}'")
+            self.discard_member(member)
+        finally:
+            tobiko.removeme_from_shared_resource(__name__, member.stack_name)
+            with self._lock:
+                self.leased.discard(member.stack_name)
+        LOG.debug(f"Pool server '{member.stack_name}' released")
+
+    def reset_member(self, member: ServerStackType):
+        self.check_member(member)
+        expected = self.security_groups.get(member.setup_stack_name())
+        # tests could have changed security groups without using tobiko
+        port = neutron.get_port(member.port_id, cached=False)
+        if (expected is not None and
+                sorted(port['security_groups']) != expected):
+            LOG.debug(f"Restoring pool server '{member.stack_name}' "
+                      f"security groups: {expected}")
+            neutron.update_port(port, security_groups=expected)
+
+
+_POOLS: typing.Dict[typing.Type, ServerStackPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def server_stack_pool(stack_class: typing.Type[ServerStackType],
+                      size: int = None) -> ServerStackPool[ServerStackType]:
+    """Get the pool of servers of given stack class of this process"""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(stack_class)
+        if pool is None:
+            if size is None:
+                size = tobiko.tobiko_config().nova.server_pool_size
+            _POOLS[stack_class] = pool = ServerStackPool(stack_class,
+                                                         size=size)
+        return pool
+
+
+def lease_server_stack(stack_class: typing.Type[ServerStackType],
+                       timeout: tobiko.Seconds = None) -> ServerStackType:
+    """Get a pre-booted server stack for current test case only
+
+    The server is released when current test case ends. Tests leasing a
+    server must not delete it, neither make any change to it that would
+    survive a status check and a reset of its port security groups.
+    """
+    pool = server_stack_pool(stack_class)
+    if timeout is None:
+        timeout = tobiko.tobiko_config().nova.server_pool_lease_timeout
+    member = pool.lease(timeout=timeout)
+    tobiko.add_cleanup(pool.release, member)
+    return member
@@ -56,7 +56,7 @@ def test_neutron_agents_are_alive(timeout=420., interval=3.) \
         LOG.debug("Look for unhealthy Neutron agents...")
         try:
             # get Neutron agent list
-            agents = neutron.list_agents()
+            agents = neutron.list_agents(cached=False)
         except (neutron.ServiceUnavailable,
                 neutron.NeutronClientException,
                 exceptions.connection.ConnectFailure) as ex:
@@ -115,7 +115,7 @@ def test_alive_agents_are_consistent_along_time(retry_timeout=360.,
         for attempt_in in tobiko.retry(sleep_time=consistent_sleep,
                                        count=consistent_count):
             try:
-                agents = neutron.list_agents()
+                agents = neutron.list_agents(cached=False)
             except (neutron.ServiceUnavailable,
                     neutron.NeutronClientException,
                     exceptions.connection.ConnectFailure):
@@ -635,68 +635,62 @@ def test_ovs_interfaces_are_absent(
         f"OVS interface(s) found on OpenStack nodes: {interfaces}")
 
 
+OVN_LEADER_TEST_NETWORK_NAME = 'tobiko_ovn_leader_test_network'
+
+# Maximum number of port creation requests sent at the same time
+OVN_LEADER_TEST_MAX_WORKERS = 10
+
+
+def list_ovn_leader_test_ports() -> tobiko.Selection[neutron.PortType]:
+    network = neutron.find_network(name=OVN_LEADER_TEST_NETWORK_NAME)
+    return tobiko.select(neutron.iter_ports(network=network,
+                                            fields=['id', 'name']))
+
+
 def cleanup_ports_network(port_count):
     # This function cleans up the ports and the created network
-    for _ in range(port_count):
-        port_name = f'tobiko_ovn_leader_test_port-{_}'
-        try:
-            port = neutron.find_port(name=port_name)
-            neutron.delete_port(port=port['id'])
-            LOG.debug("Port deleted: %s", port_name)
-        except (neutron.NoSuchPort, tobiko.ObjectNotFound):
-            LOG.debug("No Such port found: %s", port_name)
-    network = neutron.find_network(name='tobiko_ovn_leader_test_network')
+    ports = list_ovn_leader_test_ports()
+    neutron.delete_ports(ports=ports)
+    LOG.debug(f"Deleted {len(ports)} ports (expected {port_count})")
+    network = neutron.find_network(name=OVN_LEADER_TEST_NETWORK_NAME)
     neutron.delete_network(network=network)
 
 
-def find_port_retries(port_name, timeout=30., interval=3.):
-    for attempt in tobiko.retry(timeout=timeout, interval=interval):
-        try:
-            port = neutron.find_port(name=port_name)
-        except (neutron.NoSuchPort, tobiko.ObjectNotFound):
-            if attempt.is_last:
-                LOG.debug(
-                    "Port %s not found after %f seconds", port_name, timeout)
-                return None
-            else:
-                continue
-        return port
-
-
-def check_port_created(port_count):
+def check_port_created(port_count, timeout=30., interval=3.):
     # This function checks the number of ports created
     test_case = tobiko.get_test_case()
-    port_count_created = 0
-    for _ in range(port_count):
-        port_name = f'tobiko_ovn_leader_test_port-{_}'
-        port = find_port_retries(port_name)
-        if port is not None:
-            port_count_created += 1
-            LOG.debug("Port found: %s", port_name)
-        else:
-            LOG.debug("No Such port found: %s", port_name)
-    test_case.assertEqual(port_count_created, port_count)
+    for attempt in tobiko.retry(timeout=timeout, interval=interval):
+        ports = list_ovn_leader_test_ports()
+        LOG.debug(f"Found {len(ports)} ports (expected {port_count})")
+        if len(ports) >= port_count or attempt.is_last:
+            break
+    test_case.assertEqual(port_count, len(ports))
 
 
-def create_multiple_port_network(port_count):
+def create_multiple_port_network(port_count, ports_per_request=2):
     # This function is run in threading mode
     session = keystone.get_keystone_session(shared=False)
     client = neutron.get_neutron_client(session=session)
     network = neutron.create_network(client=client, add_cleanup=False,
-                                     name='tobiko_ovn_leader_test_network')
-    for _ in range(port_count):
-        # different clients are needed for the requests that are sent in
-        # parallel processes running in background
-        # with a common client, an SSLError exception is raised
-        session = keystone.get_keystone_session(shared=False)
-        client = neutron.get_neutron_client(session=session)
-        # Multiple requests are sent in background mode to save time
-        # and not to wait till the control returns
-        sh.start_background_process(bg_function=neutron.create_port,
-                                    bg_process_name=f"create_port-{_}",
-                                    client=client, network=network,
-                                    add_cleanup=False,
-                                    name=f'tobiko_ovn_leader_test_port-{_}')
+                                     name=OVN_LEADER_TEST_NETWORK_NAME)
+    # Ports are created with small bulk requests sent all together, so
+    # that many OVN DB transactions are ongoing when the leadership is
+    # transferred
+    ports = [{'name': f'tobiko_ovn_leader_test_port-{i}'}
+             for i in range(port_count)]
+    # every request is sent with its own Keystone session: with a common
+    # client, an SSLError exception is raised
+    request_count = -(-port_count // ports_per_request)
+    try:
+        neutron.create_ports_bulk(ports,
+                                  network=network,
+                                  add_cleanup=False,
+                                  bulk_size=ports_per_request,
+                                  max_workers=min(request_count,
+                                                  OVN_LEADER_TEST_MAX_WORKERS))
+    except neutron.BulkOperationError as ex:
+        # missing ports are reported by check_port_created
+        LOG.exception(f"Failed creating ports: {ex}")
     LOG.debug("Finished creating %r ports", port_count)
 
 
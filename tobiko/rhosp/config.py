@@ -91,6 +91,17 @@ RHOSP_OPTIONS = [
                default=10,
                help="maximum number of unreplied pings during the "
                     "background ping tests."),
+
+    # Disruption tests related settings:
+    cfg.FloatOpt('disruption_stagger',
+                 default=0.,
+                 help="seconds passed between disrupting a node and the "
+                      "next one when disrupting many nodes at once "
+                      "(0 to disrupt all of them at the same time)"),
+    cfg.FloatOpt('reboot_timeout',
+                 default=600.,
+                 help="maximum time in seconds nodes have to come back "
+                      "after being disrupted"),
 ]
 
 TRIPLEO_OPTIONS = [
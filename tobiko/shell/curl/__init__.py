@@ -16,11 +16,16 @@
 from __future__ import absolute_import
 
 from tobiko.shell.curl import _execute
+from tobiko.shell.curl import _load
 from tobiko.shell.curl import _process
 
 
 execute_curl = _execute.execute_curl
 
+CurlLoadReport = _load.CurlLoadReport
+CurlLoadResult = _load.CurlLoadResult
+execute_curl_load = _load.execute_curl_load
+
 CurlHeader = _process.CurlHeader
 CurlProcessFixture = _process.CurlProcessFixture
 assert_downloaded_file = _process.assert_downloaded_file
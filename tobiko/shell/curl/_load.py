@@ -0,0 +1,225 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import collections
+import math
+import shlex
+import typing
+
+import netaddr
+from oslo_log import log
+
+import tobiko
+from tobiko.shell.curl import _execute
+from tobiko.shell import sh
+from tobiko.shell import ssh
+
+
+LOG = log.getLogger(__name__)
+
+CURL_LOAD_MARKER = ':tobiko-curl:'
+CURL_LOAD_EXIT_MARKER = ':tobiko-curl-exit:'
+
+# curl prints it after the body of every response
+CURL_LOAD_WRITE_OUT = (
+    f'\\n{CURL_LOAD_MARKER} %{{http_code}} %{{time_connect}} '
+    '%{time_total}\\n')
+
+
+class CurlLoadResult(typing.NamedTuple):
+    """Result of a single request sent by execute_curl_load
+
+    :param content: body of the response, with blank characters stripped
+    :param http_code: HTTP status code, or zero when no response was got
+    :param time_connect: seconds spent to connect to the server
+    :param time_total: seconds spent to complete the request
+    :param exit_status: curl exit status when no response was got
+        (28 means the request timed out)
+    """
+    content: str
+    http_code: int
+    time_connect: float
+    time_total: float
+    exit_status: int = 0
+
+    @property
+    def failed(self) -> bool:
+        return not 200 <= self.http_code < 400
+
+
+class CurlLoadReport:
+    """Results of the requests sent by execute_curl_load"""
+
+    def __init__(self,
+                 results: typing.List[CurlLoadResult],
+                 url: str = None):
+        self.results = results
+        self.url = url
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}<{len(self.results)} requests, "
+                f"{len(self.failures)} failed>")
+
+    @property
+    def failures(self) -> typing.List[CurlLoadResult]:
+        return [result for result in self.results if result.failed]
+
+    @property
+    def hits(self) -> typing.Dict[str, int]:
+        """Number of successful replies by response content"""
+        return dict(collections.Counter(result.content
+                                        for result in self.results
+                                        if not result.failed))
+
+    def latencies(self, content: str = None) -> typing.List[float]:
+        """Sorted durations of successful requests
+
+        :param content: when given, only the requests replied with it are
+            considered
+        """
+        return sorted(result.time_total
+                      for result in self.results
+                      if not result.failed and
+                      (content is None or result.content == content))
+
+    def latency_percentiles(self,
+                            percentiles: typing.Iterable[int] = (50, 90, 99),
+                            content: str = None) -> typing.Dict[int, float]:
+        latencies = self.latencies(content=content)
+        if not latencies:
+            return {}
+        return {percentile: latencies[
+                    max(0, math.ceil(len(latencies) * percentile / 100) - 1)]
+                for percentile in percentiles}
+
+
+def get_curl_load_script(url: str,
+                         requests_count: int,
+                         concurrency: int = 1,
+                         keep_alive: bool = False,
+                         connect_timeout: tobiko.Seconds = None,
+                         max_time: tobiko.Seconds = None,
+                         interval: tobiko.Seconds = None) -> str:
+    """Get a shell script spreading requests between concurrent workers
+
+    Every worker writes the output of its requests to its own file, so
+    that they are not mixed together. The exit status of every curl
+    command is written after the output of its requests.
+    """
+    command = ['curl', '-g', '-s', '-w', CURL_LOAD_WRITE_OUT]
+    if connect_timeout is not None:
+        command += ['--connect-timeout', str(int(connect_timeout))]
+    if max_time is not None:
+        command += ['--max-time', str(int(max_time))]
+    exit_command = f'echo "{CURL_LOAD_EXIT_MARKER} $?"'
+    workers = max(1, min(concurrency, requests_count))
+    lines = ['dir=$(mktemp -d) || exit 1']
+    for worker in range(workers):
+        count = (requests_count // workers +
+                 int(worker < requests_count % workers))
+        if keep_alive:
+            # curl reuses the same connection for all given URLs
+            worker_command = (f'{shlex.join(command + [url] * count)}; '
+                              f'{exit_command}')
+        else:
+            worker_command = (f'for i in $(seq {count}); do '
+                              f'{shlex.join(command + [url])}; '
+                              f'{exit_command}; ')
+            if interval:
+                worker_command += f'sleep {float(interval)}; '
+            worker_command += 'done'
+        lines.append(f'({worker_command}) > "$dir/{worker:04d}" &')
+    lines += ['wait', 'cat "$dir"/*', 'rm -fr "$dir"']
+    return '\n'.join(lines)
+
+
+def parse_curl_load_output(output: str) -> typing.List[CurlLoadResult]:
+    results: typing.List[CurlLoadResult] = []
+    content: typing.List[str] = []
+    # results of the curl command whose exit status is still not known
+    pending = 0
+    for line in output.splitlines():
+        if line.startswith(CURL_LOAD_MARKER):
+            http_code, time_connect, time_total = (
+                line[len(CURL_LOAD_MARKER):].split())
+            results.append(CurlLoadResult(content='\n'.join(content).strip(),
+                                          http_code=int(http_code),
+                                          time_connect=float(time_connect),
+                                          time_total=float(time_total)))
+            content = []
+            pending += 1
+        elif line.startswith(CURL_LOAD_EXIT_MARKER):
+            exit_status = int(line[len(CURL_LOAD_EXIT_MARKER):])
+            if exit_status and not pending:
+                # curl failed without writing out any result
+                results.append(CurlLoadResult(content='', http_code=0,
+                                              time_connect=0.,
+                                              time_total=0.,
+                                              exit_status=exit_status))
+            elif exit_status:
+                # curl exit status only regards requests without response
+                for index in range(len(results) - pending, len(results)):
+                    if not results[index].http_code:
+                        results[index] = results[index]._replace(
+                            exit_status=exit_status)
+            content = []
+            pending = 0
+        else:
+            content.append(line)
+    return results
+
+
+def execute_curl_load(
+        hostname: typing.Union[str, netaddr.IPAddress] = None,
+        port: int = None,
+        path: str = None,
+        scheme: str = None,
+        requests_count: int = 10,
+        concurrency: int = 10,
+        keep_alive: bool = False,
+        connect_timeout: tobiko.Seconds = None,
+        max_time: tobiko.Seconds = None,
+        interval: tobiko.Seconds = None,
+        ssh_client: ssh.SSHClientType = None,
+        **execute_params) -> CurlLoadReport:
+    """Send many HTTP requests concurrently from the same host
+
+    A single remote command is executed: requests are spread between
+    `concurrency` workers, each one sending its share sequentially.
+
+    :param keep_alive: when true, every worker sends all its requests
+        through the same connection
+    :param interval: pause between requests of the same worker
+    """
+    netloc = _execute.make_netloc(hostname=hostname, port=port)
+    url = _execute.make_url(scheme=scheme, netloc=netloc, path=path)
+    script = get_curl_load_script(url=url,
+                                  requests_count=requests_count,
+                                  concurrency=concurrency,
+                                  keep_alive=keep_alive,
+                                  connect_timeout=connect_timeout,
+                                  max_time=max_time,
+                                  interval=interval)
+    output = sh.execute(['sh', '-c', script],
+                        ssh_client=ssh_client,
+                        **execute_params).stdout
+    report = CurlLoadReport(parse_curl_load_output(output), url=url)
+    LOG.debug(f"Sent {requests_count} requests to {url} "
+              f"(concurrency={concurrency}, keep_alive={keep_alive}): "
+              f"hits={report.hits}, failures={len(report.failures)}, "
+              f"latency percentiles={report.latency_percentiles()}")
+    return report
@@ -28,8 +28,10 @@ ensure_script_is_on_server = _custom_script.ensure_script_is_on_server
 get_log_dir = _custom_script.get_log_dir
 get_log_files = _custom_script.get_log_files
 copy_log_file = _custom_script.copy_log_file
+read_new_log_lines = _custom_script.read_new_log_lines
 get_process_pid = _custom_script.get_process_pid
 check_results = _custom_script.check_results
+check_result_lines = _custom_script.check_result_lines
 
 start_script = _custom_script.start_script
 stop_script = _custom_script.stop_script
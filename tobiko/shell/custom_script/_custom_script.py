@@ -83,6 +83,22 @@ def copy_log_file(
             tobiko.fail('Failed to download log file.')
 
 
+def read_new_log_lines(
+        logfile: str,
+        ssh_client: ssh.SSHClientType) -> typing.List[str]:
+    for attempt in tobiko.retry(timeout=60, interval=5):
+        try:
+            return files.read_new_log_lines(logfile, ssh_client=ssh_client)
+        except sh.ShellCommandFailed as err:
+            message = f'Failed to read log file. Error {err}'
+            if attempt.is_last:
+                tobiko.fail(message)
+            else:
+                LOG.debug(message)
+                LOG.debug('Retrying to read log file...')
+    raise RuntimeError("Internal bug: retry loop break itself.")
+
+
 def get_process_pid(
         command_line: str,
         ssh_client: ssh.SSHClientType = None
@@ -97,34 +113,42 @@ def get_process_pid(
 
 def check_results(
         log_filenames: typing.List[str]):
-
-    failure_limit = CONF.tobiko.rhosp.max_ping_loss_allowed
     for filename in log_filenames:
         with io.open(filename, 'rt') as fd:
-            LOG.info(f'checking custom script log file: {filename}, '
-                     f'failure_limit is :{failure_limit}')
-            failures_list = []
-            for log_line in fd.readlines():
-                log_line_json = jsonutils.loads(log_line.rstrip())
-                if log_line_json['response'] != _constants.RESULT_OK:
-                    # NOTE(salweq): Add file name to the failure line
-                    #               just for the debugging purpose
-                    log_line_json['filename'] = filename
-                    failures_list.append(log_line_json)
-
-            failures_len = len(failures_list)
-            if failures_len > 0:
-                failures_str = '\n'.join(
-                    [str(failure) for failure in failures_list])
-                LOG.warning(f'found custom script failures:\n{failures_str}')
-            else:
-                LOG.debug(f'no failures in custom script log file: {filename}')
+            log_lines = fd.readlines()
+        tobiko.truncate_logfile(filename)
+        check_result_lines(log_lines, filename)
+
 
-            tobiko.truncate_logfile(filename)
+def check_result_lines(
+        log_lines: typing.Iterable[str],
+        filename: str):
 
-            if failures_len >= failure_limit:
-                tobiko.fail(f'{failures_len} failures found '
-                            f'in file: {failures_list[-1]["filename"]}')
+    failure_limit = CONF.tobiko.rhosp.max_ping_loss_allowed
+    LOG.info(f'checking custom script log file: {filename}, '
+             f'failure_limit is :{failure_limit}')
+    failures_list = []
+    for log_line in log_lines:
+        if not log_line.strip():
+            continue
+        log_line_json = jsonutils.loads(log_line.rstrip())
+        if log_line_json['response'] != _constants.RESULT_OK:
+            # NOTE(salweq): Add file name to the failure line
+            #               just for the debugging purpose
+            log_line_json['filename'] = filename
+            failures_list.append(log_line_json)
+
+    failures_len = len(failures_list)
+    if failures_len > 0:
+        failures_str = '\n'.join(
+            [str(failure) for failure in failures_list])
+        LOG.warning(f'found custom script failures:\n{failures_str}')
+    else:
+        LOG.debug(f'no failures in custom script log file: {filename}')
+
+    if failures_len >= failure_limit:
+        tobiko.fail(f'{failures_len} failures found '
+                    f'in file: {failures_list[-1]["filename"]}')
 
 
 def start_script(
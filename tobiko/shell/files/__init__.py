@@ -15,6 +15,7 @@
 #    under the License.
 from __future__ import absolute_import
 
+from tobiko.shell.files import _cursor
 from tobiko.shell.files import _files
 from tobiko.shell.files import _logs
 
@@ -24,6 +25,10 @@ get_home_absolute_filepath = _files.get_home_absolute_filepath
 truncate_client_logfile = _files.truncate_client_logfile
 remove_old_logfile = _files.remove_old_logfile
 
+LogFileCursor = _cursor.LogFileCursor
+read_new_log_lines = _cursor.read_new_log_lines
+reset_log_file_cursor = _cursor.reset_log_file_cursor
+
 LogFileDigger = _logs.LogFileDigger
 JournalLogDigger = _logs.JournalLogDigger
 MultihostLogFileDigger = _logs.MultihostLogFileDigger
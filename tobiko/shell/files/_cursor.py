@@ -0,0 +1,166 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import dbm
+import os
+import shelve
+import shlex
+import typing
+
+from oslo_log import log
+
+import tobiko
+from tobiko.shell import sh
+from tobiko.shell import ssh
+
+
+LOG = log.getLogger(__name__)
+
+LOG_CURSORS_SHELF = 'log_cursors'
+
+# It prints the inode and the size of the log file in the first line and
+# then the bytes appended after the given offset, up to the size reported
+# by stat, so that bytes written meanwhile are left for the next read.
+# When the file was replaced (different inode) or truncated (size lower
+# than offset), it is read again from the beginning
+READ_LOG_CHUNK_COMMAND = (
+    "stat=$(stat -L -c '%i %s' {logfile}) && set -- $stat && "
+    'echo "$1 $2" && '
+    'if [ "$1" = "{inode}" ] && [ "$2" -ge {offset} ]; '
+    'then start={offset}; else start=0; fi && '
+    'tail -c +$((start + 1)) {logfile} | head -c $(($2 - start))')
+
+
+class LogFileCursor(typing.NamedTuple):
+    """Position of the last byte read from a log file
+
+    :param inode: inode of the log file when it was last read
+    :param offset: number of bytes of the file already consumed
+    :param carry: trailing bytes of an incomplete line, still not returned
+    """
+    inode: int = 0
+    offset: int = 0
+    carry: bytes = b''
+
+
+def get_log_cursors_path() -> str:
+    from tobiko import config
+    cursors_dir = os.path.expanduser(
+        config.CONF.tobiko.common.log_cursors_dir)
+    tobiko.makedirs(cursors_dir)
+    return os.path.join(cursors_dir, LOG_CURSORS_SHELF)
+
+
+def get_log_cursor_key(logfile: str,
+                       ssh_client: ssh.SSHClientType = None) -> str:
+    fixture = ssh.ssh_client_fixture(ssh_client) if ssh_client else None
+    if fixture is None:
+        login = 'localhost'
+    else:
+        login = fixture.login
+    return f'{login}:{logfile}'
+
+
+def load_log_file_cursor(key: str) -> LogFileCursor:
+    for attempt in tobiko.retry(timeout=10.0,
+                                interval=0.5):
+        try:
+            with shelve.open(get_log_cursors_path()) as db:
+                return db.get(key) or LogFileCursor()
+        except dbm.error:
+            LOG.exception(f"Error accessing shelf {LOG_CURSORS_SHELF}")
+            if attempt.is_last:
+                raise
+    raise RuntimeError("Internal bug: retry loop break itself.")
+
+
+def save_log_file_cursor(key: str,
+                         cursor: typing.Optional[LogFileCursor]):
+    for attempt in tobiko.retry(timeout=10.0,
+                                interval=0.5):
+        try:
+            with shelve.open(get_log_cursors_path()) as db:
+                if cursor is None:
+                    db.pop(key, None)
+                else:
+                    db[key] = cursor
+                return
+        except dbm.error:
+            LOG.exception(f"Error accessing shelf {LOG_CURSORS_SHELF}")
+            if attempt.is_last:
+                raise
+
+
+@tobiko.interworker_synched('log_file_cursors')
+def reset_log_file_cursor(logfile: str,
+                          ssh_client: ssh.SSHClientType = None):
+    """Forget the position of a log file that is going to be re-created"""
+    key = get_log_cursor_key(logfile, ssh_client)
+    save_log_file_cursor(key, None)
+
+
+@tobiko.interworker_synched('log_file_cursors')
+def read_new_log_lines(
+        logfile: str,
+        ssh_client: ssh.SSHClientType = None,
+        consume: typing.Callable[[typing.List[str]], int] = None,
+        **execute_params) -> typing.List[str]:
+    """Return the complete lines appended to a log file since last call
+
+    Only the bytes written after the position saved by the previous call
+    (even if made by another test process) are transferred. The log
+    file is never modified, so the process writing to it is free to
+    continue. A trailing incomplete line is kept until a later call finds
+    it terminated.
+
+    :param consume: function receiving the new lines and returning how
+        many of the first ones have to be consumed. The remaining ones are
+        only returned again by the next call. By default all of them are
+        consumed.
+    :raises sh.ShellCommandFailed: when the log file can not be read
+    """
+    key = get_log_cursor_key(logfile, ssh_client)
+    cursor = load_log_file_cursor(key)
+    command = READ_LOG_CHUNK_COMMAND.format(logfile=shlex.quote(logfile),
+                                            inode=cursor.inode,
+                                            offset=cursor.offset)
+    # as in the other log file helpers, no ssh_client means a local file
+    output = sh.execute(['sh', '-c', command],
+                        ssh_client=ssh_client or False,
+                        decode_streams=False,
+                        **execute_params).stdout
+    header, _, chunk = output.partition(b'\n')
+    inode, size = (int(field) for field in header.split())
+    if inode == cursor.inode and size >= cursor.offset:
+        start, carry = cursor.offset, cursor.carry
+    else:
+        if cursor.offset:
+            LOG.debug(f"Log file '{logfile}' has been replaced or "
+                      "truncated: reading it from the beginning")
+        start, carry = 0, b''
+
+    raw_lines = (carry + chunk).split(b'\n')
+    lines = [line.decode(errors='replace') for line in raw_lines[:-1]]
+    count = len(lines) if consume is None else consume(lines)
+    # lines that are not consumed are kept with the incomplete one
+    save_log_file_cursor(key, LogFileCursor(inode=inode,
+                                            offset=start + len(chunk),
+                                            carry=b'\n'.join(
+                                                raw_lines[count:])))
+    LOG.debug(f"Read {len(chunk)} new bytes from log file '{logfile}' "
+              f"(offset={start})")
+    return lines[:count]
@@ -21,6 +21,7 @@ import os
 import tobiko
 from tobiko.shell import sh
 from tobiko.shell import ssh
+from tobiko.shell.files import _cursor
 
 
 def get_homedir(ssh_client: ssh.SSHClientType = None) -> str:
@@ -72,6 +73,8 @@ def _truncate_remote_logfile(logfile: str,
 
 def remove_old_logfile(logfile: str,
                        ssh_client: ssh.SSHClientType = None):
+    # a new log file is going to be written from the beginning
+    _cursor.reset_log_file_cursor(logfile, ssh_client=ssh_client)
     if ssh_client:
         sh.execute(f'/usr/bin/rm -f {logfile}',
                    ssh_client=ssh_client)
@@ -134,13 +134,11 @@ def check_http_ping_results(**kwargs):
         if not server_ip:
             tobiko.fail("Server IP is required to check http ping log file.")
         # Source log file is on the guest vm so ssh_client needs to be used
-        # to get it
+        # to read the lines written there since the previous check
         src_logfile = _get_logfile_path(server_ip, ssh_client)
-        dst_logfile_name = _get_logfile_name(server_ip)
-        # Destination is local to where Tobiko is running so no need to pass
-        # ssh_client to get_log_dir() function this time
-        dest_logfile = f"{get_log_dir()}/{dst_logfile_name}"
-        custom_script.copy_log_file(src_logfile, dest_logfile, ssh_client)
+        log_lines = custom_script.read_new_log_lines(src_logfile, ssh_client)
+        custom_script.check_result_lines(log_lines, src_logfile)
+        return
 
     logfile_name = _get_logfile_name(server_ip)
     logfiles = custom_script.get_log_files(
@@ -157,6 +155,9 @@ def start_http_ping_process(
     _ensure_http_ping_script_on_server(ssh_client)
     if http_ping_process_alive(server_ip, ssh_client):
         return
+    # the script removes its log file before starting writing a new one
+    files.reset_log_file_cursor(_get_logfile_path(server_ip, ssh_client),
+                                ssh_client=ssh_client)
     custom_script.start_script(
         _get_http_ping_script_command(
             server_ip, ssh_client),
@@ -19,6 +19,7 @@ from tobiko.shell.iperf3 import _assert
 from tobiko.shell.iperf3 import _execute
 from tobiko.shell.iperf3 import _interface
 from tobiko.shell.iperf3 import _parameters
+from tobiko.shell.iperf3 import _traffic
 
 
 assert_has_bandwith_limits = _assert.assert_has_bandwith_limits
@@ -35,3 +36,10 @@ get_iperf3_client_command = _interface.get_iperf3_client_command
 
 Iperf3ClientParameters = _parameters.Iperf3ClientParameters
 iperf3_client_parameters = _parameters.iperf3_client_parameters
+
+Iperf3Pair = _traffic.Iperf3Pair
+Iperf3Measures = _traffic.Iperf3Measures
+Iperf3ClientStream = _traffic.Iperf3ClientStream
+Iperf3TrafficFixture = _traffic.Iperf3TrafficFixture
+start_iperf3_traffic = _traffic.start_iperf3_traffic
+assign_iperf3_ports = _traffic.assign_iperf3_ports
@@ -191,25 +191,26 @@ def _get_iperf3_pid(
 def _get_iperf3_log_raw(logfile: str,
                         ssh_client: ssh.SSHClientType = None):
     for attempt in tobiko.retry(timeout=60, interval=5):
-        # download the iperf results file to local
         if ssh_client is not None:
-            local_tmp_file = sh.local_shell_connection().make_temp_file()
+            # only the lines appended since the previous check are
+            # transferred from the remote iperf results file. Trailing
+            # lines not ending a JSON object are left for the next read
             try:
-                sh.get_file(logfile, local_tmp_file, ssh_client)
-            except FileNotFoundError as err:
-                message = f'Failed to download iperf log file. Error {err}'
+                iperf_log_raw = '\n'.join(
+                    files.read_new_log_lines(
+                        logfile, ssh_client=ssh_client,
+                        consume=count_log_lines_end_json))
+            except sh.ShellCommandFailed as err:
+                message = f'Failed to read iperf log file. Error {err}'
                 if attempt.is_last:
                     tobiko.fail(message)
                 else:
                     LOG.debug(message)
-                    LOG.debug('Retrying to download iperf log file...')
+                    LOG.debug('Retrying to read iperf log file...')
                     continue
-            local_logfile = local_tmp_file
         else:
-            local_logfile = logfile
-
-        # this command has to be run locally
-        iperf_log_raw = sh.execute(f"cat {local_logfile}").stdout
+            # this command has to be run locally
+            iperf_log_raw = sh.execute(f"cat {logfile}").stdout
 
         iperf_log_raw = remove_log_lines_end_json_str(iperf_log_raw)
         LOG.debug(f'iperf log raw: {iperf_log_raw} ')
@@ -278,7 +279,10 @@ def check_iperf3_client_results(address: typing.Union[str, netaddr.IPAddress],
         else:
             current_break = 0
 
-    files.truncate_client_logfile(logfile, ssh_client)
+    if ssh_client is None:
+        # local results file is not read incrementally: keep it apart
+        # once it has been checked
+        files.truncate_client_logfile(logfile)
 
     testcase = tobiko.get_test_case()
     testcase.assertLessEqual(longest_break,
@@ -287,16 +291,21 @@ def check_iperf3_client_results(address: typing.Union[str, netaddr.IPAddress],
                              CONF.tobiko.rhosp.max_total_breaks_allowed)
 
 
-def remove_log_lines_end_json_str(json_str: str) -> str:
-    lines = json_str.splitlines()
-    while lines:
-        last_line = lines[-1].strip()
+def count_log_lines_end_json(lines: typing.List[str]) -> int:
+    count = len(lines)
+    while count > 0:
+        last_line = lines[count - 1].strip()
         if len(last_line) > 0 and last_line[-1] == "}":
             # Stop when we find }
             break
-        # Remove last line, remove possible error logs
-        lines.pop()
-    return "\n".join(lines)
+        # Skip last line, skip possible error logs
+        count -= 1
+    return count
+
+
+def remove_log_lines_end_json_str(json_str: str) -> str:
+    lines = json_str.splitlines()
+    return "\n".join(lines[:count_log_lines_end_json(lines)])
 
 
 def iperf3_client_alive(address: typing.Union[str, netaddr.IPAddress],  # noqa; pylint: disable=W0613
@@ -72,6 +72,8 @@ class Iperf3Interface:
             options += self.get_json_stream_option(parameters.json_stream)
         if parameters.logfile is not None:
             options += self.get_logfile_option(parameters.logfile)
+        if parameters.parallel is not None:
+            options += self.get_parallel_option(parameters.parallel)
         return options
 
     def get_iperf3_server_options(
@@ -142,3 +144,7 @@ class Iperf3Interface:
     @staticmethod
     def get_logfile_option(logfile):
         return ['--logfile', logfile]
+
+    @staticmethod
+    def get_parallel_option(parallel: int):
+        return ['-P', max(1, parallel)]
@@ -32,6 +32,7 @@ class Iperf3ClientParameters(typing.NamedTuple):
     interval: typing.Optional[int] = None
     json_stream: typing.Optional[bool] = None
     logfile: typing.Optional[str] = None
+    parallel: typing.Optional[int] = None
 
 
 class Iperf3ServerParameters(typing.NamedTuple):
@@ -48,7 +49,8 @@ def iperf3_client_parameters(
         timeout: int = None,
         interval: int = None,
         json_stream: bool = None,
-        logfile: str = None):
+        logfile: str = None,
+        parallel: int = None):
     """Get iperf3 client parameters
     mode allowed values: client or server
     ip is only needed for client mode
@@ -76,7 +78,8 @@ def iperf3_client_parameters(
                                   timeout=timeout,
                                   interval=interval,
                                   json_stream=json_stream,
-                                  logfile=logfile)
+                                  logfile=logfile,
+                                  parallel=parallel)
 
 
 def iperf3_server_parameters(
@@ -0,0 +1,403 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import division
+
+import json
+import typing
+
+import netaddr
+import numpy
+from oslo_log import log
+
+import tobiko
+from tobiko import config
+from tobiko.shell.iperf3 import _execute
+from tobiko.shell.iperf3 import _interface
+from tobiko.shell.iperf3 import _parameters
+from tobiko.shell import sh
+from tobiko.shell import ssh
+
+
+CONF = config.CONF
+LOG = log.getLogger(__name__)
+
+DEFAULT_PORT = 5201
+
+
+class Iperf3Pair(typing.NamedTuple):
+    """iperf3 client and server couple
+
+    :param address: server address as seen from the client host
+    :param ssh_client: client host (None for the local host)
+    :param server_ssh_client: host where iperf3 server has to be (re)started
+        by Tobiko. When None, server is expected to be already listening
+    """
+    address: typing.Union[str, netaddr.IPAddress]
+    ssh_client: ssh.SSHClientType = None
+    server_ssh_client: ssh.SSHClientType = None
+    port: typing.Optional[int] = None
+    protocol: typing.Optional[str] = None
+    bitrate: typing.Optional[int] = None
+    download: typing.Optional[bool] = None
+    parallel: typing.Optional[int] = None
+
+
+class Iperf3Measures(object):
+    """iperf3 interval measures stored in numpy arrays
+
+    Arrays rows are intervals, and for bytes, retransmits and rtt columns are
+    the client streams (see iperf3 -P option). Traffic breaks (intervals where
+    no bytes were transferred by any stream) are accounted while intervals are
+    added, so statistics are available at any time without post processing.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.streams = 0
+        self._start = numpy.zeros(self.capacity)
+        self._end = numpy.zeros(self.capacity)
+        self._bytes = numpy.zeros((self.capacity, 0), dtype=numpy.int64)
+        self._retransmits = numpy.zeros((self.capacity, 0),
+                                        dtype=numpy.int64)
+        self._rtt = numpy.zeros((self.capacity, 0))
+        self.longest_break = 0.  # seconds
+        self.breaks_total = 0.  # seconds
+        self.current_break = 0.  # seconds
+
+    @property
+    def start(self) -> numpy.ndarray:
+        return self._start[:self.count]
+
+    @property
+    def end(self) -> numpy.ndarray:
+        return self._end[:self.count]
+
+    @property
+    def bytes(self) -> numpy.ndarray:
+        return self._bytes[:self.count]
+
+    @property
+    def retransmits(self) -> numpy.ndarray:
+        return self._retransmits[:self.count]
+
+    @property
+    def rtt(self) -> numpy.ndarray:
+        """Round trip time (in microseconds), NaN when not reported"""
+        return self._rtt[:self.count]
+
+    @property
+    def total_bytes(self) -> numpy.ndarray:
+        return self.bytes.sum(axis=1)
+
+    @property
+    def bits_per_second(self) -> numpy.ndarray:
+        seconds = self.end - self.start
+        return numpy.divide(self.total_bytes * 8., seconds,
+                            out=numpy.zeros(self.count),
+                            where=seconds > 0.)
+
+    def add_interval(self, data: typing.Dict[str, typing.Any]):
+        """Add an iperf3 'interval' event data"""
+        streams = data.get('streams') or []
+        if not self.streams:
+            self._init_streams(len(streams))
+        if self.count == self.capacity:
+            self._grow()
+
+        row = self.count
+        interval_sum = data['sum']
+        self._start[row] = interval_sum['start']
+        self._end[row] = interval_sum['end']
+        for column, stream in enumerate(streams[:self.streams]):
+            self._bytes[row, column] = stream.get('bytes', 0)
+            self._retransmits[row, column] = stream.get('retransmits', 0)
+            self._rtt[row, column] = stream.get('rtt', numpy.nan)
+        self.count += 1
+
+        if interval_sum['bytes'] == 0:
+            interval_duration = interval_sum['end'] - interval_sum['start']
+            self.current_break += interval_duration
+            self.longest_break = max(self.longest_break, self.current_break)
+            self.breaks_total += interval_duration
+        else:
+            self.current_break = 0.
+
+    def _init_streams(self, streams: int):
+        self.streams = streams = max(1, streams)
+        self._bytes = numpy.zeros((self.capacity, streams),
+                                  dtype=numpy.int64)
+        self._retransmits = numpy.zeros((self.capacity, streams),
+                                        dtype=numpy.int64)
+        self._rtt = numpy.full((self.capacity, streams), numpy.nan)
+
+    def _grow(self):
+        # double the capacity so adding an interval is amortized O(1)
+        self._start = _grow_array(self._start)
+        self._end = _grow_array(self._end)
+        self._bytes = _grow_array(self._bytes)
+        self._retransmits = _grow_array(self._retransmits)
+        self._rtt = _grow_array(self._rtt, fill_value=numpy.nan)
+        self.capacity *= 2
+
+
+def _grow_array(array: numpy.ndarray, fill_value=0) -> numpy.ndarray:
+    grown = numpy.full((array.shape[0] * 2,) + array.shape[1:],
+                       fill_value, dtype=array.dtype)
+    grown[:array.shape[0]] = array
+    return grown
+
+
+class Iperf3ClientStream(object):
+    """Consumes the JSON stream written by an iperf3 client"""
+
+    process: typing.Any = None
+
+    def __init__(self,
+                 pair: Iperf3Pair,
+                 process: sh.ShellProcessFixture = None):
+        self.pair = pair
+        self.process = process
+        self.measures = Iperf3Measures()
+        self.errors: typing.List[str] = []
+        self.summary: typing.Optional[typing.Dict[str, typing.Any]] = None
+        self._carry = b''
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{self.pair.address}>"
+
+    @property
+    def is_reading(self) -> bool:
+        return (self.process is not None and
+                self.process.stdout is not None and
+                not self.process.stdout.closed)
+
+    def read(self) -> int:
+        """Read available data from the client process output"""
+        assert self.process is not None
+        stdout = self.process.stdout
+        # read from the stream delegate, so that received chunks are not
+        # kept by the process fixture for the whole traffic duration
+        chunk = stdout.delegate.read(stdout.buffer_size)
+        if not chunk:
+            LOG.debug(f"iperf3 client output closed: {self}")
+            stdout.close()
+            return 0
+        return self.feed(chunk)
+
+    def feed(self, data: bytes) -> int:
+        """Parse iperf3 --json-stream output
+
+        :returns: the number of new intervals
+        """
+        lines = (self._carry + data).split(b'\n')
+        self._carry = lines.pop()
+        intervals = 0
+        for line in lines:
+            if line.strip():
+                intervals += self.parse_event(line)
+        return intervals
+
+    def parse_event(self, line: bytes) -> int:
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            LOG.debug(f"Invalid iperf3 output line from {self}: {line!r}")
+            return 0
+        name = event.get('event')
+        if name == 'interval':
+            self.measures.add_interval(event['data'])
+            return 1
+        elif name == 'end':
+            self.summary = event['data']
+        elif name == 'error':
+            LOG.warning(f"iperf3 client error from {self}: {event['data']}")
+            self.errors.append(event['data'])
+        return 0
+
+
+class Iperf3TrafficFixture(tobiko.SharedFixture):
+    """Runs many iperf3 clients at once reading their results live
+
+    iperf3 servers are (re)started first for every pair having a
+    server_ssh_client, then all clients are started without waiting for each
+    other. Clients write their intervals as JSON lines on the SSH channel
+    that are parsed as soon as they are received, so no result file has to
+    be downloaded once traffic has been stopped.
+    """
+
+    def __init__(self,
+                 pairs: typing.Iterable[Iperf3Pair],
+                 duration: typing.Optional[int] = None,
+                 interval: typing.Optional[int] = None):
+        super(Iperf3TrafficFixture, self).__init__()
+        self.pairs = assign_iperf3_ports(pairs)
+        # 0 means iperf3 clients will run until they are stopped
+        self.duration = duration or 0
+        self.interval = interval
+        self.clients: typing.List[Iperf3ClientStream] = []
+        self.servers: typing.List[Iperf3Pair] = []
+
+    def setup_fixture(self):
+        self.start_servers()
+        self.start_clients()
+
+    def cleanup_fixture(self):
+        self.stop()
+
+    def start_servers(self):
+        for pair in self.pairs:
+            if pair.server_ssh_client and not any(
+                    (server.server_ssh_client, server.port) ==
+                    (pair.server_ssh_client, pair.port)
+                    for server in self.servers):
+                _execute._stop_iperf3_server(
+                    port=pair.port, protocol=pair.protocol,
+                    ssh_client=pair.server_ssh_client)
+                _execute.start_iperf3_server(
+                    port=pair.port, protocol=pair.protocol,
+                    ssh_client=pair.server_ssh_client)
+                self.servers.append(pair)
+        for pair in self.servers:
+            if not _execute._iperf3_server_alive(
+                    port=pair.port, protocol=pair.protocol,
+                    ssh_client=pair.server_ssh_client):
+                tobiko.fail('iperf3 server did not start properly '
+                            f'on the server {pair.server_ssh_client}')
+
+    def start_clients(self):
+        for pair in self.pairs:
+            parameters = _parameters.iperf3_client_parameters(
+                address=pair.address, bitrate=pair.bitrate,
+                download=pair.download, port=pair.port,
+                protocol=pair.protocol, timeout=self.duration,
+                interval=self.interval, json_stream=True,
+                parallel=pair.parallel)
+            command = _interface.get_iperf3_client_command(parameters)
+            LOG.info(f'starting iperf3 client process to > {pair.address} '
+                     f'(port={pair.port})')
+            process = sh.process(command, ssh_client=pair.ssh_client,
+                                 stdin=False, stderr=False)
+            self.clients.append(Iperf3ClientStream(pair=pair,
+                                                   process=process.execute()))
+
+    def poll(self, timeout: tobiko.Seconds = 0.) -> int:
+        """Read results already written by the clients
+
+        :returns: the number of new intervals
+        """
+        streams = {client.process.stdout: client
+                   for client in self.clients
+                   if client.is_reading}
+        if not streams:
+            return 0
+        read_ready, _ = sh.select_files(files=list(streams),
+                                        timeout=tobiko.to_seconds(timeout),
+                                        mode='r')
+        return sum(streams[stdout].read() for stdout in read_ready)
+
+    def wait(self, timeout: tobiko.Seconds = None):
+        """Read results until every client has terminated"""
+        if timeout is None and self.duration:
+            timeout = self.duration + 30.
+        for _ in tobiko.retry(timeout=timeout):
+            if not self.is_running:
+                break
+            self.poll(timeout=1.)
+
+    @property
+    def is_running(self) -> bool:
+        return any(client.is_reading for client in self.clients)
+
+    def stop(self):
+        # read everything already sent before closing SSH channels: remote
+        # iperf3 clients are terminated by SIGPIPE when writing next interval
+        self.poll()
+        for client in self.clients:
+            if client.process is not None:
+                client.process.kill()
+        for pair in self.servers:
+            _execute._stop_iperf3_server(
+                port=pair.port, protocol=pair.protocol,
+                ssh_client=pair.server_ssh_client)
+        del self.servers[:]
+
+    @property
+    def measures(self) -> typing.List[Iperf3Measures]:
+        return [client.measures for client in self.clients]
+
+    @property
+    def longest_break(self) -> float:
+        return max((measures.longest_break for measures in self.measures),
+                   default=0.)
+
+    @property
+    def breaks_total(self) -> float:
+        return max((measures.breaks_total for measures in self.measures),
+                   default=0.)
+
+    def assert_traffic_breaks(self,
+                              max_traffic_break: float = None,
+                              max_total_breaks: float = None):
+        if max_traffic_break is None:
+            max_traffic_break = CONF.tobiko.rhosp.max_traffic_break_allowed
+        if max_total_breaks is None:
+            max_total_breaks = CONF.tobiko.rhosp.max_total_breaks_allowed
+        testcase = tobiko.get_test_case()
+        for client in self.clients:
+            if not client.measures.count:
+                testcase.fail(f"No intervals data received from {client}")
+            LOG.debug(f'{client}: longest_break='
+                      f'{client.measures.longest_break}, '
+                      f'breaks_total={client.measures.breaks_total}')
+            testcase.assertLessEqual(client.measures.longest_break,
+                                     max_traffic_break)
+            testcase.assertLessEqual(client.measures.breaks_total,
+                                     max_total_breaks)
+
+
+def assign_iperf3_ports(pairs: typing.Iterable[Iperf3Pair]) \
+        -> typing.List[Iperf3Pair]:
+    """Give a different port to every pair without one
+
+    An iperf3 server handles one test at a time, so every pair requires its
+    own server port.
+    """
+    pairs = list(pairs)
+    used_ports = {pair.port for pair in pairs if pair.port is not None}
+    next_port = CONF.tobiko.iperf3.port or DEFAULT_PORT
+    assigned = []
+    for pair in pairs:
+        if pair.port is None:
+            while next_port in used_ports:
+                next_port += 1
+            used_ports.add(next_port)
+            pair = pair._replace(port=next_port)
+        assigned.append(pair)
+    return assigned
+
+
+def start_iperf3_traffic(pairs: typing.Iterable[Iperf3Pair],
+                         duration: int = None,
+                         interval: int = None) -> Iperf3TrafficFixture:
+    """Start iperf3 traffic for all pairs at once
+
+    Traffic is stopped when the current test case finishes.
+    """
+    return tobiko.use_fixture(Iperf3TrafficFixture(pairs=pairs,
+                                                   duration=duration,
+                                                   interval=interval))
@@ -564,11 +564,11 @@ def check_ping_results(address: typing.Union[str, netaddr.IPAddress],
     testcase = tobiko.get_test_case()
     testcase.assertFalse(ping_alive(address, ssh_client))
 
-    # This function expects that the result file is available locally already
+    # only the lines written since the previous check are read
     logfile = _get_ping_logs_filepath(address, output_dir, ssh_client)
     try:
-        ping_log_raw = sh.execute(
-            f"cat {logfile}", ssh_client=ssh_client).stdout
+        ping_log_raw = '\n'.join(
+            files.read_new_log_lines(logfile, ssh_client=ssh_client))
     except sh.ShellCommandFailed as err:
         if config.is_prevent_create():
             # Tobiko is not expected to create resources in this run
@@ -595,8 +595,6 @@ def check_ping_results(address: typing.Union[str, netaddr.IPAddress],
             LOG.debug('Failed ping log file empty')
             return
 
-    files.truncate_client_logfile(logfile, ssh_client)
-
     ping_stats = _statistics.parse_ping_statistics(ping_log_raw)
 
     testcase.assertGreater(ping_stats.transmitted, 0)
@@ -114,6 +114,11 @@ RebootHostError = _reboot.RebootHostError
 RebootHostOperation = _reboot.RebootHostOperation
 RebootHostTimeoutError = _reboot.RebootHostTimeoutError
 RebootHostMethod = _reboot.RebootHostMethod
+DisruptHostsError = _reboot.DisruptHostsError
+HostDisruption = _reboot.HostDisruption
+disrupt_host = _reboot.disrupt_host
+disrupt_hosts = _reboot.disrupt_hosts
+wait_for_boot_id_change = _reboot.wait_for_boot_id_change
 crash_method = RebootHostMethod.CRASH
 hard_reset_method = RebootHostMethod.HARD
 soft_reset_method = RebootHostMethod.SOFT
@@ -132,6 +137,8 @@ wait_for_systemd_units_state = _systemctl.wait_for_systemd_units_state
 
 get_uptime = _uptime.get_uptime
 UptimeError = _uptime.UptimeError
+get_boot_id = _uptime.get_boot_id
+BootIdError = _uptime.BootIdError
 
 assert_file_size = _wc.assert_file_size
 get_file_size = _wc.get_file_size
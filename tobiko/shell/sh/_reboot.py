@@ -13,7 +13,10 @@
 #    under the License.
 from __future__ import absolute_import
 
+from concurrent import futures
 import enum
+import itertools
+import typing
 
 from oslo_log import log
 
@@ -26,6 +29,16 @@ from tobiko.shell import ssh
 
 LOG = log.getLogger(__name__)
 
+# Seconds waited before reconnecting to a disrupted host. It is multiplied
+# by RECONNECT_BACKOFF after every failed attempt, up to
+# MAX_RECONNECT_INTERVAL
+MIN_RECONNECT_INTERVAL = 1.
+MAX_RECONNECT_INTERVAL = 30.
+RECONNECT_BACKOFF = 2.
+
+# Maximum time a disrupted host has to come back with a new boot ID
+DEFAULT_DISRUPT_TIMEOUT = 600.
+
 
 class RebootHostMethod(enum.Enum):
 
@@ -189,3 +202,222 @@ class RebootHostOperation(tobiko.Operation):
         finally:
             if not self.is_rebooted:
                 self.ssh_client.close()
+
+
+DisruptionType = typing.Union[RebootHostMethod, str]
+
+
+class HostDisruption(typing.NamedTuple):
+    """What happened to a host after disrupting it
+
+    :param disrupted: time the disruption command was sent
+    :param boot_id: host boot ID before the disruption
+    :param new_boot_id: host boot ID after the reboot
+    :param recovered: time the host replied with a new boot ID
+    :param attempts: number of attempts to get the new boot ID
+    """
+    hostname: str
+    disrupted: float
+    boot_id: typing.Optional[str] = None
+    new_boot_id: typing.Optional[str] = None
+    recovered: typing.Optional[float] = None
+    attempts: int = 0
+
+    @property
+    def downtime(self) -> typing.Optional[float]:
+        if self.recovered is None:
+            return None
+        return self.recovered - self.disrupted
+
+
+class DisruptHostsError(tobiko.TobikoException):
+    message = ("{failed} of {total} hosts not disrupted or not recovered:\n"
+               "{details}")
+
+
+def get_disruption_command(disruption: DisruptionType) -> str:
+    if isinstance(disruption, RebootHostMethod):
+        return str(_command.shell_command(
+            ['sudo', '/bin/sh', '-c', disruption.command]))
+    return str(disruption)
+
+
+def wait_for_boot_id_change(ssh_client: ssh.SSHClientFixture,
+                            boot_id: str,
+                            timeout: tobiko.Seconds = None,
+                            max_interval: tobiko.Seconds = None) \
+        -> typing.Tuple[str, int]:
+    """Wait until the host replies with a boot ID other than given one
+
+    While the host is rebooting every failed attempt to get its boot ID is
+    retried after an interval growing exponentially from
+    MIN_RECONNECT_INTERVAL up to max_interval.
+
+    :returns: the new boot ID and the number of attempts made to get it
+    :raises RebootHostTimeoutError: when timeout expires
+    """
+    timeout = tobiko.to_seconds_float(timeout) or DEFAULT_DISRUPT_TIMEOUT
+    max_interval = (tobiko.to_seconds_float(max_interval) or
+                    MAX_RECONNECT_INTERVAL)
+    deadline = tobiko.time() + timeout
+    interval = MIN_RECONNECT_INTERVAL
+    for attempts in itertools.count(1):
+        # ensure SSH connection is closed before reconnecting
+        tobiko.cleanup_fixture(ssh_client)
+        try:
+            new_boot_id = _uptime.get_boot_id(
+                ssh_client=ssh_client,
+                timeout=min(30., max(1., deadline - tobiko.time())))
+        except Exception as ex:
+            LOG.debug(f"Unable to get boot ID from host '{ssh_client.host}' "
+                      f"(attempt={attempts}): {ex}")
+        else:
+            if new_boot_id != boot_id:
+                return new_boot_id, attempts
+            LOG.debug(f"Host '{ssh_client.host}' not rebooted yet "
+                      f"(attempt={attempts})")
+        time_left = deadline - tobiko.time()
+        if time_left <= 0.:
+            tobiko.cleanup_fixture(ssh_client)
+            raise RebootHostTimeoutError(hostname=ssh_client.host,
+                                         timeout=timeout)
+        tobiko.sleep(min(interval, time_left))
+        interval = min(interval * RECONNECT_BACKOFF, max_interval)
+    raise RuntimeError('Broken retry loop')
+
+
+def disrupt_host(ssh_client: ssh.SSHClientFixture,
+                 disruption: DisruptionType = RebootHostMethod.HARD,
+                 boot_id: typing.Optional[str] = None,
+                 wait_for_reboot: bool = True,
+                 delay: tobiko.Seconds = None,
+                 timeout: tobiko.Seconds = None,
+                 max_interval: tobiko.Seconds = None) -> HostDisruption:
+    """Send a disruption command to a host and wait for it to reboot
+
+    The command is sent without waiting for it to terminate. Then, unless
+    wait_for_reboot is false, it waits for the host to get a boot ID other
+    than the one it had before the disruption.
+
+    :param disruption: a reboot method or any shell command
+    :param boot_id: the boot ID got before the disruption (it is got if
+        None)
+    :param delay: seconds to wait before sending the command
+    """
+    hostname = ssh_client.host or ssh_client.hostname
+    if wait_for_reboot and boot_id is None:
+        boot_id = _uptime.get_boot_id(ssh_client=ssh_client, timeout=30.)
+    delay = tobiko.to_seconds_float(delay)
+    if delay:
+        LOG.debug(f"Wait {delay} seconds before disrupting host "
+                  f"'{hostname}'")
+        tobiko.sleep(delay)
+    command = get_disruption_command(disruption)
+    ssh_client.connect().exec_command(command)
+    result = HostDisruption(hostname=hostname,
+                            disrupted=tobiko.time(),
+                            boot_id=boot_id)
+    LOG.info(f"disrupt exec: {command} on host: {hostname}")
+    if not wait_for_reboot:
+        return result
+
+    assert boot_id is not None
+    new_boot_id, attempts = wait_for_boot_id_change(
+        ssh_client=ssh_client,
+        boot_id=boot_id,
+        timeout=timeout,
+        max_interval=max_interval)
+    result = result._replace(new_boot_id=new_boot_id,
+                             recovered=tobiko.time(),
+                             attempts=attempts)
+    LOG.info(f"Host '{hostname}' rebooted after {result.downtime:.1f} "
+             "seconds")
+    return result
+
+
+def run_on_hosts(function: typing.Callable,
+                 ssh_clients: typing.List[ssh.SSHClientFixture],
+                 max_workers: int = None) \
+        -> typing.Tuple[typing.Dict[ssh.SSHClientFixture, typing.Any],
+                        typing.Dict[ssh.SSHClientFixture, Exception]]:
+    results: typing.Dict[ssh.SSHClientFixture, typing.Any] = {}
+    errors: typing.Dict[ssh.SSHClientFixture, Exception] = {}
+    if not ssh_clients:
+        return results, errors
+    max_workers = min(max_workers or len(ssh_clients), len(ssh_clients))
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        submitted = {executor.submit(function, index, ssh_client): ssh_client
+                     for index, ssh_client in enumerate(ssh_clients)}
+        for future in futures.as_completed(submitted):
+            ssh_client = submitted[future]
+            try:
+                results[ssh_client] = future.result()
+            except Exception as ex:
+                LOG.exception(f"Error disrupting host '{ssh_client.host}'")
+                errors[ssh_client] = ex
+    return results, errors
+
+
+def disrupt_hosts(ssh_clients: typing.Iterable[ssh.SSHClientFixture],
+                  disruption: DisruptionType = RebootHostMethod.HARD,
+                  wait_for_reboot: bool = True,
+                  stagger: tobiko.Seconds = None,
+                  timeout: tobiko.Seconds = None,
+                  max_interval: tobiko.Seconds = None,
+                  max_workers: int = None) -> typing.List[HostDisruption]:
+    """Disrupt many hosts at the same time and wait for them to reboot
+
+    The boot ID of all hosts is got first. Then every host is disrupted
+    and waited for by its own thread, so that the whole operation takes
+    about the time the slowest host takes to reboot. When stagger is given
+    the n-th host is disrupted n * stagger seconds after the first one.
+
+    :returns: what happened to every host, in the same order as ssh_clients
+    :raises DisruptHostsError: when any host can't be disrupted or doesn't
+        reboot before timeout. Its 'results' and 'errors' attributes map
+        every SSH client to what happened to its host and to the error got
+        respectively.
+    """
+    ssh_clients = list(ssh_clients)
+    stagger = tobiko.to_seconds_float(stagger) or 0.
+
+    boot_ids: typing.Dict[ssh.SSHClientFixture, typing.Any] = {}
+    errors: typing.Dict[ssh.SSHClientFixture, Exception] = {}
+    if wait_for_reboot:
+        boot_ids, errors = run_on_hosts(
+            lambda index, ssh_client: _uptime.get_boot_id(
+                ssh_client=ssh_client, timeout=30.),
+            ssh_clients=ssh_clients,
+            max_workers=max_workers)
+
+    def _disrupt(index: int, ssh_client: ssh.SSHClientFixture) \
+            -> HostDisruption:
+        return disrupt_host(ssh_client=ssh_client,
+                            disruption=disruption,
+                            boot_id=boot_ids.get(ssh_client),
+                            wait_for_reboot=wait_for_reboot,
+                            delay=index * stagger,
+                            timeout=timeout,
+                            max_interval=max_interval)
+
+    if not errors:
+        start_time = tobiko.time()
+        results, errors = run_on_hosts(_disrupt,
+                                       ssh_clients=ssh_clients,
+                                       max_workers=max_workers)
+    else:
+        # don't disrupt any host when any of them is already unreachable
+        results = {}
+
+    if errors:
+        details = '\n'.join(f"- {ssh_client.host}: {error}"
+                            for ssh_client, error in errors.items())
+        raise DisruptHostsError(failed=len(errors),
+                                total=len(ssh_clients),
+                                details=details,
+                                results=results,
+                                errors=errors)
+    if wait_for_reboot:
+        LOG.info(f"{len(ssh_clients)} hosts rebooted after "
+                 f"{tobiko.time() - start_time:.1f} seconds")
+    return [results[ssh_client] for ssh_client in ssh_clients]
@@ -40,3 +40,27 @@ def get_uptime(**execute_params):
     uptime_line = output.splitlines()[0]
     uptime_string = uptime_line.split()[0]
     return float(uptime_string)
+
+
+# Random UUID generated by the kernel at every boot
+BOOT_ID_FILE = '/proc/sys/kernel/random/boot_id'
+
+
+class BootIdError(tobiko.TobikoException):
+    message = "Unable to get boot ID from host: {error}"
+
+
+def get_boot_id(**execute_params) -> str:
+    """Returns the ID the host kernel has been given at last boot
+
+    Unlike uptime it doesn't depend on host clock, so that comparing it
+    with the ID got before a reboot tells for sure whether the host has
+    been rebooted.
+    """
+    result = _execute.execute(f'cat {BOOT_ID_FILE}', stdin=False,
+                              stdout=True, stderr=True,
+                              expect_exit_status=None, **execute_params)
+    output = result.stdout and result.stdout.strip()
+    if result.exit_status or not output:
+        raise BootIdError(error=result.stderr)
+    return output.splitlines()[0].strip()
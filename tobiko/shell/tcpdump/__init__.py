@@ -17,10 +17,32 @@ from __future__ import absolute_import
 
 from tobiko.shell.tcpdump import _assert
 from tobiko.shell.tcpdump import _execute
+from tobiko.shell.tcpdump import _flows
+from tobiko.shell.tcpdump import _stream
 
 
 assert_pcap_is_empty = _assert.assert_pcap_is_empty
 assert_pcap_is_not_empty = _assert.assert_pcap_is_not_empty
+assert_bit_rate = _assert.assert_bit_rate
+assert_dscp_marks = _assert.assert_dscp_marks
+assert_flow_packets = _assert.assert_flow_packets
+assert_tcp_retransmits = _assert.assert_tcp_retransmits
+assert_vlan_tags = _assert.assert_vlan_tags
 
 start_capture = _execute.start_capture
 get_pcap = _execute.get_pcap
+
+CHUNK_SIZE = _stream.CHUNK_SIZE
+PcapChunksReader = _stream.PcapChunksReader
+PcapStreamReader = _stream.PcapStreamReader
+TcpdumpCaptureFile = _stream.TcpdumpCaptureFile
+TcpdumpRingBuffer = _stream.TcpdumpRingBuffer
+close_pcap = _stream.close_pcap
+open_pcap = _stream.open_pcap
+read_capture_chunks = _stream.read_capture_chunks
+stream_pcap = _stream.stream_pcap
+
+FlowSummary = _flows.FlowSummary
+PacketTable = _flows.PacketTable
+decode_packets = _flows.decode_packets
+decode_pcap = _flows.decode_pcap
@@ -20,6 +20,8 @@ import dpkt
 from oslo_log import log
 
 import tobiko
+from tobiko.shell.tcpdump import _flows
+from tobiko.shell.tcpdump import _stream
 
 
 LOG = log.getLogger(__name__)
@@ -27,9 +29,13 @@ LOG = log.getLogger(__name__)
 
 def assert_pcap_content(pcap: dpkt.pcap.Reader, expect_empty: bool):
     actual_empty = True
-    for _ in pcap:
-        actual_empty = False
-        break
+    try:
+        for _ in pcap:
+            actual_empty = False
+            break
+    finally:
+        # the remaining packets are not transferred
+        _stream.close_pcap(pcap)
     testcase = tobiko.get_test_case()
     LOG.debug(f'Is the obtained pcap file empty? {actual_empty}')
     testcase.assertEqual(expect_empty, actual_empty)
@@ -43,3 +49,71 @@ def assert_pcap_is_empty(pcap: dpkt.pcap.Reader):
 def assert_pcap_is_not_empty(pcap: dpkt.pcap.Reader):
     LOG.debug('This test expects a non-empty pcap capture')
     assert_pcap_content(pcap, False)
+
+
+def assert_flow_packets(table: _flows.PacketTable,
+                        min_packets: int = 1,
+                        max_packets: int = None,
+                        **criteria) -> _flows.PacketTable:
+    """Assert the number of captured packets matching given criteria"""
+    selected = table.select(**criteria)
+    LOG.debug(f'{len(selected)} captured packets match {criteria}')
+    testcase = tobiko.get_test_case()
+    testcase.assertGreaterEqual(len(selected), min_packets)
+    if max_packets is not None:
+        testcase.assertLessEqual(len(selected), max_packets)
+    return selected
+
+
+def assert_dscp_marks(table: _flows.PacketTable,
+                      dscp: int,
+                      **criteria):
+    """Assert packets matching given criteria are all marked with dscp"""
+    selected = assert_flow_packets(table, **criteria)
+    marks = sorted(set(int(mark) for mark in selected['dscp']))
+    LOG.debug(f'DSCP marks found in captured packets: {marks}')
+    tobiko.get_test_case().assertEqual([dscp], marks)
+
+
+def assert_vlan_tags(table: _flows.PacketTable,
+                     vlan: int,
+                     **criteria):
+    """Assert packets matching given criteria are all tagged with vlan"""
+    selected = assert_flow_packets(table, **criteria)
+    tags = sorted(set(int(tag) for tag in selected['vlan']))
+    LOG.debug(f'VLAN tags found in captured packets: {tags}')
+    tobiko.get_test_case().assertEqual([vlan], tags)
+
+
+def assert_tcp_retransmits(table: _flows.PacketTable,
+                           max_retransmits: int = 0,
+                           **criteria):
+    """Assert TCP flows matching given criteria retransmitted few data"""
+    flows = assert_flow_packets(table, proto='tcp', **criteria).flows()
+    retransmits = sum(flow.retransmits for flow in flows)
+    LOG.debug(f'{retransmits} TCP retransmissions found in '
+              f'{len(flows)} flows')
+    tobiko.get_test_case().assertLessEqual(retransmits, max_retransmits)
+
+
+def assert_bit_rate(table: _flows.PacketTable,
+                    min_bit_rate: float = None,
+                    max_bit_rate: float = None,
+                    interval: float = 1.,
+                    **criteria):
+    """Assert the bit rate of packets matching given criteria
+
+    The rate is checked for every interval between the first and the last
+    matching packet, excluding those ones that are only partially covered
+    by the capture.
+    """
+    selected = assert_flow_packets(table, **criteria)
+    _, rates = selected.rate_series(interval=interval)
+    if len(rates) > 2:
+        rates = rates[1:-1]
+    LOG.debug(f'Bit rates of captured packets: {rates}')
+    testcase = tobiko.get_test_case()
+    if min_bit_rate is not None:
+        testcase.assertGreaterEqual(float(rates.min()), min_bit_rate)
+    if max_bit_rate is not None:
+        testcase.assertLessEqual(float(rates.max()), max_bit_rate)
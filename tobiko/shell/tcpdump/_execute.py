@@ -16,13 +16,12 @@
 from __future__ import absolute_import
 from __future__ import division
 
-import io
-
 import dpkt
 from oslo_log import log
 
 from tobiko.shell.tcpdump import _interface
 from tobiko.shell.tcpdump import _parameters
+from tobiko.shell.tcpdump import _stream
 from tobiko.shell import sh
 from tobiko.shell import ssh
 
@@ -34,14 +33,18 @@ def start_capture(capture_file: str,
                   interface: str = None,
                   capture_filter: str = None,
                   capture_timeout: int = None,
-                  ssh_client: ssh.SSHClientType = None) \
+                  ssh_client: ssh.SSHClientType = None,
+                  file_size: int = None,
+                  file_count: int = None) \
         -> sh.ShellProcessFixture:
 
     parameters = _parameters.tcpdump_parameters(
         capture_file=capture_file,
         interface=interface,
         capture_filter=capture_filter,
-        capture_timeout=capture_timeout)
+        capture_timeout=capture_timeout,
+        file_size=file_size,
+        file_count=file_count)
 
     command = _interface.get_tcpdump_command(parameters)
 
@@ -62,12 +65,14 @@ def stop_capture(process):
 
 def get_pcap(process,
              capture_file: str,
-             ssh_client: ssh.SSHClientType = None) -> dpkt.pcap.Reader:
-    stop_capture(process)
+             ssh_client: ssh.SSHClientType = None,
+             read_filter: str = None) -> dpkt.pcap.Reader:
+    """Stop the capture and get a reader streaming the capture file
 
-    stdout = sh.execute(f"cat '{capture_file}'",
-                        ssh_client=ssh_client,
-                        sudo=True,
-                        decode_streams=False).stdout
-    pcap = dpkt.pcap.Reader(io.BytesIO(stdout))
-    return pcap
+    :param read_filter: BPF filter applied on the capturing host before
+        transferring the packets
+    """
+    stop_capture(process)
+    return _stream.stream_pcap(capture_file=capture_file,
+                               ssh_client=ssh_client,
+                               read_filter=read_filter)
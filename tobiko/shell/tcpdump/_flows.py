@@ -0,0 +1,295 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import division
+
+import socket
+import typing
+
+import dpkt
+import dpkt.sll2
+import numpy
+from numpy.lib import recfunctions
+from oslo_log import log
+
+
+LOG = log.getLogger(__name__)
+
+PACKET_DTYPE = numpy.dtype([('time', numpy.float64),
+                            ('src', 'U39'),
+                            ('dst', 'U39'),
+                            ('proto', numpy.uint8),
+                            ('sport', numpy.uint16),
+                            ('dport', numpy.uint16),
+                            ('length', numpy.uint32),
+                            ('payload', numpy.uint32),
+                            ('dscp', numpy.uint8),
+                            ('vlan', numpy.int16),
+                            ('tcp_flags', numpy.uint8),
+                            ('tcp_seq', numpy.uint32)])
+
+PACKET_FIELDS: typing.Tuple[str, ...] = PACKET_DTYPE.names or tuple()
+
+FLOW_FIELDS = ['src', 'dst', 'proto', 'sport', 'dport']
+
+NO_VLAN = -1
+
+PROTOCOLS = {'icmp': socket.IPPROTO_ICMP,
+             'tcp': socket.IPPROTO_TCP,
+             'udp': socket.IPPROTO_UDP,
+             'icmpv6': socket.IPPROTO_ICMPV6}
+
+TCP_FLAGS = {'fin': dpkt.tcp.TH_FIN,
+             'syn': dpkt.tcp.TH_SYN,
+             'rst': dpkt.tcp.TH_RST,
+             'push': dpkt.tcp.TH_PUSH,
+             'ack': dpkt.tcp.TH_ACK,
+             'urg': dpkt.tcp.TH_URG,
+             'ece': dpkt.tcp.TH_ECE,
+             'cwr': dpkt.tcp.TH_CWR}
+
+LINK_DECODERS: typing.Dict[int, typing.Callable[[bytes], typing.Any]] = {
+    dpkt.pcap.DLT_EN10MB: dpkt.ethernet.Ethernet,
+    dpkt.pcap.DLT_LINUX_SLL: dpkt.sll.SLL,
+    dpkt.pcap.DLT_LINUX_SLL2: dpkt.sll2.SLL2}
+
+
+def decode_raw_ip(buf: bytes):
+    if buf and buf[0] >> 4 == 6:
+        return dpkt.ip6.IP6(buf)
+    return dpkt.ip.IP(buf)
+
+
+# LINKTYPE_RAW value used in pcap files differs from DLT_RAW one
+for _datalink in [dpkt.pcap.DLT_RAW, 101]:
+    LINK_DECODERS[_datalink] = decode_raw_ip
+
+
+class FlowSummary(typing.NamedTuple):
+    """Statistics of the packets of a flow, identified by its 5-tuple"""
+    src: str
+    dst: str
+    proto: int
+    sport: int
+    dport: int
+    packets: int
+    bytes: int
+    first: float
+    last: float
+    retransmits: int = 0
+    dscp: typing.Tuple[int, ...] = tuple()
+    vlans: typing.Tuple[int, ...] = tuple()
+
+    @property
+    def duration(self) -> float:
+        return self.last - self.first
+
+    @property
+    def bits_per_second(self) -> float:
+        if self.duration <= 0.:
+            return 0.
+        return self.bytes * 8. / self.duration
+
+
+class PacketTable:
+    """Decoded packets of a capture, one column for every header field
+
+    Every row is a packet, described by the fields of PACKET_DTYPE.
+    Packets without an IP header are not included.
+    """
+
+    def __init__(self, packets: numpy.ndarray = None):
+        if packets is None:
+            packets = numpy.zeros(0, dtype=PACKET_DTYPE)
+        self.packets = packets
+
+    def __len__(self) -> int:
+        return len(self.packets)
+
+    def __getitem__(self, field: str) -> numpy.ndarray:
+        return self.packets[field]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}<{len(self)} packets>"
+
+    def select(self, tcp_flag: str = None, **criteria) -> 'PacketTable':
+        """Get the packets matching all given field values
+
+        :param tcp_flag: name of a TCP flag (like 'syn') that has to be set
+        :param criteria: field values to match (like dport=80). Protocol
+            can be given by name (like proto='tcp').
+        """
+        mask = numpy.ones(len(self), dtype=bool)
+        for field, value in criteria.items():
+            if field not in PACKET_FIELDS:
+                raise ValueError(f"Invalid packet field: {field!r}")
+            if field == 'proto' and isinstance(value, str):
+                value = PROTOCOLS[value.lower()]
+            mask &= self.packets[field] == value
+        if tcp_flag is not None:
+            mask &= (self.packets['proto'] == socket.IPPROTO_TCP)
+            mask &= (self.packets['tcp_flags'] &
+                     TCP_FLAGS[tcp_flag.lower()]) != 0
+        return PacketTable(self.packets[mask])
+
+    @property
+    def total_bytes(self) -> int:
+        return int(self.packets['length'].sum())
+
+    @property
+    def duration(self) -> float:
+        if len(self) < 2:
+            return 0.
+        times = self.packets['time']
+        return float(times.max() - times.min())
+
+    def rate_series(self, interval: float = 1.) \
+            -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """Get the bit rate of the packets over time
+
+        :returns: the start time of every interval and the bits per second
+            transferred during it
+        """
+        if not len(self):
+            return numpy.zeros(0), numpy.zeros(0)
+        times = self.packets['time']
+        start = times.min()
+        bins = ((times - start) // interval).astype(numpy.int64)
+        sizes = numpy.bincount(bins, weights=self.packets['length'])
+        starts = start + numpy.arange(len(sizes)) * interval
+        return starts, sizes * 8. / interval
+
+    def flows(self) -> typing.List[FlowSummary]:
+        """Group packets by 5-tuple and summarize every flow"""
+        if not len(self):
+            return []
+        packets = self.packets
+        keys, inverse = numpy.unique(
+            recfunctions.repack_fields(packets[FLOW_FIELDS]),
+            return_inverse=True)
+        inverse = inverse.reshape(-1).astype(numpy.int64)
+        count = len(keys)
+        packets_count = numpy.bincount(inverse, minlength=count)
+        bytes_count = numpy.bincount(inverse, weights=packets['length'],
+                                     minlength=count)
+        first = numpy.full(count, numpy.inf)
+        numpy.minimum.at(first, inverse, packets['time'])
+        last = numpy.full(count, -numpy.inf)
+        numpy.maximum.at(last, inverse, packets['time'])
+        retransmits = count_retransmits(packets, inverse, count)
+        dscp = group_values(inverse, packets['dscp'], count)
+        vlans = group_values(inverse, packets['vlan'], count)
+        return [FlowSummary(src=str(key['src']),
+                            dst=str(key['dst']),
+                            proto=int(key['proto']),
+                            sport=int(key['sport']),
+                            dport=int(key['dport']),
+                            packets=int(packets_count[i]),
+                            bytes=int(bytes_count[i]),
+                            first=float(first[i]),
+                            last=float(last[i]),
+                            retransmits=int(retransmits[i]),
+                            dscp=dscp[i],
+                            vlans=tuple(vlan for vlan in vlans[i]
+                                        if vlan != NO_VLAN))
+                for i, key in enumerate(keys)]
+
+
+def count_retransmits(packets: numpy.ndarray,
+                      inverse: numpy.ndarray,
+                      count: int) -> numpy.ndarray:
+    """Count TCP segments carrying data already sent by the same flow"""
+    data = ((packets['proto'] == socket.IPPROTO_TCP) &
+            (packets['payload'] > 0))
+    flows = inverse[data].astype(numpy.uint64)
+    segments = (flows << numpy.uint64(32)) | packets['tcp_seq'][data]
+    unique_flows = numpy.unique(segments) >> numpy.uint64(32)
+    return (numpy.bincount(flows.astype(numpy.int64), minlength=count) -
+            numpy.bincount(unique_flows.astype(numpy.int64),
+                           minlength=count))
+
+
+def group_values(inverse: numpy.ndarray,
+                 values: numpy.ndarray,
+                 count: int) -> typing.List[typing.Tuple[int, ...]]:
+    """Get the distinct values found for every flow"""
+    pairs = numpy.unique(numpy.stack([inverse, values.astype(numpy.int64)],
+                                     axis=1), axis=0)
+    groups: typing.List[typing.List[int]] = [[] for _ in range(count)]
+    for flow, value in pairs:
+        groups[flow].append(int(value))
+    return [tuple(group) for group in groups]
+
+
+def decode_packet(decode_link: typing.Callable[[bytes], typing.Any],
+                  timestamp: float,
+                  buf: bytes) -> typing.Optional[tuple]:
+    try:
+        frame = decode_link(buf)
+    except (dpkt.UnpackError, ValueError):
+        return None
+
+    vlan = NO_VLAN
+    if isinstance(frame, dpkt.ethernet.Ethernet):
+        vlan_tags = getattr(frame, 'vlan_tags', None)
+        if vlan_tags:
+            vlan = vlan_tags[0].id
+        frame = frame.data
+    elif isinstance(frame, (dpkt.sll.SLL, dpkt.sll2.SLL2)):
+        frame = frame.data
+
+    if isinstance(frame, dpkt.ip.IP):
+        family, dscp = socket.AF_INET, frame.tos >> 2
+    elif isinstance(frame, dpkt.ip6.IP6):
+        family, dscp = socket.AF_INET6, (frame.fc >> 2) & 0x3f
+    else:
+        return None
+
+    segment = frame.data
+    sport = dport = payload = tcp_flags = tcp_seq = 0
+    if isinstance(segment, (dpkt.tcp.TCP, dpkt.udp.UDP)):
+        sport, dport = segment.sport, segment.dport
+        payload = len(segment.data)
+        if isinstance(segment, dpkt.tcp.TCP):
+            tcp_flags, tcp_seq = segment.flags, segment.seq
+    return (float(timestamp),
+            socket.inet_ntop(family, frame.src),
+            socket.inet_ntop(family, frame.dst),
+            frame.p, sport, dport, len(buf), payload, dscp, vlan,
+            tcp_flags, tcp_seq)
+
+
+def decode_packets(packets: typing.Iterable[typing.Tuple[float, bytes]],
+                   datalink: int = dpkt.pcap.DLT_EN10MB) -> PacketTable:
+    """Decode packets headers once into a PacketTable"""
+    try:
+        decode_link = LINK_DECODERS[datalink]
+    except KeyError:
+        raise ValueError(f"Unsupported data link type: {datalink}")
+    rows = []
+    skipped = 0
+    for timestamp, buf in packets:
+        row = decode_packet(decode_link, timestamp, buf)
+        if row is None:
+            skipped += 1
+        else:
+            rows.append(row)
+    LOG.debug(f"Decoded {len(rows)} IP packets ({skipped} skipped)")
+    return PacketTable(numpy.array(rows, dtype=PACKET_DTYPE))
+
+
+def decode_pcap(pcap: dpkt.pcap.Reader) -> PacketTable:
+    return decode_packets(pcap, datalink=pcap.datalink())
@@ -15,6 +15,8 @@
 #    under the License.
 from __future__ import absolute_import
 
+import shlex
+
 from tobiko.shell.tcpdump import _parameters
 
 
@@ -23,6 +25,13 @@ def get_tcpdump_command(parameters: _parameters.TcpdumpParameters):
     return interface.get_tcpdump_command(parameters)
 
 
+def get_tcpdump_read_command(capture_file: str,
+                             read_filter: str = None) -> str:
+    interface = TcpdumpInterface()
+    return interface.get_tcpdump_read_command(capture_file=capture_file,
+                                              read_filter=read_filter)
+
+
 class TcpdumpInterface:
 
     def get_tcpdump_command(
@@ -41,6 +50,21 @@ class TcpdumpInterface:
             options += f' -i {parameters.interface}'
         else:
             options += ' -i any'
+        if parameters.file_size is not None:
+            # tcpdump drops its privileges before opening the next files
+            # of the capture, that could be not writable by its own user
+            options += f' -C {parameters.file_size} -Z root'
+        if parameters.file_count is not None:
+            options += f' -W {parameters.file_count}'
         if parameters.capture_filter is not None:
             options += f' {parameters.capture_filter}'
         return options
+
+    def get_tcpdump_read_command(self,
+                                 capture_file: str,
+                                 read_filter: str = None) -> str:
+        if read_filter is None:
+            return f'cat {capture_file}'
+        # packets are filtered on the capturing host, and only the
+        # matching ones are written to the standard output
+        return f'tcpdump -r {capture_file} -w - {shlex.quote(read_filter)}'
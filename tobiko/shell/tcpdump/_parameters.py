@@ -23,16 +23,27 @@ class TcpdumpParameters(typing.NamedTuple):
     interface: typing.Optional[str] = None
     capture_filter: typing.Optional[str] = None
     capture_timeout: typing.Optional[int] = None
+    file_size: typing.Optional[int] = None
+    file_count: typing.Optional[int] = None
 
 
 def tcpdump_parameters(
         capture_file: str,
         interface: str = None,
         capture_filter: str = None,
-        capture_timeout: int = None):
+        capture_timeout: int = None,
+        file_size: int = None,
+        file_count: int = None):
     """Get tcpdump parameters
+
+    :param file_size: size in millions of bytes after which the capture
+        continues on a new file (tcpdump -C option)
+    :param file_count: number of files of the ring buffer; the oldest one
+        is overwritten when the limit is reached (tcpdump -W option)
     """
     return TcpdumpParameters(capture_file=capture_file,
                              interface=interface,
                              capture_filter=capture_filter,
-                             capture_timeout=capture_timeout)
+                             capture_timeout=capture_timeout,
+                             file_size=file_size,
+                             file_count=file_count)
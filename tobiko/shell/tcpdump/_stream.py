@@ -0,0 +1,217 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import io
+import shlex
+import typing
+
+import dpkt
+from oslo_log import log
+
+from tobiko.shell.tcpdump import _interface
+from tobiko.shell import sh
+from tobiko.shell import ssh
+
+
+LOG = log.getLogger(__name__)
+
+CHUNK_SIZE = 256 * 1024
+
+# It prints the modification time and the name of the capture file and of
+# the ones created by tcpdump when rotating it (-C option), that are named
+# appending a number to the original file name
+LIST_CAPTURE_FILES_COMMAND = (
+    'for f in {capture_file} {capture_file}[0-9]*; do '
+    'if [ -f "$f" ]; then stat -c "%y|%n" "$f"; fi; done')
+
+
+def read_capture_chunks(capture_file: str,
+                        ssh_client: ssh.SSHClientType = None,
+                        read_filter: str = None,
+                        chunk_size: int = None) \
+        -> typing.Iterator[bytes]:
+    """Iterate over the content of a capture file, one chunk at a time
+
+    The file is transferred while it is consumed, so that no more than a
+    chunk of it is kept in memory.
+
+    :param read_filter: BPF filter applied by tcpdump on the capturing
+        host, so that only the matching packets are transferred
+    :raises sh.ShellCommandFailed: when the capture file can not be read
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    command = _interface.get_tcpdump_read_command(
+        capture_file=shlex.quote(capture_file),
+        read_filter=read_filter)
+    process = sh.process(command, ssh_client=ssh_client, sudo=True,
+                         stdin=False, stderr=False).execute()
+    completed = False
+    try:
+        transferred = 0
+        while True:
+            # read from the stream delegate, so that received chunks
+            # are not kept by the process fixture
+            chunk = process.stdout.delegate.read(chunk_size)
+            if not chunk:
+                break
+            transferred += len(chunk)
+            yield chunk
+        process.get_exit_status()
+        process.check_exit_status()
+        completed = True
+        LOG.debug(f"Transferred {transferred} bytes of capture file "
+                  f"'{capture_file}'")
+    finally:
+        if not completed:
+            process.kill(sudo=True)
+        process.close()
+
+
+class PcapChunksReader(io.RawIOBase):
+    """Read-only file object over an iterator of bytes chunks"""
+
+    def __init__(self, chunks: typing.Iterable[bytes]):
+        super(PcapChunksReader, self).__init__()
+        self._chunks = iter(chunks)
+        self._pending = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            # it stops the transfer of the chunks not consumed yet
+            close_chunks = getattr(self._chunks, 'close', None)
+            if close_chunks is not None:
+                close_chunks()
+        super(PcapChunksReader, self).close()
+
+
+class PcapStreamReader(dpkt.pcap.Reader):
+    """pcap reader that can be closed before every packet is read"""
+
+    def __init__(self, stream: typing.BinaryIO):
+        super(PcapStreamReader, self).__init__(stream)
+        self.stream = stream
+
+    def close(self):
+        self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.close()
+
+
+def open_pcap(chunks: typing.Iterable[bytes],
+              chunk_size: int = None) -> PcapStreamReader:
+    """Get a pcap reader parsing packets as chunks are received"""
+    stream = io.BufferedReader(PcapChunksReader(chunks),
+                               buffer_size=chunk_size or CHUNK_SIZE)
+    return PcapStreamReader(stream)
+
+
+def stream_pcap(capture_file: str,
+                ssh_client: ssh.SSHClientType = None,
+                read_filter: str = None,
+                chunk_size: int = None) -> PcapStreamReader:
+    """Get a pcap reader transferring the capture file while iterated
+
+    Close it to stop the transfer before every packet has been read.
+    """
+    chunks = read_capture_chunks(capture_file=capture_file,
+                                 ssh_client=ssh_client,
+                                 read_filter=read_filter,
+                                 chunk_size=chunk_size)
+    return open_pcap(chunks, chunk_size=chunk_size)
+
+
+def close_pcap(pcap: dpkt.pcap.Reader):
+    """Stop the transfer of a pcap stream not consumed until the end"""
+    if isinstance(pcap, PcapStreamReader):
+        pcap.close()
+
+
+class TcpdumpCaptureFile(typing.NamedTuple):
+    name: str
+    modified: str
+
+
+class TcpdumpRingBuffer:
+    """Retrieves the files of a capture rotated with tcpdump -C option
+
+    Every file is retrieved only once, as soon as tcpdump has completed
+    it, while the capture continues. When a ring buffer is used (tcpdump -W
+    option), a file overwritten by tcpdump is retrieved again.
+    """
+
+    def __init__(self,
+                 capture_file: str,
+                 ssh_client: ssh.SSHClientType = None,
+                 read_filter: str = None):
+        self.capture_file = capture_file
+        self.ssh_client = ssh_client
+        self.read_filter = read_filter
+        self.retrieved: typing.Set[TcpdumpCaptureFile] = set()
+
+    def list_files(self) -> typing.List[TcpdumpCaptureFile]:
+        """List capture files, from the oldest to the newest one"""
+        command = LIST_CAPTURE_FILES_COMMAND.format(
+            capture_file=shlex.quote(self.capture_file))
+        output = sh.execute(['sh', '-c', command],
+                            ssh_client=self.ssh_client,
+                            sudo=True).stdout
+        files = []
+        for line in output.splitlines():
+            modified, _, name = line.partition('|')
+            if name:
+                files.append(TcpdumpCaptureFile(name=name,
+                                                modified=modified))
+        return sorted(files, key=lambda f: (f.modified, f.name))
+
+    def fetch(self, include_current=False) \
+            -> typing.Iterator[typing.Tuple[str, dpkt.pcap.Reader]]:
+        """Iterate over the files not retrieved yet
+
+        :param include_current: when false, the newest file is skipped
+            because tcpdump could be still writing it. Use it once the
+            capture has been stopped.
+        """
+        files = self.list_files()
+        if files and not include_current:
+            files = files[:-1]
+        for capture_file in files:
+            if capture_file in self.retrieved:
+                continue
+            self.retrieved.add(capture_file)
+            LOG.debug(f"Retrieving capture file '{capture_file.name}'")
+            yield capture_file.name, stream_pcap(
+                capture_file=capture_file.name,
+                ssh_client=self.ssh_client,
+                read_filter=self.read_filter)
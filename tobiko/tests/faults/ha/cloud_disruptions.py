@@ -113,23 +113,58 @@ def network_undisrupt_node(node_name, disrupt_method=undisrupt_network):
 
 
 def disrupt_node(node_name, disrupt_method=network_disruption):
-    # reboot all controllers and wait for ssh Up on them
-    # hard reset is simultaneous while soft is sequential
+    # disrupt a node and wait for it to be rebooted (by itself or fenced
+    # because of a network disruption) or to be responsive
     # method : method of disruption to use : network_disruption |
     # container_restart
-
-    start_time = tobiko.time()
-    # using ssh_client.connect we use a fire and forget reboot method
     node = tripleo_topology.get_node(node_name)
-    node.ssh_client.connect().exec_command(disrupt_method)
-    LOG.info('disrupt exec: {} on server: {}'.format(disrupt_method,
-                                                     node.name))
+    disrupt_nodes([node], disrupt_method=disrupt_method)
+
+
+def is_reboot_disruption(disrupt_method):
+    return (isinstance(disrupt_method, sh.RebootHostMethod) or
+            is_network_disruption(disrupt_method))
 
-    if isinstance(disrupt_method, sh.RebootHostMethod) \
-            or is_network_disruption(disrupt_method):
-        check_overcloud_node_uptime(node.ssh_client, start_time)
+
+def disrupt_nodes(nodes, disrupt_method=sh.hard_reset_method,
+                  sequentially=False, stagger=None):
+    """Disrupt nodes and wait for all of them to come back
+
+    Unless sequentially, all nodes are disrupted at the same time (or
+    every [rhosp]/disruption_stagger seconds) and waited for in parallel,
+    so that it takes about the time the slowest node takes to reboot.
+    Reboots are detected by node boot ID changes. When sequentially, every
+    node is checked to be responsive before disrupting the next one.
+
+    :returns: what happened to every node (see sh.HostDisruption)
+    """
+    nodes = list(nodes)
+    wait_for_reboot = is_reboot_disruption(disrupt_method)
+    if stagger is None:
+        stagger = CONF.tobiko.rhosp.disruption_stagger
+    if sequentially:
+        groups = [[node] for node in nodes]
     else:
-        check_overcloud_node_responsive(node)
+        groups = [nodes]
+
+    disruptions = []
+    for group in groups:
+        disruptions += sh.disrupt_hosts(
+            [node.ssh_client for node in group],
+            disruption=disrupt_method,
+            wait_for_reboot=wait_for_reboot,
+            stagger=stagger,
+            timeout=CONF.tobiko.rhosp.reboot_timeout)
+        if sequentially or not wait_for_reboot:
+            # next node is disrupted only after this one is responsive
+            for node in group:
+                check_overcloud_node_responsive(node)
+
+    for node, disruption in zip(nodes, disruptions):
+        if disruption.downtime is not None:
+            LOG.info(f"Node '{node.name}' was down for "
+                     f"{disruption.downtime:.1f} seconds")
+    return disruptions
 
 
 def check_overcloud_node_uptime(ssh_client, start_time):
@@ -191,12 +226,9 @@ def reset_all_controller_nodes_sequentially(
 
 def disrupt_all_controller_nodes(disrupt_method=sh.hard_reset_method,
                                  sequentially=False, exclude_list=None):
-    # TODO(eolivare): join disrupt_all_controller_nodes and
-    # reboot_all_controller_nodes methods because they are very similar
-
     # reboot all controllers and wait for ssh Up on them
     # method : method of disruptino to use : reset | network_disruption
-    # hard reset is simultaneous while soft is sequential
+    # nodes are disrupted at the same time unless sequentially
     # exclude_list = list of nodes to NOT reset
 
     controlplane_groups = ['controller', 'messaging', 'database', 'networker']
@@ -208,62 +240,18 @@ def disrupt_all_controller_nodes(disrupt_method=sh.hard_reset_method,
     if exclude_list:
         nodes = [node for node in nodes if node.name not in exclude_list]
 
-    start_time = {}
-    for controller in nodes:
-        start_time[controller.name] = tobiko.time()
-        if isinstance(disrupt_method, sh.RebootHostMethod):
-            reboot_node(controller.name, wait=sequentially,
-                        reboot_method=disrupt_method)
-        else:
-            # using ssh_client.connect we use a fire and forget reboot method
-            controller.ssh_client.connect().exec_command(disrupt_method)
-            LOG.info('disrupt exec: {} on server: {}'.format(disrupt_method,
-                                                             controller.name))
-            tobiko.cleanup_fixture(controller.ssh_client)
-            if sequentially and is_network_disruption(disrupt_method):
-                check_overcloud_node_uptime(
-                    controller.ssh_client, start_time[controller.name])
-        if sequentially:
-            check_overcloud_node_responsive(controller)
-
-    if not sequentially:
-        for controller in nodes:
-            if isinstance(disrupt_method, sh.RebootHostMethod) \
-                    or is_network_disruption(disrupt_method):
-                check_overcloud_node_uptime(
-                    controller.ssh_client, start_time[controller.name])
-            else:
-                check_overcloud_node_responsive(controller)
+    return disrupt_nodes(nodes, disrupt_method=disrupt_method,
+                         sequentially=sequentially)
 
 
 def reboot_all_controller_nodes(reboot_method=sh.hard_reset_method,
                                 sequentially=False, exclude_list=None):
     # reboot all controllers and wait for ssh Up on them
     # method : method of disruptino to use : hard or soft reset
-    # hard reset is simultaneous while soft is sequential
     # exclude_list = list of nodes to NOT reset
-
-    controlplane_groups = ['controller', 'messaging', 'database', 'networker']
-    actual_controlplane_groups = tripleo_topology.actual_node_groups(
-        controlplane_groups)
-    nodes = topology.list_openstack_nodes(group=actual_controlplane_groups)
-
-    # remove excluded nodes from reset list
-    if exclude_list:
-        nodes = [node for node in nodes if node.name not in exclude_list]
-
-    start_time = {}
-    for controller in nodes:
-        start_time[controller.name] = tobiko.time()
-        sh.reboot_host(ssh_client=controller.ssh_client, wait=sequentially,
-                       method=reboot_method)
-        LOG.info('reboot exec: {} on server: {}'.format(reboot_method,
-                                                        controller.name))
-        tobiko.cleanup_fixture(controller.ssh_client)
-    if not sequentially:
-        for controller in nodes:
-            check_overcloud_node_uptime(
-                controller.ssh_client, start_time[controller.name])
+    return disrupt_all_controller_nodes(disrupt_method=reboot_method,
+                                        sequentially=sequentially,
+                                        exclude_list=exclude_list)
 
 
 def is_ipv6addr_main_vip():
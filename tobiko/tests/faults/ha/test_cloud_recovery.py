@@ -103,14 +103,19 @@ def octavia_health_checks():
         return
     # check LBs and Amphorae are healthy
     LOG.debug("check all LBs are in healthy status")
+    watched = []
     for lb in octavia.list_load_balancers():
         LOG.debug("checkin LBs:\n%s", lb)
-        octavia.wait_for_status(lb['id'], interval=3., timeout=120.)
-        octavia.wait_for_status(lb['id'],
-                                status_key=octavia.OPERATING_STATUS,
-                                status=octavia.ONLINE,
-                                interval=3.,
-                                timeout=120.)
+        watched.append(octavia.watch_status(lb['id'],
+                                            interval=3.,
+                                            timeout=120.))
+        watched.append(octavia.watch_status(
+            lb['id'],
+            status_key=octavia.OPERATING_STATUS,
+            status=octavia.ONLINE,
+            interval=3.,
+            timeout=120.))
+    tobiko.wait_for_futures(watched)
     LOG.debug("All LBs are in healthy status")
 
 
@@ -71,6 +71,7 @@ class OctaviaBasicFaultTest(testtools.TestCase):
                     port=self.listener.protocol_port)
                 break
             except (octavia.RoundRobinException,
+                    octavia.RequestException,
                     octavia.TrafficTimeoutError,
                     sh.ShellCommandFailed):
                 LOG.exception(
@@ -82,7 +82,8 @@ def _test_traffic(pool_id: str, ip_address: str, lb_algorithm: str,
                               f"{attempt.elapsed_time} seconds")
             if attempt.is_last:
                 raise
-        except (octavia.TrafficTimeoutError,
+        except (octavia.RequestException,
+                octavia.TrafficTimeoutError,
                 sh.ShellCommandFailed):
             LOG.exception(f"Traffic didn't reach all members after "
                           f"#{attempt.number} attempts and "
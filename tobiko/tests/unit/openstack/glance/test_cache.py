@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import gzip
+import hashlib
+import os
+from unittest import mock
+
+from tobiko.openstack import glance
+from tobiko.openstack.glance import _cache
+from tobiko.tests import unit
+
+
+IMAGE_URL = 'http://example.com/images/my-image.img'
+
+
+class GlanceImageCacheTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(GlanceImageCacheTest, self).setUp()
+        self.cache = glance.glance_image_cache(self.create_tempdir())
+        self.download = mock.Mock(side_effect=self.write_image_file)
+
+    @staticmethod
+    def write_image_file(path: str, data: bytes = b'image data'):
+        with open(path, 'wb') as stream:
+            stream.write(data)
+
+    def test_fetch_image_file(self):
+        image_file = self.cache.fetch_image_file(url=IMAGE_URL,
+                                                 download=self.download)
+        sha256 = hashlib.sha256(b'image data').hexdigest()
+        self.assertEqual(glance.CachedImageFile(
+            path=os.path.join(self.cache.objects_dir, sha256),
+            sha256=sha256,
+            size=len(b'image data')), image_file)
+        self.download.assert_called_once()
+
+        # the same URL is not downloaded again
+        self.assertEqual(image_file, self.cache.fetch_image_file(
+            url=IMAGE_URL, download=self.download))
+        self.download.assert_called_once()
+
+    def test_fetch_image_file_when_corrupted(self):
+        image_file = self.cache.fetch_image_file(url=IMAGE_URL,
+                                                 download=self.download)
+        # same size, different content
+        self.write_image_file(image_file.path, b'IMAGE DATA')
+        os.utime(image_file.path, ns=(0, 0))
+        self.assertEqual(image_file, self.cache.fetch_image_file(
+            url=IMAGE_URL, download=self.download))
+        self.assertEqual(2, self.download.call_count)
+        with open(image_file.path, 'rb') as stream:
+            self.assertEqual(b'image data', stream.read())
+
+    def test_fetch_image_file_when_download_fails(self):
+        self.download.side_effect = RuntimeError
+        self.assertRaises(RuntimeError, self.cache.fetch_image_file,
+                          url=IMAGE_URL, download=self.download)
+        self.assertEqual([], os.listdir(self.cache.objects_dir))
+        self.assertIsNone(self.cache.get_image_file(IMAGE_URL))
+
+    def test_fetch_image_file_resumes_partial_download(self):
+        paths = []
+
+        def fail_download(path: str):
+            paths.append(path)
+            self.write_image_file(path, b'image')
+            raise RuntimeError
+
+        self.download.side_effect = fail_download
+        self.assertRaises(RuntimeError, self.cache.fetch_image_file,
+                          url=IMAGE_URL, download=self.download)
+        self.assertTrue(os.path.isfile(paths[0]))
+
+        # the partial file is passed again to the download function
+        self.download.side_effect = self.write_image_file
+        image_file = self.cache.fetch_image_file(url=IMAGE_URL,
+                                                 download=self.download)
+        self.download.assert_called_with(paths[0])
+        self.assertFalse(os.path.exists(paths[0]))
+        self.assertEqual(len(b'image data'), image_file.size)
+
+    def test_get_data_hash(self):
+        image_file = os.path.join(self.cache.cache_dir, 'my-image.img.gz')
+        with gzip.open(image_file, 'wb') as stream:
+            stream.write(b'image data')
+        data_hash = self.cache.get_data_hash(image_file=image_file,
+                                             algorithm='sha512')
+        self.assertEqual(hashlib.sha512(b'image data').hexdigest(),
+                         data_hash)
+
+        # the hash is not computed again until the file changes
+        open_image_file = self.patch(_cache._io, 'open_image_file')
+        self.assertEqual(data_hash, self.cache.get_data_hash(
+            image_file=image_file, algorithm='sha512'))
+        open_image_file.assert_not_called()
+
+    def test_get_data_size(self):
+        image_file = os.path.join(self.cache.cache_dir, 'my-image.img.gz')
+        with gzip.open(image_file, 'wb') as stream:
+            stream.write(b'image data')
+        data_hash = self.cache.get_data_hash(image_file=image_file,
+                                             algorithm='sha512')
+
+        # the size is computed together with the hash
+        open_image_file = self.patch(_cache._io, 'open_image_file')
+        self.assertEqual(len(b'image data'), self.cache.get_data_size(
+            image_file=image_file))
+        self.assertEqual(data_hash, self.cache.get_data_hash(
+            image_file=image_file, algorithm='sha512'))
+        open_image_file.assert_not_called()
+
+    def test_get_decompressed_file(self):
+        image_file = os.path.join(self.cache.cache_dir, 'my-image.img.gz')
+        with gzip.open(image_file, 'wb') as stream:
+            stream.write(b'image data')
+        path = self.cache.get_decompressed_file(image_file=image_file)
+        with open(path, 'rb') as stream:
+            self.assertEqual(b'image data', stream.read())
+
+        # the file is not decompressed again until it changes
+        open_image_file = self.patch(_cache._io, 'open_image_file')
+        self.assertEqual(path, self.cache.get_decompressed_file(
+            image_file=image_file))
+        open_image_file.assert_not_called()
@@ -0,0 +1,183 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import hashlib
+import json
+import os
+import typing
+
+import requests
+
+from tobiko.openstack import glance
+from tobiko.openstack.glance import _download
+from tobiko.tests import unit
+
+
+IMAGE_URL = 'http://example.com/images/my-image.img'
+
+IMAGE_DATA = bytes(range(256)) * 40 + b'tail'
+
+
+class FakeResponse:
+
+    def __init__(self,
+                 status_code: int = 200,
+                 headers: typing.Dict[str, str] = None,
+                 content: bytes = b'',
+                 fail_after: int = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+        self.fail_after = fail_after
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size: int):
+        for offset in range(0, len(self.content), chunk_size):
+            if self.fail_after is not None and offset >= self.fail_after:
+                raise requests.ConnectionError('connection lost')
+            yield self.content[offset:offset + chunk_size]
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+
+    def __init__(self,
+                 data: bytes = IMAGE_DATA,
+                 accept_ranges=True,
+                 fail_ranges: typing.Iterable[int] = ()):
+        self.data = data
+        self.accept_ranges = accept_ranges
+        # Range requests starting from these offsets fail once
+        self.fail_ranges = set(fail_ranges)
+        self.ranges: typing.List[typing.Tuple[int, int]] = []
+
+    def head(self, url, **kwargs):
+        headers = {'content-length': str(len(self.data)),
+                   'etag': '"some-etag"'}
+        if self.accept_ranges:
+            headers['accept-ranges'] = 'bytes'
+        return FakeResponse(headers=headers)
+
+    def get(self, url, headers=None, **kwargs):
+        range_header = (headers or {}).get('Range')
+        if range_header is None or not self.accept_ranges:
+            return FakeResponse(content=self.data)
+        start, end = (int(value)
+                      for value in range_header[len('bytes='):].split('-'))
+        self.ranges.append((start, end))
+        fail_after = None
+        if start in self.fail_ranges:
+            self.fail_ranges.remove(start)
+            fail_after = 1
+        return FakeResponse(status_code=206,
+                            content=self.data[start:end + 1],
+                            fail_after=fail_after)
+
+
+class ImageDownloaderTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(ImageDownloaderTest, self).setUp()
+        self.path = os.path.join(self.create_tempdir(), 'my-image.img')
+
+    def download(self, session: FakeSession, **kwargs) \
+            -> glance.DownloadStats:
+        kwargs.setdefault('segment_size', 1000)
+        kwargs.setdefault('buffer_size', 100)
+        kwargs.setdefault('retry_interval', .01)
+        return glance.download_image_file(url=IMAGE_URL,
+                                          path=self.path,
+                                          session=session,
+                                          **kwargs)
+
+    def assert_downloaded(self):
+        with open(self.path, 'rb') as stream:
+            self.assertEqual(IMAGE_DATA, stream.read())
+        self.assertFalse(os.path.exists(self.path + '.progress'))
+
+    def test_download(self):
+        session = FakeSession()
+        stats = self.download(session)
+        self.assert_downloaded()
+        self.assertEqual(11, len(session.ranges))
+        self.assertEqual((10000, len(IMAGE_DATA) - 1), max(session.ranges))
+        self.assertEqual(len(IMAGE_DATA), stats.size)
+        self.assertEqual(len(IMAGE_DATA), stats.downloaded)
+        self.assertEqual(0, stats.resumed)
+
+    def test_download_retries_failed_segment(self):
+        session = FakeSession(fail_ranges=[3000])
+        self.download(session)
+        self.assert_downloaded()
+        # the segment is resumed from the first byte not written
+        self.assertIn((3100, 3999), session.ranges)
+
+    def test_download_resumes_partial_file(self):
+        session = FakeSession(fail_ranges=[2000, 5000])
+        self.assertRaises(glance.ImageDownloadError, self.download, session,
+                          retry_count=1)
+        with open(self.path + '.progress') as stream:
+            self.assertEqual(9, len(json.load(stream)['done']))
+
+        session = FakeSession()
+        stats = self.download(session)
+        self.assert_downloaded()
+        self.assertEqual([(2000, 2999), (5000, 5999)], sorted(session.ranges))
+        self.assertEqual(2000, stats.downloaded)
+        self.assertEqual(len(IMAGE_DATA) - 2000, stats.resumed)
+
+    def test_download_without_ranges(self):
+        session = FakeSession(accept_ranges=False)
+        stats = self.download(session)
+        self.assert_downloaded()
+        self.assertEqual([], session.ranges)
+        self.assertEqual(len(IMAGE_DATA), stats.downloaded)
+
+    def test_download_with_checksum(self):
+        checksum = 'sha256:' + hashlib.sha256(IMAGE_DATA).hexdigest()
+        self.download(FakeSession(), checksum=checksum)
+        self.assert_downloaded()
+
+    def test_download_with_checksum_mismatch(self):
+        checksum = 'sha256:' + hashlib.sha256(b'other data').hexdigest()
+        ex = self.assertRaises(glance.ImageDownloadError, self.download,
+                               FakeSession(), checksum=checksum)
+        self.assertIn('checksum mismatch', str(ex))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_download_local_file(self):
+        source = os.path.join(self.create_tempdir(), 'source.img')
+        with open(source, 'wb') as stream:
+            stream.write(IMAGE_DATA)
+        stats = glance.download_image_file(url='file://' + source,
+                                           path=self.path)
+        self.assert_downloaded()
+        self.assertEqual(len(IMAGE_DATA), stats.downloaded)
+
+    def test_copy_file_without_sendfile(self):
+        source = os.path.join(self.create_tempdir(), 'source.img')
+        with open(source, 'wb') as stream:
+            stream.write(IMAGE_DATA)
+        self.patch(_download.os, 'sendfile', side_effect=OSError)
+        self.assertEqual(len(IMAGE_DATA),
+                         _download.copy_file(source, self.path))
+        self.assert_downloaded()
@@ -0,0 +1,270 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import gzip
+import hashlib
+import os
+import typing
+from unittest import mock
+
+from glanceclient.v2 import client as glanceclient
+
+from tobiko import config
+from tobiko.openstack import glance
+from tobiko.tests.unit import openstack
+
+
+CONF = config.CONF
+
+
+class MockClient(mock.NonCallableMagicMock):
+    pass
+
+
+class MyImageFixture(glance.UrlGlanceImageFixture):
+    disk_format = 'qcow2'
+
+
+class UrlGlanceImageFixtureTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(UrlGlanceImageFixtureTest, self).setUp()
+        self.patch(glanceclient, 'Client', MockClient)
+        image_dir = self.create_tempdir()
+        image_file = os.path.join(image_dir, 'my-image.qcow2')
+        with open(image_file, 'wb') as stream:
+            stream.write(b'image data')
+        self.patch(CONF.tobiko.glance, 'reuse_images_with_same_data', True)
+        self.client = MockClient()
+        self.client.http_client.session.get_project_id.return_value = (
+            'project-id')
+        self.fixture = MyImageFixture(image_url=f'file://{image_file}',
+                                      image_dir=image_dir)
+        self.fixture.glance_client = self.client
+
+    def list_images(self, images):
+
+        def _list_images(limit=None, filters=None):
+            if 'os_hash_value' in filters:
+                return [image
+                        for image in images
+                        if image.os_hash_value == filters['os_hash_value']]
+            return []
+
+        self.client.images.list.side_effect = _list_images
+
+    def test_setup_with_same_data_image(self):
+        image = mock.Mock(id='other-id', status='active',
+                          disk_format='qcow2', container_format='bare',
+                          os_hash_algo='sha512', owner='project-id',
+                          tags=[],
+                          os_hash_value=hashlib.sha512(
+                              b'image data').hexdigest())
+        image.name = 'other-image'
+        self.list_images([image])
+        self.client.images.get.return_value = image
+
+        self.fixture.setUp()
+
+        self.assertEqual('other-id', self.fixture.image_id)
+        self.assertEqual('other-id', self.fixture.reused_image_id)
+        self.client.images.create.assert_not_called()
+        self.client.images.upload.assert_not_called()
+
+        # the image is not deleted because it has not been created by
+        # the fixture
+        self.fixture.cleanUp()
+        self.client.images.delete.assert_not_called()
+
+    def test_find_image_with_same_data_when_formats_differ(self):
+        image = mock.Mock(id='other-id', status='active',
+                          disk_format='raw', container_format='bare',
+                          os_hash_algo='sha512', owner='project-id',
+                          tags=[],
+                          os_hash_value=hashlib.sha512(
+                              b'image data').hexdigest())
+        self.list_images([image])
+        self.assertIsNone(self.fixture.find_image_with_same_data())
+
+    def test_find_image_with_same_data_when_tags_differ(self):
+        image = mock.Mock(id='other-id', status='active',
+                          disk_format='qcow2', container_format='bare',
+                          os_hash_algo='sha512', owner='project-id',
+                          tags=['evacuable'],
+                          os_hash_value=hashlib.sha512(
+                              b'image data').hexdigest())
+        self.list_images([image])
+        self.assertIsNone(self.fixture.find_image_with_same_data())
+
+    def test_find_image_with_same_data_of_other_project(self):
+        image = mock.Mock(id='other-id', status='active',
+                          disk_format='qcow2', container_format='bare',
+                          os_hash_algo='sha512', owner='other-project-id',
+                          tags=[],
+                          os_hash_value=hashlib.sha512(
+                              b'image data').hexdigest())
+        self.list_images([image])
+        self.assertIsNone(self.fixture.find_image_with_same_data())
+
+    def test_find_image_with_same_data_when_disabled(self):
+        self.patch(CONF.tobiko.glance, 'reuse_images_with_same_data', False)
+        self.assertIsNone(self.fixture.find_image_with_same_data())
+        self.client.images.list.assert_not_called()
+
+    def create_gzip_file(self) -> str:
+        image_file = os.path.join(self.create_tempdir(), 'my-image.qcow2.gz')
+        with gzip.open(image_file, 'wb') as stream:
+            stream.write(b'image data')
+        return image_file
+
+    def test_get_image_from_compressed_file(self):
+        image_file = self.create_gzip_file()
+        image_data, image_size = self.fixture.get_image_from_file(image_file)
+        with image_data:
+            self.assertIsInstance(image_data, glance.DecompressionPipeline)
+            self.assertEqual(b'image data', image_data.read())
+        self.assertEqual(len(b'image data'), image_size)
+
+    def test_get_image_from_compressed_file_with_cache(self):
+        self.patch(CONF.tobiko.glance, 'cache_decompressed_images', True)
+        image_file = self.create_gzip_file()
+        image_data, image_size = self.fixture.get_image_from_file(image_file)
+        with image_data:
+            self.assertTrue(image_data.name.startswith(
+                self.fixture.image_cache.decompressed_dir))
+            self.assertEqual(b'image data', image_data.read())
+        self.assertEqual(len(b'image data'), image_size)
+
+
+class ImportGlanceImageFixtureTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(ImportGlanceImageFixtureTest, self).setUp()
+        self.patch(glanceclient, 'Client', MockClient)
+        self.image_dir = self.create_tempdir()
+        self.client = MockClient()
+        self.images: typing.Dict[str, mock.Mock] = {}
+        self.staged: typing.Dict[str, bytes] = {}
+        self.import_methods = ['glance-direct', 'web-download',
+                               'copy-image']
+        self.client.images.create.side_effect = self.create_image
+        self.client.images.list.side_effect = self.list_images
+        self.client.images.get.side_effect = (
+            lambda image_id: self.images[image_id])
+        self.client.images.stage.side_effect = self.stage_image
+        self.client.images.image_import.side_effect = self.import_image
+        self.client.images.get_import_info.side_effect = (
+            lambda: {'import-methods': {'value': self.import_methods}})
+
+    def create_fixture(self, image_url: str, **kwargs) -> MyImageFixture:
+        fixture = MyImageFixture(image_url=image_url,
+                                 image_dir=self.image_dir,
+                                 **kwargs)
+        fixture.glance_client = self.client
+        fixture.wait_interval = .01
+        return fixture
+
+    def create_image_file(self) -> str:
+        image_file = os.path.join(self.image_dir, 'my-image.qcow2')
+        with open(image_file, 'wb') as stream:
+            stream.write(b'image data')
+        return f'file://{image_file}'
+
+    def create_image(self, name, status='queued', stores='', **params):
+        image = mock.Mock(id=f'{name}-id', status=status, stores=stores,
+                          os_glance_failed_import='',
+                          os_glance_importing_to_stores='', **params)
+        image.name = name
+        self.images[image.id] = image
+        return {'id': image.id}
+
+    def list_images(self, limit=None, filters=None):
+        return [image
+                for image in self.images.values()
+                if image.name == filters.get('name')]
+
+    def stage_image(self, image_id, image_data, image_size=None):
+        self.staged[image_id] = image_data.read()
+
+    def import_image(self, image_id, method, stores=None, **params):
+        image = self.images[image_id]
+        image.status = 'active'
+        image.stores = ','.join(stores or ['default'])
+
+    def test_setup_with_web_download(self):
+        fixture = self.create_fixture(
+            image_url='http://example.com/images/my-image.qcow2',
+            image_import_method='web-download')
+        fixture.setUp()
+        self.assertEqual('active', fixture.image.status)
+        self.client.images.image_import.assert_called_once_with(
+            image_id=fixture.image_id, method='web-download',
+            uri='http://example.com/images/my-image.qcow2')
+        self.client.images.stage.assert_not_called()
+        self.client.images.upload.assert_not_called()
+
+    def test_setup_with_glance_direct(self):
+        # Glance can't download a local file by itself
+        fixture = self.create_fixture(image_url=self.create_image_file(),
+                                      image_import_method='web-download',
+                                      image_import_stores=['store1'])
+        fixture.setUp()
+        self.assertEqual('active', fixture.image.status)
+        self.assertEqual({fixture.image_id: b'image data'}, self.staged)
+        self.client.images.image_import.assert_called_once_with(
+            image_id=fixture.image_id, method='glance-direct',
+            stores=['store1'], allow_failure=False)
+        self.client.images.upload.assert_not_called()
+
+    def test_setup_when_import_method_is_disabled(self):
+        self.import_methods = ['glance-direct']
+        fixture = self.create_fixture(
+            image_url='http://example.com/images/my-image.qcow2',
+            image_import_method='web-download')
+        self.assertEqual('glance-direct', fixture.get_image_import_method())
+        self.import_methods = []
+        self.assertIsNone(fixture.get_image_import_method())
+
+    def test_import_image_when_it_fails(self):
+        fixture = self.create_fixture(image_url=self.create_image_file(),
+                                      image_import_method='glance-direct')
+        self.create_image(fixture.image_name)
+
+        def fail_import(image_id, **params):
+            self.images[image_id].os_glance_failed_import = 'default'
+
+        self.client.images.image_import.side_effect = fail_import
+        fixture.get_image()
+        self.assertRaises(glance.GlanceImageImportFailed,
+                          fixture.upload_image)
+
+    def test_copy_image_to_stores(self):
+        fixture = self.create_fixture(image_url=self.create_image_file(),
+                                      image_import_stores=['store1',
+                                                           'store2'])
+        self.create_image(fixture.image_name, status='active',
+                          stores='store1')
+
+        def copy_image(**params):
+            self.images[params['image_id']].stores = 'store1,store2'
+
+        self.client.images.image_import.side_effect = copy_image
+        image = fixture.copy_image_to_stores(fixture.get_image())
+        self.assertEqual(['store1', 'store2'], glance.get_image_stores(image))
+        self.client.images.image_import.assert_called_once_with(
+            image_id=image.id, method='copy-image', stores=['store2'],
+            allow_failure=False)
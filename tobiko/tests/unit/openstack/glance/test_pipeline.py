@@ -0,0 +1,95 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import bz2
+import gzip
+import lzma
+import os
+import typing
+
+from tobiko.openstack import glance
+from tobiko.tests import unit
+
+
+IMAGE_DATA = bytes(range(256)) * 1000
+
+COMPRESSORS: typing.Dict[str, typing.Callable[[bytes], bytes]] = {
+    'bz2': bz2.compress,
+    'gz': gzip.compress,
+    'xz': lzma.compress}
+
+
+class DecompressionPipelineTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(DecompressionPipelineTest, self).setUp()
+        self.temp_dir = self.create_tempdir()
+
+    def create_image_file(self, compression_type: str = None,
+                          data: bytes = IMAGE_DATA) -> str:
+        path = os.path.join(self.temp_dir,
+                            f'my-image.{compression_type or "raw"}')
+        if compression_type:
+            data = COMPRESSORS[compression_type](data)
+        with open(path, 'wb') as stream:
+            stream.write(data)
+        return path
+
+    def read_all(self, pipeline: glance.DecompressionPipeline,
+                 chunk_size: int = 1000) -> bytes:
+        chunks = []
+        with pipeline:
+            while True:
+                chunk = pipeline.read(chunk_size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return b''.join(chunks)
+
+    def test_read(self):
+        for compression_type in [None] + sorted(COMPRESSORS):
+            image_file = self.create_image_file(compression_type)
+            pipeline = glance.open_image_pipeline(
+                filename=image_file, buffer_size=4096, queue_size=2)
+            self.assertEqual(IMAGE_DATA, self.read_all(pipeline),
+                             compression_type)
+            self.assertEqual(len(IMAGE_DATA), pipeline.stats.size)
+
+    def test_read_all(self):
+        image_file = self.create_image_file('gz')
+        with glance.open_image_pipeline(filename=image_file,
+                                        buffer_size=4096) as pipeline:
+            self.assertEqual(IMAGE_DATA, pipeline.read())
+
+    def test_read_corrupted_file(self):
+        image_file = self.create_image_file('gz')
+        with open(image_file, 'r+b') as stream:
+            stream.truncate(os.path.getsize(image_file) // 2)
+        pipeline = glance.open_image_pipeline(filename=image_file,
+                                              compression_type='gz',
+                                              buffer_size=4096)
+        self.assertRaises(EOFError, self.read_all, pipeline)
+
+    def test_close_before_end(self):
+        image_file = self.create_image_file('xz')
+        pipeline = glance.open_image_pipeline(filename=image_file,
+                                              buffer_size=1024,
+                                              queue_size=1)
+        self.assertEqual(IMAGE_DATA[:100], pipeline.read(100))
+        pipeline.close()
+        self.assertTrue(pipeline.closed)
+        self.assertFalse(pipeline._thread.is_alive())
@@ -0,0 +1,184 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import typing
+from unittest import mock
+
+from heatclient.v1 import client as heatclient
+from heatclient import exc
+
+import tobiko
+from tobiko.openstack import heat
+from tobiko.openstack.heat import _stack
+from tobiko.tests.unit import openstack
+
+
+class FakeStacksManager:
+    """Deletes stacks after they have been got twice"""
+
+    def __init__(self, names: typing.Iterable[str], failing=()):
+        self.status = {name: heat.CREATE_COMPLETE for name in names}
+        self.failing = set(failing)
+        self.checks: typing.Dict[str, int] = {}
+        self.deleted: typing.List[str] = []
+        self.list_calls = 0
+
+    def delete(self, name):
+        # stacks requiring this one must have been already deleted
+        self.deleted.append(name)
+        self.status[name] = heat.DELETE_IN_PROGRESS
+        self.checks[name] = 0
+
+    def _get(self, name):
+        status = self.status.get(name)
+        if status == heat.DELETE_IN_PROGRESS:
+            self.checks[name] += 1
+            if self.checks[name] > 1:
+                if name in self.failing:
+                    self.status[name] = status = heat.DELETE_FAILED
+                else:
+                    del self.status[name]
+                    return None
+        if status is None:
+            return None
+        return mock.MagicMock(stack_name=name, id=f'{name}-id',
+                              stack_status=status,
+                              stack_status_reason='')
+
+    def get(self, name, resolve_outputs=False):
+        stack = self._get(name)
+        if stack is None:
+            raise exc.HTTPNotFound
+        return stack
+
+    def list(self, filters):
+        self.list_calls += 1
+        stacks = [self._get(name) for name in filters['name']]
+        return [stack for stack in stacks if stack is not None]
+
+
+class MockClient(mock.NonCallableMagicMock):
+    pass
+
+
+class CleanupStack(heat.HeatStackFixture):
+
+    in_use = 0
+
+    def count_stack_users(self) -> int:
+        return self.in_use or super().count_stack_users()
+
+    def cleanup_fixture(self):
+        pass
+
+
+class NetworkStack(CleanupStack):
+    pass
+
+
+class ServerStack(CleanupStack):
+    network = tobiko.required_fixture(NetworkStack, setup=False)
+
+
+class PeerServerStack(CleanupStack):
+    server = tobiko.required_fixture(ServerStack, setup=False)
+
+
+class OtherNetworkStack(CleanupStack):
+    pass
+
+
+class ServersTest:
+    stack = tobiko.required_fixture(PeerServerStack)
+    other_stack = tobiko.required_fixture(OtherNetworkStack)
+
+
+def fixture_name(cls) -> str:
+    return tobiko.get_fixture_name(cls)
+
+
+class CleanupStacksTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(CleanupStacksTest, self).setUp()
+        self.patch(heatclient, 'Client', MockClient)
+        for cls in [NetworkStack, ServerStack, PeerServerStack,
+                    OtherNetworkStack]:
+            self.addCleanup(tobiko.remove_fixture, cls)
+
+    def setup_stacks(self, failing=()) -> FakeStacksManager:
+        names = [fixture_name(cls)
+                 for cls in [NetworkStack, ServerStack, PeerServerStack,
+                             OtherNetworkStack]]
+        client = MockClient()
+        client.stacks = FakeStacksManager(names, failing=failing)
+        self.patch(CleanupStack, 'client', client)
+        return client.stacks
+
+    def test_cleanup_stacks(self):
+        stacks = self.setup_stacks()
+        deleted = heat.cleanup_stacks([ServersTest], interval=.01)
+        self.assertEqual({fixture_name(NetworkStack),
+                          fixture_name(OtherNetworkStack),
+                          fixture_name(ServerStack),
+                          fixture_name(PeerServerStack)}, set(deleted))
+        self.assertEqual({}, stacks.status)
+        # stacks are deleted after the ones requiring them
+        self.assertEqual([fixture_name(OtherNetworkStack),
+                          fixture_name(PeerServerStack)],
+                         sorted(stacks.deleted[:2]))
+        self.assertEqual([fixture_name(ServerStack),
+                          fixture_name(NetworkStack)],
+                         stacks.deleted[2:])
+
+    def test_cleanup_stacks_when_in_use(self):
+        stacks = self.setup_stacks()
+        self.patch(ServerStack, 'in_use', 1)
+        deleted = heat.cleanup_stacks([ServersTest], interval=.01)
+        self.assertEqual({fixture_name(OtherNetworkStack),
+                          fixture_name(PeerServerStack)}, set(deleted))
+        self.assertEqual({fixture_name(NetworkStack),
+                          fixture_name(ServerStack)}, set(stacks.status))
+
+    def test_cleanup_stacks_when_used_by_test(self):
+        stacks = self.setup_stacks()
+        stack_name = tobiko.get_fixture(ServerStack).setup_stack_name()
+        tobiko.addme_to_shared_resource(_stack.__name__, stack_name)
+        self.addCleanup(tobiko.removeme_from_shared_resource,
+                        _stack.__name__, stack_name)
+        deleted = heat.cleanup_stacks([ServersTest], interval=.01)
+        self.assertEqual({fixture_name(OtherNetworkStack),
+                          fixture_name(PeerServerStack)}, set(deleted))
+        self.assertEqual({fixture_name(NetworkStack),
+                          fixture_name(ServerStack)}, set(stacks.status))
+        # shelves are only read by the cleanup
+        self.assertEqual({self.id()},
+                         tobiko.get_shared_resource_users(_stack.__name__,
+                                                          stack_name))
+
+    def test_cleanup_stacks_when_failing(self):
+        stacks = self.setup_stacks(failing=[fixture_name(ServerStack)])
+        ex = self.assertRaises(heat.CleanupStacksError,
+                               heat.cleanup_stacks, [ServersTest],
+                               interval=.01)
+        self.assertEqual(1, ex.failed)
+        self.assertEqual(4, ex.total)
+        self.assertEqual([fixture_name(ServerStack)], list(ex.errors))
+        self.assertEqual(heat.DELETE_FAILED,
+                         stacks.status[fixture_name(ServerStack)])
+        self.assertIn(fixture_name(NetworkStack), stacks.status)
+        self.assertNotIn(fixture_name(NetworkStack), stacks.deleted)
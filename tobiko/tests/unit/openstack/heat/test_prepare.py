@@ -0,0 +1,188 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import threading
+import typing
+from unittest import mock
+
+from heatclient.v1 import client as heatclient
+
+import tobiko
+from tobiko.openstack import heat
+from tobiko.tests.unit import openstack
+
+
+SETUP_ORDER: typing.List[str] = []
+SETUP_LOCK = threading.Lock()
+
+
+class RecordingStack(heat.HeatStackFixture):
+
+    template = heat.heat_template({'template': 'recording'})
+    failing = False
+
+    def setup_fixture(self):
+        # it sets up required fixtures as stacks do with their outputs
+        for name in dir(type(self)):
+            if isinstance(getattr(type(self), name), tobiko.RequiredFixture):
+                getattr(self, name)
+        with SETUP_LOCK:
+            SETUP_ORDER.append(type(self).__name__)
+        if self.failing:
+            raise RuntimeError('stack creation failed')
+
+    def cleanup_fixture(self):
+        pass
+
+
+class NetworkStack(RecordingStack):
+    pass
+
+
+class ImageFixture(tobiko.SharedFixture):
+    pass
+
+
+class ServerStack(RecordingStack):
+    network = tobiko.required_fixture(NetworkStack)
+    image = tobiko.required_fixture(ImageFixture)
+
+
+class PeerServerStack(RecordingStack):
+    server = tobiko.required_fixture(ServerStack)
+
+
+class OtherNetworkStack(RecordingStack):
+    pass
+
+
+class FailingNetworkStack(RecordingStack):
+    failing = True
+
+
+class FailingServerStack(RecordingStack):
+    network = tobiko.required_fixture(FailingNetworkStack)
+
+
+class PeerServerTest:
+    stack = tobiko.required_fixture(PeerServerStack)
+    other_stack = tobiko.required_fixture(OtherNetworkStack)
+
+
+class FailingServerTest:
+    stack = tobiko.required_fixture(FailingServerStack)
+    other_stack = tobiko.required_fixture(OtherNetworkStack)
+
+
+def fixture_name(cls) -> str:
+    return tobiko.get_fixture_name(cls)
+
+
+class MockClient(mock.NonCallableMagicMock):
+    pass
+
+
+def mock_stack(cls, status, tags=None):
+    return mock.MagicMock(stack_name=fixture_name(cls),
+                          id=f'{cls.__name__}-id',
+                          stack_status=status,
+                          stack_status_reason='',
+                          tags=tags)
+
+
+class PrepareStacksTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(PrepareStacksTest, self).setUp()
+        SETUP_ORDER.clear()
+        for cls in [NetworkStack, ImageFixture, ServerStack,
+                    PeerServerStack, OtherNetworkStack,
+                    FailingNetworkStack, FailingServerStack]:
+            self.addCleanup(tobiko.remove_fixture, cls)
+
+    def test_get_stacks_dependencies(self):
+        result = heat.get_stacks_dependencies([PeerServerTest])
+        self.assertEqual(
+            {fixture_name(NetworkStack): set(),
+             fixture_name(OtherNetworkStack): set(),
+             fixture_name(ServerStack): {fixture_name(NetworkStack)},
+             fixture_name(PeerServerStack): {fixture_name(NetworkStack),
+                                             fixture_name(ServerStack)}},
+            result)
+
+    def test_prepare_stacks(self):
+        result = heat.prepare_stacks([PeerServerTest], max_workers=2)
+        self.assertEqual({fixture_name(NetworkStack),
+                          fixture_name(OtherNetworkStack),
+                          fixture_name(ServerStack),
+                          fixture_name(PeerServerStack)}, set(result))
+        self.assertEqual(4, len(SETUP_ORDER))
+        self.assertLess(SETUP_ORDER.index('NetworkStack'),
+                        SETUP_ORDER.index('ServerStack'))
+        self.assertLess(SETUP_ORDER.index('ServerStack'),
+                        SETUP_ORDER.index('PeerServerStack'))
+
+    def test_prepare_stacks_with_failure(self):
+        ex = self.assertRaises(heat.PrepareStacksError,
+                               heat.prepare_stacks, [FailingServerTest])
+        self.assertEqual(2, ex.failed)
+        self.assertEqual(3, ex.total)
+        self.assertIsInstance(ex.errors[fixture_name(FailingNetworkStack)],
+                              Exception)
+        self.assertIsInstance(ex.errors[fixture_name(FailingServerStack)],
+                              heat.RequiredStacksNotPrepared)
+        self.assertEqual(['FailingNetworkStack', 'OtherNetworkStack'],
+                         sorted(SETUP_ORDER))
+
+    def test_prepare_stacks_when_prevent_create(self):
+        self.patch(heatclient, 'Client', MockClient)
+        client = MockClient()
+        self.patch(RecordingStack, 'client', client)
+        fingerprint = tobiko.get_fixture(NetworkStack).get_stack_fingerprint()
+        client.stacks.list.return_value = [
+            mock_stack(NetworkStack, heat.CREATE_COMPLETE,
+                       tags=[heat.FINGERPRINT_TAG_PREFIX + fingerprint]),
+            mock_stack(OtherNetworkStack, heat.UPDATE_COMPLETE),
+            mock_stack(ServerStack, heat.CREATE_COMPLETE,
+                       tags=[heat.FINGERPRINT_TAG_PREFIX + 'outdated'])]
+        with mock.patch.dict('os.environ', {'TOBIKO_PREVENT_CREATE': 'True'}):
+            ex = self.assertRaises(heat.InvalidStacksError,
+                                   heat.prepare_stacks, [PeerServerTest])
+        self.assertEqual(2, ex.failed)
+        self.assertEqual(4, ex.total)
+        self.assertIsInstance(ex.errors[fixture_name(ServerStack)],
+                              heat.OutdatedStackError)
+        self.assertIsInstance(ex.errors[fixture_name(PeerServerStack)],
+                              heat.HeatStackNotFound)
+        # stacks status is got with a single request
+        client.stacks.list.assert_called_once()
+        self.assertEqual(
+            {fixture_name(NetworkStack), fixture_name(OtherNetworkStack),
+             fixture_name(ServerStack), fixture_name(PeerServerStack)},
+            set(client.stacks.list.call_args.kwargs['filters']['name']))
+        self.assertEqual([], SETUP_ORDER)
+
+    def test_validate_stacks_when_failed(self):
+        self.patch(heatclient, 'Client', MockClient)
+        client = MockClient()
+        self.patch(RecordingStack, 'client', client)
+        client.stacks.list.return_value = [
+            mock_stack(NetworkStack, heat.UPDATE_FAILED)]
+        ex = self.assertRaises(heat.InvalidStacksError,
+                               heat.validate_stacks, [NetworkStack])
+        self.assertIsInstance(ex.errors[fixture_name(NetworkStack)],
+                              heat.HeatStackUpdateFailed)
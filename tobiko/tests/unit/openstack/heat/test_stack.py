@@ -116,7 +116,7 @@ class HeatStackFixtureTest(openstack.OpenstackTest):
     def test_setup(self, fixture_class=MyStack, template=None,
                    stack_name=None, parameters=None, wait_interval=None,
                    stacks=None, create_conflict=False, call_create=True,
-                   call_delete=False, call_sleep=False):
+                   call_delete=False, call_sleep=False, call_update=False):
         client = MockClient()
         stacks = stacks or [
             exc.HTTPNotFound,
@@ -152,13 +152,24 @@ class HeatStackFixtureTest(openstack.OpenstackTest):
                        fixture_class.parameters.values) or
                       {})
         self.assertEqual(parameters, stack.parameters.values)
+        fingerprint_tag = (heat.FINGERPRINT_TAG_PREFIX +
+                           stack.get_stack_fingerprint())
         if call_create:
             client.stacks.create.assert_called_once_with(
                 parameters=parameters, stack_name=stack.stack_name,
-                template=tobiko.dump_yaml(stack.template.template))
+                template=tobiko.dump_yaml(stack.template.template),
+                tags=fingerprint_tag)
         else:
             client.stacks.create.assert_not_called()
 
+        if call_update:
+            client.stacks.update.assert_called_once_with(
+                '<stack-id>', existing=True, parameters=parameters,
+                template=tobiko.dump_yaml(stack.template.template),
+                tags=f'some-tag,{fingerprint_tag}')
+        else:
+            client.stacks.update.assert_not_called()
+
         if call_sleep:
             sleep.assert_called()
 
@@ -217,6 +228,32 @@ class HeatStackFixtureTest(openstack.OpenstackTest):
         self.test_setup(stacks=[mock_stack('CREATE_COMPLETE')],
                         call_create=False)
 
+    def test_setup_when_create_complete_up_to_date(self):
+        stack = MyStack(client=MockClient())
+        fingerprint = stack.get_stack_fingerprint(parameters={})
+        tags = [heat.FINGERPRINT_TAG_PREFIX + fingerprint]
+        self.test_setup(stacks=[mock_stack('CREATE_COMPLETE', tags=tags)],
+                        call_create=False)
+
+    def test_setup_when_create_complete_outdated(self):
+        tags = ['some-tag', heat.FINGERPRINT_TAG_PREFIX + 'outdated']
+        self.test_setup(stacks=[mock_stack('CREATE_COMPLETE', tags=tags),
+                                mock_stack('UPDATE_COMPLETE')],
+                        call_create=False, call_update=True)
+
+    def test_setup_when_update_in_progress_outdated(self):
+        tags = ['some-tag', heat.FINGERPRINT_TAG_PREFIX + 'outdated']
+        self.test_setup(stacks=[mock_stack('UPDATE_IN_PROGRESS', tags=tags),
+                                mock_stack('UPDATE_COMPLETE', tags=tags),
+                                mock_stack('UPDATE_COMPLETE')],
+                        call_create=False, call_update=True, call_sleep=True)
+
+    def test_setup_when_update_failed(self):
+        self.test_setup(stacks=[mock_stack('UPDATE_FAILED'),
+                                None,
+                                mock_stack('CREATE_IN_PROGRESS')],
+                        call_delete=True)
+
     def test_setup_when_create_failed(self):
         self.test_setup(stacks=[mock_stack('CREATE_FAILED'),
                                 mock_stack('DELETE_IN_PROGRESS'),
@@ -308,7 +345,8 @@ class HeatStackFixtureTest(openstack.OpenstackTest):
             self.fail(message)
 
 
-def mock_stack(status, stack_id='<stack-id>', outputs=None):
+def mock_stack(status, stack_id='<stack-id>', outputs=None, tags=None):
     return mock.MagicMock(stack_status=status,
                           id=stack_id,
-                          outputs=outputs or [])
+                          outputs=outputs or [],
+                          tags=tags)
@@ -19,6 +19,7 @@ from heatclient.common import template_utils
 
 import tobiko
 from tobiko.openstack import heat
+from tobiko.openstack.heat import _template
 from tobiko.tests.unit import openstack
 
 
@@ -45,3 +46,91 @@ class HeatTemplateFileTest(openstack.OpenstackTest):
         self.assertEqual(template_files, template.template_files)
         template_yaml = tobiko.dump_yaml(template_dict)
         self.assertEqual(template_yaml, template.template_yaml)
+
+
+NESTED_TEMPLATE = """
+heat_template_version: 2015-04-30
+resources:
+  nested:
+    type: nested.yaml
+"""
+
+
+class HeatTemplateCacheTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(HeatTemplateCacheTest, self).setUp()
+        self.template_dir = self.create_tempdir()
+        self.cache_dir = os.path.join(self.create_tempdir(), 'templates')
+        self.template_file = self.write_file('my-stack.yaml',
+                                             NESTED_TEMPLATE)
+        self.nested_file = self.write_file(
+            'nested.yaml', 'heat_template_version: 2015-04-30\n')
+        self.compile_template_file = self.patch(
+            _template, 'compile_template_file',
+            side_effect=_template.compile_template_file)
+
+    def write_file(self, name: str, content: str, mtime: int = None) -> str:
+        path = os.path.join(self.template_dir, name)
+        with open(path, 'w') as stream:
+            stream.write(content)
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+        return path
+
+    def test_get_template_contents(self):
+        cache = _template.HeatTemplateCache(cache_dir=self.cache_dir)
+        template_files, template = cache.get_template_contents(
+            self.template_file)
+        self.assertEqual(
+            template_utils.get_template_contents(
+                template_file=self.template_file),
+            (template_files, template))
+
+        # changing returned values must not change cached ones
+        expected = template_utils.get_template_contents(
+            template_file=self.template_file)
+        template['resources'].clear()
+        self.assertEqual(expected,
+                         cache.get_template_contents(self.template_file))
+        self.compile_template_file.assert_called_once_with(self.template_file)
+
+    def test_get_template_contents_from_disk(self):
+        expected = _template.HeatTemplateCache(
+            cache_dir=self.cache_dir).get_template_contents(
+            self.template_file)
+        self.compile_template_file.reset_mock()
+        cache = _template.HeatTemplateCache(cache_dir=self.cache_dir)
+        self.assertEqual(expected,
+                         cache.get_template_contents(self.template_file))
+        self.compile_template_file.assert_not_called()
+
+    def test_get_template_contents_without_cache_dir(self):
+        _template.HeatTemplateCache().get_template_contents(
+            self.template_file)
+        _template.HeatTemplateCache().get_template_contents(
+            self.template_file)
+        self.assertEqual(2, self.compile_template_file.call_count)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_get_template_contents_when_changed(self):
+        cache = _template.HeatTemplateCache(cache_dir=self.cache_dir)
+        cache.get_template_contents(self.template_file)
+        self.write_file('my-stack.yaml',
+                        NESTED_TEMPLATE + 'description: changed\n')
+        _, template = cache.get_template_contents(self.template_file)
+        self.assertEqual('changed', template['description'])
+        self.assertEqual(2, self.compile_template_file.call_count)
+
+    def test_get_template_contents_when_nested_changed(self):
+        cache = _template.HeatTemplateCache(cache_dir=self.cache_dir)
+        cache.get_template_contents(self.template_file)
+        mtime = os.stat(self.nested_file).st_mtime_ns + 1000000000
+        self.write_file('nested.yaml',
+                        'heat_template_version: 2016-10-14\n',
+                        mtime=mtime)
+        template_files, _ = _template.HeatTemplateCache(
+            cache_dir=self.cache_dir).get_template_contents(
+            self.template_file)
+        self.assertIn('2016-10-14', list(template_files.values())[0])
+        self.assertEqual(2, self.compile_template_file.call_count)
@@ -0,0 +1,135 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from unittest import mock
+
+from heatclient.v1 import client as heatclient
+from heatclient import exc
+
+import tobiko
+from tobiko.openstack import heat
+from tobiko.openstack.heat import _stack
+from tobiko.tests.unit import openstack
+
+
+def mock_stack(name, status, stack_id=None):
+    return mock.MagicMock(stack_name=name,
+                          stack_status=status,
+                          stack_status_reason=f'{name} is {status}',
+                          id=stack_id or f'{name}-id')
+
+
+def mock_event(resource_name, reason):
+    return mock.MagicMock(resource_name=resource_name,
+                          resource_status_reason=reason)
+
+
+class MockClient(mock.NonCallableMagicMock):
+    pass
+
+
+class HeatStackStatusWatcherTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(HeatStackStatusWatcherTest, self).setUp()
+        self.patch(heatclient, 'Client', MockClient)
+        self.now = 1000.
+        self.patch(tobiko, 'time', lambda: self.now)
+        self.client = MockClient()
+
+    def test_get_stack(self):
+        self.client.stacks.list.return_value = [
+            mock_stack('stack-1', heat.CREATE_IN_PROGRESS),
+            mock_stack('stack-2', heat.CREATE_COMPLETE)]
+        watcher = heat.HeatStackStatusWatcher(self.client)
+        with watcher.watch('stack-1'), watcher.watch('stack-2'):
+            stack_1 = watcher.get_stack('stack-1', max_age=3.)
+            stack_2 = watcher.get_stack('stack-2', max_age=3.)
+        self.assertEqual(heat.CREATE_IN_PROGRESS, stack_1.stack_status)
+        self.assertEqual(heat.CREATE_COMPLETE, stack_2.stack_status)
+        self.client.stacks.list.assert_called_once_with(
+            filters={'name': ['stack-1', 'stack-2']})
+        self.client.stacks.get.assert_not_called()
+
+    def test_get_stack_when_expired(self):
+        self.client.stacks.list.side_effect = [
+            [mock_stack('stack-1', heat.CREATE_IN_PROGRESS)],
+            [mock_stack('stack-1', heat.CREATE_COMPLETE)]]
+        watcher = heat.HeatStackStatusWatcher(self.client)
+        with watcher.watch('stack-1'):
+            stack = watcher.get_stack('stack-1', max_age=3.)
+            self.assertEqual(heat.CREATE_IN_PROGRESS, stack.stack_status)
+            self.now += 1.
+            stack = watcher.get_stack('stack-1', max_age=3.)
+            self.assertEqual(heat.CREATE_IN_PROGRESS, stack.stack_status)
+            self.now += 3.
+            stack = watcher.get_stack('stack-1', max_age=3.)
+            self.assertEqual(heat.CREATE_COMPLETE, stack.stack_status)
+        self.assertEqual(2, self.client.stacks.list.call_count)
+
+    def test_get_stack_when_not_listed(self):
+        self.client.stacks.list.return_value = []
+        self.client.stacks.get.side_effect = [
+            mock_stack('stack-1', heat.DELETE_COMPLETE),
+            exc.HTTPNotFound]
+        watcher = heat.HeatStackStatusWatcher(self.client)
+        with watcher.watch('stack-1'):
+            stack = watcher.get_stack('stack-1', max_age=3.)
+            self.assertEqual(heat.DELETE_COMPLETE, stack.stack_status)
+            self.assertIsNone(watcher.get_stack('stack-1', max_age=3.))
+        self.client.stacks.get.assert_called_with('stack-1',
+                                                  resolve_outputs=False)
+        self.assertEqual({}, watcher.watched)
+
+    def test_heat_stack_status_watcher(self):
+        watcher = heat.heat_stack_status_watcher(self.client)
+        self.assertIs(watcher, heat.heat_stack_status_watcher(self.client))
+        self.assertIsNot(watcher,
+                         heat.heat_stack_status_watcher(MockClient()))
+
+
+class GetStackFailuresTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(GetStackFailuresTest, self).setUp()
+        self.patch(heatclient, 'Client', MockClient)
+        self.client = MockClient()
+        self.client.events.list.return_value = [
+            mock_event('my-stack', 'Resource CREATE failed'),
+            mock_event('port', 'Quota exceeded for resources: [port]')]
+
+    def test_get_stack_failures(self):
+        stack = mock_stack('my-stack', heat.CREATE_FAILED)
+        failures = heat.get_stack_failures(stack, client=self.client)
+        self.assertEqual(['port: Quota exceeded for resources: [port]'],
+                         failures)
+        self.client.events.list.assert_called_once_with(
+            'my-stack-id',
+            filters={'resource_status': 'CREATE_FAILED'},
+            nested_depth=3,
+            sort_dir='desc',
+            limit=10)
+
+    def test_check_stack_status(self):
+        stack = mock_stack('my-stack', heat.CREATE_FAILED)
+        ex = self.assertRaises(_stack.HeatStackCreationFailed,
+                               _stack.check_stack_status,
+                               stack, {heat.CREATE_COMPLETE},
+                               client=self.client)
+        self.assertEqual(['port: Quota exceeded for resources: [port]'],
+                         ex.failures)
+        self.assertIn('- port: Quota exceeded', str(ex))
@@ -0,0 +1,203 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import os
+import threading
+from unittest import mock
+
+from keystoneauth1 import exceptions
+
+import tobiko
+from tobiko.openstack import keystone
+from tobiko.tests.unit import openstack
+
+
+class FakeSession:
+
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.requests = []
+
+    def request(self, url, method, **kwargs):
+        self.requests.append((url, method, kwargs))
+        if self.status_code >= 400:
+            raise exceptions.from_response(
+                mock.MagicMock(status_code=self.status_code,
+                               headers={}, text=''),
+                method, url)
+        return mock.MagicMock(status_code=self.status_code)
+
+    def get(self, url, **kwargs):
+        return self.request(url, 'GET', **kwargs)
+
+
+class AuthenticatingSession(FakeSession):
+
+    def request(self, url, method, **kwargs):
+        if not url.endswith('/auth'):
+            # it is sent by the same thread, through the same session
+            self.get('http://127.0.0.1/compute/auth')
+        return super(AuthenticatingSession, self).request(
+            url, method, **kwargs)
+
+
+class AdaptiveConcurrencyLimiterTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(AdaptiveConcurrencyLimiterTest, self).setUp()
+        self.now = 1000.
+        self.patch(tobiko, 'time', lambda: self.now)
+
+    def test_increase(self):
+        limiter = keystone.AdaptiveConcurrencyLimiter(
+            service='compute', initial_limit=2, max_limit=4)
+        for _ in range(3):
+            limiter.release(limiter.acquire(), status_code=200)
+        self.assertEqual(3, limiter.stats.limit)
+        for _ in range(20):
+            limiter.release(limiter.acquire(), status_code=200)
+        self.assertEqual(4, limiter.stats.limit)
+
+    def test_decrease(self):
+        limiter = keystone.AdaptiveConcurrencyLimiter(
+            service='compute', initial_limit=8)
+        started = [limiter.acquire() for _ in range(4)]
+        self.now += 1.
+        for start in started:
+            limiter.release(start, status_code=503)
+        # concurrent errors make the limit back off only once
+        self.assertEqual(4, limiter.stats.limit)
+        self.now += 1.
+        limiter.release(limiter.acquire(), status_code=429)
+        self.assertEqual(2, limiter.stats.limit)
+
+    def test_decrease_to_min_limit(self):
+        limiter = keystone.AdaptiveConcurrencyLimiter(
+            service='compute', initial_limit=4, min_limit=3)
+        self.now += 1.
+        limiter.release(limiter.acquire(), status_code=503)
+        self.assertEqual(3, limiter.stats.limit)
+
+    def test_not_throttled(self):
+        limiter = keystone.AdaptiveConcurrencyLimiter(
+            service='compute', initial_limit=4)
+        limiter.release(limiter.acquire(), status_code=404)
+        limiter.release(limiter.acquire(), status_code=500)
+        limiter.release(limiter.acquire())
+        stats = limiter.stats
+        self.assertEqual(4, stats.limit)
+        self.assertEqual(3, stats.requests)
+        self.assertEqual(0, stats.throttled)
+        self.assertEqual(1, stats.failures)
+
+    def test_stats(self):
+        limiter = keystone.AdaptiveConcurrencyLimiter(
+            service='compute', initial_limit=4)
+        first = limiter.acquire()
+        self.now += 1.
+        second = limiter.acquire()
+        self.assertEqual(2, limiter.stats.in_flight)
+        self.now += 2.
+        limiter.release(first, status_code=200)
+        limiter.release(second, status_code=503)
+        stats = limiter.stats
+        self.assertEqual(0, stats.in_flight)
+        self.assertEqual(2, stats.max_in_flight)
+        self.assertEqual(2, stats.requests)
+        self.assertEqual(1, stats.throttled)
+        self.assertEqual(3., stats.max_latency)
+        self.assertEqual(2.5, stats.mean_latency)
+
+    def test_acquire_waits_for_release(self):
+        limiter = keystone.AdaptiveConcurrencyLimiter(
+            service='compute', initial_limit=1, max_limit=1)
+        started = limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+        limiter.release(started, status_code=200)
+        self.assertTrue(acquired.wait(5.))
+        thread.join()
+
+    def test_shared_limit(self):
+        state_file = keystone.ConcurrencyStateFile(
+            os.path.join(self.create_tempdir(), 'state.json'))
+        limiter = keystone.AdaptiveConcurrencyLimiter(
+            service='compute', initial_limit=8, state_file=state_file)
+        other = keystone.AdaptiveConcurrencyLimiter(
+            service='compute', initial_limit=8, state_file=state_file)
+        self.now += 1.
+        limiter.release(limiter.acquire(), status_code=503)
+        self.assertEqual(4, limiter.stats.limit)
+        self.assertEqual(4, state_file.get_limit('compute')['limit'])
+        self.now += 1.
+        other.release(other.acquire(), status_code=200)
+        self.assertEqual(4, other.stats.limit)
+        self.assertIsNone(state_file.get_limit('network'))
+
+    def test_shared_limit_expired(self):
+        state_file = keystone.ConcurrencyStateFile(
+            os.path.join(self.create_tempdir(), 'state.json'), ttl=60.)
+        state_file.set_limit('compute', 2.)
+        self.now += 61.
+        self.assertIsNone(state_file.get_limit('compute'))
+        # a limiter created by a later test run keeps its initial limit
+        limiter = keystone.AdaptiveConcurrencyLimiter(
+            service='compute', initial_limit=8, state_file=state_file)
+        limiter.release(limiter.acquire(), status_code=200)
+        self.assertEqual(8, limiter.stats.limit)
+
+
+class ConcurrencyLimiterManagerTest(openstack.OpenstackTest):
+
+    def test_setup_session(self):
+        manager = keystone.ConcurrencyLimiterManager(initial_limit=4)
+        session = manager.setup_session(FakeSession())
+        session.get('http://127.0.0.1/compute/servers',
+                    endpoint_filter={'service_type': 'compute'})
+        session.get('http://127.0.0.1:5000/identity/v3/auth/tokens')
+        stats = manager.get_stats()
+        self.assertEqual({'compute', '127.0.0.1:5000'}, set(stats))
+        self.assertEqual(1, stats['compute'].requests)
+        self.assertEqual(0, stats['compute'].in_flight)
+
+    def test_setup_session_with_error(self):
+        manager = keystone.ConcurrencyLimiterManager(initial_limit=4)
+        session = manager.setup_session(FakeSession(status_code=503))
+        self.assertRaises(exceptions.ServiceUnavailable, session.get,
+                          'http://127.0.0.1/compute/servers',
+                          endpoint_filter={'service_type': 'compute'})
+        stats = manager.get_stats()['compute']
+        self.assertEqual(1, stats.throttled)
+        self.assertEqual(2, stats.limit)
+        self.assertEqual(0, stats.in_flight)
+
+    def test_setup_session_with_nested_request(self):
+        manager = keystone.ConcurrencyLimiterManager(initial_limit=1,
+                                                     max_limit=1)
+        session = manager.setup_session(AuthenticatingSession())
+        session.get('http://127.0.0.1/compute/servers')
+        self.assertEqual(['http://127.0.0.1/compute/auth',
+                          'http://127.0.0.1/compute/servers'],
+                         [url for url, _, _ in session.requests])
+        self.assertEqual(1, manager.get_stats()['127.0.0.1'].requests)
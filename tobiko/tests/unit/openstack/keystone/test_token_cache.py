@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import datetime
+import os
+import stat
+
+from keystoneauth1 import access
+from keystoneauth1.identity import v3
+
+from tobiko.openstack import keystone
+from tobiko.tests.unit import openstack
+from tobiko.tests.unit.openstack.keystone import test_session
+
+
+def create_auth_ref(token: str, expires_in: float) -> access.AccessInfo:
+    expires = (datetime.datetime.now(datetime.timezone.utc) +
+               datetime.timedelta(seconds=expires_in))
+    body = {'token': {'expires_at': expires.isoformat(),
+                      'catalog': [{'type': 'compute', 'endpoints': []}]}}
+    return access.create(body=body, auth_token=token)
+
+
+class FakeAuthPlugin(v3.Password):
+
+    def __init__(self):
+        super(FakeAuthPlugin, self).__init__(
+            auth_url=test_session.CREDENTIALS.auth_url)
+        self.tokens = []
+        self.expires_in = 3600.
+
+    def get_auth_ref(self, session, **kwargs):
+        token = f'token-{len(self.tokens)}'
+        self.tokens.append(token)
+        return create_auth_ref(token, expires_in=self.expires_in)
+
+
+class KeystoneTokenCacheTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(KeystoneTokenCacheTest, self).setUp()
+        self.cache_dir = os.path.join(self.create_tempdir(), 'tokens')
+
+    def create_plugin(self, credentials=test_session.CREDENTIALS) \
+            -> FakeAuthPlugin:
+        cache = keystone.KeystoneTokenCache(credentials=credentials,
+                                            cache_dir=self.cache_dir)
+        plugin = FakeAuthPlugin()
+        cache.setup_plugin(plugin)
+        return plugin
+
+    def test_get_access(self):
+        plugin = self.create_plugin()
+        auth_ref = plugin.get_access(session=None)
+        self.assertEqual('token-0', auth_ref.auth_token)
+        self.assertTrue(auth_ref.service_catalog.get_endpoints())
+        cache_file, = os.listdir(self.cache_dir)
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(
+            os.path.join(self.cache_dir, cache_file)).st_mode))
+        self.assertNotIn(test_session.CREDENTIALS.password, cache_file)
+
+    def test_get_access_shared(self):
+        plugin = self.create_plugin()
+        other_plugin = self.create_plugin()
+        plugin.get_access(session=None)
+        auth_ref = other_plugin.get_access(session=None)
+        self.assertEqual('token-0', auth_ref.auth_token)
+        self.assertEqual([], other_plugin.tokens)
+        self.assertTrue(auth_ref.service_catalog.get_endpoints())
+
+    def test_get_access_with_other_credentials(self):
+        self.create_plugin().get_access(session=None)
+        other_plugin = self.create_plugin(
+            credentials=test_session.DEFAULT_CREDENTIALS)
+        other_plugin.get_access(session=None)
+        self.assertEqual(['token-0'], other_plugin.tokens)
+        self.assertEqual(2, len(os.listdir(self.cache_dir)))
+
+    def test_get_access_when_expiring(self):
+        plugin = self.create_plugin()
+        plugin.expires_in = 200.
+        plugin.get_access(session=None)
+        other_plugin = self.create_plugin()
+        other_plugin.get_access(session=None)
+        self.assertEqual(['token-0'], other_plugin.tokens)
+
+    def test_get_access_after_invalidate(self):
+        plugin = self.create_plugin()
+        plugin.get_access(session=None)
+        plugin.invalidate()
+        auth_ref = plugin.get_access(session=None)
+        self.assertEqual('token-1', auth_ref.auth_token)
+        self.assertEqual('token-1', self.create_plugin().get_access(
+            session=None).auth_token)
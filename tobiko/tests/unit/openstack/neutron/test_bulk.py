@@ -0,0 +1,122 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import threading
+from unittest import mock
+
+from tobiko.openstack import keystone
+from tobiko.openstack import neutron
+from tobiko.openstack.neutron import _client
+from tobiko.tests.unit import openstack
+
+
+class NeutronBulkTest(openstack.OpenstackTest):
+
+    def setUp(self):
+        super(NeutronBulkTest, self).setUp()
+        self.client = mock.Mock()
+        self.patch(_client, 'neutron_client', return_value=self.client)
+        self.get_keystone_session = self.patch(keystone,
+                                               'get_keystone_session')
+        self.get_neutron_client = self.patch(_client, 'get_neutron_client',
+                                             return_value=self.client)
+
+    def test_create_ports_bulk(self):
+        def create_port(body):
+            return {'ports': [dict(port, id=port['name'])
+                              for port in body['ports']]}
+
+        self.client.create_port.side_effect = create_port
+        ports = neutron.create_ports_bulk(
+            [{'name': str(i)} for i in range(5)],
+            network='net-id', bulk_size=2, add_cleanup=False)
+        self.assertEqual([str(i) for i in range(5)],
+                         [port['id'] for port in ports])
+        self.assertEqual({'net-id'},
+                         {port['network_id'] for port in ports})
+        self.assertEqual(3, self.client.create_port.call_count)
+
+    def test_create_ports_bulk_with_session_per_worker(self):
+        barrier = threading.Barrier(2, timeout=10.)
+
+        def create_port(body):
+            # both requests are being sent at the same time
+            barrier.wait()
+            return {'ports': body['ports']}
+
+        self.client.create_port.side_effect = create_port
+        neutron.create_ports_bulk([{'name': str(i)} for i in range(4)],
+                                  bulk_size=2, max_workers=2,
+                                  add_cleanup=False)
+        self.assertEqual(2, self.client.create_port.call_count)
+        self.get_keystone_session.assert_called_with(shared=False)
+        self.assertEqual(2, self.get_keystone_session.call_count)
+        self.assertEqual(2, self.get_neutron_client.call_count)
+
+    def test_create_ports_bulk_with_client(self):
+        client = mock.Mock()
+        self.client.create_port.return_value = {'ports': []}
+        neutron.create_ports_bulk([{'name': str(i)} for i in range(4)],
+                                  client=client, bulk_size=2,
+                                  max_workers=2, add_cleanup=False)
+        # a given client is not shared by concurrent requests
+        self.assertEqual(2, self.client.create_port.call_count)
+        _client.neutron_client.assert_called_with(client)
+        self.get_keystone_session.assert_not_called()
+
+    def test_create_ports_bulk_with_failure(self):
+        def create_port(body):
+            if body['ports'][0]['name'] == '2':
+                raise _client.NeutronClientException('quota exceeded')
+            return {'ports': body['ports']}
+
+        self.client.create_port.side_effect = create_port
+        ex = self.assertRaises(neutron.BulkOperationError,
+                               neutron.create_ports_bulk,
+                               [{'name': str(i)} for i in range(5)],
+                               network='net-id', bulk_size=2,
+                               add_cleanup=False)
+        self.assertEqual(1, ex.failed)
+        self.assertEqual([2], list(ex.errors))
+        self.assertIn('quota exceeded', str(ex))
+
+    def test_create_security_group_rules_bulk(self):
+        self.client.create_security_group_rule.return_value = {
+            'security_group_rules': [{'id': 'rule-id'}]}
+        rules = neutron.create_security_group_rules_bulk(
+            'sg-id', [{'protocol': 'tcp'}], add_cleanup=False)
+        self.assertEqual([{'id': 'rule-id'}], rules)
+        self.client.create_security_group_rule.assert_called_once_with(
+            body={'security_group_rules': [{'protocol': 'tcp',
+                                            'security_group_id': 'sg-id'}]})
+
+    def test_delete_ports(self):
+        def delete_port(port_id):
+            if port_id == 'missing':
+                raise _client.NotFound()
+            if port_id == 'busy':
+                raise _client.NeutronClientException('port in use')
+
+        self.client.delete_port.side_effect = delete_port
+        self.assertEqual(['a', 'b'],
+                         neutron.delete_ports(['a', {'id': 'b'}, 'missing']))
+        ex = self.assertRaises(neutron.BulkOperationError,
+                               neutron.delete_ports,
+                               ['a', 'busy', 'missing'],
+                               should_exist=True)
+        self.assertEqual({'busy', 'missing'}, set(ex.errors))
+        self.assertEqual(3, ex.total)
@@ -13,6 +13,8 @@
 #    under the License.
 from __future__ import absolute_import
 
+from unittest import mock
+
 from neutronclient.v2_0 import client as neutronclient
 
 from tobiko.openstack import keystone
@@ -97,3 +99,31 @@ class NeutronClientTest(openstack.OpenstackTest):
 
     def test_get_subnet_id_with_dict(self):
         self.assertEqual('some_id', neutron.get_subnet_id({'id': 'some_id'}))
+
+
+class IterNeutronResourcesTest(openstack.OpenstackTest):
+
+    def test_iter_ports(self):
+        client = neutronclient.Client(endpoint_url='http://neutron',
+                                      token='token')
+        client.get = mock.Mock(side_effect=[
+            neutronclient._DictWithMeta(
+                {'ports': [{'id': 'a'}, {'id': 'b'}],
+                 'ports_links': [
+                     {'rel': 'next',
+                      'href': 'http://neutron/v2.0/ports?limit=2&marker=b'}]},
+                []),
+            neutronclient._DictWithMeta({'ports': [{'id': 'c'}]}, [])])
+        ports = neutron.iter_ports(client=client,
+                                   network='network-id',
+                                   fields=['id'],
+                                   page_size=2)
+        self.assertEqual({'id': 'a'}, next(ports))
+        client.get.assert_called_once_with(
+            '/ports', params={'network_id': 'network-id',
+                              'fields': ['id'],
+                              'limit': 2})
+        self.assertEqual([{'id': 'b'}, {'id': 'c'}], list(ports))
+        self.assertEqual(2, client.get.call_count)
+        client.get.assert_called_with(
+            '/ports', params={'limit': ['2'], 'marker': ['b']})
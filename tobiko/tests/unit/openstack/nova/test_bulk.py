@@ -0,0 +1,87 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from unittest import mock
+
+from tobiko.openstack import nova
+from tobiko.openstack.nova import _client
+from tobiko.tests import unit
+
+
+def server(server_id: str, name: str, status: str, updated: str = 't1'):
+    _server = mock.Mock(id=server_id, status=status, updated=updated)
+    _server.name = name
+    return _server
+
+
+class CreateServersTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(CreateServersTest, self).setUp()
+        self.client = mock.Mock()
+        self.client.servers.create.return_value = 'r-1'
+        self.client.servers.list.side_effect = self.list_servers
+        self.patch(_client, 'nova_client', return_value=self.client)
+        self.reserved = [server('a', 'vm-2', 'BUILD'),
+                         server('b', 'vm-10', 'BUILD'),
+                         server('c', 'vm-1', 'BUILD')]
+        self.changes = [[server('a', 'vm-2', 'ACTIVE', 't2'),
+                         server('b', 'vm-10', 'ACTIVE', 't2'),
+                         server('c', 'vm-1', 'BUILD', 't1')],
+                        [server('c', 'vm-1', 'ACTIVE', 't3')]]
+
+    def list_servers(self, detailed, search_opts, marker=None, **_):
+        if 'reservation_id' in search_opts:
+            self.assertEqual({'reservation_id': 'r-1'}, search_opts)
+            # reserved servers are all got with the first page
+            return [] if marker else self.reserved
+        return self.changes.pop(0)
+
+    def test_create_servers(self):
+        servers = nova.create_servers(name='vm', image='image',
+                                      flavor='flavor', count=3,
+                                      network='net', key_name='key',
+                                      interval=0.)
+        self.assertEqual(['vm-1', 'vm-2', 'vm-10'],
+                         [_server.name for _server in servers])
+        self.assertEqual(['ACTIVE'] * 3,
+                         [_server.status for _server in servers])
+        self.client.servers.create.assert_called_once_with(
+            name='vm', image='image', flavor='flavor', min_count=3,
+            max_count=3, reservation_id=True, nics=[{'net-id': 'net'}],
+            key_name='key')
+        self.client.servers.delete.assert_not_called()
+
+    def test_create_servers_with_too_few_servers(self):
+        self.reserved = self.reserved[:2]
+        ex = self.assertRaises(nova.CreateServersError,
+                               nova.create_servers, name='vm',
+                               image='image', flavor='flavor', count=3,
+                               min_count=3)
+        self.assertEqual(2, ex.created)
+        self.assertEqual(['a', 'b'],
+                         [call.args[0] for call in
+                          self.client.servers.delete.call_args_list])
+
+    def test_create_servers_with_error(self):
+        self.changes[1] = [server('c', 'vm-1', 'ERROR', 't3')]
+        self.assertRaises(nova.WaitForServerStatusError,
+                          nova.create_servers, name='vm', image='image',
+                          flavor='flavor', count=3, interval=0.)
+        self.assertEqual(['a', 'b', 'c'],
+                         [call.args[0] for call in
+                          self.client.servers.delete.call_args_list])
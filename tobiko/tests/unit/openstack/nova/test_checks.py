@@ -0,0 +1,72 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from unittest import mock
+
+from tobiko.openstack import nova
+from tobiko.openstack.nova import _client
+from tobiko.tests import unit
+
+
+def server(server_id: str, status: str, updated: str):
+    return mock.Mock(id=server_id, status=status, updated=updated)
+
+
+class WaitForServersStatusTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(WaitForServersStatusTest, self).setUp()
+        self.client = mock.Mock()
+        self.patch(_client, 'nova_client', return_value=self.client)
+
+    def test_wait_for_servers_status(self):
+        self.client.servers.list.side_effect = [
+            [server('a', 'SHUTOFF', 't1'), server('b', 'ACTIVE', 't2'),
+             server('c', 'ACTIVE', 't1')],
+            [server('b', 'ACTIVE', 't2')],
+            [server('a', 'ACTIVE', 't3')]]
+        servers = nova.wait_for_servers_status(servers=['a', 'b'],
+                                               status='ACTIVE',
+                                               interval=0.)
+        self.assertEqual({'a', 'b'}, set(servers))
+        self.assertEqual('ACTIVE', servers['a'].status)
+        self.assertEqual(
+            [mock.call(detailed=True, search_opts={}),
+             mock.call(detailed=True, search_opts={'changes-since': 't2'}),
+             mock.call(detailed=True, search_opts={'changes-since': 't2'})],
+            self.client.servers.list.call_args_list)
+
+    def test_wait_for_servers_status_with_error(self):
+        self.client.servers.list.side_effect = [
+            [server('a', 'BUILD', 't1'), server('b', 'BUILD', 't1')],
+            [server('a', 'ERROR', 't2')]]
+        self.assertRaises(nova.WaitForServerStatusError,
+                          nova.wait_for_servers_status,
+                          servers=['a', 'b'], status='ACTIVE', interval=0.)
+
+    def test_wait_for_servers_status_with_missing_server(self):
+        self.client.servers.list.return_value = [server('a', 'ACTIVE', 't1')]
+        self.assertRaises(nova.ServerNotFoundError,
+                          nova.wait_for_servers_status,
+                          servers=['a', 'b'], status='ACTIVE', interval=0.)
+
+    def test_wait_for_servers_status_timeout(self):
+        self.client.servers.list.return_value = [server('a', 'BUILD', 't1')]
+        self.assertRaises(nova.WaitForServersStatusTimeout,
+                          nova.wait_for_servers_status,
+                          servers=['a'], status='ACTIVE', timeout=0.1,
+                          interval=0.01)
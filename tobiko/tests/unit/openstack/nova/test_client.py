@@ -13,8 +13,11 @@
 #    under the License.
 from __future__ import absolute_import
 
+from unittest import mock
+
 from tobiko.openstack import keystone
 from tobiko.openstack import nova
+from tobiko.openstack.nova import _client
 from tobiko.tests.unit import openstack
 from tobiko.tests.unit.openstack import test_client
 
@@ -64,3 +67,27 @@ class NeutronClientTest(openstack.OpenstackTest):
         client = nova.nova_client(fixture)
         self.assertIsInstance(client, nova.CLIENT_CLASSES)
         self.assertIs(client, fixture.client)
+
+
+class IterServersTest(openstack.OpenstackTest):
+
+    def test_iter_servers(self):
+        client = mock.Mock()
+        self.patch(_client, 'nova_client', return_value=client)
+        # server max_limit could be lower than page size
+        client.servers.list.side_effect = [
+            [mock.Mock(id='a'), mock.Mock(id='b')],
+            [mock.Mock(id='c')],
+            [mock.Mock(id='d')],
+            []]
+        servers = nova.iter_servers(page_size=2,
+                                    status='ACTIVE')
+        self.assertEqual('a', next(servers).id)
+        client.servers.list.assert_called_once_with(
+            detailed=True, search_opts={'status': 'ACTIVE'}, marker=None,
+            limit=2)
+        self.assertEqual(['b', 'c', 'd'], [server.id for server in servers])
+        self.assertEqual(
+            [None, 'b', 'c', 'd'],
+            [call.kwargs['marker']
+             for call in client.servers.list.call_args_list])
@@ -13,10 +13,16 @@
 #    under the License.
 from __future__ import absolute_import
 
+import typing
+from unittest import mock
+
 import testtools
 
 import tobiko
 from tobiko.openstack import nova
+from tobiko.openstack.nova import _cloud_init
+from tobiko.shell import sh
+from tobiko.tests import unit
 
 
 class TestUserData(testtools.TestCase):
@@ -56,3 +62,88 @@ class TestCloudConfig(testtools.TestCase):
         self.assertEqual({'runcmd': [['echo', '1'],
                                      ['echo', '2']]},
                          cloud_config)
+
+
+class WaitForServersCloudInitTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super().setUp()
+        self.statuses: typing.Dict[str, str] = {}
+        self.commands: typing.List[typing.Tuple[str, str]] = []
+        self.timeouts: typing.List[tobiko.Seconds] = []
+        self.patch(sh, 'get_hostname',
+                   lambda ssh_client, **_: ssh_client.host)
+        self.patch(sh, 'execute', self.execute)
+
+    def execute(self, command, ssh_client, timeout=None, **_):
+        self.commands.append((ssh_client.host, command))
+        if command.startswith('cloud-init'):
+            self.timeouts.append(timeout)
+            output = f"....\nstatus: {self.statuses[ssh_client.host]}\n"
+            if self.statuses[ssh_client.host] == 'error':
+                raise sh.ShellCommandFailed(command=command,
+                                            exit_status=1,
+                                            stdin=None,
+                                            stdout=output,
+                                            stderr='')
+        else:
+            output = f"{command} output"
+        return mock.Mock(stdout=output)
+
+    def ssh_client(self, host: str, status: str):
+        self.statuses[host] = status
+        return mock.Mock(host=host)
+
+    def test_wait_for_servers_cloud_init_done(self):
+        ssh_clients = [self.ssh_client(f'server-{i}', 'done')
+                       for i in range(3)]
+        results = nova.wait_for_servers_cloud_init_done(ssh_clients)
+        self.assertEqual(['server-0', 'server-1', 'server-2'],
+                         [result.hostname for result in results])
+        self.assertEqual(['done'] * 3,
+                         [result.status for result in results])
+        self.assertEqual([None] * 3, [result.error for result in results])
+        # a single command per server, without reading any log file
+        self.assertEqual(
+            sorted((f'server-{i}', 'cloud-init status --wait')
+                   for i in range(3)),
+            sorted(self.commands))
+        # commands never wait forever
+        self.assertEqual([_cloud_init.CLOUD_INIT_TIMEOUT] * 3, self.timeouts)
+
+    def test_wait_for_servers_cloud_init_done_with_timeout(self):
+        ssh_clients = [self.ssh_client('server-0', 'done')]
+        nova.wait_for_servers_cloud_init_done(ssh_clients, timeout=60.)
+        self.assertEqual([60.], self.timeouts)
+
+    def test_wait_for_servers_cloud_init_done_with_error(self):
+        ssh_clients = [self.ssh_client('server-0', 'done'),
+                       self.ssh_client('server-1', 'error')]
+        ex = self.assertRaises(nova.WaitForServersCloudInitError,
+                               nova.wait_for_servers_cloud_init_done,
+                               ssh_clients)
+        self.assertEqual(1, ex.failed)
+        self.assertEqual(2, ex.total)
+        self.assertIsNone(ex.results[0].error)
+        self.assertEqual('error', ex.results[1].status)
+        self.assertIsInstance(ex.results[1].error,
+                              nova.InvalidCloudInitStatusError)
+        # log files are read only from failed servers
+        self.assertEqual(
+            [('server-1', f'cat "{_cloud_init.CLOUD_INIT_LOG_FILE}"'),
+             ('server-1', f'cat "{_cloud_init.CLOUD_INIT_OUTPUT_FILE}"')],
+            [(host, command)
+             for host, command in self.commands
+             if not command.startswith('cloud-init')])
+        self.assertIn(f'cat "{_cloud_init.CLOUD_INIT_LOG_FILE}" output',
+                      str(ex))
+
+    def test_parse_cloud_init_status(self):
+        self.assertEqual('running',
+                         _cloud_init.parse_cloud_init_status(
+                             'status: running\n'))
+        self.assertEqual('done',
+                         _cloud_init.parse_cloud_init_status(
+                             '\n......\nstatus: done\n'))
+        self.assertIsNone(_cloud_init.parse_cloud_init_status(
+            'usage: cloud-init status [-h] [--long]\n'))
@@ -0,0 +1,81 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from unittest import mock
+
+from tobiko.openstack import octavia
+from tobiko.shell import sh
+from tobiko.tests import unit
+from tobiko.tests.unit.shell import test_curl
+
+
+class CheckMembersBalancedTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(CheckMembersBalancedTest, self).setUp()
+        self.execute = self.patch(sh, 'execute')
+
+    def check_members_balanced(self, *replies, protocol='HTTP', **params):
+        self.execute.return_value = mock.Mock(
+            stdout=test_curl.curl_load_output(*replies))
+        return octavia.check_members_balanced(
+            ip_address='10.0.0.1', protocol=protocol, port=80,
+            members_count=2, requests_count=2, **params)
+
+    def test_check_members_balanced(self):
+        self.assertEqual({'a': 2, 'b': 2}, self.check_members_balanced(
+            ('a', 200, .1), ('b', 200, .1), ('b', 200, .1), ('a', 200, .1),
+            lb_algorithm='ROUND_ROBIN'))
+        self.execute.assert_called_once()
+
+    def test_check_members_balanced_unbalanced(self):
+        self.assertRaises(
+            octavia.RoundRobinException, self.check_members_balanced,
+            ('a', 200, .1), ('b', 200, .1), ('a', 200, .1), ('a', 200, .1),
+            lb_algorithm='ROUND_ROBIN')
+
+    def test_check_members_balanced_missing_member(self):
+        self.assertRaises(
+            octavia.RoundRobinException, self.check_members_balanced,
+            ('a', 200, .1), ('a', 200, .1), ('a', 200, .1), ('a', 200, .1))
+
+    def test_check_members_balanced_with_tcp(self):
+        self.check_members_balanced(
+            ('a', 200, .1), ('b', 200, .1), ('b', 200, .1), ('a', 200, .1),
+            protocol='TCP', keep_alive=True)
+        script = self.execute.call_args[0][0][-1]
+        self.assertIn('for i in $(seq', script)
+
+    def test_check_members_balanced_timeout(self):
+        self.assertRaises(
+            octavia.TrafficTimeoutError, self.check_members_balanced,
+            ('a', 200, .1), ('b', 200, .1), ('', 0, 10., 28), ('a', 200, .1))
+
+    def test_check_members_balanced_curl_failure(self):
+        self.assertRaises(
+            sh.ShellCommandFailed, self.check_members_balanced,
+            ('a', 200, .1), ('b', 200, .1), ('', 0, .1, 7), ('a', 200, .1))
+
+    def test_check_members_balanced_error_reply(self):
+        self.assertRaises(
+            octavia.RequestException, self.check_members_balanced,
+            ('a', 200, .1), ('b', 200, .1), ('', 503, .1), ('a', 200, .1))
+
+    def test_check_members_balanced_missing_replies(self):
+        self.assertRaises(
+            octavia.RequestException, self.check_members_balanced,
+            ('a', 200, .1), ('b', 200, .1), ('a', 200, .1))
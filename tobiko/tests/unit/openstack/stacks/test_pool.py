@@ -0,0 +1,172 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import threading
+import typing
+from unittest import mock
+
+import tobiko
+from tobiko.openstack import neutron
+from tobiko.openstack import nova
+from tobiko.openstack import stacks
+from tobiko.openstack.stacks import _pool
+from tobiko.tests import unit
+
+
+class PoolServerStack(stacks.ServerStackFixture):
+
+    setup_count = 0
+    cleanup_count = 0
+    # IDs of the stacks existing on the cloud by name
+    stack_ids: typing.Dict[str, str] = {}
+
+    def setUp(self):
+        # it skips checks requiring a cloud
+        tobiko.SharedFixture.setUp(self)
+
+    def setup_fixture(self):
+        self.setup_count += 1
+        self.stack = mock.Mock(id=self.stack_ids.setdefault(
+            self.stack_name, f'{self.stack_name}-{id(self)}'))
+
+    def get_stack(self, resolve_outputs=False):
+        stack_id = self.stack_ids.get(self.stack_name)
+        self.stack = None if stack_id is None else mock.Mock(id=stack_id)
+        return self.stack
+
+    def setup_client(self):
+        return mock.Mock()
+
+    def cleanup_fixture(self):
+        pass
+
+    def cleanup_stack(self):
+        self.cleanup_count += 1
+        self.stack_ids.pop(self.stack_name, None)
+
+    def ensure_server_status(self,
+                             status: str,
+                             retry_count: int = None,
+                             retry_timeout: tobiko.Seconds = None,
+                             retry_interval: tobiko.Seconds = None):
+        raise RuntimeError(f"unable to change server status to {status}")
+
+    @property
+    def server_id(self) -> str:
+        # every new stack has a new server
+        return f'{self.stack_name}-server-{id(self)}'
+
+    @property
+    def port_id(self) -> str:
+        return f'{self.stack_name}-port'
+
+
+class ServerStackPoolTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(ServerStackPoolTest, self).setUp()
+        self.servers: typing.Dict[str, mock.Mock] = {}
+        self.ports: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        self.patch(nova, 'get_server', side_effect=self.get_server)
+        self.patch(neutron, 'get_port', side_effect=self.get_port)
+        self.update_port = self.patch(neutron, 'update_port')
+        self.patch(PoolServerStack, 'stack_ids', {})
+        self.pool = stacks.ServerStackPool(PoolServerStack, size=2)
+
+    def tearDown(self):
+        for member in list(self.pool.members.values()):
+            if member.stack_name in self.pool.leased:
+                self.pool.release(member)
+        self.pool._executor.shutdown(wait=True)
+        super(ServerStackPoolTest, self).tearDown()
+
+    def get_server(self, server_id):
+        return self.servers.setdefault(server_id,
+                                       mock.Mock(id=server_id,
+                                                 status='ACTIVE'))
+
+    def get_port(self, port_id, cached=True):
+        return self.ports.setdefault(port_id, {'id': port_id,
+                                               'security_groups': ['sg1']})
+
+    def test_lease(self):
+        first = self.pool.lease(timeout=5.)
+        second = self.pool.lease(timeout=5.)
+        self.assertNotEqual(first.stack_name, second.stack_name)
+        self.assertEqual({'PoolServerStack-pool-0', 'PoolServerStack-pool-1'},
+                         {member.stack_name.rsplit('.', 1)[-1]
+                          for member in [first, second]})
+        self.assertEqual([1, 1], [first.setup_count, second.setup_count])
+
+        # all servers are leased
+        self.assertRaises(stacks.ServerStackPoolError, self.pool.lease,
+                          timeout=.1)
+
+        self.pool.release(first)
+        self.assertIs(first, self.pool.lease(timeout=5.))
+
+    def test_lease_renews_servers_replaced_by_other_worker(self):
+        members = [self.pool.lease(timeout=5.), self.pool.lease(timeout=5.)]
+        for member in members:
+            self.pool.release(member)
+            # another worker replaces the stack
+            PoolServerStack.stack_ids[member.stack_name] = (
+                f'{member.stack_name}-new')
+
+        new_member = self.pool.lease(timeout=5.)
+        self.assertNotIn(new_member, members)
+        self.assertEqual(f'{new_member.stack_name}-new', new_member.stack.id)
+        self.assertEqual(1, new_member.setup_count)
+        self.assertEqual([0, 0], [member.cleanup_count
+                                  for member in members])
+
+    def test_release_restores_security_groups(self):
+        member = self.pool.lease(timeout=5.)
+        self.ports[member.port_id]['security_groups'] = ['sg2']
+        self.pool.release(member)
+        self.update_port.assert_called_once_with(
+            self.ports[member.port_id], security_groups=['sg1'])
+        self.assertIs(member, self.pool.members[member.stack_name])
+
+    def test_release_replaces_broken_server(self):
+        member = self.pool.lease(timeout=5.)
+        self.servers[member.server_id].status = 'ERROR'
+        self.pool.release(member)
+        self.pool._futures[member.stack_name].result(timeout=5.)
+        self.assertEqual(1, member.cleanup_count)
+        new_member = self.pool.members[member.stack_name]
+        self.assertIsNot(member, new_member)
+        self.assertEqual(1, new_member.setup_count)
+
+    def test_release_keeps_replaced_server_unavailable(self):
+        member = self.pool.lease(timeout=5.)
+        released = threading.Event()
+        users: typing.List[typing.Set[str]] = []
+
+        def cleanup_stack():
+            released.wait(timeout=5.)
+            users.append(tobiko.get_shared_resource_users(
+                _pool.__name__, member.stack_name))
+
+        self.patch(member, 'cleanup_stack', side_effect=cleanup_stack)
+        self.servers[member.server_id].status = 'ERROR'
+        self.pool.release(member)
+        released.set()
+        self.pool._futures[member.stack_name].result(timeout=5.)
+        self.assertEqual([{_pool.REPLACING_USER}], users)
+        self.assertEqual(set(), tobiko.get_shared_resource_users(
+            _pool.__name__, member.stack_name))
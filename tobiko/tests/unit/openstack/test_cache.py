@@ -0,0 +1,209 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import tobiko
+from tobiko import openstack
+from tobiko.openstack import _cache
+from tobiko.tests import unit
+
+
+class FakeNeutronClient:
+
+    def __init__(self):
+        self.networks = []
+        self.calls = 0
+
+    def list_networks(self, **params):
+        self.calls += 1
+        return {'networks': [network for network in self.networks
+                             if params.items() <= network.items()]}
+
+    def create_network(self, **network):
+        self.networks.append(network)
+        return {'network': network}
+
+    def list_agents(self, **params):
+        self.calls += 1
+        return {'agents': []}
+
+    def update_agent(self, agent, body):
+        return {'agent': body['agent']}
+
+    def show_network(self, network, **params):
+        self.calls += 1
+        return {'network': {'id': network}}
+
+    def list_ext(self, collection, path, retrieve_all, **params):
+        raise RuntimeError('not expected to be wrapped')
+
+
+class FakeManager:
+
+    def __init__(self):
+        self.calls = 0
+
+    def list(self):
+        self.calls += 1
+        return [self.calls]
+
+    def get(self, object_id):
+        self.calls += 1
+        return object_id
+
+    def delete(self, object_id):
+        pass
+
+
+class FakeClient:
+
+    def __init__(self):
+        self.hypervisors = FakeManager()
+        self.servers = FakeManager()
+
+
+class ApiCacheTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(ApiCacheTest, self).setUp()
+        self.now = 1000.
+        self.patch(tobiko, 'time', lambda: self.now)
+        self.patch(_cache, 'API_CACHES', _cache.weakref.WeakSet())
+        self.patch(tobiko.tobiko_config().common, 'api_cache_ttl', 10.)
+        self.patch(tobiko.tobiko_config().common, 'api_cache_size', 2)
+
+    def test_neutron_client_cache(self):
+        client = FakeNeutronClient()
+        cache = _cache.setup_neutron_client_cache(client)
+        assert cache is not None
+        self.assertEqual({'networks': []}, client.list_networks())
+        self.assertEqual({'networks': []}, client.list_networks())
+        self.assertEqual(1, client.calls)
+        self.assertEqual(_cache.ApiCacheStats(hits=1, misses=1, size=1),
+                         cache.stats)
+
+        # creating a network discards cached networks lists
+        client.create_network(name='a')
+        self.assertEqual({'networks': [{'name': 'a'}]}, client.list_networks())
+        self.assertEqual(2, client.calls)
+        self.assertEqual(1, cache.stats.invalidations)
+
+        # results of calls with different parameters are cached apart
+        self.assertEqual({'networks': []}, client.list_networks(name='b'))
+        self.assertEqual(3, client.calls)
+        self.assertRaises(RuntimeError, client.list_ext, 'networks',
+                          '/networks', True)
+
+    def test_neutron_client_cache_agents(self):
+        client = FakeNeutronClient()
+        _cache.setup_neutron_client_cache(client)
+        client.list_agents()
+        client.list_agents()
+        self.assertEqual(1, client.calls)
+        # updating an agent discards cached agents lists
+        client.update_agent('agent-id', body={'agent': {}})
+        client.list_agents()
+        self.assertEqual(2, client.calls)
+        # waiters and health checks get fresh results
+        with openstack.api_cache_disabled():
+            client.list_agents()
+        self.assertEqual(3, client.calls)
+
+    def test_neutron_client_cache_show(self):
+        client = FakeNeutronClient()
+        _cache.setup_neutron_client_cache(client)
+        self.assertEqual({'network': {'id': 'a'}}, client.show_network('a'))
+        self.assertEqual({'network': {'id': 'a'}}, client.show_network('a'))
+        self.assertEqual(1, client.calls)
+        client.create_network(name='b')
+        client.show_network('a')
+        self.assertEqual(2, client.calls)
+
+    def test_neutron_client_cache_returns_copies(self):
+        client = FakeNeutronClient()
+        _cache.setup_neutron_client_cache(client)
+        client.create_network(name='a')
+        client.list_networks()['networks'].pop()
+        self.assertEqual({'networks': [{'name': 'a'}]}, client.list_networks())
+
+    def test_neutron_client_cache_skips_paginated_calls(self):
+        client = FakeNeutronClient()
+        _cache.setup_neutron_client_cache(client)
+        client.list_networks(retrieve_all=False)
+        client.list_networks(retrieve_all=False)
+        self.assertEqual(2, client.calls)
+
+    def test_cache_expires(self):
+        client = FakeClient()
+        cache = _cache.setup_managers_cache(
+            'fake', client, cached_managers=['hypervisors'])
+        assert cache is not None
+        self.assertEqual([1], client.hypervisors.list())
+        self.now += 9.
+        self.assertEqual([1], client.hypervisors.list())
+        self.now += 2.
+        self.assertEqual([2], client.hypervisors.list())
+
+    def test_cache_disabled(self):
+        client = FakeClient()
+        _cache.setup_managers_cache('fake', client,
+                                    cached_managers=['hypervisors'])
+        self.assertEqual([1], client.hypervisors.list())
+        with openstack.api_cache_disabled():
+            self.assertEqual([2], client.hypervisors.list())
+        self.assertEqual([2], client.hypervisors.list())
+
+    def test_cache_not_disabled(self):
+        client = FakeClient()
+        _cache.setup_managers_cache('fake', client,
+                                    cached_managers=['hypervisors'])
+        self.assertEqual('a', client.hypervisors.get('a'))
+        with openstack.api_cache_disabled(False):
+            self.assertEqual('a', client.hypervisors.get('a'))
+        self.assertEqual(1, client.hypervisors.calls)
+
+    def test_cache_size(self):
+        client = FakeNeutronClient()
+        cache = _cache.setup_neutron_client_cache(client)
+        assert cache is not None
+        for name in ['a', 'b', 'c', 'a']:
+            client.list_networks(name=name)
+        self.assertEqual(4, client.calls)
+        self.assertEqual(_cache.ApiCacheStats(misses=4, evictions=2, size=2),
+                         cache.stats)
+
+    def test_mutating_manager_invalidates_related_resources(self):
+        client = FakeClient()
+        _cache.setup_managers_cache('fake', client,
+                                    cached_managers=['hypervisors'],
+                                    mutating_managers=['servers'])
+        self.assertEqual([1], client.hypervisors.list())
+        # servers list is not cached
+        self.assertEqual([1], client.servers.list())
+        self.assertEqual([2], client.servers.list())
+        client.servers.delete('server-id')
+        self.assertEqual([2], client.hypervisors.list())
+        self.assertEqual(_cache.ApiCacheStats(misses=2, invalidations=1,
+                                              size=1),
+                         openstack.get_api_cache_stats())
+
+    def test_cache_disabled_by_config(self):
+        self.patch(tobiko.tobiko_config().common, 'api_cache_ttl', 0.)
+        client = FakeNeutronClient()
+        self.assertIsNone(_cache.setup_neutron_client_cache(client))
+        client.list_networks()
+        client.list_networks()
+        self.assertEqual(2, client.calls)
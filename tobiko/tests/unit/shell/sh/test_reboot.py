@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import typing
+from unittest import mock
+
+import tobiko
+from tobiko.shell import sh
+from tobiko.shell.sh import _uptime
+from tobiko.tests import unit
+
+
+class DisruptHostsTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(DisruptHostsTest, self).setUp()
+        self.mock_time = self.patch_time(time_increment=0.)
+        self.patch(tobiko, 'cleanup_fixture')
+        self.patch(_uptime, 'get_boot_id', side_effect=self.get_boot_id)
+        self.boot_ids: typing.Dict[str, typing.List[typing.Any]] = {}
+
+    def get_boot_id(self, ssh_client, **_):
+        boot_id = self.boot_ids[ssh_client.host].pop(0)
+        if isinstance(boot_id, Exception):
+            raise boot_id
+        return boot_id
+
+    def ssh_client(self, host: str, *boot_ids: typing.Any):
+        self.boot_ids[host] = list(boot_ids)
+        return mock.Mock(host=host)
+
+    def test_disrupt_hosts(self):
+        unreachable = sh.BootIdError(error='connection refused')
+        ssh_clients = [
+            self.ssh_client('host-0', 'a0', unreachable, 'b0'),
+            self.ssh_client('host-1', 'a1', 'a1', unreachable, 'b1')]
+        disruptions = sh.disrupt_hosts(ssh_clients)
+        self.assertEqual(['host-0', 'host-1'],
+                         [d.hostname for d in disruptions])
+        self.assertEqual(['a0', 'a1'], [d.boot_id for d in disruptions])
+        self.assertEqual(['b0', 'b1'], [d.new_boot_id for d in disruptions])
+        self.assertEqual([2, 3], [d.attempts for d in disruptions])
+        for ssh_client in ssh_clients:
+            ssh_client.connect().exec_command.assert_called_once_with(
+                "sudo /bin/sh -c 'echo 1 > /proc/sys/kernel/sysrq && "
+                "echo b > /proc/sysrq-trigger'")
+
+    def test_disrupt_hosts_with_stagger(self):
+        ssh_clients = [self.ssh_client(f'host-{i}', 'a', 'b')
+                       for i in range(3)]
+        sh.disrupt_hosts(ssh_clients, stagger=10.)
+        # the first host is disrupted without waiting
+        sleep_calls = self.mock_time.sleep.call_args_list
+        self.assertEqual([10., 20.],
+                         sorted(call.args[0] for call in sleep_calls))
+
+    def test_disrupt_hosts_without_waiting(self):
+        ssh_clients = [self.ssh_client('host-0')]
+        disruptions = sh.disrupt_hosts(ssh_clients,
+                                       disruption='sudo pkill -9 mysqld',
+                                       wait_for_reboot=False)
+        self.assertIsNone(disruptions[0].downtime)
+        ssh_clients[0].connect().exec_command.assert_called_once_with(
+            'sudo pkill -9 mysqld')
+
+    def test_disrupt_hosts_timeout(self):
+        ssh_clients = [self.ssh_client('host-0', 'a', 'b'),
+                       self.ssh_client('host-1', *(['a'] * 100))]
+        ex = self.assertRaises(sh.DisruptHostsError, sh.disrupt_hosts,
+                               ssh_clients, timeout=60.)
+        self.assertEqual(1, ex.failed)
+        self.assertEqual('b', ex.results[ssh_clients[0]].new_boot_id)
+        self.assertIsInstance(ex.errors[ssh_clients[1]],
+                              sh.RebootHostTimeoutError)
+
+    def test_disrupt_hosts_with_unreachable_host(self):
+        ssh_clients = [self.ssh_client('host-0', 'a', 'b'),
+                       self.ssh_client('host-1',
+                                       sh.BootIdError(error='unreachable'))]
+        ex = self.assertRaises(sh.DisruptHostsError, sh.disrupt_hosts,
+                               ssh_clients)
+        self.assertEqual(1, ex.failed)
+        # no host is disrupted
+        ssh_clients[0].connect().exec_command.assert_not_called()
+
+    def test_wait_for_boot_id_change_backoff(self):
+        unreachable = sh.BootIdError(error='connection refused')
+        ssh_client = self.ssh_client('host-0', *([unreachable] * 6), 'b')
+        new_boot_id, attempts = sh.wait_for_boot_id_change(
+            ssh_client, boot_id='a', max_interval=10.)
+        self.assertEqual(('b', 7), (new_boot_id, attempts))
+        self.assertEqual([1., 2., 4., 8., 10., 10.],
+                         [call.args[0]
+                          for call in self.mock_time.sleep.call_args_list])
@@ -0,0 +1,82 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from tobiko.shell import curl
+from tobiko.shell.curl import _load
+from tobiko.tests import unit
+
+
+def curl_load_output(*replies) -> str:
+    """Output of curl commands sending a request each
+
+    :param replies: tuples of content, HTTP code, total time and optionally
+        curl exit status
+    """
+    output = ''
+    for content, http_code, time, *exit_status in replies:
+        output += (f'{content}\n\n:tobiko-curl: {http_code} 0.001 {time}\n'
+                   f':tobiko-curl-exit: {(exit_status or [0])[0]}\n')
+    return output
+
+
+class CurlLoadTest(unit.TobikoUnitTest):
+
+    def test_get_curl_load_script(self):
+        script = _load.get_curl_load_script(url='http://10.0.0.1/id',
+                                            requests_count=5,
+                                            concurrency=2)
+        self.assertIn('for i in $(seq 3); do curl', script)
+        self.assertIn('for i in $(seq 2); do curl', script)
+        self.assertEqual(2, script.count('echo ":tobiko-curl-exit: $?"'))
+        self.assertEqual(2, script.count(' &\n'))
+
+    def test_get_curl_load_script_with_keep_alive(self):
+        script = _load.get_curl_load_script(url='http://10.0.0.1/id',
+                                            requests_count=4,
+                                            concurrency=8,
+                                            keep_alive=True)
+        self.assertEqual(4, script.count('http://10.0.0.1/id'))
+        self.assertNotIn('seq', script)
+
+    def test_parse_curl_load_output(self):
+        output = ('a\n:tobiko-curl: 200 0.001 0.010\n'
+                  '\n:tobiko-curl: 000 0.000 10.000\n')
+        self.assertEqual(
+            [curl.CurlLoadResult('a', 200, 0.001, 0.01),
+             curl.CurlLoadResult('', 0, 0., 10.)],
+            _load.parse_curl_load_output(output))
+
+    def test_parse_curl_load_output_with_exit_status(self):
+        output = ('a\n:tobiko-curl: 200 0.001 0.010\n'
+                  '\n:tobiko-curl: 000 0.000 10.000\n'
+                  ':tobiko-curl-exit: 28\n'
+                  ':tobiko-curl-exit: 7\n')
+        self.assertEqual(
+            [curl.CurlLoadResult('a', 200, 0.001, 0.01),
+             curl.CurlLoadResult('', 0, 0., 10., 28),
+             curl.CurlLoadResult('', 0, 0., 0., 7)],
+            _load.parse_curl_load_output(output))
+
+    def test_report(self):
+        report = curl.CurlLoadReport(_load.parse_curl_load_output(
+            curl_load_output(('a', 200, 0.1), ('b', 200, 0.3),
+                             ('a', 200, 0.2), ('', 404, 0.01))))
+        self.assertEqual({'a': 2, 'b': 1}, report.hits)
+        self.assertEqual(1, len(report.failures))
+        self.assertEqual([0.1, 0.2], report.latencies(content='a'))
+        self.assertEqual({50: 0.2, 100: 0.3},
+                         report.latency_percentiles(percentiles=[50, 100]))
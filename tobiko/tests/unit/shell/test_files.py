@@ -0,0 +1,95 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import os
+
+from tobiko import config
+from tobiko.shell import files
+from tobiko.shell import sh
+from tobiko.tests import unit
+
+
+CONF = config.CONF
+
+
+class ReadNewLogLinesTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(ReadNewLogLinesTest, self).setUp()
+        temp_dir = self.create_tempdir()
+        self.patch(CONF.tobiko.common, 'log_cursors_dir',
+                   os.path.join(temp_dir, 'cursors'))
+        self.logfile = os.path.join(temp_dir, 'some.log')
+
+    def write_log(self, text: str, mode: str = 'a'):
+        with open(self.logfile, mode) as fd:
+            fd.write(text)
+
+    def test_read_new_log_lines(self):
+        self.write_log('line 1\nline 2\n')
+        self.assertEqual(['line 1', 'line 2'],
+                         files.read_new_log_lines(self.logfile))
+        self.assertEqual([], files.read_new_log_lines(self.logfile))
+        self.write_log('line 3\n')
+        self.assertEqual(['line 3'],
+                         files.read_new_log_lines(self.logfile))
+
+    def test_read_new_log_lines_with_partial_line(self):
+        self.write_log('line 1\nline')
+        self.assertEqual(['line 1'],
+                         files.read_new_log_lines(self.logfile))
+        self.write_log(' 2\nline 3\n')
+        self.assertEqual(['line 2', 'line 3'],
+                         files.read_new_log_lines(self.logfile))
+
+    def test_read_new_log_lines_with_consume(self):
+        self.write_log('line 1\nline 2\nline')
+        self.assertEqual(['line 1'],
+                         files.read_new_log_lines(self.logfile,
+                                                  consume=lambda lines: 1))
+        self.assertEqual([],
+                         files.read_new_log_lines(self.logfile,
+                                                  consume=lambda lines: 0))
+        self.write_log(' 3\n')
+        self.assertEqual(['line 2', 'line 3'],
+                         files.read_new_log_lines(self.logfile))
+
+    def test_read_new_log_lines_when_replaced(self):
+        self.write_log('line 1\nline 2\n')
+        files.read_new_log_lines(self.logfile)
+        os.rename(self.logfile, self.logfile + '.old')
+        self.write_log('line 3\n')
+        self.assertEqual(['line 3'],
+                         files.read_new_log_lines(self.logfile))
+
+    def test_read_new_log_lines_when_truncated(self):
+        self.write_log('line 1\nline 2\n')
+        files.read_new_log_lines(self.logfile)
+        self.write_log('line 3\n', mode='w')
+        self.assertEqual(['line 3'],
+                         files.read_new_log_lines(self.logfile))
+
+    def test_read_new_log_lines_after_reset(self):
+        self.write_log('line 1\n')
+        files.read_new_log_lines(self.logfile)
+        files.reset_log_file_cursor(self.logfile)
+        self.assertEqual(['line 1'],
+                         files.read_new_log_lines(self.logfile))
+
+    def test_read_new_log_lines_when_missing(self):
+        self.assertRaises(sh.ShellCommandFailed,
+                          files.read_new_log_lines, self.logfile)
@@ -0,0 +1,100 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import json
+
+import numpy
+
+from tobiko.shell import iperf3
+from tobiko.tests import unit
+
+
+def interval_event(start: float, *streams_bytes: int) -> bytes:
+    streams = [{'start': start, 'end': start + 1., 'bytes': stream_bytes,
+                'retransmits': 1, 'rtt': 100 + i}
+               for i, stream_bytes in enumerate(streams_bytes)]
+    data = {'streams': streams,
+            'sum': {'start': start, 'end': start + 1.,
+                    'bytes': sum(streams_bytes)}}
+    return json.dumps({'event': 'interval', 'data': data}).encode() + b'\n'
+
+
+class Iperf3ClientStreamTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(Iperf3ClientStreamTest, self).setUp()
+        self.client = iperf3.Iperf3ClientStream(
+            pair=iperf3.Iperf3Pair(address='10.0.0.1'))
+
+    def test_feed(self):
+        data = (b'{"event": "start", "data": {}}\n' +
+                interval_event(0., 10, 20) +
+                interval_event(1., 30, 40))
+        self.assertEqual(2, self.client.feed(data))
+        measures = self.client.measures
+        self.assertEqual(2, measures.count)
+        self.assertEqual(2, measures.streams)
+        numpy.testing.assert_array_equal([[10, 20], [30, 40]],
+                                         measures.bytes)
+        numpy.testing.assert_array_equal([30, 70], measures.total_bytes)
+        numpy.testing.assert_array_equal([[100, 101], [100, 101]],
+                                         measures.rtt)
+        numpy.testing.assert_array_equal([240., 560.],
+                                         measures.bits_per_second)
+
+    def test_feed_partial_lines(self):
+        data = interval_event(0., 10) + interval_event(1., 20)
+        self.assertEqual(0, self.client.feed(data[:10]))
+        self.assertEqual(1, self.client.feed(data[10:-10]))
+        self.assertEqual(1, self.client.feed(data[-10:]))
+        numpy.testing.assert_array_equal([[10], [20]],
+                                         self.client.measures.bytes)
+
+    def test_feed_traffic_breaks(self):
+        for start, stream_bytes in enumerate([10, 0, 0, 10, 0, 10]):
+            self.client.feed(interval_event(float(start), stream_bytes))
+        measures = self.client.measures
+        self.assertEqual(2., measures.longest_break)
+        self.assertEqual(3., measures.breaks_total)
+        self.assertEqual(0., measures.current_break)
+
+    def test_feed_many_intervals(self):
+        for start in range(200):
+            self.client.feed(interval_event(float(start), start))
+        measures = self.client.measures
+        self.assertEqual(200, measures.count)
+        numpy.testing.assert_array_equal(numpy.arange(200),
+                                         measures.total_bytes)
+        numpy.testing.assert_array_equal(numpy.arange(200.), measures.start)
+
+    def test_feed_end_and_error(self):
+        self.client.feed(b'{"event": "error", "data": "unable to connect"}\n'
+                         b'{"event": "end", "data": {"sum": {}}}\n')
+        self.assertEqual(['unable to connect'], self.client.errors)
+        self.assertEqual({'sum': {}}, self.client.summary)
+        self.assertEqual(0, self.client.measures.count)
+
+
+class AssignIperf3PortsTest(unit.TobikoUnitTest):
+
+    def test_assign_iperf3_ports(self):
+        pairs = [iperf3.Iperf3Pair(address='10.0.0.1'),
+                 iperf3.Iperf3Pair(address='10.0.0.1', port=5202),
+                 iperf3.Iperf3Pair(address='10.0.0.1')]
+        self.assertEqual([5201, 5202, 5203],
+                         [pair.port
+                          for pair in iperf3.assign_iperf3_ports(pairs)])
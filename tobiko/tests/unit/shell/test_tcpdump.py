@@ -0,0 +1,224 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import io
+import socket
+from unittest import mock
+
+import dpkt
+import numpy
+
+from tobiko.shell import sh
+from tobiko.shell import tcpdump
+from tobiko.shell.tcpdump import _interface
+from tobiko.shell.tcpdump import _parameters
+from tobiko.tests import unit
+
+
+def write_pcap(*packets: bytes) -> bytes:
+    stream = io.BytesIO()
+    writer = dpkt.pcap.Writer(stream)
+    for i, packet in enumerate(packets):
+        writer.writepkt(packet, ts=float(i))
+    return stream.getvalue()
+
+
+def ethernet_frame(src: str, dst: str, segment, dscp: int = 0,
+                   vlan: int = None) -> bytes:
+    ip = dpkt.ip.IP(src=socket.inet_aton(src), dst=socket.inet_aton(dst),
+                    tos=dscp << 2, data=segment,
+                    p=(dpkt.ip.IP_PROTO_TCP
+                       if isinstance(segment, dpkt.tcp.TCP)
+                       else dpkt.ip.IP_PROTO_UDP))
+    frame = dpkt.ethernet.Ethernet(src=b'\x00' * 6, dst=b'\x01' * 6,
+                                   type=dpkt.ethernet.ETH_TYPE_IP, data=ip)
+    if vlan is not None:
+        frame.vlan_tags = [dpkt.ethernet.VLANtag8021Q(id=vlan)]
+        frame.vlan = vlan
+        frame.type = dpkt.ethernet.ETH_TYPE_8021Q
+    return bytes(frame)
+
+
+class OpenPcapTest(unit.TobikoUnitTest):
+
+    def test_open_pcap(self):
+        packets = [bytes([i]) * (10 + i) for i in range(20)]
+        data = write_pcap(*packets)
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+        pcap = tcpdump.open_pcap(iter(chunks), chunk_size=16)
+        self.assertEqual([(float(i), packet)
+                          for i, packet in enumerate(packets)],
+                         list(pcap))
+
+    def test_open_pcap_is_lazy(self):
+        data = write_pcap(b'a' * 100, b'b' * 100)
+        consumed = []
+
+        def chunks():
+            for i in range(0, len(data), 10):
+                consumed.append(i)
+                yield data[i:i + 10]
+
+        pcap = tcpdump.open_pcap(chunks(), chunk_size=10)
+        self.assertEqual((0., b'a' * 100), next(iter(pcap)))
+        self.assertLess(len(consumed), len(data) // 10)
+
+    def test_close_pcap(self):
+        data = write_pcap(b'a' * 100, b'b' * 100)
+        closed = []
+
+        def chunks():
+            try:
+                for i in range(0, len(data), 10):
+                    yield data[i:i + 10]
+            finally:
+                closed.append(True)
+
+        pcap = tcpdump.open_pcap(chunks(), chunk_size=10)
+        self.assertEqual((0., b'a' * 100), next(iter(pcap)))
+        tcpdump.close_pcap(pcap)
+        self.assertEqual([True], closed)
+
+    def test_assert_pcap_is_not_empty_closes_pcap(self):
+        pcap = mock.MagicMock(spec=tcpdump.PcapStreamReader)
+        pcap.__iter__.return_value = iter([(0., b'a')])
+        tcpdump.assert_pcap_is_not_empty(pcap)
+        pcap.close.assert_called_once_with()
+
+
+class TcpdumpInterfaceTest(unit.TobikoUnitTest):
+
+    def test_get_tcpdump_command_with_ring_buffer(self):
+        parameters = _parameters.tcpdump_parameters(
+            capture_file='/tmp/capture.pcap', capture_filter='icmp',
+            file_size=10, file_count=3)
+        self.assertEqual('tcpdump -s0 -Un -w /tmp/capture.pcap -i any '
+                         '-C 10 -Z root -W 3 icmp',
+                         _interface.get_tcpdump_command(parameters))
+
+    def test_get_tcpdump_read_command(self):
+        self.assertEqual('cat /tmp/capture.pcap',
+                         _interface.get_tcpdump_read_command(
+                             '/tmp/capture.pcap'))
+        self.assertEqual('tcpdump -r /tmp/capture.pcap -w - icmp',
+                         _interface.get_tcpdump_read_command(
+                             '/tmp/capture.pcap', read_filter='icmp'))
+        self.assertEqual("tcpdump -r /tmp/capture.pcap -w - "
+                         "'icmp and host 10.0.0.1'",
+                         _interface.get_tcpdump_read_command(
+                             '/tmp/capture.pcap',
+                             read_filter='icmp and host 10.0.0.1'))
+
+
+class TcpdumpRingBufferTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(TcpdumpRingBufferTest, self).setUp()
+        self.listing = ''
+        self.patch(sh, 'execute', self.execute)
+        self.stream_pcap = self.patch(tcpdump._stream, 'stream_pcap',
+                                      return_value=mock.sentinel.pcap)
+        self.ring = tcpdump.TcpdumpRingBuffer('/tmp/capture.pcap')
+
+    def execute(self, *args, **kwargs):
+        return mock.Mock(stdout=self.listing)
+
+    def fetch(self, **kwargs):
+        return [name for name, _ in self.ring.fetch(**kwargs)]
+
+    def test_fetch(self):
+        self.listing = ('2026-01-01 00:00:02.0 +0000|/tmp/capture.pcap1\n'
+                        '2026-01-01 00:00:01.0 +0000|/tmp/capture.pcap\n'
+                        '2026-01-01 00:00:03.0 +0000|/tmp/capture.pcap2\n')
+        self.assertEqual(['/tmp/capture.pcap', '/tmp/capture.pcap1'],
+                         self.fetch())
+        self.assertEqual([], self.fetch())
+        self.assertEqual(['/tmp/capture.pcap2'],
+                         self.fetch(include_current=True))
+        self.assertEqual(3, self.stream_pcap.call_count)
+
+    def test_fetch_overwritten_file(self):
+        self.listing = ('2026-01-01 00:00:01.0 +0000|/tmp/capture.pcap0\n'
+                        '2026-01-01 00:00:02.0 +0000|/tmp/capture.pcap1\n')
+        self.assertEqual(['/tmp/capture.pcap0'], self.fetch())
+        self.listing = ('2026-01-01 00:00:03.0 +0000|/tmp/capture.pcap0\n'
+                        '2026-01-01 00:00:02.0 +0000|/tmp/capture.pcap1\n')
+        self.assertEqual(['/tmp/capture.pcap1'], self.fetch())
+
+
+class PacketTableTest(unit.TobikoUnitTest):
+
+    def setUp(self):
+        super(PacketTableTest, self).setUp()
+        packets = []
+        for i, seq in enumerate([1, 101, 101, 201]):
+            tcp = dpkt.tcp.TCP(sport=40000, dport=80, seq=seq,
+                               flags=dpkt.tcp.TH_ACK, data=b'x' * 100)
+            packets.append((float(i) / 2., ethernet_frame(
+                '10.0.0.1', '10.0.0.2', tcp, dscp=10, vlan=100)))
+        for i in range(3):
+            udp = dpkt.udp.UDP(sport=5000, dport=53, data=b'y' * 50)
+            packets.append((float(i), ethernet_frame(
+                '10.0.0.2', '10.0.0.3', udp)))
+        packets.append((0., b'not a frame'))
+        self.table = tcpdump.decode_packets(packets)
+
+    def test_decode_packets(self):
+        self.assertEqual(7, len(self.table))
+        numpy.testing.assert_array_equal([10] * 4 + [0] * 3,
+                                         self.table['dscp'])
+        numpy.testing.assert_array_equal([100] * 4 + [-1] * 3,
+                                         self.table['vlan'])
+
+    def test_select(self):
+        self.assertEqual(4, len(self.table.select(proto='tcp', dport=80)))
+        self.assertEqual(3, len(self.table.select(src='10.0.0.2')))
+        self.assertEqual(4, len(self.table.select(tcp_flag='ack')))
+        self.assertEqual(0, len(self.table.select(tcp_flag='syn')))
+        self.assertRaises(ValueError, self.table.select, port=80)
+
+    def test_flows(self):
+        tcp_flow, udp_flow = self.table.flows()
+        self.assertEqual(('10.0.0.1', '10.0.0.2', 6, 40000, 80),
+                         tcp_flow[:5])
+        self.assertEqual(4, tcp_flow.packets)
+        self.assertEqual(1, tcp_flow.retransmits)
+        self.assertEqual((10,), tcp_flow.dscp)
+        self.assertEqual((100,), tcp_flow.vlans)
+        self.assertEqual(1.5, tcp_flow.duration)
+        self.assertEqual(3, udp_flow.packets)
+        self.assertEqual(0, udp_flow.retransmits)
+        self.assertEqual((), udp_flow.vlans)
+        self.assertEqual(self.table.total_bytes,
+                         tcp_flow.bytes + udp_flow.bytes)
+
+    def test_rate_series(self):
+        table = self.table.select(proto='udp')
+        starts, rates = table.rate_series(interval=1.)
+        numpy.testing.assert_array_equal([0., 1., 2.], starts)
+        numpy.testing.assert_array_equal([table['length'][0] * 8.] * 3,
+                                         rates)
+
+    def test_assert_helpers(self):
+        tcpdump.assert_dscp_marks(self.table, dscp=10, proto='tcp')
+        tcpdump.assert_vlan_tags(self.table, vlan=100, dport=80)
+        tcpdump.assert_tcp_retransmits(self.table, max_retransmits=1)
+        self.assertRaises(self.failureException,
+                          tcpdump.assert_tcp_retransmits, self.table)
+        self.assertRaises(self.failureException,
+                          tcpdump.assert_flow_packets, self.table,
+                          dport=443)
@@ -15,6 +15,7 @@ from __future__ import absolute_import
 
 import os
 import sys
+import threading
 import unittest
 from unittest import mock
 
@@ -481,6 +482,19 @@ class SharedFixtureTest(unit.TobikoUnitTest):
         fixture.setUp()
         fixture.setup_fixture.assert_called_once_with()
 
+    def test_setup_concurrently(self):
+        fixture = MyFixture()
+        started = threading.Event()
+        fixture.setup_fixture.side_effect = lambda: started.wait(5.)
+        threads = [threading.Thread(target=fixture.setUp)
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        started.set()
+        for thread in threads:
+            thread.join()
+        fixture.setup_fixture.assert_called_once_with()
+
     def test_setup_when_skipping(self):
         fixture = MySkyppingFixture()
         self.assertRaises(testtools.MultipleExceptions, fixture.setUp)
@@ -0,0 +1,69 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from concurrent import futures
+import threading
+
+import tobiko
+from tobiko.common import _lockutils
+from tobiko.tests import unit
+
+
+class InterworkerLockTest(unit.TobikoUnitTest):
+
+    def test_lock_is_reentrant(self):
+        name = self.id()
+        with tobiko.interworker_lock(name):
+            with tobiko.interworker_lock(name):
+                pass
+            # inner call must leave the lock acquired
+            self.assertFalse(self.acquire_from_other_thread(name))
+        self.assertTrue(self.acquire_from_other_thread(name))
+
+    def test_lock_excludes_threads(self):
+        name = self.id()
+        inside = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def locked():
+            with tobiko.interworker_lock(name):
+                with lock:
+                    if inside:
+                        overlaps.append(True)
+                    inside.append(True)
+                tobiko.sleep(.01)
+                with lock:
+                    inside.pop()
+
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(locked) for _ in range(8)]:
+                future.result(timeout=10.)
+        self.assertEqual([], overlaps)
+
+    @staticmethod
+    def acquire_from_other_thread(name: str) -> bool:
+        thread_lock = _lockutils.get_thread_lock(name)
+
+        def acquire():
+            gotten = thread_lock.rlock.acquire(blocking=False)
+            if gotten:
+                thread_lock.rlock.release()
+            return gotten
+
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(acquire).result(timeout=10.)
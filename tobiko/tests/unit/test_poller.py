@@ -0,0 +1,141 @@
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+from unittest import mock
+
+import tobiko
+from tobiko.common import _poller
+from tobiko.tests import unit
+
+
+class FakeObjects:
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.get_object = mock.Mock(side_effect=self._get_object)
+        self.list_objects = mock.Mock(side_effect=self._list_objects)
+
+    def _get_object(self, object_id, **params):
+        return {'id': object_id, 'status': self._next_status(object_id),
+                **params}
+
+    def _list_objects(self):
+        return [{'id': object_id, 'status': self._next_status(object_id)}
+                for object_id in list(self.statuses)
+                if object_id != 'hidden']
+
+    def _next_status(self, object_id):
+        statuses = self.statuses[object_id]
+        if len(statuses) > 1:
+            return statuses.pop(0)
+        return statuses[0]
+
+
+def has_status(status):
+    return lambda obj: obj['status'] == status
+
+
+class StatusPollerTest(unit.TobikoUnitTest):
+
+    def test_wait_for_object(self):
+        objects = FakeObjects({'a': ['BUILD', 'BUILD', 'ACTIVE']})
+        kind = tobiko.PollingKind(name='fake',
+                                  get_object=objects.get_object)
+        result = tobiko.wait_for_object(kind, 'a',
+                                        predicate=has_status('ACTIVE'),
+                                        timeout=10.,
+                                        interval=.01,
+                                        zone='z')
+        self.assertEqual({'id': 'a', 'status': 'ACTIVE', 'zone': 'z'},
+                         result)
+        self.assertEqual(3, objects.get_object.call_count)
+        objects.get_object.assert_called_with('a', zone='z')
+
+    def test_wait_for_futures_with_list_objects(self):
+        objects = FakeObjects({'a': ['BUILD', 'ACTIVE'],
+                               'b': ['BUILD', 'BUILD', 'ACTIVE'],
+                               'hidden': ['ACTIVE']})
+        kind = tobiko.PollingKind(name='fake',
+                                  get_object=objects.get_object,
+                                  list_objects=objects.list_objects)
+        poller = tobiko.StatusPoller()
+        results = tobiko.wait_for_futures(
+            poller.watch(kind, object_id, predicate=has_status('ACTIVE'),
+                         timeout=10., interval=.01)
+            for object_id in ['a', 'b', 'hidden'])
+        self.assertEqual([{'id': 'a', 'status': 'ACTIVE'},
+                          {'id': 'b', 'status': 'ACTIVE'},
+                          {'id': 'hidden', 'status': 'ACTIVE'}],
+                         results)
+        # objects missing from the list are got one by one
+        objects.get_object.assert_called_once_with('hidden')
+
+    def test_poll_batches_objects_of_the_same_kind(self):
+        objects = FakeObjects({'a': ['BUILD'], 'b': ['BUILD']})
+        kind = tobiko.PollingKind(name='fake',
+                                  get_object=objects.get_object,
+                                  list_objects=objects.list_objects)
+        watches = [_poller.ObjectWatch(kind=kind,
+                                       object_id=object_id,
+                                       predicate=has_status('ACTIVE'),
+                                       params={},
+                                       timeout=None,
+                                       interval=10.,
+                                       backoff=2.)
+                   for object_id in ['a', 'b']]
+        intervals = []
+        for _ in range(5):
+            tobiko.StatusPoller.poll(watches)
+            intervals.append(watches[0].interval)
+        self.assertEqual(5, objects.list_objects.call_count)
+        objects.get_object.assert_not_called()
+        # it polls fast at first, then slower
+        self.assertEqual([2., 4., 8., 10., 10.], intervals)
+
+    def test_wait_for_object_timeout(self):
+        objects = FakeObjects({'a': ['BUILD']})
+        kind = tobiko.PollingKind(name='fake',
+                                  get_object=objects.get_object)
+        ex = self.assertRaises(tobiko.WaitForObjectTimeout,
+                               tobiko.wait_for_object, kind, 'a',
+                               predicate=has_status('ACTIVE'),
+                               timeout=.1,
+                               interval=.01)
+        self.assertEqual('a', ex.object_id)
+        self.assertEqual({'id': 'a', 'status': 'BUILD'}, ex.last_value)
+        self.assertIsInstance(ex, tobiko.RetryTimeLimitError)
+
+    def test_wait_for_object_with_predicate_error(self):
+        objects = FakeObjects({'a': ['BUILD', 'ERROR']})
+        kind = tobiko.PollingKind(name='fake',
+                                  get_object=objects.get_object)
+
+        def predicate(obj):
+            if obj['status'] == 'ERROR':
+                raise ValueError(obj['status'])
+            return obj['status'] == 'ACTIVE'
+
+        ex = self.assertRaises(ValueError, tobiko.wait_for_object, kind,
+                               'a', predicate=predicate, timeout=10.,
+                               interval=.01)
+        self.assertEqual('ERROR', str(ex))
+
+    def test_wait_for_object_with_get_error(self):
+        kind = tobiko.PollingKind(
+            name='fake', get_object=mock.Mock(side_effect=KeyError('a')))
+        self.assertRaises(KeyError, tobiko.wait_for_object, kind, 'a',
+                          predicate=has_status('ACTIVE'), timeout=10.)
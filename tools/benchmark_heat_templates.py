@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import yaml
+
+TOP_DIR = os.path.realpath(os.path.dirname(os.path.dirname(__file__)))
+
+if TOP_DIR not in sys.path:
+    sys.path.insert(0, TOP_DIR)
+
+from heatclient.common import template_utils  # noqa
+
+from tobiko.common import _yaml  # noqa
+from tobiko.openstack.heat import _template  # noqa
+
+STACKS_DIR = os.path.join(TOP_DIR, 'tobiko', 'openstack', 'stacks')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure the time required to compile all Heat '
+                    'templates of tobiko stacks')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='number of times every template is compiled')
+    args = parser.parse_args()
+
+    template_files = sorted(glob.glob(os.path.join(STACKS_DIR, '**',
+                                                   '*.yaml'),
+                                      recursive=True))
+    sys.stdout.write(f"Compiling {len(template_files)} templates "
+                     f"{args.repeat} times (libyaml: "
+                     f"{yaml.__with_libyaml__})\n")
+    cache_dir = tempfile.mkdtemp()
+    try:
+        results = benchmark(template_files=template_files,
+                            cache_dir=cache_dir,
+                            repeat=args.repeat)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    for name, elapsed in results:
+        sys.stdout.write(f"{name:<28} {elapsed * 1000.:10.2f} ms\n")
+
+
+def benchmark(template_files, cache_dir, repeat):
+
+    def compile_uncached(template_file):
+        _, template = template_utils.get_template_contents(
+            template_file=template_file)
+        yaml.safe_dump(template)
+
+    def compile_cached(cache):
+
+        def compile_template(template_file):
+            _, template = cache.get_template_contents(template_file)
+            _yaml.dump_yaml(template)
+
+        return compile_template
+
+    memory_cache = _template.HeatTemplateCache(cache_dir=cache_dir)
+    for template_file in template_files:
+        # it fills both memory and disk caches
+        memory_cache.get_template_contents(template_file)
+
+    def compile_from_disk(template_file):
+        # a new cache has nothing in memory, like a new tobiko process
+        disk_cache = _template.HeatTemplateCache(cache_dir=cache_dir)
+        compile_cached(disk_cache)(template_file)
+
+    modes = [
+        ('uncached', compile_uncached),
+        ('disk cache', compile_from_disk),
+        ('memory cache', compile_cached(memory_cache)),
+    ]
+    results = []
+    for name, compile_template in modes:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for template_file in template_files:
+                compile_template(template_file)
+        results.append((name, time.perf_counter() - start))
+    return results
+
+
+if __name__ == '__main__':
+    main()
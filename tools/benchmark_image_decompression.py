@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Red Hat, Inc.
+#
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+
+import argparse
+import bz2
+import gzip
+import hashlib
+import lzma
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+TOP_DIR = os.path.realpath(os.path.dirname(os.path.dirname(__file__)))
+
+if TOP_DIR not in sys.path:
+    sys.path.insert(0, TOP_DIR)
+
+from tobiko.openstack.glance import _io  # noqa
+from tobiko.openstack.glance import _pipeline  # noqa
+
+COMPRESSORS = {'bz2': bz2.compress,
+               'gz': gzip.compress,
+               'xz': lzma.compress}
+
+# Size of the chunks glance client reads from the image file to upload
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure the throughput of uploading decompressed '
+                    'image data with and without a decompressing thread')
+    parser.add_argument('--size', type=int, default=64,
+                        help='size in MiB of the decompressed image data')
+    parser.add_argument('--upload-rate', type=float, default=50.,
+                        help='simulated network upload rate in MB/s')
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        data = create_image_data(args.size * 1024 * 1024)
+        sys.stdout.write(f"Reading {len(data)} bytes of image data\n")
+        for compression_type, compress in sorted(COMPRESSORS.items()):
+            image_file = os.path.join(temp_dir,
+                                      f'image.{compression_type}')
+            with open(image_file, 'wb') as stream:
+                stream.write(compress(data))
+            for name, elapsed in benchmark(image_file, compression_type,
+                                           args.upload_rate * 1e6):
+                sys.stdout.write(
+                    f"{compression_type:<4} {name:<12} {elapsed:8.2f} s "
+                    f"{len(data) / elapsed / 1e6:8.1f} MB/s\n")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def create_image_data(size):
+    # half random data, half zeros, like a partially filled disk image
+    blocks = []
+    for _ in range(0, size, 8192):
+        blocks.append(os.urandom(4096))
+        blocks.append(bytes(4096))
+    return b''.join(blocks)[:size]
+
+
+def upload(stream, upload_rate):
+    # it waits for the network like a real upload would do
+    digest = hashlib.sha512()
+    while True:
+        chunk = stream.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+        time.sleep(len(chunk) / upload_rate)
+    return digest.hexdigest()
+
+
+def benchmark(image_file, compression_type, upload_rate):
+    modes = [
+        ('synchronous', lambda: _io.open_image_file(
+            filename=image_file, mode='rb',
+            compression_type=compression_type)),
+        ('pipeline', lambda: _pipeline.open_image_pipeline(
+            filename=image_file, compression_type=compression_type)),
+    ]
+    results = []
+    for name, open_file in modes:
+        start = time.perf_counter()
+        with open_file() as stream:
+            upload(stream, upload_rate)
+        results.append((name, time.perf_counter() - start))
+    return results
+
+
+if __name__ == '__main__':
+    main()